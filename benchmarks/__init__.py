@@ -0,0 +1,42 @@
+"""
+PyMountain基准测试集 | PyMountain benchmark suite
+
+用法 | Usage:
+    python -m benchmarks list
+    python -m benchmarks run --quick --output results/baseline.json
+    python -m benchmarks run interpolation --output results/current.json
+    python -m benchmarks compare results/baseline.json results/current.json --threshold 0.1
+    python -m benchmarks run --memory --quick --output results/memory.json
+    python -m benchmarks footprint 10000 100000
+    python -m benchmarks import --max-seconds 0.5
+"""
+
+from .registry import Benchmark, benchmark, get_benchmarks
+from .memory import measure_memory, mountain_data_footprint, RSSSampler
+from .runner import run_suite, save_results, load_results, compare_results, format_comparison
+
+# 注册基准测试的模块 | Modules registering benchmarks
+BENCHMARK_MODULES = (
+    'bench_data',
+    'bench_interpolation',
+    'bench_color',
+    'bench_render',
+    'bench_serialization',
+    'bench_terrain',
+    'bench_analysis',
+)
+
+__all__ = [
+    "Benchmark",
+    "benchmark",
+    "get_benchmarks",
+    "run_suite",
+    "save_results",
+    "load_results",
+    "compare_results",
+    "format_comparison",
+    "measure_memory",
+    "mountain_data_footprint",
+    "RSSSampler",
+    "BENCHMARK_MODULES",
+]
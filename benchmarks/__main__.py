@@ -0,0 +1,149 @@
+"""
+基准测试命令行入口 | Benchmark command-line entry point
+"""
+
+import argparse
+import importlib
+import json
+import sys
+from pathlib import Path
+from typing import List, Optional
+
+# 优先使用仓库中的源码 | Prefer the in-repo sources
+SRC_DIR = Path(__file__).resolve().parents[1] / 'src'
+if SRC_DIR.is_dir() and str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from . import BENCHMARK_MODULES, bench_import
+from .memory import MEMORY_STATS, mountain_data_footprint, format_footprint
+from .registry import get_benchmarks
+from .runner import TIME_STATS, run_suite, save_results, load_results, compare_results, format_comparison
+
+
+def _load_benchmarks() -> None:
+    """导入注册基准测试的模块 | Import the modules that register benchmarks"""
+    import matplotlib
+    matplotlib.use('Agg')
+    for module_name in BENCHMARK_MODULES:
+        importlib.import_module(f".{module_name}", __package__)
+
+
+def _cmd_list(args: argparse.Namespace) -> int:
+    """列出基准测试 | List benchmarks"""
+    _load_benchmarks()
+    for bench in get_benchmarks(args.filter):
+        cases = sum(1 for _ in bench.cases(quick=args.quick))
+        print(f"{bench.name:<40} {cases:>3} case(s)  {bench.description}")
+    return 0
+
+
+def _cmd_run(args: argparse.Namespace) -> int:
+    """运行基准测试，可选与基线比较 | Run benchmarks, optionally comparing against a baseline"""
+    _load_benchmarks()
+    benchmarks = get_benchmarks(args.filter)
+    if not benchmarks:
+        print(f"No benchmarks match {args.filter}")
+        return 2
+
+    mode = 'memory' if args.memory else 'time'
+    repeat = args.repeat if args.repeat is not None else (3 if args.memory else 5)
+    results = run_suite(benchmarks, quick=args.quick, repeat=repeat, min_time=args.min_time, mode=mode)
+    if args.output:
+        print(f"Results written to {save_results(results, args.output)}")
+
+    errors = [case_id for case_id, entry in results['results'].items() if 'error' in entry]
+    if errors:
+        print(f"{len(errors)} case(s) failed: {', '.join(errors)}")
+
+    if args.compare:
+        report = compare_results(load_results(args.compare), results, args.threshold, args.stat, args.min_bytes)
+        print(format_comparison(report, verbose=args.verbose))
+        if report['regressions']:
+            return 1
+    return 1 if errors else 0
+
+
+def _cmd_compare(args: argparse.Namespace) -> int:
+    """比较两个结果文件 | Compare two result files"""
+    report = compare_results(load_results(args.baseline), load_results(args.current), args.threshold, args.stat,
+                             args.min_bytes)
+    print(format_comparison(report, verbose=args.verbose))
+    return 1 if report['regressions'] else 0
+
+
+def _cmd_footprint(args: argparse.Namespace) -> int:
+    """报告MountainData每个点的内存占用 | Report the per-point memory footprint of MountainData"""
+    rows = mountain_data_footprint(args.sizes)
+    print(format_footprint(rows))
+    if args.json_path:
+        with open(args.json_path, 'w') as f:
+            json.dump(rows, f, indent=2)
+    return 0
+
+
+def _add_compare_options(parser: argparse.ArgumentParser) -> None:
+    """比较选项 | Comparison options"""
+    parser.add_argument('--threshold', type=float, default=0.1,
+                        help='relative slowdown or growth flagged as a regression (default: 0.1 = 10%%)')
+    parser.add_argument('--stat', choices=TIME_STATS + MEMORY_STATS, default=None,
+                        help='statistic to compare (default: median for time runs, peak_bytes for memory runs)')
+    parser.add_argument('--min-bytes', type=int, default=64 * 1024,
+                        help='minimum absolute change of memory statistics (default: 65536)')
+    parser.add_argument('-v', '--verbose', action='store_true', help='also list unchanged cases')
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """命令行入口 | Command-line entry point"""
+    parser = argparse.ArgumentParser(prog='python -m benchmarks', description='PyMountain benchmark suite')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    list_parser = subparsers.add_parser('list', help='list registered benchmarks')
+    list_parser.add_argument('filter', nargs='*', help='name wildcards or groups')
+    list_parser.add_argument('--quick', action='store_true', help='count quick-mode cases only')
+    list_parser.set_defaults(func=_cmd_list)
+
+    run_parser = subparsers.add_parser('run', help='run benchmarks and save results as JSON')
+    run_parser.add_argument('filter', nargs='*', help='name wildcards or groups (default: all)')
+    run_parser.add_argument('-o', '--output', help='JSON file to write results to')
+    run_parser.add_argument('--quick', action='store_true', help='run only the smallest parameter values')
+    run_parser.add_argument('--memory', action='store_true',
+                            help='measure allocation peak, retained bytes and RSS growth instead of time')
+    run_parser.add_argument('--repeat', type=int, default=None,
+                            help='samples per case (default: 5, or 3 with --memory)')
+    run_parser.add_argument('--min-time', type=float, default=0.05,
+                            help='minimum seconds per sample (default: 0.05)')
+    run_parser.add_argument('--compare', metavar='BASELINE', help='compare against a baseline result file')
+    _add_compare_options(run_parser)
+    run_parser.set_defaults(func=_cmd_run)
+
+    compare_parser = subparsers.add_parser('compare', help='compare two result files')
+    compare_parser.add_argument('baseline', help='baseline result file')
+    compare_parser.add_argument('current', help='current result file')
+    _add_compare_options(compare_parser)
+    compare_parser.set_defaults(func=_cmd_compare)
+
+    footprint_parser = subparsers.add_parser('footprint', help='report MountainData memory per point')
+    footprint_parser.add_argument('sizes', nargs='*', type=int, default=[10_000, 100_000],
+                                  help='point counts (default: 10000 100000)')
+    footprint_parser.add_argument('--json', dest='json_path', default=None, help='write the rows to this JSON file')
+    footprint_parser.set_defaults(func=_cmd_footprint)
+
+    import_parser = subparsers.add_parser('import', help='benchmark `import pymountain` startup time',
+                                          add_help=False)
+    import_parser.set_defaults(func=None)
+
+    args, remaining = parser.parse_known_args(argv)
+    if args.command == 'import':
+        return bench_import.main(remaining)
+    if remaining:
+        parser.error(f"unrecognized arguments: {' '.join(remaining)}")
+    try:
+        return args.func(args)
+    except ValueError as e:
+        # 如结果文件格式不符或比较的统计量与运行模式不匹配 | e.g. bad result files or a statistic not matching the run mode
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+
+
+if __name__ == '__main__':
+    sys.exit(main())
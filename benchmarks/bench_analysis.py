@@ -0,0 +1,82 @@
+"""
+地形分析基准测试：规则网格上的导数、剖面、可视域、水文与路径 | Terrain analysis benchmarks: derivatives, profiles, viewsheds, hydrology and routing on regular grids
+"""
+
+import numpy as np
+
+from pymountain import GridData
+from pymountain.analysis import terrain_derivatives, ProfileSampler, viewshed, line_of_sight, hydrology
+from pymountain.analysis import cost_surface, least_cost_path, cost_distance
+from pymountain.utils.terrain import generate_terrain
+
+from .registry import benchmark
+
+
+def _make_grid(size: int) -> GridData:
+    """创建北向上的30米合成地形网格 | Create a north-up 30 m synthetic terrain grid"""
+    return GridData(generate_terrain(size, seed=7), (0.0, 30.0, 0.0, size * 30.0, 0.0, -30.0))
+
+
+@benchmark('analysis', size=[512, 2048], product=['slope', 'aspect', 'curvature', 'roughness', 'hillshade'])
+def bench_derivative(size, product):
+    """单个地形导数 | Single terrain derivative"""
+    grid = _make_grid(size)
+    return lambda: terrain_derivatives(grid, (product,))
+
+
+@benchmark('analysis', size=[2048], tile_size=[256, 1024, 4096])
+def bench_derivatives_tiled(size, tile_size):
+    """一次遍历计算全部导数 | All derivatives in one pass"""
+    grid = _make_grid(size)
+    return lambda: terrain_derivatives(grid, tile_size=tile_size)
+
+
+@benchmark('analysis', size=[2048], profiles=[10, 1000])
+def bench_profiles(size, profiles):
+    """批量高程剖面提取与指标 | Batch elevation profile extraction and metrics"""
+    grid = _make_grid(size)
+    sampler = ProfileSampler(grid)
+    rng = np.random.default_rng(0)
+    polylines = rng.uniform(0.0, size * 30.0, (profiles, 8, 2))
+    return lambda: sampler.extract(polylines).metrics()
+
+
+@benchmark('analysis', size=[512, 2048])
+def bench_viewshed(size):
+    """单观察点可视域 | Single-observer viewshed"""
+    grid = _make_grid(size)
+    center = size * 15.0
+    return lambda: viewshed(grid, (center, center), observer_height=10.0)
+
+
+@benchmark('analysis', size=[2048], pairs=[1000, 100000])
+def bench_line_of_sight(size, pairs):
+    """批量通视查询 | Batch line-of-sight queries"""
+    grid = _make_grid(size)
+    rng = np.random.default_rng(0)
+    points = rng.uniform(0.0, size * 30.0, (2, pairs, 2))
+    return lambda: line_of_sight(grid, points[0], points[1], spacing=300.0)
+
+
+@benchmark('analysis', size=[512, 1024])
+def bench_hydrology(size):
+    """填洼、流向、汇流累积与流域 | Filling, flow direction, accumulation and watersheds"""
+    grid = _make_grid(size)
+    return lambda: hydrology(grid)
+
+
+@benchmark('analysis', size=[512, 2048], heuristic_weight=[0.0, 1.0, 2.0])
+def bench_least_cost_path(size, heuristic_weight):
+    """对角线最小成本路径（0为Dijkstra） | Corner-to-corner least-cost path (0 is Dijkstra)"""
+    cost = cost_surface(_make_grid(size), max_slope=70.0)
+    start, end = (45.0, size * 30.0 - 45.0), (size * 30.0 - 45.0, 45.0)
+    return lambda: least_cost_path(cost, start, end, heuristic_weight=heuristic_weight)
+
+
+@benchmark('analysis', size=[512, 1024])
+def bench_cost_distance(size):
+    """多源累积成本栅格 | Multi-source accumulated cost raster"""
+    cost = cost_surface(_make_grid(size), max_slope=70.0)
+    rng = np.random.default_rng(0)
+    sources = rng.uniform(30.0, size * 30.0 - 30.0, (8, 2))
+    return lambda: cost_distance(cost, sources)
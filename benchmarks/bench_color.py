@@ -0,0 +1,55 @@
+"""
+颜色映射基准测试 | Color mapping benchmarks
+"""
+
+import numpy as np
+
+from pymountain.utils.color_mapping import ColorMapper, apply_color_mapping, clear_colormap_cache, get_colormap
+from pymountain.utils.statistics import StreamingHistogram
+
+from ._data import make_grid
+from .registry import benchmark
+
+
+@benchmark('color', size=[100, 1_000, 2_000], dtype=['float64', 'uint8'])
+def bench_map_values(size, dtype):
+    """查找表映射size×size网格 | Lookup-table mapping of a size×size grid"""
+    Z = make_grid(size)[2]
+    mapper = ColorMapper('terrain', vmin=float(Z.min()), vmax=float(Z.max()))
+    return lambda: mapper.map_values(Z, dtype=np.dtype(dtype))
+
+
+@benchmark('color', size=[100, 1_000])
+def bench_colormap_call(size):
+    """直接调用Matplotlib颜色映射（对照） | Calling the Matplotlib colormap directly (reference)"""
+    Z = make_grid(size)[2]
+    cmap = get_colormap('terrain')
+    normalized = (Z - Z.min()) / (Z.max() - Z.min())
+    return lambda: cmap(normalized)
+
+
+@benchmark('color', size=[100, 1_000])
+def bench_apply_color_mapping(size):
+    """自动范围的apply_color_mapping | apply_color_mapping with automatic range"""
+    Z = make_grid(size)[2]
+    return lambda: apply_color_mapping(Z, 'terrain')
+
+
+@benchmark('color', size=[1_000, 2_000], mode=['exact', 'streaming'])
+def bench_auto_range(size, mode):
+    """百分位自动范围：精确排序与流式直方图 | Percentile auto range: exact sort versus streaming histogram"""
+    Z = make_grid(size)[2]
+    mapper = ColorMapper('terrain')
+    if mode == 'streaming':
+        return lambda: mapper.auto_range(StreamingHistogram().update(Z))
+    return lambda: mapper.auto_range(Z)
+
+
+@benchmark('color')
+def bench_cold_lut():
+    """冷缓存下构建颜色映射和查找表 | Building the colormap and lookup table with cold caches"""
+    def run():
+        clear_colormap_cache()
+        ColorMapper('terrain').get_lut(np.uint8)
+    return run
+
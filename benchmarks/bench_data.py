@@ -0,0 +1,79 @@
+"""
+MountainData基准测试：导入、边界、统计和区域查询 | MountainData benchmarks: ingest, bounds, statistics and region queries
+"""
+
+from pymountain import MountainData
+
+from ._data import make_terrain
+from .registry import benchmark
+
+
+@benchmark('data', n=[1_000, 10_000])
+def bench_ingest_add_point(n):
+    """逐点add_point导入 | Per-point add_point ingest"""
+    x, y, z = (array.tolist() for array in make_terrain(n))
+
+    def run():
+        data = MountainData()
+        for xi, yi, zi in zip(x, y, z):
+            data.add_point(xi, yi, zi)
+    return run
+
+
+@benchmark('data', n=[10_000, 100_000, 1_000_000])
+def bench_ingest_from_arrays(n):
+    """数组模式导入 | Array-backed ingest"""
+    x, y, z = make_terrain(n)
+    return lambda: MountainData.from_arrays(x, y, z)
+
+
+@benchmark('data', n=[1_000, 10_000, 100_000], backing=['arrays', 'points'])
+def bench_bounds(n, backing):
+    """未缓存的边界计算 | Uncached bounds computation"""
+    data = _make_data(n, backing)
+
+    def run():
+        data._clear_cache()
+        data.get_bounds()
+    return run
+
+
+@benchmark('data', n=[1_000, 10_000, 100_000], backing=['arrays', 'points'])
+def bench_elevation_stats(n, backing):
+    """高程统计 | Elevation statistics"""
+    data = _make_data(n, backing)
+    return data.get_elevation_stats
+
+
+@benchmark('data', n=[1_000, 10_000, 100_000], backing=['arrays', 'points'])
+def bench_region_query(n, backing):
+    """矩形区域查询（约覆盖1/4范围） | Rectangular region query (about a quarter of the extent)"""
+    data = _make_data(n, backing)
+    return lambda: data.get_points_in_region(-5, 5, -5, 5)
+
+
+@benchmark('data', n=[1_000, 10_000, 100_000])
+def bench_to_numpy_points(n):
+    """点模式下转换为NumPy数组 | Conversion to NumPy arrays in point mode"""
+    data = _make_data(n, 'points')
+    return data.to_numpy_arrays
+
+
+@benchmark('data', n=[10_000, 100_000, 1_000_000])
+def bench_fingerprint(n):
+    """未缓存的内容指纹 | Uncached content fingerprint"""
+    data = _make_data(n, 'arrays')
+
+    def run():
+        data._clear_cache()
+        data.fingerprint()
+    return run
+
+
+def _make_data(n: int, backing: str) -> MountainData:
+    """创建数组模式或点模式的数据 | Create array-backed or point-backed data"""
+    data = MountainData.from_arrays(*make_terrain(n))
+    if backing == 'points':
+        # 访问points会物化为BasePoint列表 | Accessing points materializes the BasePoint list
+        data.points
+    return data
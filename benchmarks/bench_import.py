@@ -0,0 +1,131 @@
+"""
+PyMountain导入时间基准测试 | PyMountain import-time benchmark
+
+在全新的解释器中反复测量`import pymountain`的耗时，并检查导入包时没有加载重量级依赖。
+超出阈值或加载了被禁止的模块时以非零状态退出，可用于CI回归检查 |
+Measures `import pymountain` in fresh interpreters and checks that importing the package does
+not load heavy dependencies. Exits non-zero when the threshold is exceeded or a forbidden module
+is loaded, so it can guard against regressions in CI
+
+用法 | Usage:
+    python benchmarks/bench_import.py --repeat 10 --max-seconds 0.5
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+# 导入pymountain时不应加载的模块 | Modules that must not be loaded by importing pymountain
+FORBIDDEN_MODULES = ('matplotlib', 'matplotlib.pyplot', 'scipy', 'scipy.interpolate', 'scipy.spatial')
+
+SRC_DIR = Path(__file__).resolve().parents[1] / 'src'
+
+_PROBE = """
+import sys, time, json
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(json.dumps({{'seconds': elapsed, 'modules': sorted(sys.modules)}}))
+"""
+
+
+def _child_env() -> Dict[str, str]:
+    """子进程环境：优先使用仓库中的源码 | Child environment: prefer the in-repo sources"""
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [str(SRC_DIR), env.get('PYTHONPATH')]))
+    return env
+
+
+def measure_import(module: str = 'pymountain', repeat: int = 10) -> Dict[str, Any]:
+    """
+    在全新解释器中测量模块导入时间 | Measure module import time in fresh interpreters
+
+    Args:
+        module: 模块名 | Module name
+        repeat: 重复次数 | Number of repetitions
+
+    Returns:
+        包含每次耗时、中位数、最小值和已加载的被禁止模块的字典 |
+        Dictionary with per-run times, median, minimum and forbidden modules that were loaded
+    """
+    env = _child_env()
+    samples: List[float] = []
+    loaded: set = set()
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, '-c', _PROBE.format(module=module)],
+                                check=True, capture_output=True, text=True, env=env).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        samples.append(result['seconds'])
+        loaded.update(name for name in FORBIDDEN_MODULES if name in result['modules'])
+
+    return {
+        'module': module,
+        'repeat': repeat,
+        'samples': samples,
+        'median': statistics.median(samples),
+        'min': min(samples),
+        'forbidden_loaded': sorted(loaded),
+    }
+
+
+def top_imports(module: str = 'pymountain', limit: int = 10) -> List[Dict[str, Any]]:
+    """
+    使用-X importtime列出累计耗时最多的导入 | List the imports with the largest cumulative time using -X importtime
+
+    Args:
+        module: 模块名 | Module name
+        limit: 返回条目数 | Number of entries to return
+
+    Returns:
+        包含模块名、自身和累计微秒数的字典列表 | List of dictionaries with module name, self and cumulative microseconds
+    """
+    stderr = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+                            check=True, capture_output=True, text=True, env=_child_env()).stderr
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = (part.strip() for part in line[len('import time:'):].split('|'))
+        entries.append({'module': name, 'self_us': int(self_us), 'cumulative_us': int(cumulative_us)})
+    entries.sort(key=lambda entry: entry['cumulative_us'], reverse=True)
+    return entries[:limit]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """命令行入口 | Command-line entry point"""
+    parser = argparse.ArgumentParser(description='Benchmark `import pymountain` startup time')
+    parser.add_argument('--module', default='pymountain', help='module to import')
+    parser.add_argument('--repeat', type=int, default=10, help='number of fresh interpreters')
+    parser.add_argument('--max-seconds', type=float, default=None,
+                        help='fail when the median import time exceeds this many seconds')
+    parser.add_argument('--json', dest='json_path', default=None, help='write the result to this JSON file')
+    args = parser.parse_args(argv)
+
+    result = measure_import(args.module, args.repeat)
+    result['top_imports'] = top_imports(args.module)
+
+    print(f"import {result['module']}: median {result['median'] * 1000:.1f} ms, "
+          f"min {result['min'] * 1000:.1f} ms over {result['repeat']} runs")
+    for entry in result['top_imports']:
+        print(f"  {entry['cumulative_us'] / 1000:8.1f} ms  {entry['module']}")
+
+    if args.json_path:
+        Path(args.json_path).write_text(json.dumps(result, indent=2))
+
+    failed = False
+    if result['forbidden_loaded']:
+        print(f"FAIL: heavy modules loaded at import time: {', '.join(result['forbidden_loaded'])}")
+        failed = True
+    if args.max_seconds is not None and result['median'] > args.max_seconds:
+        print(f"FAIL: median import time {result['median']:.3f}s exceeds {args.max_seconds:.3f}s")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,50 @@
+"""
+插值基准测试：各插值方法在不同点数和网格尺寸下的耗时 | Interpolation benchmarks: each method across point counts and grid sizes
+"""
+
+import numpy as np
+
+from pymountain.utils.interpolation import (
+    linear_interpolation,
+    cubic_interpolation,
+    rbf_interpolation,
+    adaptive_interpolation,
+)
+
+from ._data import make_terrain
+from .registry import benchmark
+
+
+def _setup(n: int, grid: int):
+    """散点数据和目标网格 | Scattered data and target grid"""
+    x, y, z = make_terrain(n)
+    xi, yi = np.meshgrid(np.linspace(-10, 10, grid), np.linspace(-10, 10, grid))
+    return x, y, z, xi, yi
+
+
+@benchmark('interpolation', n=[1_000, 10_000, 100_000], grid=[50, 100, 200])
+def bench_linear(n, grid):
+    """griddata线性插值 | griddata linear interpolation"""
+    x, y, z, xi, yi = _setup(n, grid)
+    return lambda: linear_interpolation(x, y, z, xi, yi)
+
+
+@benchmark('interpolation', n=[1_000, 10_000, 100_000], grid=[50, 100, 200])
+def bench_cubic(n, grid):
+    """griddata三次插值 | griddata cubic interpolation"""
+    x, y, z, xi, yi = _setup(n, grid)
+    return lambda: cubic_interpolation(x, y, z, xi, yi)
+
+
+@benchmark('interpolation', n=[200, 1_000, 2_000], grid=[50, 100, 200])
+def bench_rbf(n, grid):
+    """RBF插值（复杂度随点数立方增长，点数较少） | RBF interpolation (cubic in the point count, so fewer points)"""
+    x, y, z, xi, yi = _setup(n, grid)
+    return lambda: rbf_interpolation(x, y, z, xi, yi)
+
+
+@benchmark('interpolation', n=[1_000, 10_000], grid=[50, 100, 200])
+def bench_adaptive(n, grid):
+    """按密度自适应选择方法 | Density-adaptive method selection"""
+    x, y, z, xi, yi = _setup(n, grid)
+    return lambda: adaptive_interpolation(x, y, z, xi, yi)
@@ -0,0 +1,58 @@
+"""
+渲染器基准测试：渲染并编码为PNG | Renderer benchmarks: render and encode to PNG
+"""
+
+import io
+from typing import Union
+
+from pymountain import MountainData, GridData
+from pymountain.renderers.matplotlib_renderer import Matplotlib3DRenderer, MatplotlibContourRenderer
+from pymountain.renderers.software_renderer import SoftwareRenderer3D
+
+from ._data import make_terrain, make_grid
+from .registry import benchmark
+
+
+def _render_and_encode(renderer, data: Union[MountainData, GridData]):
+    """构建渲染并编码的可调用对象 | Build a callable that renders and encodes"""
+    def run():
+        renderer.render(data)
+        renderer.save_figure(io.BytesIO(), format='png')
+        release = getattr(renderer, '_release_figure', None)
+        if release is not None:
+            release()
+    return run
+
+
+@benchmark('render', n=[1_000, 10_000], grid=[50, 100], pool=[False, True])
+def bench_matplotlib_3d(n, grid, pool):
+    """Matplotlib三维表面 | Matplotlib 3D surface"""
+    renderer = Matplotlib3DRenderer(config={'grid_resolution': grid, 'use_figure_pool': pool})
+    return _render_and_encode(renderer, MountainData.from_arrays(*make_terrain(n)))
+
+
+@benchmark('render', n=[1_000, 10_000], grid=[50, 100, 200], pool=[False, True])
+def bench_matplotlib_contour(n, grid, pool):
+    """Matplotlib等高线（关闭等高线缓存） | Matplotlib contours (contour cache disabled)"""
+    renderer = MatplotlibContourRenderer(config={'grid_resolution': grid, 'use_figure_pool': pool,
+                                                 'use_contour_cache': False})
+    return _render_and_encode(renderer, MountainData.from_arrays(*make_terrain(n)))
+
+
+@benchmark('render', n=[1_000, 10_000], grid=[50, 100, 200])
+def bench_software_3d(n, grid):
+    """NumPy软件光栅化 | NumPy software rasterizer"""
+    renderer = SoftwareRenderer3D(config={'grid_resolution': grid})
+    return _render_and_encode(renderer, MountainData.from_arrays(*make_terrain(n)))
+
+
+@benchmark('render', size=[256, 1024], renderer=['contour', 'software'])
+def bench_grid_data(size, renderer):
+    """规则网格直接重采样渲染（无散点插值） | Regular grid rendered by resampling (no scattered interpolation)"""
+    X_grid, Y_grid, Z_grid = make_grid(size)
+    data = GridData.from_coordinates(X_grid, Y_grid, Z_grid)
+    if renderer == 'contour':
+        instance = MatplotlibContourRenderer(config={'grid_resolution': 100, 'use_contour_cache': False})
+    else:
+        instance = SoftwareRenderer3D(config={'grid_resolution': 100})
+    return _render_and_encode(instance, data)
@@ -0,0 +1,70 @@
+"""
+序列化基准测试：JSON、数组文件和图像格式 | Serialization benchmarks: JSON, array files and image formats
+"""
+
+import io
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+from pymountain import MountainData
+from pymountain.renderers.matplotlib_renderer import MatplotlibContourRenderer
+from pymountain.services.batch import load_dataset_arrays
+
+from ._data import make_terrain
+from .registry import benchmark
+
+
+@benchmark('serialization', n=[1_000, 10_000, 100_000])
+def bench_to_json(n):
+    """序列化为JSON字符串 | Serialize to a JSON string"""
+    data = MountainData.from_arrays(*make_terrain(n))
+    return data.to_json
+
+
+@benchmark('serialization', n=[1_000, 10_000, 100_000])
+def bench_load_json(n):
+    """从JSON字符串加载 | Load from a JSON string"""
+    text = MountainData.from_arrays(*make_terrain(n)).to_json()
+    return lambda: MountainData().load_from_json(text)
+
+
+@benchmark('serialization', n=[10_000, 100_000, 1_000_000], format=['npy', 'npz'])
+def bench_load_dataset(n, format):
+    """从二进制数据集文件加载坐标数组 | Load coordinate arrays from a binary dataset file"""
+    return _load_dataset_case(n, format)
+
+
+@benchmark('serialization', n=[10_000, 100_000])
+def bench_load_dataset_csv(n):
+    """从CSV数据集文件加载坐标数组 | Load coordinate arrays from a CSV dataset file"""
+    return _load_dataset_case(n, 'csv')
+
+
+@benchmark('serialization', format=['png', 'jpg', 'svg', 'pdf'])
+def bench_encode_figure(format):
+    """将已渲染的等高线图编码为图像 | Encode a rendered contour figure"""
+    renderer = MatplotlibContourRenderer(config={'grid_resolution': 100})
+    renderer.render(MountainData.from_arrays(*make_terrain(5_000)))
+    return lambda: renderer.save_figure(io.BytesIO(), format=format)
+
+
+def _load_dataset_case(n: int, format: str):
+    """写出数据集文件并返回加载它的可调用对象 | Write a dataset file and return a callable loading it"""
+    x, y, z = make_terrain(n)
+    workdir = tempfile.TemporaryDirectory(prefix='pymountain-bench-')
+    path = Path(workdir.name) / f"dataset.{format}"
+    if format == 'npy':
+        np.save(path, np.vstack((x, y, z)))
+    elif format == 'npz':
+        np.savez(path, x=x, y=y, z=z)
+    else:
+        np.savetxt(path, np.column_stack((x, y, z)), delimiter=',', header='x,y,z', comments='')
+
+    def run():
+        # 持有临时目录引用直至基准测试结束 | Keep the temporary directory alive for the benchmark's lifetime
+        workdir
+        # 求和以确保内存映射的数据确实被读取 | Sum so memory-mapped data is actually read
+        return [np.asarray(array).sum() for array in load_dataset_arrays(path)]
+    return run
@@ -0,0 +1,19 @@
+"""
+合成地形基准测试：分形网格和散点样本的生成耗时 | Synthetic terrain benchmarks: fractal grid and scattered sample generation
+"""
+
+from pymountain.utils.terrain import generate_terrain, sample_terrain
+
+from .registry import benchmark
+
+
+@benchmark('terrain', size=[256, 1024], method=['fbm', 'ridged', 'diamond_square', 'spectral'])
+def bench_grid(size, method):
+    """生成size x size高程网格 | Generate a size x size elevation grid"""
+    return lambda: generate_terrain(size, method=method, seed=1)
+
+
+@benchmark('terrain', n=[100_000, 1_000_000], method=['fbm', 'ridged'])
+def bench_samples(n, method):
+    """生成散点样本 | Generate scattered samples"""
+    return lambda: sample_terrain(n, method=method, seed=1)
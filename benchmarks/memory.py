@@ -0,0 +1,257 @@
+"""
+内存基准测试：分配峰值、残留字节和常驻内存 | Memory benchmarks: peak allocations, retained bytes and resident memory
+
+measure_memory()用tracemalloc记录一次调用期间Python和NumPy分配的峰值、调用结束并回收后仍然残留的字节数以及
+返回值占用的字节数，同时由后台线程采样进程常驻内存(RSS)以覆盖tracemalloc看不到的分配（如Agg缓冲区） |
+measure_memory() uses tracemalloc to record the peak of Python and NumPy allocations during a call,
+the bytes still retained after the call returns and garbage is collected, and the bytes held by
+the return value. A background thread samples the process resident set size (RSS) at the same
+time to cover allocations tracemalloc cannot see (such as Agg buffers)
+"""
+
+import gc
+import os
+import threading
+import tracemalloc
+from typing import Dict, Any, List, Callable, Optional, Sequence
+
+# 内存模式下可比较的统计量 | Statistics comparable in memory mode
+MEMORY_STATS = ('peak_bytes', 'retained_bytes', 'result_bytes', 'rss_peak_bytes')
+
+
+def read_rss() -> Optional[int]:
+    """
+    读取当前进程的常驻内存 | Read the resident set size of the current process
+
+    优先使用psutil，其次读取Linux的/proc/self/statm，均不可用时返回None |
+    Uses psutil when installed, then Linux /proc/self/statm, and returns None when neither is available
+
+    Returns:
+        常驻内存字节数或None | Resident bytes or None
+    """
+    try:
+        import psutil
+    except ImportError:
+        psutil = None
+    if psutil is not None:
+        return psutil.Process().memory_info().rss
+
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+class RSSSampler:
+    """
+    后台采样进程常驻内存峰值 | Sample the peak process resident set size in the background
+
+    NumPy在大多数数组运算中释放GIL，因此采样线程能在长时间运算期间运行；短于采样间隔的峰值可能被遗漏 |
+    NumPy releases the GIL in most array operations, so the sampler runs during long computations;
+    peaks shorter than the sampling interval may be missed
+
+    Attributes:
+        start_rss: 开始时的常驻内存 | Resident memory at start
+        peak_rss: 采样到的常驻内存峰值 | Peak sampled resident memory
+    """
+
+    def __init__(self, interval: float = 0.001):
+        """
+        初始化采样器 | Initialize sampler
+
+        Args:
+            interval: 采样间隔（秒） | Sampling interval (seconds)
+        """
+        self.interval = interval
+        self.start_rss: Optional[int] = None
+        self.peak_rss: Optional[int] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _sample(self) -> None:
+        """采样一次 | Take one sample"""
+        rss = read_rss()
+        if rss is not None and (self.peak_rss is None or rss > self.peak_rss):
+            self.peak_rss = rss
+
+    def _run(self) -> None:
+        """采样循环 | Sampling loop"""
+        while not self._stop.wait(self.interval):
+            self._sample()
+
+    def __enter__(self) -> 'RSSSampler':
+        self.start_rss = self.peak_rss = read_rss()
+        if self.start_rss is not None:
+            self._thread = threading.Thread(target=self._run, name='pymountain-rss-sampler', daemon=True)
+            self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        if self._thread is not None:
+            self._sample()
+            self._stop.set()
+            self._thread.join()
+
+    @property
+    def peak_delta(self) -> Optional[int]:
+        """相对开始时的常驻内存峰值增量 | Peak resident memory growth relative to the start"""
+        if self.start_rss is None or self.peak_rss is None:
+            return None
+        return self.peak_rss - self.start_rss
+
+
+def measure_memory(func: Callable[[], Any], repeat: int = 3, warmup: bool = True,
+                   sample_rss: bool = True) -> Dict[str, Any]:
+    """
+    测量一次调用的内存使用 | Measure the memory use of one call
+
+    预热调用用于填充导入、查找表等一次性缓存，使残留字节反映每次调用的增长（泄漏或无界缓存）。
+    各样本取峰值的最大值和残留、返回值字节的中位数 |
+    The warmup call fills one-off caches such as imports and lookup tables, so retained bytes reflect
+    per-call growth (leaks or unbounded caches). Across samples the maximum peak and the median
+    retained and result bytes are reported
+
+    Args:
+        func: 无参可调用对象 | Zero-argument callable
+        repeat: 样本数 | Number of samples
+        warmup: 是否先调用一次预热 | Whether to call once for warmup first
+        sample_rss: 是否同时采样常驻内存 | Whether to sample resident memory as well
+
+    Returns:
+        包含peak_bytes、retained_bytes、result_bytes、rss_peak_bytes和各样本的字典 |
+        Dictionary with peak_bytes, retained_bytes, result_bytes, rss_peak_bytes and the samples
+    """
+    if repeat < 1:
+        raise ValueError("repeat must be >= 1")
+
+    started_tracemalloc = not tracemalloc.is_tracing()
+    if started_tracemalloc:
+        tracemalloc.start()
+    try:
+        if warmup:
+            func()
+
+        samples: List[Dict[str, Optional[int]]] = []
+        for _ in range(repeat):
+            gc.collect()
+            baseline = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            sampler = RSSSampler() if sample_rss else None
+            if sampler is not None:
+                with sampler:
+                    result = func()
+            else:
+                result = func()
+            peak = tracemalloc.get_traced_memory()[1] - baseline
+            gc.collect()
+            holding = tracemalloc.get_traced_memory()[0] - baseline
+            del result
+            gc.collect()
+            retained = tracemalloc.get_traced_memory()[0] - baseline
+            samples.append({
+                'peak_bytes': peak,
+                'retained_bytes': retained,
+                'result_bytes': holding - retained,
+                'rss_peak_bytes': sampler.peak_delta if sampler is not None else None,
+            })
+    finally:
+        if started_tracemalloc:
+            tracemalloc.stop()
+
+    def median(key: str) -> int:
+        values = sorted(sample[key] for sample in samples)
+        return values[len(values) // 2]
+
+    rss_values = [sample['rss_peak_bytes'] for sample in samples if sample['rss_peak_bytes'] is not None]
+    return {
+        'repeat': repeat,
+        'peak_bytes': max(sample['peak_bytes'] for sample in samples),
+        'retained_bytes': median('retained_bytes'),
+        'result_bytes': median('result_bytes'),
+        'rss_peak_bytes': max(rss_values) if rss_values else None,
+        'samples': samples,
+    }
+
+
+def format_bytes(num_bytes: Optional[float]) -> str:
+    """以合适的单位格式化字节数 | Format a byte count with a suitable unit"""
+    if num_bytes is None:
+        return 'n/a'
+    sign = '-' if num_bytes < 0 else ''
+    value = abs(num_bytes)
+    for unit in ('B', 'KiB', 'MiB'):
+        if value < 1024:
+            return f"{sign}{value:.3g} {unit}" if unit != 'B' else f"{sign}{value:.0f} B"
+        value /= 1024
+    return f"{sign}{value:.3g} GiB"
+
+
+def mountain_data_footprint(sizes: Sequence[int] = (10_000, 100_000)) -> List[Dict[str, Any]]:
+    """
+    测量MountainData每个点的内存占用 | Measure the per-point memory footprint of MountainData
+
+    分别测量数组模式(from_arrays)、物化为BasePoint列表后的点模式和逐点add_point构建的实例，
+    以及to_json()的分配峰值 |
+    Measures array-backed instances (from_arrays), point-backed instances after materializing the
+    BasePoint list, instances built point by point with add_point, and the allocation peak of to_json()
+
+    Args:
+        sizes: 点数列表 | Point counts
+
+    Returns:
+        每种规模和存储方式一行的字典列表 | List of dictionaries, one row per size and storage mode
+    """
+    from pymountain import MountainData
+    from ._data import make_terrain
+
+    rows = []
+    for n in sizes:
+        x, y, z = make_terrain(n)
+        x_list, y_list, z_list = x.tolist(), y.tolist(), z.tolist()
+
+        def arrays():
+            # 复制输入，使数组本身计入占用 | Copy the inputs so the arrays themselves are counted
+            return MountainData.from_arrays(x.copy(), y.copy(), z.copy())
+
+        def points():
+            data = MountainData.from_arrays(x, y, z)
+            data.points
+            return data
+
+        def add_point():
+            data = MountainData()
+            for xi, yi, zi in zip(x_list, y_list, z_list):
+                data.add_point(xi, yi, zi)
+            return data
+
+        for mode, func in (('arrays', arrays), ('points', points), ('add_point', add_point)):
+            stats = measure_memory(func, repeat=1, sample_rss=False)
+            rows.append({'n': n, 'mode': mode, 'bytes': stats['result_bytes'],
+                         'bytes_per_point': stats['result_bytes'] / n, 'peak_bytes': stats['peak_bytes']})
+
+        data = MountainData.from_arrays(x, y, z)
+        stats = measure_memory(data.to_json, repeat=1, sample_rss=False)
+        rows.append({'n': n, 'mode': 'to_json', 'bytes': stats['result_bytes'],
+                     'bytes_per_point': stats['peak_bytes'] / n, 'peak_bytes': stats['peak_bytes']})
+
+    return rows
+
+
+def format_footprint(rows: List[Dict[str, Any]]) -> str:
+    """
+    格式化每点内存报告 | Format the per-point memory report
+
+    Args:
+        rows: mountain_data_footprint()的返回值 | Return value of mountain_data_footprint()
+
+    Returns:
+        报告文本 | Report text
+    """
+    lines = [f"{'n':>10}  {'mode':<10} {'retained':>12} {'per point':>12} {'peak':>12}"]
+    for row in rows:
+        lines.append(f"{row['n']:>10}  {row['mode']:<10} {format_bytes(row['bytes']):>12} "
+                     f"{row['bytes_per_point']:>10.1f} B {format_bytes(row['peak_bytes']):>12}")
+    lines.append("to_json: 'per point' is the allocation peak divided by the point count")
+    return '\n'.join(lines)
+
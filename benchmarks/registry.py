@@ -0,0 +1,97 @@
+"""
+基准测试注册表 | Benchmark registry
+
+基准测试函数接收参数并完成准备工作，返回需要计时的无参可调用对象；准备阶段不计入耗时 |
+A benchmark function receives its parameters, performs the setup and returns the zero-argument
+callable to be timed; the setup is not included in the timing
+"""
+
+import fnmatch
+import itertools
+from dataclasses import dataclass, field
+from typing import Dict, Any, List, Callable, Iterator, Optional, Tuple
+
+
+@dataclass
+class Benchmark:
+    """
+    已注册的基准测试 | Registered benchmark
+
+    Attributes:
+        name: 基准测试名称 | Benchmark name
+        group: 分组（data、interpolation、color、render、serialization、terrain、analysis） | Group (data, interpolation, color, render, serialization, terrain, analysis)
+        func: 准备函数，返回待计时的可调用对象 | Setup function returning the callable to time
+        params: 参数名到候选值列表的映射 | Mapping of parameter names to lists of values
+        description: 简要说明 | Short description
+    """
+    name: str
+    group: str
+    func: Callable[..., Callable[[], Any]]
+    params: Dict[str, List[Any]] = field(default_factory=dict)
+    description: str = ''
+
+    def cases(self, quick: bool = False) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        展开参数组合 | Expand parameter combinations
+
+        Args:
+            quick: 仅使用每个参数的第一个值 | Use only the first value of each parameter
+
+        Yields:
+            (用例ID, 参数字典)元组 | (case ID, parameter dict) tuples
+        """
+        names = list(self.params)
+        values = [self.params[name][:1] if quick else self.params[name] for name in names]
+        for combination in itertools.product(*values):
+            kwargs = dict(zip(names, combination))
+            if kwargs:
+                yield f"{self.name}[{','.join(f'{k}={v}' for k, v in kwargs.items())}]", kwargs
+            else:
+                yield self.name, kwargs
+
+
+# 全局注册表 | Global registry
+_REGISTRY: Dict[str, Benchmark] = {}
+
+
+def benchmark(group: str, name: Optional[str] = None, **params: List[Any]) -> Callable:
+    """
+    注册基准测试的装饰器 | Decorator registering a benchmark
+
+    Args:
+        group: 分组名 | Group name
+        name: 基准测试名称（默认为"group.函数名"） | Benchmark name (defaults to "group.function_name")
+        **params: 参数名到候选值列表的映射 | Mapping of parameter names to lists of values
+
+    Returns:
+        装饰器 | Decorator
+    """
+    def decorator(func: Callable[..., Callable[[], Any]]) -> Callable[..., Callable[[], Any]]:
+        func_name = func.__name__[len('bench_'):] if func.__name__.startswith('bench_') else func.__name__
+        bench_name = name or f"{group}.{func_name}"
+        if bench_name in _REGISTRY:
+            raise ValueError(f"Benchmark already registered: {bench_name}")
+        doc = (func.__doc__ or '').strip().splitlines()
+        _REGISTRY[bench_name] = Benchmark(name=bench_name, group=group, func=func,
+                                          params={key: list(value) for key, value in params.items()},
+                                          description=doc[0] if doc else '')
+        return func
+    return decorator
+
+
+def get_benchmarks(patterns: Optional[List[str]] = None) -> List[Benchmark]:
+    """
+    按名称通配符或分组筛选基准测试 | Select benchmarks by name wildcard or group
+
+    Args:
+        patterns: 通配符列表（匹配名称或分组），None表示全部 | Wildcards matching names or groups (None for all)
+
+    Returns:
+        按名称排序的基准测试列表 | Benchmarks sorted by name
+    """
+    selected = []
+    for bench in _REGISTRY.values():
+        if not patterns or any(fnmatch.fnmatch(bench.name, pattern) or bench.group == pattern
+                               for pattern in patterns):
+            selected.append(bench)
+    return sorted(selected, key=lambda bench: bench.name)
@@ -0,0 +1,362 @@
+"""
+基准测试运行与结果比较 | Benchmark running and result comparison
+
+每个用例先预热一次，再自动确定每个样本的调用次数，使单个样本耗时不低于min_time，
+最后记录repeat个样本的每次调用耗时统计。结果连同机器元数据保存为JSON，compare_results()
+按阈值标记回归和改进 |
+Each case is warmed up once, then the number of calls per sample is chosen so a sample lasts at
+least min_time, and per-call statistics over repeat samples are recorded. Results are saved as
+JSON together with machine metadata, and compare_results() flags regressions and improvements
+beyond a threshold
+
+内存模式(mode='memory')用memory.measure_memory()代替计时，记录每个用例的分配峰值、残留字节和常驻内存增量，
+并以同样方式比较 |
+Memory mode (mode='memory') replaces timing with memory.measure_memory(), recording the allocation
+peak, retained bytes and resident memory growth of each case, which are compared the same way
+"""
+
+import datetime
+import gc
+import json
+import os
+import platform
+import socket
+import statistics
+import subprocess
+import time
+import traceback
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Union, Callable
+
+from .memory import MEMORY_STATS, measure_memory, format_bytes
+from .registry import Benchmark
+
+# 结果文件格式版本 | Result file format version
+SCHEMA_VERSION = 1
+
+# 运行模式 | Run modes
+MODES = ('time', 'memory')
+
+# 计时模式下可比较的统计量 | Statistics comparable in time mode
+TIME_STATS = ('median', 'min', 'mean')
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+
+def collect_metadata() -> Dict[str, Any]:
+    """
+    收集机器和环境元数据 | Collect machine and environment metadata
+
+    Returns:
+        元数据字典 | Metadata dictionary
+    """
+    import numpy
+
+    metadata: Dict[str, Any] = {
+        'timestamp': datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds'),
+        'hostname': socket.gethostname(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'processor': platform.processor(),
+        'cpu_count': os.cpu_count(),
+        'python': platform.python_version(),
+        'python_implementation': platform.python_implementation(),
+        'packages': {'numpy': numpy.__version__},
+    }
+
+    for module_name in ('scipy', 'matplotlib', 'contourpy', 'pymountain'):
+        try:
+            module = __import__(module_name)
+            metadata['packages'][module_name] = getattr(module, '__version__', 'unknown')
+        except ImportError:
+            metadata['packages'][module_name] = None
+
+    try:
+        commit = subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=REPO_ROOT, capture_output=True,
+                                text=True, timeout=10).stdout.strip()
+        dirty = subprocess.run(['git', 'status', '--porcelain', '--untracked-files=no'], cwd=REPO_ROOT,
+                               capture_output=True, text=True, timeout=30).stdout.strip()
+        metadata['git_commit'] = commit or None
+        metadata['git_dirty'] = bool(dirty)
+    except (OSError, subprocess.SubprocessError):
+        metadata['git_commit'] = None
+        metadata['git_dirty'] = None
+
+    return metadata
+
+
+def time_callable(func: Callable[[], Any], repeat: int = 5, min_time: float = 0.05,
+                  max_number: int = 1_000_000) -> Dict[str, Any]:
+    """
+    测量可调用对象的每次调用耗时 | Measure per-call time of a callable
+
+    Args:
+        func: 无参可调用对象 | Zero-argument callable
+        repeat: 样本数 | Number of samples
+        min_time: 单个样本的最短耗时（秒） | Minimum duration of one sample (seconds)
+        max_number: 每个样本的最大调用次数 | Maximum calls per sample
+
+    Returns:
+        包含每次调用耗时统计（秒）的字典 | Dictionary with per-call timing statistics (seconds)
+    """
+    # 预热并估计调用次数 | Warm up and estimate the number of calls
+    start = time.perf_counter()
+    func()
+    first = time.perf_counter() - start
+    number = 1
+    if first < min_time:
+        number = min(max_number, max(1, int(min_time / max(first, 1e-9))))
+
+    samples = []
+    gc_was_enabled = gc.isenabled()
+    gc.collect()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for _ in range(number):
+                func()
+            samples.append((time.perf_counter() - start) / number)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    quartiles = statistics.quantiles(samples, n=4) if len(samples) > 1 else [samples[0]] * 3
+    return {
+        'number': number,
+        'repeat': repeat,
+        'min': min(samples),
+        'median': statistics.median(samples),
+        'mean': statistics.fmean(samples),
+        'stdev': statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        'iqr': quartiles[2] - quartiles[0],
+        'samples': samples,
+    }
+
+
+def run_suite(benchmarks: List[Benchmark], quick: bool = False, repeat: int = 5, min_time: float = 0.05,
+              progress: Optional[Callable[[str], None]] = print, mode: str = 'time') -> Dict[str, Any]:
+    """
+    运行基准测试集 | Run a benchmark suite
+
+    准备或运行失败的用例记录错误后继续 | Cases whose setup or run fails are recorded with the error and skipped
+
+    Args:
+        benchmarks: 基准测试列表 | Benchmarks to run
+        quick: 仅运行每个参数的第一个值 | Run only the first value of each parameter
+        repeat: 样本数 | Number of samples
+        min_time: 单个样本的最短耗时（秒） | Minimum duration of one sample (seconds)
+        progress: 进度输出函数（None表示静默） | Progress output function (None for silent)
+        mode: 'time'测量耗时，'memory'测量内存 | 'time' measures duration, 'memory' measures memory
+
+    Returns:
+        包含元数据和各用例结果的字典 | Dictionary with metadata and per-case results
+    """
+    if mode not in MODES:
+        raise ValueError(f"mode must be one of {MODES}")
+
+    results: Dict[str, Any] = {}
+    for bench in benchmarks:
+        for case_id, params in bench.cases(quick=quick):
+            entry: Dict[str, Any] = {'group': bench.group, 'benchmark': bench.name, 'params': params}
+            try:
+                func = bench.func(**params)
+                if mode == 'memory':
+                    entry.update(measure_memory(func, repeat=repeat))
+                else:
+                    entry.update(time_callable(func, repeat=repeat, min_time=min_time))
+            except Exception as e:
+                message = str(e).splitlines()[0] if str(e) else ''
+                entry['error'] = f"{type(e).__name__}: {message[:200]}"
+                entry['traceback'] = traceback.format_exc()
+            results[case_id] = entry
+            if progress is not None:
+                if 'error' in entry:
+                    progress(f"{case_id:<60} ERROR {entry['error']}")
+                elif mode == 'memory':
+                    progress(f"{case_id:<60} peak {format_bytes(entry['peak_bytes']):>10}  "
+                             f"retained {format_bytes(entry['retained_bytes']):>10}  "
+                             f"rss {format_bytes(entry['rss_peak_bytes']):>10}")
+                else:
+                    progress(f"{case_id:<60} {format_seconds(entry['median']):>10} "
+                             f"(±{format_seconds(entry['iqr'])}, n={entry['number']}x{entry['repeat']})")
+
+    return {
+        'schema': SCHEMA_VERSION,
+        'metadata': collect_metadata(),
+        'settings': {'quick': quick, 'repeat': repeat, 'min_time': min_time, 'mode': mode},
+        'results': results,
+    }
+
+
+def format_seconds(seconds: float) -> str:
+    """以合适的单位格式化时间 | Format a duration with a suitable unit"""
+    for unit, scale in (('s', 1.0), ('ms', 1e-3), ('us', 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.3g} {unit}"
+    return f"{seconds / 1e-9:.3g} ns"
+
+
+def save_results(results: Dict[str, Any], path: Union[str, Path]) -> Path:
+    """
+    保存结果为JSON | Save results as JSON
+
+    Args:
+        results: run_suite()的返回值 | Return value of run_suite()
+        path: 文件路径 | File path
+
+    Returns:
+        文件路径 | File path
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(results, indent=2, sort_keys=True))
+    return path
+
+
+def load_results(path: Union[str, Path]) -> Dict[str, Any]:
+    """
+    加载JSON结果 | Load JSON results
+
+    Args:
+        path: 文件路径 | File path
+
+    Returns:
+        结果字典 | Results dictionary
+    """
+    results = json.loads(Path(path).read_text())
+    if results.get('schema') != SCHEMA_VERSION:
+        raise ValueError(f"{path}: unsupported benchmark result schema {results.get('schema')!r}")
+    return results
+
+
+def compare_results(baseline: Dict[str, Any], current: Dict[str, Any], threshold: float = 0.1,
+                    stat: Optional[str] = None, min_bytes: int = 64 * 1024) -> Dict[str, Any]:
+    """
+    比较两次运行的结果 | Compare the results of two runs
+
+    当前值超过基线(1 + threshold)倍时记为回归，低于基线/(1 + threshold)时记为改进 |
+    A case regresses when the current value exceeds (1 + threshold) times the baseline and
+    improves when it falls below baseline / (1 + threshold)
+
+    内存统计量的变化还需超过min_bytes，以免几KB的波动在小基线上被放大 |
+    Changes in memory statistics must also exceed min_bytes, so a few kilobytes of noise on a small
+    baseline are not flagged
+
+    Args:
+        baseline: 基线结果 | Baseline results
+        current: 当前结果 | Current results
+        threshold: 相对阈值 | Relative threshold
+        stat: 比较的统计量：计时模式为'median'、'min'或'mean'，内存模式为'peak_bytes'、'retained_bytes'、
+            'result_bytes'或'rss_peak_bytes'（默认分别为'median'和'peak_bytes'） |
+            Statistic to compare: 'median', 'min' or 'mean' in time mode, 'peak_bytes', 'retained_bytes',
+            'result_bytes' or 'rss_peak_bytes' in memory mode (defaults to 'median' and 'peak_bytes')
+        min_bytes: 内存统计量的最小绝对变化 | Minimum absolute change of memory statistics
+
+    Returns:
+        包含regressions、improvements、unchanged、missing、added和errors列表的字典 |
+        Dictionary with regressions, improvements, unchanged, missing, added and errors lists
+    """
+    if threshold < 0:
+        raise ValueError("threshold must be >= 0")
+    base_mode = baseline.get('settings', {}).get('mode', 'time')
+    current_mode = current.get('settings', {}).get('mode', 'time')
+    if base_mode != current_mode:
+        raise ValueError(f"cannot compare a {base_mode} run with a {current_mode} run")
+    valid_stats = MEMORY_STATS if current_mode == 'memory' else TIME_STATS
+    if stat is None:
+        stat = valid_stats[0]
+    if stat not in valid_stats:
+        raise ValueError(f"stat for {current_mode} mode must be one of {valid_stats}")
+    is_memory = current_mode == 'memory'
+
+    base_results, current_results = baseline['results'], current['results']
+    report: Dict[str, Any] = {'threshold': threshold, 'stat': stat, 'mode': current_mode,
+                              'regressions': [], 'improvements': [],
+                              'unchanged': [], 'missing': [], 'added': [], 'errors': []}
+
+    # 不同机器或解释器上的结果不可直接比较 | Results from different machines or interpreters are not directly comparable
+    base_meta, current_meta = baseline.get('metadata', {}), current.get('metadata', {})
+    report['environment_differences'] = {
+        key: (base_meta.get(key), current_meta.get(key))
+        for key in ('hostname', 'machine', 'processor', 'cpu_count', 'python', 'packages')
+        if base_meta.get(key) != current_meta.get(key)
+    }
+
+    for case_id in sorted(set(base_results) | set(current_results)):
+        base, cur = base_results.get(case_id), current_results.get(case_id)
+        if cur is None:
+            report['missing'].append(case_id)
+            continue
+        if base is None:
+            report['added'].append(case_id)
+            continue
+        if 'error' in cur or 'error' in base:
+            report['errors'].append({'case': case_id, 'error': cur.get('error') or base.get('error')})
+            continue
+
+        base_value, cur_value = base.get(stat), cur.get(stat)
+        if base_value is None or cur_value is None:
+            # 例如无法采样常驻内存的平台 | e.g. platforms where resident memory cannot be sampled
+            report['errors'].append({'case': case_id, 'error': f"{stat} not recorded"})
+            continue
+
+        if base_value > 0:
+            ratio = cur_value / base_value
+        else:
+            ratio = 1.0 if cur_value <= base_value else float('inf')
+        row = {'case': case_id, 'baseline': base_value, 'current': cur_value, 'ratio': ratio}
+        significant = not is_memory or abs(cur_value - base_value) > min_bytes
+        if significant and ratio > 1 + threshold:
+            report['regressions'].append(row)
+        elif significant and ratio < 1 / (1 + threshold):
+            report['improvements'].append(row)
+        else:
+            report['unchanged'].append(row)
+
+    report['regressions'].sort(key=lambda row: row['ratio'], reverse=True)
+    report['improvements'].sort(key=lambda row: row['ratio'])
+    return report
+
+
+def format_comparison(report: Dict[str, Any], verbose: bool = False) -> str:
+    """
+    格式化比较报告 | Format a comparison report
+
+    Args:
+        report: compare_results()的返回值 | Return value of compare_results()
+        verbose: 是否列出未变化的用例 | Whether to list unchanged cases
+
+    Returns:
+        报告文本 | Report text
+    """
+    is_memory = report.get('mode') == 'memory'
+    fmt = format_bytes if is_memory else format_seconds
+    lines = [f"Comparison of {report['stat']}{'' if is_memory else ' times'}, threshold {report['threshold']:.0%}"]
+    for key, (base_value, current_value) in report.get('environment_differences', {}).items():
+        lines.append(f"WARNING: {key} differs: {base_value} -> {current_value}")
+
+    def table(title: str, rows: List[Dict[str, Any]]) -> None:
+        if not rows:
+            return
+        lines.append(f"\n{title} ({len(rows)}):")
+        for row in rows:
+            lines.append(f"  {row['case']:<60} {fmt(row['baseline']):>10} -> "
+                         f"{fmt(row['current']):>10}  x{row['ratio']:.2f}")
+
+    table('REGRESSIONS', report['regressions'])
+    table('Improvements', report['improvements'])
+    if verbose:
+        table('Unchanged', report['unchanged'])
+    else:
+        lines.append(f"\nUnchanged: {len(report['unchanged'])}")
+
+    for title, key in (('Missing from current run', 'missing'), ('New in current run', 'added')):
+        if report[key]:
+            lines.append(f"\n{title} ({len(report[key])}):")
+            lines.extend(f"  {case_id}" for case_id in report[key])
+    if report['errors']:
+        lines.append(f"\nErrors ({len(report['errors'])}):")
+        lines.extend(f"  {item['case']}: {item['error']}" for item in report['errors'])
+
+    return '\n'.join(lines)
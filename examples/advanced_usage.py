@@ -16,7 +16,8 @@ from pymountain import (
     cubic_interpolation,
     rbf_interpolation,
     create_elevation_colormap,
-    apply_color_mapping
+    apply_color_mapping,
+    profile,
 )
 
 plt.rcParams['font.sans-serif'] = ['SimHei']
@@ -327,6 +328,17 @@ def performance_analysis():
     print("性能分析结果已保存到 output/performance_analysis.png")
     plt.show()
 
+    # 分阶段剖析最大数据量的渲染 | Profile each stage of the largest render
+    with profile() as prof:
+        renderer = Matplotlib3DRenderer(config={'colormap': 'viridis'})
+        renderer.render(data)
+        renderer.save_figure('output/performance_profile.png')
+        renderer.close()
+
+    print(prof.format_summary())
+    prof.to_chrome_trace('output/performance_trace.json')
+    print("阶段跟踪已保存到 output/performance_trace.json（可在chrome://tracing中打开）")
+
     return performance_results
 
 
@@ -28,24 +28,78 @@ __author__ = "PyMountain Team"
 __email__ = "pymountain@example.com"
 __license__ = "MIT"
 
-# 核心模块导入 | Core module imports
+import importlib
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+# 核心模块导入（仅依赖NumPy） | Core module imports (NumPy only)
 from .core.data import BasePoint, MountainData
-from .core.renderer import BaseRenderer
-from .renderers.matplotlib_renderer import (
-    MatplotlibRenderer,
-    Matplotlib3DRenderer,
-    MatplotlibContourRenderer,
-)
-from .utils.interpolation import (
-    linear_interpolation,
-    cubic_interpolation,
-    rbf_interpolation,
-)
-from .utils.color_mapping import (
-    ColorMapper,
-    create_elevation_colormap,
-    apply_color_mapping,
-)
+from .core.grid import GridData
+from .core.renderer import BaseRenderer, RenderingError
+from .core.profiling import profile, register_hook, unregister_hook, Profiler, StageRecord
+from .utils.resources import ResourceManager, get_resource_manager
+
+# 延迟导入：依赖matplotlib/scipy的名称在首次访问时才导入 |
+# Lazy imports: names depending on matplotlib/scipy are imported on first access
+_LAZY_IMPORTS = {
+    # Matplotlib渲染器 | Matplotlib renderers
+    "MatplotlibRenderer": ".renderers.matplotlib_renderer",
+    "Matplotlib3DRenderer": ".renderers.matplotlib_renderer",
+    "MatplotlibContourRenderer": ".renderers.matplotlib_renderer",
+    "MatplotlibProfileRenderer": ".renderers.matplotlib_renderer",
+    # 软件渲染器 | Software renderer
+    "SoftwareRenderer3D": ".renderers.software_renderer",
+    # 插值工具 | Interpolation utilities
+    "linear_interpolation": ".utils.interpolation",
+    "cubic_interpolation": ".utils.interpolation",
+    "rbf_interpolation": ".utils.interpolation",
+    # 颜色映射工具 | Color mapping utilities
+    "ColorMapper": ".utils.color_mapping",
+    "create_elevation_colormap": ".utils.color_mapping",
+    "apply_color_mapping": ".utils.color_mapping",
+    # 栅格读取 | Raster reading
+    "read_raster": ".utils.raster_io",
+}
+
+# 按需加载的子包 | Subpackages loaded on demand
+_LAZY_SUBMODULES = ("core", "renderers", "utils", "services", "analysis", "cli")
+
+if TYPE_CHECKING:
+    from .renderers.matplotlib_renderer import (
+        MatplotlibRenderer,
+        Matplotlib3DRenderer,
+        MatplotlibContourRenderer,
+        MatplotlibProfileRenderer,
+    )
+    from .renderers.software_renderer import SoftwareRenderer3D
+    from .utils.interpolation import (
+        linear_interpolation,
+        cubic_interpolation,
+        rbf_interpolation,
+    )
+    from .utils.color_mapping import (
+        ColorMapper,
+        create_elevation_colormap,
+        apply_color_mapping,
+    )
+    from .utils.raster_io import read_raster
+
+
+def __getattr__(name: str):
+    """按需导入公共名称和子包 | Import public names and subpackages on demand"""
+    if name in _LAZY_SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS) | set(_LAZY_SUBMODULES))
 
 # 公共API | Public API
 __all__ = [
@@ -57,12 +111,22 @@ __all__ = [
     # 核心数据类 | Core data classes
     "BasePoint",
     "MountainData",
+    "GridData",
     # 渲染器基类 | Renderer base class
     "BaseRenderer",
+    # 性能剖析 | Profiling
+    "profile",
+    "register_hook",
+    "unregister_hook",
+    "Profiler",
+    "StageRecord",
     # Matplotlib渲染器 | Matplotlib renderers
     "MatplotlibRenderer",
     "Matplotlib3DRenderer",
     "MatplotlibContourRenderer",
+    "MatplotlibProfileRenderer",
+    # 软件渲染器 | Software renderer
+    "SoftwareRenderer3D",
     # 插值工具 | Interpolation utilities
     "linear_interpolation",
     "cubic_interpolation",
@@ -71,6 +135,11 @@ __all__ = [
     "ColorMapper",
     "create_elevation_colormap",
     "apply_color_mapping",
+    # 栅格读取 | Raster reading
+    "read_raster",
+    # 资源管理 | Resource management
+    "ResourceManager",
+    "get_resource_manager",
 ]
 
 # 包级别配置 | Package-level configuration
@@ -92,6 +161,10 @@ class Config:
     MAX_POINTS_FOR_REALTIME = 10000
     INTERPOLATION_GRID_SIZE = 100
     
+    # 内存预算（None表示不限制） | Memory budget (None for unlimited)
+    MEMORY_BUDGET_BYTES = None
+    MEMORY_EVICTION_POLICY = "lru"
+    
     @classmethod
     def set_default_interpolation(cls, method: str) -> None:
         """设置默认插值方法 | Set default interpolation method"""
@@ -109,6 +182,24 @@ class Config:
         """设置性能限制 | Set performance limits"""
         cls.MAX_POINTS_FOR_REALTIME = max_points
         cls.INTERPOLATION_GRID_SIZE = grid_size
+    
+    @classmethod
+    def set_memory_budget(cls, budget_bytes, policy: str = "lru") -> None:
+        """
+        设置所有缓存共享的内存预算 | Set the memory budget shared by all caches
+        
+        Args:
+            budget_bytes: 字节预算（None表示不限制） | Byte budget (None for unlimited)
+            policy: 淘汰策略（"lru"或"cost"） | Eviction policy ("lru" or "cost")
+        """
+        get_resource_manager().set_budget(budget_bytes, policy)
+        cls.MEMORY_BUDGET_BYTES = budget_bytes
+        cls.MEMORY_EVICTION_POLICY = policy
+    
+    @classmethod
+    def get_memory_usage(cls) -> dict:
+        """获取缓存内存用量和淘汰统计 | Get cache memory usage and eviction statistics"""
+        return get_resource_manager().get_stats()
 
 
 # 全局配置实例 | Global configuration instance
@@ -134,34 +225,146 @@ def get_info() -> dict:
 
 
 # 便捷函数 | Convenience functions
-def quick_render(points, renderer_type="3d", **kwargs):
+def _as_mountain_data(points, x=None, y=None, z=None) -> MountainData:
+    """
+    将各种点数据输入转换为MountainData | Convert the supported point inputs to MountainData
+    
+    Args:
+        points: MountainData、DataFrame、(N, 3)数组或[(x, y, z), ...]列表 |
+                MountainData, DataFrame, (N, 3) array or [(x, y, z), ...] list
+        x: X坐标数组（与y、z一起代替points） | X coordinate array (together with y and z instead of points)
+        y: Y坐标数组 | Y coordinate array
+        z: Z坐标数组 | Z coordinate array
+    
+    Returns:
+        MountainData实例 | MountainData instance
+        
+    Raises:
+        ValueError: 输入无法解释为(N, 3)点集 | Input cannot be interpreted as an (N, 3) point set
+    """
+    if points is None:
+        if x is None or y is None or z is None:
+            raise ValueError("Either points or all of x, y and z must be given")
+        return MountainData.from_arrays(x, y, z)
+    
+    if x is not None or y is not None or z is not None:
+        raise ValueError("points and x/y/z are mutually exclusive")
+    
+    if isinstance(points, MountainData):
+        return points
+    
+    # DataFrame（鸭子类型，避免导入pandas） | DataFrame (duck-typed to avoid importing pandas)
+    if hasattr(points, 'columns') and hasattr(points, 'to_numpy'):
+        if all(column in points.columns for column in ('x', 'y', 'z')):
+            return MountainData.from_arrays(*(points[column].to_numpy(dtype=np.float64) for column in ('x', 'y', 'z')))
+        return MountainData.from_xyz(points.to_numpy(dtype=np.float64)[:, :3])
+    
+    array = np.asarray(points, dtype=np.float64)
+    if array.size == 0:
+        array = array.reshape(0, 3)
+    if array.ndim != 2 or array.shape[1] != 3:
+        raise ValueError(f"points must be an (N, 3) array or a sequence of (x, y, z) tuples, got shape {array.shape}")
+    return MountainData.from_xyz(array)
+
+
+def _reduce_level_of_detail(data: MountainData, grid_size: int) -> MountainData:
+    """
+    将点云按网格单元平均以降低细节层次 | Reduce level of detail by averaging the points in each grid cell
+    
+    每个非空单元输出一个点（坐标和高程取单元内均值），点数不超过grid_size² |
+    Each non-empty cell yields one point (mean coordinates and elevation), so at most grid_size² points remain
+    
+    Args:
+        data: 山体数据对象 | Mountain data object
+        grid_size: 每个轴上的单元数 | Number of cells per axis
+    
+    Returns:
+        降采样后的MountainData实例 | Decimated MountainData instance
+        
+    Raises:
+        RenderingError: 数据包含NaN或无穷值 | Data contains NaN or infinite values
+    """
+    x, y, z = data.to_numpy_arrays()
+    
+    # 与渲染路径相同的校验：非有限坐标会产生无效的单元索引 |
+    # Same validation as the render path: non-finite coordinates would yield invalid cell indices
+    for array in (x, y, z):
+        if not np.isfinite(array).all():
+            reason = "Data contains NaN values" if np.isnan(array).any() else "Data contains infinite values"
+            raise RenderingError(f"Data preparation failed: {reason}")
+    bounds = data.get_bounds()
+    span_x = (bounds['max_x'] - bounds['min_x']) or 1.0
+    span_y = (bounds['max_y'] - bounds['min_y']) or 1.0
+    
+    col = np.minimum(((x - bounds['min_x']) * (grid_size / span_x)).astype(np.intp), grid_size - 1)
+    row = np.minimum(((y - bounds['min_y']) * (grid_size / span_y)).astype(np.intp), grid_size - 1)
+    cell = row * grid_size + col
+    
+    counts = np.bincount(cell, minlength=grid_size * grid_size)
+    occupied = counts > 0
+    counts = counts[occupied]
+    averages = [np.bincount(cell, weights=values, minlength=grid_size * grid_size)[occupied] / counts
+                for values in (x, y, z)]
+    
+    metadata = dict(data.metadata)
+    metadata['lod'] = {'source_points': len(data), 'grid_size': grid_size, 'points': int(len(counts))}
+    return MountainData.from_arrays(*averages, metadata=metadata)
+
+
+def quick_render(points=None, renderer_type="3d", *, x=None, y=None, z=None, lod=True, **kwargs):
     """
     快速渲染山体数据的便捷函数 | Convenience function for quick mountain data rendering
     
+    数组和DataFrame输入不经过逐点的Python处理。"auto"模式根据Config.MAX_POINTS_FOR_REALTIME
+    选择渲染器；点数超过该值时按Config.INTERPOLATION_GRID_SIZE网格平均降采样 |
+    Array and DataFrame inputs involve no per-point Python work. "auto" mode selects the renderer from
+    Config.MAX_POINTS_FOR_REALTIME; above that point count the data is averaged onto a
+    Config.INTERPOLATION_GRID_SIZE grid
+    
     Args:
-        points: 点数据列表，格式为[(x, y, z), ...] | Point data list in format [(x, y, z), ...]
+        points: 点数据，可为[(x, y, z), ...]列表、(N, 3)数组、含x/y/z列的DataFrame、MountainData或GridData |
+                Point data: [(x, y, z), ...] list, (N, 3) array, DataFrame with x/y/z columns, MountainData or GridData
         renderer_type: 渲染器类型 | Renderer type ("3d", "contour", "auto")
+        x: X坐标数组（代替points） | X coordinate array (instead of points)
+        y: Y坐标数组 | Y coordinate array
+        z: Z坐标数组 | Z coordinate array
+        lod: 点数超过实时上限时是否降采样 | Whether to decimate when the point count exceeds the realtime limit
         **kwargs: 传递给渲染器的额外参数 | Additional parameters for renderer
     
     Returns:
         渲染器实例 | Renderer instance
     """
-    # 创建数据对象 | Create data object
-    data = MountainData()
-    for x, y, z in points:
-        data.add_point(x, y, z)
+    # 创建数据对象（GridData直接渲染，由渲染器按grid_resolution重采样） |
+    # Create data object (GridData is rendered directly and resampled to grid_resolution by the renderer)
+    if isinstance(points, GridData):
+        data = points
+        over_budget = points.size > Config.MAX_POINTS_FOR_REALTIME
+    else:
+        data = _as_mountain_data(points, x, y, z)
+        over_budget = len(data) > Config.MAX_POINTS_FOR_REALTIME
     
     # 准备渲染器配置 | Prepare renderer configuration
     config_dict = kwargs.copy()
+    config_dict.setdefault('grid_resolution', Config.INTERPOLATION_GRID_SIZE)
+    if over_budget:
+        # 大数据集上cubic和rbf插值代价过高 | cubic and rbf interpolation are too costly on large datasets
+        config_dict.setdefault('interpolation_method', 'linear')
+    
+    # 细节层次：超出网格分辨率的点不会增加插值表面的细节 |
+    # Level of detail: points beyond the grid resolution add no detail to the interpolated surface
+    if lod and over_budget and isinstance(data, MountainData):
+        data = _reduce_level_of_detail(data, config_dict['grid_resolution'])
     
     # 选择渲染器 | Select renderer
+    from .renderers.matplotlib_renderer import Matplotlib3DRenderer, MatplotlibContourRenderer
+    
     if renderer_type == "3d":
         renderer = Matplotlib3DRenderer(config=config_dict)
     elif renderer_type == "contour":
         renderer = MatplotlibContourRenderer(config=config_dict)
     else:  # auto
-        # 根据数据点数量自动选择 | Auto-select based on data point count
-        if len(points) > 1000:
+        # 根据数据点数量和实时上限自动选择 | Auto-select based on point count and the realtime limit
+        if over_budget:
             renderer = MatplotlibContourRenderer(config=config_dict)
         else:
             renderer = Matplotlib3DRenderer(config=config_dict)
@@ -0,0 +1,7 @@
+"""允许通过python -m pymountain运行命令行 | Allow running the CLI via python -m pymountain"""
+
+import sys
+
+from .cli import main
+
+sys.exit(main())
@@ -0,0 +1,48 @@
+"""
+PyMountain地形分析模块 | PyMountain terrain analysis module
+
+在规则网格(GridData)上运行的矢量化地形分析。结果同样是GridData，可直接交给渲染器和ColorMapper |
+Vectorized terrain analysis on regular grids (GridData). Results are GridData as well, so they go
+straight to the renderers and ColorMapper
+"""
+
+# 地形导数 | Terrain derivatives
+from .derivatives import slope, aspect, curvature, roughness, hillshade, terrain_derivatives
+
+# 高程剖面 | Elevation profiles
+from .profiles import ElevationProfile, ProfileSet, ProfileSampler, extract_profiles, densify_polylines
+
+# 可视域与通视 | Viewshed and line of sight
+from .viewshed import viewshed, viewsheds, line_of_sight
+
+# 水文分析 | Hydrology
+from .hydrology import fill_depressions, flow_direction, flow_accumulation, watersheds, hydrology
+
+# 最小成本路径 | Least-cost paths
+from .routing import RoutePath, cost_surface, least_cost_path, cost_distance
+
+__all__ = [
+    "slope",
+    "aspect",
+    "curvature",
+    "roughness",
+    "hillshade",
+    "terrain_derivatives",
+    "ElevationProfile",
+    "ProfileSet",
+    "ProfileSampler",
+    "extract_profiles",
+    "densify_polylines",
+    "viewshed",
+    "viewsheds",
+    "line_of_sight",
+    "fill_depressions",
+    "flow_direction",
+    "flow_accumulation",
+    "watersheds",
+    "hydrology",
+    "RoutePath",
+    "cost_surface",
+    "least_cost_path",
+    "cost_distance",
+]
@@ -0,0 +1,327 @@
+"""
+PyMountain地形导数模块 | PyMountain terrain derivatives module
+
+在规则网格上用3x3有限差分核计算坡度、坡向、剖面/平面曲率、粗糙度和山体阴影。
+一阶导数使用Horn公式，二阶导数使用Zevenbergen-Thorne公式。大网格按带有1个单元光环的重叠瓦片处理
+（可选多线程），内存占用与瓦片大小成正比。无数据邻居用中心单元代替，无数据单元的结果为NaN |
+Computes slope, aspect, profile/plan curvature, roughness and hillshade on regular grids with 3x3
+finite-difference kernels: Horn's formula for first derivatives and Zevenbergen-Thorne for second
+derivatives. Large grids are processed in overlapping tiles with a one-cell halo (optionally on
+several threads), so memory use scales with the tile size. Missing neighbours are replaced by the
+center cell, and missing cells give NaN
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, Tuple, Union, Callable, Iterable
+
+import numpy as np
+
+from ..core.data import MountainData
+from ..core.grid import GridData, as_grid
+
+
+# 可计算的地形导数 | Available terrain derivatives
+DERIVATIVES = ('slope', 'aspect', 'curvature', 'roughness', 'hillshade')
+
+SLOPE_UNITS = ('degrees', 'radians', 'percent')
+CURVATURE_KINDS = ('profile', 'plan', 'total')
+
+# 默认瓦片边长（单元） | Default tile edge length (cells)
+DEFAULT_TILE_SIZE = 1024
+
+# 3x3邻域在带光环块中的切片偏移，按行优先编号z1..z9 | Offsets of the 3x3 neighbourhood in a haloed block, numbered z1..z9 row-major
+_OFFSETS = [(dr, dc) for dr in range(3) for dc in range(3)]
+
+
+def slope(data: Union[GridData, MountainData], units: str = 'degrees', z_factor: float = 1.0,
+          **options) -> GridData:
+    """
+    计算坡度 | Compute slope
+
+    Args:
+        data: 规则网格或山体数据（散点先经as_grid()网格化） | Regular grid or mountain data (scattered points are gridded with as_grid() first)
+        units: 'degrees'、'radians'或'percent' | 'degrees', 'radians' or 'percent'
+        z_factor: 高程单位到水平单位的换算系数 | Conversion factor from elevation units to horizontal units
+        **options: 瓦片参数（见terrain_derivatives()） | Tiling options (see terrain_derivatives())
+
+    Returns:
+        坡度网格 | Slope grid
+    """
+    return terrain_derivatives(data, {'slope': {'units': units}}, z_factor=z_factor, **options)['slope']
+
+
+def aspect(data: Union[GridData, MountainData], **options) -> GridData:
+    """
+    计算坡向：下坡方向，从正北顺时针的度数[0, 360)，平坦单元为NaN |
+    Compute aspect: the downslope direction in degrees clockwise from north in [0, 360); flat cells are NaN
+
+    Args:
+        data: 规则网格或山体数据 | Regular grid or mountain data
+        **options: 瓦片参数（见terrain_derivatives()） | Tiling options (see terrain_derivatives())
+
+    Returns:
+        坡向网格 | Aspect grid
+    """
+    return terrain_derivatives(data, ('aspect',), **options)['aspect']
+
+
+def curvature(data: Union[GridData, MountainData], kind: str = 'profile', z_factor: float = 1.0,
+              **options) -> GridData:
+    """
+    计算曲率（正值为凸，单位为1/水平单位） | Compute curvature (positive is convex, in 1/horizontal units)
+
+    'profile'为沿坡度方向的法曲率，'plan'为等高线曲率，'total'为负拉普拉斯算子 |
+    'profile' is the normal curvature along the slope direction, 'plan' is the contour curvature,
+    'total' is the negative Laplacian
+
+    Args:
+        data: 规则网格或山体数据 | Regular grid or mountain data
+        kind: 'profile'、'plan'或'total' | 'profile', 'plan' or 'total'
+        z_factor: 高程单位到水平单位的换算系数 | Conversion factor from elevation units to horizontal units
+        **options: 瓦片参数（见terrain_derivatives()） | Tiling options (see terrain_derivatives())
+
+    Returns:
+        曲率网格 | Curvature grid
+    """
+    return terrain_derivatives(data, {'curvature': {'kind': kind}}, z_factor=z_factor, **options)['curvature']
+
+
+def roughness(data: Union[GridData, MountainData], **options) -> GridData:
+    """
+    计算粗糙度：3x3邻域内最大与最小高程之差 | Compute roughness: the range of elevations in the 3x3 neighbourhood
+
+    Args:
+        data: 规则网格或山体数据 | Regular grid or mountain data
+        **options: 瓦片参数（见terrain_derivatives()） | Tiling options (see terrain_derivatives())
+
+    Returns:
+        粗糙度网格 | Roughness grid
+    """
+    return terrain_derivatives(data, ('roughness',), **options)['roughness']
+
+
+def hillshade(data: Union[GridData, MountainData], azimuth: float = 315.0, altitude: float = 45.0,
+              z_factor: float = 1.0, **options) -> GridData:
+    """
+    计算山体阴影：表面法线与光照方向夹角的余弦，范围[0, 1] | Compute hillshade: cosine between the surface normal and the light direction, in [0, 1]
+
+    结果可用ColorMapper('gray')映射，或与高程颜色相乘得到晕渲图 |
+    The result can be mapped with ColorMapper('gray') or multiplied with elevation colors for shaded relief
+
+    Args:
+        data: 规则网格或山体数据 | Regular grid or mountain data
+        azimuth: 光源方位角（从正北顺时针的度数） | Light azimuth (degrees clockwise from north)
+        altitude: 光源高度角（度） | Light altitude (degrees)
+        z_factor: 高程单位到水平单位的换算系数 | Conversion factor from elevation units to horizontal units
+        **options: 瓦片参数（见terrain_derivatives()） | Tiling options (see terrain_derivatives())
+
+    Returns:
+        山体阴影网格 | Hillshade grid
+    """
+    products = {'hillshade': {'azimuth': azimuth, 'altitude': altitude}}
+    return terrain_derivatives(data, products, z_factor=z_factor, **options)['hillshade']
+
+
+def terrain_derivatives(data: Union[GridData, MountainData],
+                        products: Union[Iterable[str], Dict[str, Dict[str, Any]]] = DERIVATIVES,
+                        z_factor: float = 1.0, tile_size: int = DEFAULT_TILE_SIZE,
+                        workers: Optional[int] = None, dtype: Any = np.float32,
+                        resolution: Optional[int] = None) -> Dict[str, GridData]:
+    """
+    在一次瓦片遍历中计算多个地形导数 | Compute several terrain derivatives in one tiled pass
+
+    每个瓦片只读取一次并共享有限差分结果。NumPy运算释放GIL，因此workers > 1时瓦片在线程池中并行计算 |
+    Each tile is read once and its finite differences are shared between products. NumPy releases
+    the GIL, so tiles run in parallel on a thread pool when workers > 1
+
+    Args:
+        data: 规则网格或山体数据 | Regular grid or mountain data
+        products: 导数名称列表，或名称到参数字典的映射（slope: units；curvature: kind；hillshade: azimuth、altitude） |
+            Derivative names, or a mapping of names to parameter dictionaries (slope: units; curvature: kind;
+            hillshade: azimuth, altitude)
+        z_factor: 高程单位到水平单位的换算系数 | Conversion factor from elevation units to horizontal units
+        tile_size: 瓦片边长（单元） | Tile edge length (cells)
+        workers: 线程数（None或1为串行） | Number of threads (None or 1 runs serially)
+        dtype: 输出浮点类型 | Output floating-point dtype
+        resolution: 散点数据网格化的分辨率（见GridData.from_mountain_data()） | Gridding resolution for scattered data (see GridData.from_mountain_data())
+
+    Returns:
+        导数名称到GridData的字典 | Dictionary of derivative names to GridData
+
+    Raises:
+        ValueError: 导数名称或参数无效，或网格有旋转 | Invalid derivative name or parameter, or the grid is rotated
+    """
+    grid = as_grid(data, resolution=resolution)
+    if grid.is_rotated:
+        raise ValueError("Terrain derivatives require a grid without rotation")
+    if tile_size < 1:
+        raise ValueError("tile_size must be >= 1")
+
+    products = _normalize_products(products)
+    _, width, _, _, _, height = grid.transform
+    rows, cols = grid.shape
+    outputs = {name: np.empty((rows, cols), dtype=dtype) for name in products}
+    kernel = _make_kernel(products, width, height, z_factor)
+
+    tiles = [(r, min(r + tile_size, rows), c, min(c + tile_size, cols))
+             for r in range(0, rows, tile_size) for c in range(0, cols, tile_size)]
+
+    def run(tile: Tuple[int, int, int, int]) -> None:
+        r0, r1, c0, c1 = tile
+        block = read_haloed_block(grid, r0, r1, c0, c1, halo=1)
+        for name, values in kernel(block).items():
+            outputs[name][r0:r1, c0:c1] = values
+
+    if workers is not None and workers > 1 and len(tiles) > 1:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(run, tiles))
+    else:
+        for tile in tiles:
+            run(tile)
+
+    return {name: GridData(values, grid.transform, metadata={'product': name, **products[name]})
+            for name, values in outputs.items()}
+
+
+def read_haloed_block(grid: GridData, r0: int, r1: int, c0: int, c1: int, halo: int = 1) -> np.ndarray:
+    """
+    读取带光环的float64块，网格外和无数据单元为NaN | Read a float64 block with a halo; cells outside the grid and missing cells are NaN
+
+    Args:
+        grid: 规则网格 | Regular grid
+        r0: 起始行 | First row
+        r1: 结束行（不含） | Stop row (exclusive)
+        c0: 起始列 | First column
+        c1: 结束列（不含） | Stop column (exclusive)
+        halo: 光环宽度（单元） | Halo width (cells)
+
+    Returns:
+        形状为(r1 - r0 + 2 * halo, c1 - c0 + 2 * halo)的数组 | Array of shape (r1 - r0 + 2 * halo, c1 - c0 + 2 * halo)
+    """
+    rows, cols = grid.shape
+    block = np.full((r1 - r0 + 2 * halo, c1 - c0 + 2 * halo), np.nan)
+    sr0, sr1 = max(r0 - halo, 0), min(r1 + halo, rows)
+    sc0, sc1 = max(c0 - halo, 0), min(c1 + halo, cols)
+    target = block[sr0 - r0 + halo:sr1 - r0 + halo, sc0 - c0 + halo:sc1 - c0 + halo]
+    target[...] = grid.z[sr0:sr1, sc0:sc1]
+    if grid.has_nodata():
+        target[~grid.valid_mask()[sr0:sr1, sc0:sc1]] = np.nan
+    return block
+
+
+def _normalize_products(products: Union[Iterable[str], Dict[str, Dict[str, Any]]]) -> Dict[str, Dict[str, Any]]:
+    """规范化并验证导数参数 | Normalize and validate derivative parameters"""
+    if not isinstance(products, dict):
+        products = {name: {} for name in products}
+    if not products:
+        raise ValueError("At least one derivative must be requested")
+
+    defaults = {
+        'slope': {'units': 'degrees'},
+        'aspect': {},
+        'curvature': {'kind': 'profile'},
+        'roughness': {},
+        'hillshade': {'azimuth': 315.0, 'altitude': 45.0},
+    }
+    normalized = {}
+    for name, params in products.items():
+        if name not in defaults:
+            raise ValueError(f"Unknown derivative '{name}', expected one of {DERIVATIVES}")
+        unknown = set(params) - set(defaults[name])
+        if unknown:
+            raise ValueError(f"Unknown parameters for {name}: {sorted(unknown)}")
+        normalized[name] = {**defaults[name], **params}
+
+    if 'slope' in normalized and normalized['slope']['units'] not in SLOPE_UNITS:
+        raise ValueError(f"units must be one of {SLOPE_UNITS}")
+    if 'curvature' in normalized and normalized['curvature']['kind'] not in CURVATURE_KINDS:
+        raise ValueError(f"kind must be one of {CURVATURE_KINDS}")
+    return normalized
+
+
+def _make_kernel(products: Dict[str, Dict[str, Any]], width: float, height: float,
+                 z_factor: float) -> Callable[[np.ndarray], Dict[str, np.ndarray]]:
+    """
+    构建在带光环块上计算所需导数的函数 | Build the function computing the requested derivatives on a haloed block
+
+    height对北向上网格为负，使q为向北的梯度；z_factor作用于高程差，使一阶和二阶导数都随其线性缩放 |
+    height is negative for north-up grids, so q is the northward gradient; z_factor scales elevation
+    differences, so first and second derivatives both scale linearly with it
+    """
+    needs_first = any(name in products for name in ('slope', 'aspect', 'curvature', 'hillshade'))
+    needs_second = 'curvature' in products
+
+    def kernel(block: np.ndarray) -> Dict[str, np.ndarray]:
+        z = [block[dr:dr + block.shape[0] - 2, dc:dc + block.shape[1] - 2] for dr, dc in _OFFSETS]
+        center = z[4]
+        missing = np.isnan(center)
+        if np.isnan(block).any():
+            # 无数据邻居用中心单元代替 | Missing neighbours take the center value
+            z = [center if k == 4 else np.where(np.isnan(v), center, v) for k, v in enumerate(z)]
+        z1, z2, z3, z4, z5, z6, z7, z8, z9 = z
+
+        results = {}
+        if needs_first:
+            # Horn公式，原地运算以减少临时数组 | Horn's formula, computed in place to limit temporaries
+            p = z3 - z1
+            p += z9
+            p -= z7
+            p += 2 * (z6 - z4)
+            p *= z_factor / (8 * width)
+            q = z7 - z1
+            q += z9
+            q -= z3
+            q += 2 * (z8 - z2)
+            q *= z_factor / (8 * height)
+            gradient_sq = p * p
+            gradient_sq += q * q
+
+        if 'slope' in products:
+            units = products['slope']['units']
+            if units == 'percent':
+                results['slope'] = np.sqrt(gradient_sq) * 100
+            else:
+                angle = np.arctan(np.sqrt(gradient_sq))
+                results['slope'] = np.degrees(angle) if units == 'degrees' else angle
+
+        if 'aspect' in products:
+            # 下坡向量(-p, -q)的罗盘方位 | Compass bearing of the downslope vector (-p, -q)
+            bearing = np.degrees(np.arctan2(-p, -q)) % 360
+            results['aspect'] = np.where(gradient_sq > 0, bearing, np.nan)
+
+        if 'hillshade' in products:
+            azimuth = np.radians(products['hillshade']['azimuth'])
+            altitude = np.radians(products['hillshade']['altitude'])
+            # 法线(-p, -q, 1)与光照方向的点积 | Dot product of the normal (-p, -q, 1) with the light direction
+            light_east = np.sin(azimuth) * np.cos(altitude)
+            light_north = np.cos(azimuth) * np.cos(altitude)
+            shade = (np.sin(altitude) - p * light_east - q * light_north) / np.sqrt(1 + gradient_sq)
+            results['hillshade'] = np.clip(shade, 0, 1)
+
+        if needs_second:
+            # Zevenbergen-Thorne二阶差分 | Zevenbergen-Thorne second differences
+            r = (z4 - 2 * z5 + z6) * (z_factor / (width * width))
+            t = (z2 - 2 * z5 + z8) * (z_factor / (height * height))
+            s = (z9 - z7 - z3 + z1) * (z_factor / (4 * width * height))
+            kind = products['curvature']['kind']
+            if kind == 'total':
+                values = -(r + t)
+            else:
+                with np.errstate(invalid='ignore', divide='ignore'):
+                    if kind == 'profile':
+                        values = -(p * p * r + 2 * p * q * s + q * q * t) / (gradient_sq * (1 + gradient_sq) ** 1.5)
+                    else:
+                        values = -(q * q * r - 2 * p * q * s + p * p * t) / gradient_sq ** 1.5
+                values = np.where(gradient_sq > 0, values, 0.0)
+            results['curvature'] = values
+
+        if 'roughness' in products:
+            stacked = np.stack(z)
+            results['roughness'] = stacked.max(axis=0) - stacked.min(axis=0)
+
+        if missing.any():
+            for values in results.values():
+                values[missing] = np.nan
+        return results
+
+    return kernel
@@ -0,0 +1,441 @@
+"""
+PyMountain水文分析模块 | PyMountain hydrology module
+
+在规则网格上计算填洼、D8流向、汇流累积量和流域。填洼使用带堆的Priority-Flood（洼地内的单元走先进先出队列，
+不进堆），同时记录每个单元被淹没时的来源方向，用于在平地和填平的洼地上确定流向；流向取最陡下降方向，
+没有更低邻居时沿淹没来源方向。汇流累积按拓扑波次矢量化推进，流域用指针倍增标注，全程不对单元递归。
+除输出数组外，每个单元只需几个字节的工作内存，临时数组按行块限制大小 |
+Computes depression filling, D8 flow direction, flow accumulation and watersheds on regular grids.
+Filling uses Priority-Flood with a heap (cells inside depressions go through a plain FIFO queue instead
+of the heap) and records the direction each cell was flooded from, which routes flow across flats and
+filled depressions; flow follows the steepest descent and falls back to that direction where no
+neighbour is lower. Flow accumulation advances in vectorized topological waves and watersheds are
+labelled by pointer jumping, so no step recurses over cells. Apart from the outputs, the working
+memory is a few bytes per cell, and temporaries are bounded by row blocks
+"""
+
+import heapq
+from collections import deque
+from typing import Dict, Any, Optional, Tuple, Union, Iterable, Sequence
+
+import numpy as np
+
+from ..core.data import MountainData
+from ..core.grid import GridData, as_grid
+
+
+# ESRI D8编码及对应的(行, 列)偏移：东、东南、南、西南、西、西北、北、东北；0为出口 |
+# ESRI D8 codes and their (row, col) offsets: E, SE, S, SW, W, NW, N, NE; 0 marks an outlet
+D8_CODES = (1, 2, 4, 8, 16, 32, 64, 128)
+D8_OFFSETS = ((0, 1), (1, 1), (1, 0), (1, -1), (0, -1), (-1, -1), (-1, 0), (-1, 1))
+
+# 可计算的水文结果 | Available hydrology products
+HYDROLOGY_PRODUCTS = ('filled', 'direction', 'accumulation', 'watersheds')
+
+# 行块和累积波次的单元数上限 | Cell limit for row blocks and accumulation waves
+DEFAULT_BLOCK_CELLS = 1 << 20
+
+# 小于此单元数的累积波次逐个单元处理 | Accumulation waves smaller than this are processed cell by cell
+SERIAL_WAVE_CELLS = 64
+
+
+def fill_depressions(data: Union[GridData, MountainData], resolution: Optional[int] = None) -> GridData:
+    """
+    填平洼地，使每个单元都能流到网格边缘或无数据区 | Fill depressions so every cell drains to the grid edge or a missing area
+
+    Args:
+        data: 规则网格或山体数据（散点先经as_grid()网格化） | Regular grid or mountain data (scattered points are gridded with as_grid() first)
+        resolution: 散点数据网格化的分辨率 | Gridding resolution for scattered data
+
+    Returns:
+        填洼后的高程网格 | Filled elevation grid
+    """
+    return hydrology(data, ('filled',), resolution=resolution)['filled']
+
+
+def flow_direction(data: Union[GridData, MountainData], resolution: Optional[int] = None) -> GridData:
+    """
+    计算D8流向（隐含填洼） | Compute D8 flow directions (filling depressions implicitly)
+
+    结果为D8_CODES中的编码，流出网格的出口为0，无数据为NaN |
+    Values are codes from D8_CODES, outlets draining off the grid are 0 and missing cells are NaN
+
+    Args:
+        data: 规则网格或山体数据 | Regular grid or mountain data
+        resolution: 散点数据网格化的分辨率 | Gridding resolution for scattered data
+
+    Returns:
+        流向网格 | Flow direction grid
+    """
+    return hydrology(data, ('direction',), resolution=resolution)['direction']
+
+
+def flow_accumulation(data: Union[GridData, MountainData], weights: Optional[Union[GridData, np.ndarray]] = None,
+                      resolution: Optional[int] = None) -> GridData:
+    """
+    计算汇流累积量：流经每个单元的上游单元数（含自身）或权重和 |
+    Compute flow accumulation: the number of upstream cells (including the cell itself) or the sum of weights
+
+    结果跨越多个数量级，可视化前通常取对数 | Values span orders of magnitude, so take the logarithm before visualizing
+
+    Args:
+        data: 高程网格、山体数据，或flow_direction()的结果 | Elevation grid, mountain data, or a flow_direction() result
+        weights: 每个单元的权重（如降水量），默认为1 | Per-cell weights (such as rainfall), 1 by default
+        resolution: 散点数据网格化的分辨率 | Gridding resolution for scattered data
+
+    Returns:
+        汇流累积网格 | Flow accumulation grid
+    """
+    if _is_direction_grid(data):
+        return _accumulation_grid(data, _receivers(data), weights)
+    return hydrology(data, ('accumulation',), weights=weights, resolution=resolution)['accumulation']
+
+
+def watersheds(data: Union[GridData, MountainData], outlets: Optional[Sequence[Tuple[float, float]]] = None,
+               resolution: Optional[int] = None) -> GridData:
+    """
+    标注流域 | Label watersheds
+
+    未指定出口时每个终点（流出网格或流入无数据区的单元）一个流域；指定出口时标签按出口顺序为1..k，
+    不流经任何出口的单元为NaN |
+    Without outlets every terminal cell (draining off the grid or into a missing area) gets its own
+    basin; with outlets the labels are 1..k in outlet order and cells draining past none of them are NaN
+
+    Args:
+        data: 高程网格、山体数据，或flow_direction()的结果 | Elevation grid, mountain data, or a flow_direction() result
+        outlets: 出口地理坐标列表 | List of outlet world coordinates
+        resolution: 散点数据网格化的分辨率 | Gridding resolution for scattered data
+
+    Returns:
+        流域标签网格 | Watershed label grid
+    """
+    if _is_direction_grid(data):
+        return _watershed_grid(data, _receivers(data), outlets)
+    return hydrology(data, ('watersheds',), outlets=outlets, resolution=resolution)['watersheds']
+
+
+def hydrology(data: Union[GridData, MountainData], products: Iterable[str] = HYDROLOGY_PRODUCTS,
+              weights: Optional[Union[GridData, np.ndarray]] = None,
+              outlets: Optional[Sequence[Tuple[float, float]]] = None,
+              resolution: Optional[int] = None) -> Dict[str, GridData]:
+    """
+    一次填洼后计算多个水文结果 | Compute several hydrology products from one depression fill
+
+    Args:
+        data: 规则网格或山体数据 | Regular grid or mountain data
+        products: HYDROLOGY_PRODUCTS中的名称 | Names from HYDROLOGY_PRODUCTS
+        weights: 汇流累积的单元权重 | Per-cell weights for flow accumulation
+        outlets: 流域出口地理坐标列表 | List of watershed outlet world coordinates
+        resolution: 散点数据网格化的分辨率 | Gridding resolution for scattered data
+
+    Returns:
+        结果名称到GridData的字典 | Dictionary of product names to GridData
+
+    Raises:
+        ValueError: 结果名称无效，或网格有旋转 | Invalid product name, or the grid is rotated
+    """
+    products = tuple(products)
+    unknown = set(products) - set(HYDROLOGY_PRODUCTS)
+    if unknown:
+        raise ValueError(f"Unknown hydrology products {sorted(unknown)}, expected some of {HYDROLOGY_PRODUCTS}")
+
+    grid = as_grid(data, resolution=resolution)
+    if grid.is_rotated:
+        raise ValueError("Hydrology requires a grid without rotation")
+
+    surface, parent = _priority_flood(grid)
+    results = {}
+    if 'filled' in products:
+        results['filled'] = GridData(surface[1:-1, 1:-1], grid.transform, metadata={'product': 'filled'})
+    if set(products) == {'filled'}:
+        return results
+
+    direction = GridData(_d8_directions(surface, parent, grid.transform), grid.transform,
+                         metadata={'product': 'flow_direction'})
+    del surface, parent
+    if 'direction' in products:
+        results['direction'] = direction
+
+    if 'accumulation' in products or 'watersheds' in products:
+        receivers = _receivers(direction)
+        if 'accumulation' in products:
+            results['accumulation'] = _accumulation_grid(direction, receivers, weights)
+        if 'watersheds' in products:
+            results['watersheds'] = _watershed_grid(direction, receivers, outlets)
+    return {name: results[name] for name in products}
+
+
+def _is_direction_grid(data: Any) -> bool:
+    """是否为flow_direction()的结果 | Whether data is a flow_direction() result"""
+    return isinstance(data, GridData) and data.metadata.get('product') == 'flow_direction'
+
+
+def _block_rows(cols: int) -> int:
+    """每个行块的行数 | Rows per row block"""
+    return max(1, DEFAULT_BLOCK_CELLS // max(cols, 1))
+
+
+def _priority_flood(grid: GridData) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Priority-Flood填洼并记录淹没来源方向 | Priority-Flood depression filling that records the flooding direction
+
+    从网格边缘和无数据区旁的单元出发，按高程从低到高淹没；低于当前水位的单元被抬高到水位并进入先进先出队列，
+    无需经过堆，按队列顺序记录的来源方向使平地上的水流汇向溢出点。整个网格的状态保存在bytearray和NumPy数组的
+    memoryview中，只有堆和队列里的前沿单元是Python对象 |
+    Floods inward from cells on the grid edge and next to missing areas, lowest first; cells below the
+    current water level are raised to it and go through a FIFO queue that bypasses the heap, so the
+    recorded directions converge on the spill point across flats. Grid-wide state lives in bytearrays
+    and a memoryview of a NumPy array; only the front cells in the heap and queue are Python objects
+
+    Returns:
+        (外扩一圈NaN的填洼高程, 外扩一圈的D8来源编码（种子为0）) |
+        (filled elevations padded by one NaN cell, padded D8 codes of the flooding direction (0 for seeds))
+    """
+    rows, cols = grid.shape
+    width = cols + 2
+    surface = np.full((rows + 2, width), np.nan, dtype=grid.z.dtype)
+    closed = bytearray(surface.size)
+    closed_grid = np.frombuffer(closed, dtype=np.uint8).reshape(surface.shape)
+    closed_grid[0] = closed_grid[-1] = 1
+    closed_grid[:, 0] = closed_grid[:, -1] = 1
+
+    step = _block_rows(cols)
+    valid = grid.valid_mask()
+    for r0 in range(0, rows, step):
+        r1 = min(r0 + step, rows)
+        missing = ~valid[r0:r1]
+        block = surface[r0 + 1:r1 + 1, 1:-1]
+        block[...] = grid.z[r0:r1]
+        block[missing] = np.nan
+        closed_grid[r0 + 1:r1 + 1, 1:-1][missing] = 1
+
+    # 种子：与网格外或无数据单元相邻的有效单元 | Seeds: valid cells next to the outside or a missing cell
+    seeds = []
+    for r0 in range(0, rows, step):
+        r1 = min(r0 + step, rows)
+        touches = np.zeros((r1 - r0, cols), dtype=bool)
+        for dr, dc in D8_OFFSETS:
+            touches |= closed_grid[r0 + 1 + dr:r1 + 1 + dr, 1 + dc:width - 1 + dc] == 1
+        local = np.flatnonzero(touches & (closed_grid[r0 + 1:r1 + 1, 1:-1] == 0))
+        seeds.append((local // cols + r0 + 1) * width + local % cols + 1)
+    seeds = np.concatenate(seeds)
+    closed_grid.reshape(-1)[seeds] = 1
+
+    flat = surface.reshape(-1)
+    heap = list(zip(flat[seeds].tolist(), seeds.tolist()))
+    heapq.heapify(heap)
+    del seeds
+
+    # 邻居的扁平偏移，以及从邻居流回当前单元的编码 | Flat offsets of the neighbours and the code flowing from each back to the current cell
+    code_of = dict(zip(D8_OFFSETS, D8_CODES))
+    neighbours = tuple((dr * width + dc, code_of[(-dr, -dc)]) for dr, dc in D8_OFFSETS)
+    parent = bytearray(surface.size)
+    values = memoryview(flat)
+    pit = deque()
+    push, pop = heapq.heappush, heapq.heappop
+    while heap or pit:
+        level, cell = pit.popleft() if pit else pop(heap)
+        for offset, code in neighbours:
+            neighbour = cell + offset
+            if closed[neighbour]:
+                continue
+            closed[neighbour] = 1
+            parent[neighbour] = code
+            value = values[neighbour]
+            if value <= level:
+                values[neighbour] = level
+                pit.append((level, neighbour))
+            else:
+                push(heap, (value, neighbour))
+
+    return surface, np.frombuffer(parent, dtype=np.uint8).reshape(surface.shape)
+
+
+def _d8_directions(surface: np.ndarray, parent: np.ndarray, transform: Tuple[float, ...]) -> np.ndarray:
+    """
+    由填洼高程计算D8流向 | Compute D8 directions from the filled surface
+
+    有更低邻居时取最陡下降方向，否则取淹没来源方向。两者都指向更早淹没的单元，因此流向图无环 |
+    Cells with a lower neighbour take the steepest descent, others the flooding direction. Both point
+    to cells flooded earlier, so the flow graph is acyclic
+    """
+    rows, cols = surface.shape[0] - 2, surface.shape[1] - 2
+    width = cols + 2
+    dx, dy = abs(transform[1]), abs(transform[5])
+    distances = [np.hypot(dr * dy, dc * dx) for dr, dc in D8_OFFSETS]
+    directions = np.empty((rows, cols), dtype=np.float32)
+
+    step = _block_rows(cols)
+    for r0 in range(0, rows, step):
+        r1 = min(r0 + step, rows)
+        center = surface[r0 + 1:r1 + 1, 1:-1]
+        codes = parent[r0 + 1:r1 + 1, 1:-1].astype(np.float32)
+        steepest = np.zeros(center.shape)
+        for (dr, dc), code, distance in zip(D8_OFFSETS, D8_CODES, distances):
+            neighbour = surface[r0 + 1 + dr:r1 + 1 + dr, 1 + dc:width - 1 + dc]
+            with np.errstate(invalid='ignore'):
+                drop = (center - neighbour) / distance
+                steeper = drop > steepest
+            np.copyto(steepest, drop, where=steeper)
+            codes[steeper] = code
+        codes[np.isnan(center)] = np.nan
+        directions[r0:r1] = codes
+    return directions
+
+
+def _receivers(direction: GridData) -> np.ndarray:
+    """
+    将D8流向转换为下游单元的扁平索引（出口和无数据为-1） | Convert D8 directions to flat indices of the downstream cell (-1 for outlets and missing cells)
+
+    Raises:
+        ValueError: 存在无效的D8编码 | Invalid D8 codes are present
+    """
+    rows, cols = direction.shape
+    index_dtype = np.int32 if rows * cols < 2 ** 31 else np.int64
+    receivers = np.empty(rows * cols, dtype=index_dtype)
+    valid = direction.valid_mask()
+
+    known = np.zeros(256, dtype=bool)
+    row_offset = np.zeros(256, dtype=np.intp)
+    col_offset = np.zeros(256, dtype=np.intp)
+    for code, (dr, dc) in zip(D8_CODES, D8_OFFSETS):
+        known[code], row_offset[code], col_offset[code] = True, dr, dc
+
+    step = _block_rows(cols)
+    for r0 in range(0, rows, step):
+        r1 = min(r0 + step, rows)
+        block_valid = valid[r0:r1]
+        codes = np.where(block_valid, direction.z[r0:r1], 0)
+        if np.any((codes != 0) & ~np.isin(codes, D8_CODES)):
+            raise ValueError(f"Flow directions must be 0 or one of {D8_CODES}")
+        codes = codes.astype(np.intp)
+        row = np.arange(r0, r1)[:, None] + row_offset[codes]
+        col = np.arange(cols)[None, :] + col_offset[codes]
+        inside = known[codes] & block_valid & (row >= 0) & (row < rows) & (col >= 0) & (col < cols)
+        # 流入无数据单元视为出口 | Flowing into a missing cell counts as an outlet
+        inside[inside] = valid[row[inside], col[inside]]
+        receivers[r0 * cols:r1 * cols] = np.where(inside, row * cols + col, -1).reshape(-1)
+    return receivers
+
+
+def _accumulation_grid(direction: GridData, receivers: np.ndarray,
+                       weights: Optional[Union[GridData, np.ndarray]]) -> GridData:
+    """
+    按拓扑波次矢量化计算汇流累积 | Compute flow accumulation in vectorized topological waves
+
+    先处理没有上游的单元，把累积量加到下游；下游单元的所有上游处理完后进入下一波。
+    波次合并到DEFAULT_BLOCK_CELLS大小；小于SERIAL_WAVE_CELLS的波次沿河道逐个单元处理 |
+    Cells without upstream neighbours are processed first and add their totals downstream; a
+    downstream cell joins the next wave once all of its donors are done. Waves are merged up to
+    DEFAULT_BLOCK_CELLS; waves smaller than SERIAL_WAVE_CELLS follow their channels one cell at a time
+    """
+    size = receivers.size
+    valid = direction.valid_mask().reshape(-1)
+    if weights is None:
+        accumulation = np.ones(size)
+    else:
+        weights = weights.filled(0.0) if isinstance(weights, GridData) else np.asarray(weights)
+        if weights.shape != direction.shape:
+            raise ValueError(f"weights must have shape {direction.shape}, got {weights.shape}")
+        accumulation = np.nan_to_num(weights.astype(np.float64).reshape(-1))
+
+    in_degree = np.zeros(size, dtype=np.uint8)
+    pending = deque()
+    for start in range(0, size, DEFAULT_BLOCK_CELLS):
+        downstream = receivers[start:start + DEFAULT_BLOCK_CELLS]
+        np.add.at(in_degree, downstream[downstream >= 0], 1)
+    for start in range(0, size, DEFAULT_BLOCK_CELLS):
+        part = slice(start, start + DEFAULT_BLOCK_CELLS)
+        pending.append(np.flatnonzero((in_degree[part] == 0) & valid[part]) + start)
+
+    # 小波次时矢量化开销占主导，改为沿河道逐个下行 | Small waves are dominated by vectorization overhead, so they walk down the channel cell by cell
+    receiver_view, total_view, degree_view = memoryview(receivers), memoryview(accumulation), memoryview(in_degree)
+    while pending:
+        cells = pending.popleft()
+        while pending and len(cells) < DEFAULT_BLOCK_CELLS:
+            cells = np.concatenate((cells, pending.popleft()))
+        if len(cells) < SERIAL_WAVE_CELLS:
+            for cell in cells.tolist():
+                down = receiver_view[cell]
+                while down >= 0:
+                    total_view[down] += total_view[cell]
+                    degree_view[down] -= 1
+                    if degree_view[down]:
+                        break
+                    cell, down = down, receiver_view[down]
+            continue
+        downstream = receivers[cells]
+        draining = downstream >= 0
+        cells, downstream = cells[draining], downstream[draining]
+        if not len(cells):
+            continue
+        np.add.at(accumulation, downstream, accumulation[cells])
+        np.subtract.at(in_degree, downstream, 1)
+        ready = downstream[in_degree[downstream] == 0]
+        if len(ready) > 1:
+            # 同一下游可能有多个上游在本波次，去重 | A downstream cell may have several donors in this wave, so deduplicate
+            ready.sort()
+            ready = ready[np.concatenate(([True], ready[1:] != ready[:-1]))]
+        if len(ready):
+            pending.append(ready)
+
+    accumulation[~valid] = np.nan
+    return GridData(accumulation.reshape(direction.shape), direction.transform,
+                    metadata={'product': 'flow_accumulation', 'weighted': weights is not None})
+
+
+def _watershed_grid(direction: GridData, receivers: np.ndarray,
+                    outlets: Optional[Sequence[Tuple[float, float]]]) -> GridData:
+    """
+    用指针倍增标注流域 | Label watersheds by pointer jumping
+
+    每个单元的指针从下游单元开始，反复替换为指针的指针，约log2(最长流路)次后都指向终点 |
+    Each pointer starts at the downstream cell and is repeatedly replaced by its own pointer; after
+    about log2(longest flow path) rounds every pointer reaches its terminal cell
+    """
+    rows, cols = direction.shape
+    size = rows * cols
+    valid = direction.valid_mask().reshape(-1)
+    pointer = receivers.copy()
+    for start in range(0, size, DEFAULT_BLOCK_CELLS):
+        part = pointer[start:start + DEFAULT_BLOCK_CELLS]
+        terminal = part < 0
+        part[terminal] = np.arange(start, start + len(part), dtype=pointer.dtype)[terminal]
+
+    if outlets is not None:
+        row, col = direction.world_to_pixel(*np.asarray(outlets, dtype=np.float64).reshape(-1, 2).T)
+        row, col = np.rint(row).astype(np.intp), np.rint(col).astype(np.intp)
+        if np.any((row < 0) | (row >= rows) | (col < 0) | (col >= cols)):
+            raise ValueError("Every outlet must lie inside the grid")
+        terminals = row * cols + col
+        if not valid[terminals].all():
+            raise ValueError("Outlets must not lie on missing cells")
+        # 出口截断向下游的指针 | Outlets cut the pointers leading further downstream
+        pointer[terminals] = terminals
+    else:
+        terminals = []
+        for start in range(0, size, DEFAULT_BLOCK_CELLS):
+            part = slice(start, start + DEFAULT_BLOCK_CELLS)
+            own = pointer[part] == np.arange(start, min(start + DEFAULT_BLOCK_CELLS, size))
+            terminals.append(np.flatnonzero(own & valid[part]) + start)
+        terminals = np.concatenate(terminals)
+
+    following = np.empty_like(pointer)
+    while True:
+        np.take(pointer, pointer, out=following)
+        if np.array_equal(following, pointer):
+            break
+        pointer, following = following, pointer
+    del following
+
+    # 终点编号为1..k，0表示不流经任何终点 | Terminals are numbered 1..k; 0 means draining past none of them
+    numbering = np.zeros(size, dtype=np.float32)
+    numbering[terminals] = np.arange(1, len(terminals) + 1)
+    labels = np.empty(size, dtype=np.float32)
+    for start in range(0, size, DEFAULT_BLOCK_CELLS):
+        part = slice(start, start + DEFAULT_BLOCK_CELLS)
+        block = numbering[pointer[part]]
+        block[(block == 0) | ~valid[part]] = np.nan
+        labels[part] = block
+    return GridData(labels.reshape(rows, cols), direction.transform,
+                    metadata={'product': 'watersheds', 'basins': len(terminals)})
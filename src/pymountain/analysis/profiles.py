@@ -0,0 +1,349 @@
+"""
+PyMountain高程剖面模块 | PyMountain elevation profile module
+
+按给定间距加密折线，并在一次矢量化调用中为所有折线采样高程。剖面以拼接数组加偏移量的形式保存，
+数千条剖面的指标（累计爬升、下降、最大坡度等）同样一次算出 |
+Densifies polylines at a given spacing and samples elevation for all of them in one vectorized
+call. Profiles are stored as concatenated arrays plus offsets, so metrics (ascent, descent, max
+grade, ...) for thousands of profiles are computed in one pass as well
+"""
+
+import hashlib
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple, Union, Iterator, Sequence
+
+import numpy as np
+
+from ..core.data import MountainData
+from ..core.grid import GridData, as_grid
+
+
+# 散点数据的采样方法 | Sampling methods for scattered data
+SAMPLER_METHODS = ('auto', 'grid', 'linear', 'nearest')
+
+# 剖面指标 | Profile metrics
+PROFILE_METRICS = ('length', 'ascent', 'descent', 'max_grade', 'min_elevation', 'max_elevation')
+
+Polyline = Union[np.ndarray, Sequence[Tuple[float, float]]]
+
+
+@dataclass
+class ElevationProfile:
+    """
+    单条高程剖面 | Single elevation profile
+
+    Attributes:
+        distance: 沿线累计距离 | Cumulative distance along the line
+        x: 采样点X坐标 | Sample X coordinates
+        y: 采样点Y坐标 | Sample Y coordinates
+        elevation: 采样高程（数据范围外为NaN） | Sampled elevations (NaN outside the data)
+    """
+
+    distance: np.ndarray
+    x: np.ndarray
+    y: np.ndarray
+    elevation: np.ndarray
+
+    @property
+    def length(self) -> float:
+        """剖面长度 | Profile length"""
+        return float(self.distance[-1]) if len(self.distance) else 0.0
+
+    def metrics(self) -> Dict[str, float]:
+        """
+        计算剖面指标 | Compute profile metrics
+
+        Returns:
+            包含length、ascent、descent、max_grade、min_elevation和max_elevation的字典 |
+            Dictionary with length, ascent, descent, max_grade, min_elevation and max_elevation
+        """
+        offsets = np.array([0, len(self.distance)])
+        return {name: float(values[0]) for name, values in _profile_metrics(self.distance, self.elevation, offsets).items()}
+
+    def __len__(self) -> int:
+        return len(self.distance)
+
+
+@dataclass
+class ProfileSet:
+    """
+    一批高程剖面（拼接存储） | A batch of elevation profiles (stored concatenated)
+
+    第i条剖面占据各数组的[offsets[i], offsets[i + 1])区间 | Profile i occupies [offsets[i], offsets[i + 1]) of each array
+
+    Attributes:
+        distance: 各剖面内的累计距离 | Cumulative distance within each profile
+        x: 采样点X坐标 | Sample X coordinates
+        y: 采样点Y坐标 | Sample Y coordinates
+        elevation: 采样高程（数据范围外为NaN） | Sampled elevations (NaN outside the data)
+        offsets: 长度为剖面数+1的起始偏移 | Start offsets, one longer than the profile count
+    """
+
+    distance: np.ndarray
+    x: np.ndarray
+    y: np.ndarray
+    elevation: np.ndarray
+    offsets: np.ndarray
+
+    @classmethod
+    def from_profiles(cls, profiles: Sequence[ElevationProfile]) -> 'ProfileSet':
+        """
+        由单条剖面列表创建 | Create from a list of single profiles
+
+        Args:
+            profiles: 剖面列表 | List of profiles
+
+        Returns:
+            ProfileSet实例 | ProfileSet instance
+        """
+        offsets = np.zeros(len(profiles) + 1, dtype=np.intp)
+        np.cumsum([len(profile) for profile in profiles], out=offsets[1:])
+        arrays = [np.concatenate([getattr(profile, name) for profile in profiles]) if profiles else np.empty(0)
+                  for name in ('distance', 'x', 'y', 'elevation')]
+        return cls(*arrays, offsets=offsets)
+
+    def metrics(self) -> Dict[str, np.ndarray]:
+        """
+        一次计算所有剖面的指标 | Compute metrics for all profiles at once
+
+        坡度为高差与水平距离之比（不是百分比）；NaN采样点两侧的区段不计入 |
+        Grades are rise over run (not percent); steps next to NaN samples are skipped
+
+        Returns:
+            指标名称到每条剖面一个值的数组的字典 | Dictionary of metric names to arrays with one value per profile
+        """
+        return _profile_metrics(self.distance, self.elevation, self.offsets)
+
+    def fingerprint(self) -> str:
+        """计算剖面内容指纹（用于渲染缓存） | Compute a content fingerprint of the profiles (for the render cache)"""
+        digest = hashlib.blake2b(digest_size=16)
+        for array in (self.offsets, self.distance, self.elevation):
+            digest.update(np.ascontiguousarray(array).tobytes())
+        return digest.hexdigest()
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index: int) -> ElevationProfile:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("profile index out of range")
+        part = slice(self.offsets[index], self.offsets[index + 1])
+        return ElevationProfile(self.distance[part], self.x[part], self.y[part], self.elevation[part])
+
+    def __iter__(self) -> Iterator[ElevationProfile]:
+        for index in range(len(self)):
+            yield self[index]
+
+
+class ProfileSampler:
+    """
+    缓存网格或插值器的剖面采样器 | Profile sampler caching a grid or interpolator
+
+    网格数据直接双线性采样；散点数据在构造时建立一次插值器（规则格网上的点还原为GridData，其余点建立Delaunay
+    三角剖分），之后所有剖面复用 |
+    Grid data is sampled bilinearly. For scattered data the interpolator is built once at construction
+    (lattice points are restored to GridData, other points get a Delaunay triangulation) and reused
+    for every profile
+
+    Attributes:
+        method: 实际使用的采样方法 | Sampling method in use
+        grid: 网格（采样方法为'grid'时） | Grid (when the method is 'grid')
+    """
+
+    def __init__(self, data: Union[GridData, MountainData], method: str = 'auto',
+                 grid_method: str = 'bilinear', resolution: Optional[int] = None):
+        """
+        初始化采样器 | Initialize sampler
+
+        Args:
+            data: 规则网格或山体数据 | Regular grid or mountain data
+            method: 'auto'（网格或格网点用'grid'，其余用'linear'）、'grid'、'linear'或'nearest' |
+                'auto' ('grid' for grids and lattice points, otherwise 'linear'), 'grid', 'linear' or 'nearest'
+            grid_method: 网格采样方法（'bilinear'或'nearest'） | Grid sampling method ('bilinear' or 'nearest')
+            resolution: 'grid'方法对散点网格化的分辨率 | Gridding resolution for scattered data with the 'grid' method
+        """
+        if method not in SAMPLER_METHODS:
+            raise ValueError(f"method must be one of {SAMPLER_METHODS}")
+
+        self.grid: Optional[GridData] = None
+        self._grid_method = grid_method
+        self._interpolator = None
+
+        if isinstance(data, GridData) or method == 'grid':
+            self.grid = as_grid(data, resolution=resolution)
+            method = 'grid'
+        elif method == 'auto':
+            try:
+                self.grid = GridData.from_mountain_data(data, method=None)
+                method = 'grid'
+            except ValueError:
+                method = 'linear'
+
+        if method != 'grid':
+            from scipy.interpolate import LinearNDInterpolator, NearestNDInterpolator
+
+            x, y, z = data.to_numpy_arrays()
+            points = np.column_stack((x, y))
+            if method == 'linear':
+                self._interpolator = LinearNDInterpolator(points, z, fill_value=np.nan)
+            else:
+                self._interpolator = NearestNDInterpolator(points, z)
+        self.method = method
+
+    def sample(self, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        """
+        在任意坐标处采样高程 | Sample elevations at arbitrary coordinates
+
+        Args:
+            x: X坐标数组 | X coordinate array
+            y: Y坐标数组 | Y coordinate array
+
+        Returns:
+            高程数组（数据范围外为NaN） | Elevation array (NaN outside the data)
+        """
+        if self.grid is not None:
+            return np.asarray(self.grid.sample(x, y, method=self._grid_method), dtype=np.float64)
+        return self._interpolator(np.asarray(x, dtype=np.float64), np.asarray(y, dtype=np.float64))
+
+    def extract(self, polylines: Sequence[Polyline], spacing: Optional[float] = None) -> ProfileSet:
+        """
+        加密折线并一次采样所有剖面 | Densify polylines and sample all profiles in one call
+
+        Args:
+            polylines: 折线列表，每条为(N, 2)顶点数组 | List of polylines, each an (N, 2) vertex array
+            spacing: 采样间距（网格默认为较小的像素尺寸） | Sample spacing (defaults to the smaller pixel size for grids)
+
+        Returns:
+            ProfileSet实例 | ProfileSet instance
+        """
+        if spacing is None:
+            if self.grid is None:
+                raise ValueError("spacing is required for scattered data")
+            spacing = min(self.grid.resolution)
+        x, y, distance, offsets = densify_polylines(polylines, spacing)
+        return ProfileSet(distance, x, y, self.sample(x, y), offsets)
+
+
+def extract_profiles(data: Union[GridData, MountainData], polylines: Sequence[Polyline],
+                     spacing: Optional[float] = None, method: str = 'auto') -> ProfileSet:
+    """
+    提取一批高程剖面的便捷函数 | Convenience function extracting a batch of elevation profiles
+
+    对同一数据重复提取时，应创建一个ProfileSampler并复用 | For repeated extraction on the same data, create one ProfileSampler and reuse it
+
+    Args:
+        data: 规则网格或山体数据 | Regular grid or mountain data
+        polylines: 折线列表，每条为(N, 2)顶点数组 | List of polylines, each an (N, 2) vertex array
+        spacing: 采样间距 | Sample spacing
+        method: 采样方法（见ProfileSampler） | Sampling method (see ProfileSampler)
+
+    Returns:
+        ProfileSet实例 | ProfileSet instance
+    """
+    return ProfileSampler(data, method=method).extract(polylines, spacing)
+
+
+def densify_polylines(polylines: Sequence[Polyline],
+                      spacing: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    按固定间距加密一批折线（全程矢量化） | Densify a batch of polylines at a fixed spacing (fully vectorized)
+
+    每条折线从起点开始每隔spacing取一个点，并始终包含终点 | Each polyline gets a point every spacing from its start and always includes its end
+
+    Args:
+        polylines: 折线列表，每条为(N, 2)顶点数组，N >= 2 | List of polylines, each an (N, 2) vertex array with N >= 2
+        spacing: 采样间距 | Sample spacing
+
+    Returns:
+        (x, y, distance, offsets)元组，第i条折线的点位于[offsets[i], offsets[i + 1]) |
+        (x, y, distance, offsets) tuple; points of polyline i lie in [offsets[i], offsets[i + 1])
+
+    Raises:
+        ValueError: 间距不为正或折线少于2个顶点 | Non-positive spacing or a polyline with fewer than 2 vertices
+    """
+    if not spacing > 0:
+        raise ValueError("spacing must be positive")
+    if len(polylines) == 0:
+        empty = np.empty(0)
+        return empty, empty, empty, np.zeros(1, dtype=np.intp)
+
+    arrays = [np.asarray(line, dtype=np.float64).reshape(-1, 2) for line in polylines]
+    if min(len(line) for line in arrays) < 2:
+        raise ValueError("Every polyline needs at least 2 vertices")
+    counts = np.array([len(line) for line in arrays])
+    vertices = np.concatenate(arrays)
+    vertex_start = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    vertex_last = vertex_start + counts - 1
+
+    # 拼接后的累计距离，跨折线的"段"长度置0 | Cumulative distance over the concatenation; "segments" across polylines get zero length
+    segment_length = np.hypot(*np.diff(vertices, axis=0).T)
+    segment_length[vertex_last[:-1]] = 0.0
+    cumulative = np.concatenate(([0.0], np.cumsum(segment_length)))
+    base = cumulative[vertex_start]
+    lengths = cumulative[vertex_last] - base
+
+    # 每条折线的采样数：0, spacing, 2*spacing, ... 再加终点 | Samples per polyline: 0, spacing, 2*spacing, ... plus the end
+    steps = np.floor(lengths / spacing).astype(np.intp)
+    exact_end = np.isclose(steps * spacing, lengths) & (steps > 0)
+    samples = steps + 1 + (~exact_end)
+    offsets = np.zeros(len(arrays) + 1, dtype=np.intp)
+    np.cumsum(samples, out=offsets[1:])
+
+    owner = np.repeat(np.arange(len(arrays)), samples)
+    step_index = np.arange(offsets[-1]) - offsets[owner]
+    distance = np.minimum(step_index * spacing, lengths[owner])
+    distance[offsets[1:] - 1] = lengths
+
+    # 定位所在线段并线性插值 | Locate the containing segment and interpolate linearly
+    position = base[owner] + distance
+    segment = np.searchsorted(cumulative, position, side='right') - 1
+    segment = np.clip(segment, vertex_start[owner], vertex_last[owner] - 1)
+    length = segment_length[segment]
+    with np.errstate(invalid='ignore', divide='ignore'):
+        t = np.where(length > 0, (position - cumulative[segment]) / length, 0.0)
+    start, end = vertices[segment], vertices[segment + 1]
+    x = start[:, 0] + t * (end[:, 0] - start[:, 0])
+    y = start[:, 1] + t * (end[:, 1] - start[:, 1])
+    return x, y, distance, offsets
+
+
+def _profile_metrics(distance: np.ndarray, elevation: np.ndarray, offsets: np.ndarray) -> Dict[str, np.ndarray]:
+    """在拼接数组上按剖面分组计算指标 | Compute per-profile metrics over concatenated arrays"""
+    count = len(offsets) - 1
+    owner = np.repeat(np.arange(count), np.diff(offsets))
+
+    rise = np.diff(elevation)
+    run = np.diff(distance)
+    step_owner = owner[:-1] if len(owner) else owner
+    # 跨剖面的差分和NaN区段不计入 | Differences across profiles and steps touching NaN are skipped
+    keep = np.isfinite(rise) & (run > 0)
+    keep[offsets[1:-1] - 1] = False
+    rise, run, step_owner = rise[keep], run[keep], step_owner[keep]
+
+    ascent = np.bincount(step_owner, weights=np.maximum(rise, 0), minlength=count)
+    descent = np.bincount(step_owner, weights=np.maximum(-rise, 0), minlength=count)
+    max_grade = np.zeros(count)
+    np.maximum.at(max_grade, step_owner, np.abs(rise) / run)
+
+    finite = np.isfinite(elevation)
+    min_elevation = np.full(count, np.inf)
+    max_elevation = np.full(count, -np.inf)
+    np.minimum.at(min_elevation, owner[finite], elevation[finite])
+    np.maximum.at(max_elevation, owner[finite], elevation[finite])
+    empty = ~np.isfinite(min_elevation)
+    min_elevation[empty] = np.nan
+    max_elevation[empty] = np.nan
+
+    length = np.zeros(count)
+    nonempty = np.diff(offsets) > 0
+    length[nonempty] = distance[offsets[1:][nonempty] - 1]
+    return {
+        'length': length,
+        'ascent': ascent,
+        'descent': descent,
+        'max_grade': max_grade,
+        'min_elevation': min_elevation,
+        'max_elevation': max_elevation,
+    }
@@ -0,0 +1,363 @@
+"""
+PyMountain最小成本路径模块 | PyMountain least-cost path module
+
+由坡度和高程构建成本面，并在隐式的8邻接图上用二叉堆(heapq)运行Dijkstra/A*：邻居由外扩一圈的扁平索引加
+固定偏移得到，不生成任何边。两个相邻单元间的成本为两单元成本均值乘以中心距。网格状态保存在bytearray和
+NumPy数组的memoryview中，只有堆中的前沿单元是Python对象 |
+Builds cost surfaces from slope and elevation and runs Dijkstra/A* with a binary heap (heapq) over
+an implicit 8-connected graph: neighbours are fixed offsets from a flat index into a grid padded by
+one cell, so no edge is ever built. Moving between neighbouring cells costs the mean of their costs
+times the center distance. Grid state lives in bytearrays and memoryviews of NumPy arrays; only the
+front cells in the heap are Python objects
+"""
+
+import heapq
+import math
+from dataclasses import dataclass
+from typing import Optional, Tuple, List, Union, Sequence
+
+import numpy as np
+
+from ..core.data import MountainData
+from ..core.grid import GridData, as_grid
+from .derivatives import DEFAULT_TILE_SIZE, slope
+
+
+# 8邻接的(行, 列)偏移 | (row, col) offsets of the 8-connected neighbourhood
+_NEIGHBOURS = ((0, 1), (1, 1), (1, 0), (1, -1), (0, -1), (-1, -1), (-1, 0), (-1, 1))
+
+# 行块的单元数上限 | Cell limit for row blocks
+_BLOCK_CELLS = 1 << 20
+
+Point = Union[Tuple[float, float], np.ndarray]
+
+
+@dataclass
+class RoutePath:
+    """
+    最小成本路径 | Least-cost path
+
+    Attributes:
+        x: 路径单元中心X坐标 | X coordinates of the path cell centers
+        y: 路径单元中心Y坐标 | Y coordinates of the path cell centers
+        distance: 沿路径累计的水平距离 | Cumulative horizontal distance along the path
+        cost: 沿路径累计的成本 | Cumulative cost along the path
+    """
+
+    x: np.ndarray
+    y: np.ndarray
+    distance: np.ndarray
+    cost: np.ndarray
+
+    @property
+    def total_cost(self) -> float:
+        """路径总成本 | Total path cost"""
+        return float(self.cost[-1])
+
+    @property
+    def length(self) -> float:
+        """路径水平长度 | Horizontal path length"""
+        return float(self.distance[-1])
+
+    def to_polyline(self) -> np.ndarray:
+        """
+        转换为(N, 2)顶点数组，可交给ProfileSampler提取高程剖面 | Convert to an (N, 2) vertex array, ready for ProfileSampler
+
+        Returns:
+            顶点数组 | Vertex array
+        """
+        return np.column_stack((self.x, self.y))
+
+    def __len__(self) -> int:
+        return len(self.x)
+
+
+def cost_surface(data: Union[GridData, MountainData], slope_weight: float = 10.0, elevation_weight: float = 0.0,
+                 base_cost: float = 1.0, max_slope: Optional[float] = None, z_factor: float = 1.0,
+                 tile_size: int = DEFAULT_TILE_SIZE, resolution: Optional[int] = None) -> GridData:
+    """
+    由坡度和高程构建单位距离成本面 | Build a cost-per-unit-distance surface from slope and elevation
+
+    cost = base_cost + slope_weight * tan(坡度) + elevation_weight * 归一化高程；超过max_slope的单元和无数据单元
+    不可通行(NaN) |
+    cost = base_cost + slope_weight * tan(slope) + elevation_weight * normalized elevation; cells steeper
+    than max_slope and missing cells are impassable (NaN)
+
+    Args:
+        data: 规则网格或山体数据（散点先经as_grid()网格化） | Regular grid or mountain data (scattered points are gridded with as_grid() first)
+        slope_weight: 坡度正切的权重 | Weight of the slope tangent
+        elevation_weight: 归一化到[0, 1]的高程的权重 | Weight of the elevation normalized to [0, 1]
+        base_cost: 平地成本 | Cost on flat ground
+        max_slope: 可通行的最大坡度（度） | Steepest passable slope (degrees)
+        z_factor: 高程单位到水平单位的换算系数 | Conversion factor from elevation units to horizontal units
+        tile_size: 坡度计算的瓦片边长 | Tile edge length for the slope computation
+        resolution: 散点数据网格化的分辨率 | Gridding resolution for scattered data
+
+    Returns:
+        float32成本网格 | float32 cost grid
+
+    Raises:
+        ValueError: 权重或基础成本为负 | Negative weights or base cost
+    """
+    if min(slope_weight, elevation_weight, base_cost) < 0:
+        raise ValueError("Weights and base cost must be non-negative")
+
+    grid = as_grid(data, resolution=resolution)
+    gradient = slope(grid, units='percent', z_factor=z_factor, tile_size=tile_size).z
+    stats = grid.get_elevation_stats()
+    low, span = stats['min'], (stats['max'] - stats['min']) or 1.0
+    max_tangent = math.tan(math.radians(max_slope)) if max_slope is not None else None
+
+    rows, cols = grid.shape
+    costs = np.empty((rows, cols), dtype=np.float32)
+    step = max(1, _BLOCK_CELLS // cols)
+    for r0 in range(0, rows, step):
+        r1 = min(r0 + step, rows)
+        tangent = gradient[r0:r1] / np.float32(100)
+        block = costs[r0:r1]
+        np.multiply(tangent, slope_weight, out=block)
+        block += base_cost
+        if elevation_weight:
+            block += elevation_weight * (grid.z[r0:r1] - low) / span
+        if max_tangent is not None:
+            block[tangent > max_tangent] = np.nan
+
+    metadata = {'product': 'cost', 'slope_weight': slope_weight, 'elevation_weight': elevation_weight,
+                'base_cost': base_cost, 'max_slope': max_slope}
+    return GridData(costs, grid.transform, metadata=metadata)
+
+
+def least_cost_path(cost: GridData, start: Point, end: Point, heuristic_weight: float = 1.0,
+                    margin: Optional[float] = None) -> RoutePath:
+    """
+    在成本面上搜索两点间的最小成本路径（A*） | Find the least-cost path between two points on a cost surface (A*)
+
+    启发函数为最小单元成本乘以8邻接（octile）距离，heuristic_weight = 1时结果最优；大于1时为加权A*，
+    扩展的单元更少，成本至多为最优的heuristic_weight倍；为0时退化为Dijkstra。margin把搜索限制在起终点
+    外包框外扩margin的窗口内 |
+    The heuristic is the smallest cell cost times the octile distance, so heuristic_weight = 1 gives
+    optimal paths; above 1 it becomes weighted A*, expanding fewer cells at up to heuristic_weight
+    times the optimal cost; 0 falls back to Dijkstra. margin restricts the search to the bounding box
+    of the endpoints grown by margin
+
+    Args:
+        cost: 成本网格（见cost_surface()），NaN或inf为不可通行 | Cost grid (see cost_surface()); NaN or inf is impassable
+        start: 起点地理坐标 | Start world coordinates
+        end: 终点地理坐标 | End world coordinates
+        heuristic_weight: 启发函数权重 | Heuristic weight
+        margin: 搜索窗口外扩距离（None为整个网格） | Search window margin (None for the whole grid)
+
+    Returns:
+        RoutePath实例 | RoutePath instance
+
+    Raises:
+        ValueError: 端点在网格外或不可通行，或终点不可达 | Endpoints outside the grid or impassable, or the end is unreachable
+    """
+    if heuristic_weight < 0:
+        raise ValueError("heuristic_weight must be non-negative")
+
+    start_cell = _cell(cost, start, 'start')
+    end_cell = _cell(cost, end, 'end')
+    row0, col0 = 0, 0
+    if margin is not None:
+        reach_rows = int(math.ceil(margin / abs(cost.transform[5])))
+        reach_cols = int(math.ceil(margin / abs(cost.transform[1])))
+        row0 = max(min(start_cell[0], end_cell[0]) - reach_rows, 0)
+        col0 = max(min(start_cell[1], end_cell[1]) - reach_cols, 0)
+        cost = cost.window(row0, max(start_cell[0], end_cell[0]) + reach_rows + 1,
+                           col0, max(start_cell[1], end_cell[1]) + reach_cols + 1)
+
+    engine = _CostGrid(cost)
+    source = engine.index(start_cell[0] - row0, start_cell[1] - col0)
+    target = engine.index(end_cell[0] - row0, end_cell[1] - col0)
+    if engine.closed[source] or engine.closed[target]:
+        raise ValueError("start and end must lie on passable cells")
+
+    engine.search([source], target=target, heuristic_weight=heuristic_weight)
+    if not engine.settled(target):
+        raise ValueError("end is not reachable from start")
+
+    path = engine.trace(target)
+    rows, cols = np.divmod(path, engine.width)
+    x, y = cost.cell_center(rows - 1, cols - 1)
+    steps = np.hypot(np.diff(x), np.diff(y))
+    return RoutePath(x, y, np.concatenate(([0.0], np.cumsum(steps))), engine.distance[path])
+
+
+def cost_distance(cost: GridData, sources: Union[Sequence[Point], np.ndarray],
+                  max_cost: Optional[float] = None) -> GridData:
+    """
+    计算多源累计成本距离栅格（Dijkstra） | Compute a multi-source accumulated cost-distance raster (Dijkstra)
+
+    Args:
+        cost: 成本网格（见cost_surface()） | Cost grid (see cost_surface())
+        sources: 源点地理坐标列表，或与网格同形状的布尔掩膜 | List of source world coordinates, or a boolean mask shaped like the grid
+        max_cost: 最大累计成本，超出后停止搜索 | Maximum accumulated cost; the search stops beyond it
+
+    Returns:
+        到最近源点的累计成本网格，不可达和不可通行单元为NaN | Grid of accumulated cost to the nearest source; unreachable and impassable cells are NaN
+
+    Raises:
+        ValueError: 没有可通行的源点 | No passable source
+    """
+    engine = _CostGrid(cost)
+    rows, cols = cost.shape
+    mask = np.asarray(sources) if isinstance(sources, np.ndarray) else None
+    if mask is not None and mask.dtype == bool:
+        if mask.shape != (rows, cols):
+            raise ValueError(f"Source mask must have shape {(rows, cols)}, got {mask.shape}")
+        source_rows, source_cols = np.nonzero(mask)
+        cells = list(zip(source_rows.tolist(), source_cols.tolist()))
+    else:
+        cells = [_cell(cost, point, 'source') for point in np.asarray(sources, dtype=np.float64).reshape(-1, 2)]
+    indices = [engine.index(row, col) for row, col in cells]
+    indices = [index for index in indices if not engine.closed[index]]
+    if not indices:
+        raise ValueError("At least one source must lie on a passable cell")
+
+    engine.search(indices, max_cost=max_cost)
+    values = engine.distance.reshape(rows + 2, cols + 2)[1:-1, 1:-1].copy()
+    values[np.isinf(values)] = np.nan
+    return GridData(values, cost.transform, metadata={'product': 'cost_distance', 'sources': len(indices)})
+
+
+def _cell(grid: GridData, point: Point, name: str) -> Tuple[int, int]:
+    """地理坐标所在单元 | Cell containing a world coordinate"""
+    row, col = grid.world_to_pixel(point[0], point[1])
+    row, col = int(np.rint(row)), int(np.rint(col))
+    rows, cols = grid.shape
+    if not (0 <= row < rows and 0 <= col < cols):
+        raise ValueError(f"The {name} point {tuple(point)} is outside the grid")
+    return row, col
+
+
+class _CostGrid:
+    """
+    隐式8邻接图上的搜索状态 | Search state on the implicit 8-connected graph
+
+    成本、距离和前驱都保存在外扩一圈的扁平数组中；外圈和不可通行单元预先标记为已关闭，循环中无需边界检查 |
+    Costs, distances and predecessors live in flat arrays padded by one cell; the padding and
+    impassable cells start closed, so the loop needs no bounds checks
+    """
+
+    def __init__(self, cost: GridData):
+        if cost.is_rotated:
+            raise ValueError("Routing requires a grid without rotation")
+        rows, cols = cost.shape
+        self.width = cols + 2
+        costs = np.full((rows + 2, self.width), np.inf)
+        step = max(1, _BLOCK_CELLS // cols)
+        for r0 in range(0, rows, step):
+            r1 = min(r0 + step, rows)
+            block = costs[r0 + 1:r1 + 1, 1:-1]
+            block[...] = cost.z[r0:r1]
+            block[~cost.valid_mask()[r0:r1]] = np.inf
+            if (block < 0).any():
+                raise ValueError("Costs must be non-negative")
+        self.closed = bytearray(costs.size)
+        np.frombuffer(self.closed, dtype=np.uint8)[~np.isfinite(costs.reshape(-1))] = 1
+        self.costs = costs.reshape(-1)
+        self.distance = np.full(costs.size, np.inf)
+        self.parent = bytearray(costs.size)
+        passable = self.costs[np.isfinite(self.costs)]
+        self.min_cost = float(passable.min()) if len(passable) else 0.0
+        self.dx, self.dy = abs(cost.transform[1]), abs(cost.transform[5])
+
+    def index(self, row: int, col: int) -> int:
+        """单元的扁平索引 | Flat index of a cell"""
+        return (row + 1) * self.width + col + 1
+
+    def settled(self, index: int) -> bool:
+        """单元是否已求得最终距离 | Whether the cell has its final distance"""
+        return math.isfinite(self.distance[index])
+
+    def search(self, sources: List[int], target: Optional[int] = None, heuristic_weight: float = 0.0,
+               max_cost: Optional[float] = None) -> None:
+        """
+        从源点出发运行Dijkstra，给定目标和启发权重时运行A* | Run Dijkstra from the sources, or A* given a target and heuristic weight
+
+        使用惰性删除：同一单元可能多次入堆，出堆时跳过已关闭的单元 |
+        Uses lazy deletion: a cell may be pushed several times, and closed cells are skipped when popped
+        """
+        width = self.width
+        diagonal = math.hypot(self.dx, self.dy)
+        lengths = {(0, 1): self.dx, (1, 0): self.dy}
+        # (扁平偏移, 中心距的一半, 从邻居回到当前单元的编号) | (flat offset, half the center distance, code leading back from the neighbour)
+        neighbours = tuple((dr * width + dc, lengths.get((abs(dr), abs(dc)), diagonal) / 2,
+                            _NEIGHBOURS.index((-dr, -dc)) + 1) for dr, dc in _NEIGHBOURS)
+
+        closed, parent = self.closed, self.parent
+        distance, costs = memoryview(self.distance), memoryview(self.costs)
+        limit = math.inf if max_cost is None else max_cost
+        heap = []
+        for source in sources:
+            distance[source] = 0.0
+            heap.append((0.0, source))
+        heapq.heapify(heap)
+        push, pop = heapq.heappush, heapq.heappop
+
+        if target is None or heuristic_weight == 0:
+            while heap:
+                current, cell = pop(heap)
+                if closed[cell]:
+                    continue
+                if current > limit:
+                    break
+                closed[cell] = 1
+                if cell == target:
+                    break
+                here = costs[cell]
+                for offset, half, code in neighbours:
+                    neighbour = cell + offset
+                    if closed[neighbour]:
+                        continue
+                    candidate = current + (here + costs[neighbour]) * half
+                    if candidate < distance[neighbour]:
+                        distance[neighbour] = candidate
+                        parent[neighbour] = code
+                        push(heap, (candidate, neighbour))
+        else:
+            # octile距离：先走对角线，余下沿长轴直行 | Octile distance: diagonals first, then straight along the longer axis
+            scale = self.min_cost * heuristic_weight
+            row_step, col_step = self.dy * scale, self.dx * scale
+            diagonal_saving = (diagonal - self.dx - self.dy) * scale
+            target_row, target_col = divmod(target, width)
+            while heap:
+                _, cell = pop(heap)
+                if closed[cell]:
+                    continue
+                closed[cell] = 1
+                if cell == target:
+                    break
+                current = distance[cell]
+                here = costs[cell]
+                for offset, half, code in neighbours:
+                    neighbour = cell + offset
+                    if closed[neighbour]:
+                        continue
+                    candidate = current + (here + costs[neighbour]) * half
+                    if candidate < distance[neighbour]:
+                        distance[neighbour] = candidate
+                        parent[neighbour] = code
+                        row, col = divmod(neighbour, width)
+                        rows_left = abs(row - target_row)
+                        cols_left = abs(col - target_col)
+                        estimate = (rows_left * row_step + cols_left * col_step
+                                    + (rows_left if rows_left < cols_left else cols_left) * diagonal_saving)
+                        push(heap, (candidate + estimate, neighbour))
+
+        # 未关闭的单元只有暂定距离 | Cells left open only have tentative distances
+        open_cells = np.frombuffer(self.closed, dtype=np.uint8) == 0
+        self.distance[open_cells] = np.inf
+
+    def trace(self, target: int) -> np.ndarray:
+        """沿前驱回溯路径，返回从源点到目标的扁平索引 | Follow predecessors back; returns flat indices from the source to the target"""
+        width = self.width
+        back = (0,) + tuple(dr * width + dc for dr, dc in _NEIGHBOURS)
+        parent = self.parent
+        path = [target]
+        cell = target
+        while parent[cell]:
+            cell += back[parent[cell]]
+            path.append(cell)
+        return np.array(path[::-1], dtype=np.intp)
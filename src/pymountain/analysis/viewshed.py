@@ -0,0 +1,363 @@
+"""
+PyMountain可视域模块 | PyMountain viewshed module
+
+从观察点向分析窗口边界上的每个单元发射射线（R2径向算法），整批射线作为二维数组处理：沿射线的仰角正切
+用np.maximum.accumulate求得地平线，目标高于地平线即可见。批量通视查询把观察点-目标对作为两点折线一次采样；
+多观察点分析在进程池上运行，网格以内存映射文件在进程间共享 |
+Casts rays from the observer to every cell on the boundary of the analysis window (the radial R2
+algorithm) and processes a whole batch of rays as one 2-D array: the horizon along each ray is
+np.maximum.accumulate of the elevation-angle tangents, and a cell is visible when its target rises
+above that horizon. Batch line-of-sight queries sample observer/target pairs as two-vertex
+polylines in one call; multi-observer runs go to a process pool that shares the grid through a
+memory-mapped file
+"""
+
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, Any, Optional, Tuple, List, Union, Sequence
+
+import numpy as np
+
+from ..core.data import MountainData
+from ..core.grid import GridData, as_grid
+from .profiles import ProfileSampler
+
+
+# 地球半径（米）与标准大气折射系数 | Earth radius (meters) and standard atmospheric refraction coefficient
+EARTH_RADIUS = 6371000.0
+DEFAULT_REFRACTION = 0.13
+
+# 每批射线的最大采样数，限制临时数组的内存 | Maximum samples per batch of rays, bounding temporary memory
+DEFAULT_CHUNK_SAMPLES = 1 << 21
+
+# 多观察点结果的合并方式 | Ways of combining multi-observer results
+COMBINE_MODES = ('count', 'any')
+
+Point = Union[Tuple[float, float], np.ndarray]
+
+
+def viewshed(data: Union[GridData, MountainData], observer: Point, observer_height: float = 1.7,
+             target_height: float = 0.0, max_distance: Optional[float] = None,
+             earth_curvature: bool = False, refraction: float = DEFAULT_REFRACTION,
+             chunk_samples: int = DEFAULT_CHUNK_SAMPLES, resolution: Optional[int] = None) -> GridData:
+    """
+    计算单个观察点的可视域 | Compute the viewshed of one observer
+
+    结果为可见1.0、不可见0.0，无数据和超出max_distance的单元为NaN，可直接交给等高线渲染器或ColorMapper |
+    The result is 1.0 for visible and 0.0 for hidden cells, with NaN for missing cells and cells
+    beyond max_distance, so it goes straight to the contour renderer or ColorMapper
+
+    Args:
+        data: 规则网格或山体数据（散点先经as_grid()网格化） | Regular grid or mountain data (scattered points are gridded with as_grid() first)
+        observer: 观察点地理坐标(x, y) | Observer world coordinates (x, y)
+        observer_height: 观察点离地高度 | Observer height above ground
+        target_height: 目标离地高度 | Target height above ground
+        max_distance: 最大分析距离（None为整个网格） | Maximum analysis distance (None for the whole grid)
+        earth_curvature: 是否修正地球曲率和大气折射 | Whether to correct for earth curvature and refraction
+        refraction: 大气折射系数 | Atmospheric refraction coefficient
+        chunk_samples: 每批射线的最大采样数 | Maximum samples per batch of rays
+        resolution: 散点数据网格化的分辨率 | Gridding resolution for scattered data
+
+    Returns:
+        可视域网格 | Viewshed grid
+
+    Raises:
+        ValueError: 观察点在网格外或位于无数据单元，或网格有旋转 | Observer outside the grid or on a missing cell, or the grid is rotated
+    """
+    grid = as_grid(data, resolution=resolution)
+    z = _elevation_array(grid)
+    row, col = _observer_cell(grid, observer)
+    visible, window = _visible_window(z, grid.transform, row, col, z[row, col] + observer_height,
+                                      target_height, max_distance, _curvature_coefficient(earth_curvature, refraction),
+                                      chunk_samples)
+    values = _window_result(z, grid.transform, row, col, window, max_distance)
+    r0, r1, c0, c1 = window
+    target = values[r0:r1, c0:c1]
+    target[visible] = 1.0
+
+    metadata = {'product': 'viewshed', 'observer': tuple(float(v) for v in observer),
+                'observer_height': observer_height, 'target_height': target_height}
+    return GridData(values, grid.transform, metadata=metadata)
+
+
+def viewsheds(data: Union[GridData, MountainData], observers: Sequence[Point],
+              observer_height: Union[float, Sequence[float]] = 1.7, target_height: float = 0.0,
+              max_distance: Optional[float] = None, earth_curvature: bool = False,
+              refraction: float = DEFAULT_REFRACTION, combine: Optional[str] = 'count',
+              workers: Optional[int] = None, chunk_samples: int = DEFAULT_CHUNK_SAMPLES,
+              scratch_dir: Optional[Union[str, Path]] = None, mp_context: Optional[Any] = None,
+              resolution: Optional[int] = None) -> Union[GridData, List[GridData]]:
+    """
+    计算多个观察点的可视域 | Compute viewsheds for several observers
+
+    workers > 1时观察点分配到进程池；网格只写入一次临时.npy文件，各工作进程以只读内存映射打开 |
+    With workers > 1 observers are spread over a process pool; the grid is written once to a
+    scratch .npy file that every worker opens as a read-only memory map
+
+    Args:
+        data: 规则网格或山体数据 | Regular grid or mountain data
+        observers: 观察点地理坐标列表 | List of observer world coordinates
+        observer_height: 观察点离地高度（标量或每个观察点一个值） | Observer height above ground (scalar or one per observer)
+        target_height: 目标离地高度 | Target height above ground
+        max_distance: 最大分析距离 | Maximum analysis distance
+        earth_curvature: 是否修正地球曲率和大气折射 | Whether to correct for earth curvature and refraction
+        refraction: 大气折射系数 | Atmospheric refraction coefficient
+        combine: 'count'（每个单元可见的观察点数）、'any'（任一观察点可见）或None（返回各自的可视域） |
+            'count' (number of observers seeing each cell), 'any' (visible from any observer) or None (return each viewshed)
+        workers: 进程数（None或1为串行） | Number of processes (None or 1 runs serially)
+        chunk_samples: 每批射线的最大采样数 | Maximum samples per batch of rays
+        scratch_dir: 暂存网格的目录（默认临时目录） | Directory for the staged grid (defaults to a temporary directory)
+        mp_context: multiprocessing上下文 | multiprocessing context
+        resolution: 散点数据网格化的分辨率 | Gridding resolution for scattered data
+
+    Returns:
+        合并后的GridData，或combine为None时的GridData列表 | Combined GridData, or a list of GridData when combine is None
+
+    Raises:
+        ValueError: combine无效或观察点无效 | Invalid combine mode or observer
+    """
+    if combine is not None and combine not in COMBINE_MODES:
+        raise ValueError(f"combine must be one of {COMBINE_MODES} or None")
+
+    grid = as_grid(data, resolution=resolution)
+    z = _elevation_array(grid)
+    observers = np.asarray(observers, dtype=np.float64).reshape(-1, 2)
+    heights = np.broadcast_to(np.asarray(observer_height, dtype=np.float64), (len(observers),))
+    coefficient = _curvature_coefficient(earth_curvature, refraction)
+
+    # 在主进程中验证观察点，使错误在启动进程池前抛出 | Validate observers in the parent so errors surface before the pool starts
+    cells = [_observer_cell(grid, point) for point in observers]
+    tasks = [(row, col, float(z[row, col] + height), target_height, max_distance, coefficient, chunk_samples)
+             for (row, col), height in zip(cells, heights)]
+
+    if workers is not None and workers > 1 and len(tasks) > 1:
+        own_scratch = scratch_dir is None
+        scratch = Path(tempfile.mkdtemp(prefix='pymountain-viewshed-') if own_scratch else scratch_dir)
+        try:
+            scratch.mkdir(parents=True, exist_ok=True)
+            staged = scratch / 'elevation.npy'
+            np.save(staged, z)
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                     initargs=(str(staged), grid.transform), mp_context=mp_context) as executor:
+                packed = list(executor.map(_run_observer, tasks))
+            results = [(np.unpackbits(bits, count=shape[0] * shape[1]).reshape(shape).astype(bool), window)
+                       for bits, shape, window in packed]
+        finally:
+            if own_scratch:
+                shutil.rmtree(scratch, ignore_errors=True)
+    else:
+        results = [_visible_window(z, grid.transform, *task) for task in tasks]
+
+    if combine is None:
+        grids = []
+        for (row, col), point, height, (visible, window) in zip(cells, observers, heights, results):
+            values = _window_result(z, grid.transform, row, col, window, max_distance)
+            r0, r1, c0, c1 = window
+            values[r0:r1, c0:c1][visible] = 1.0
+            metadata = {'product': 'viewshed', 'observer': (float(point[0]), float(point[1])),
+                        'observer_height': float(height), 'target_height': target_height}
+            grids.append(GridData(values, grid.transform, metadata=metadata))
+        return grids
+
+    counts = np.zeros(z.shape, dtype=np.float32)
+    for visible, (r0, r1, c0, c1) in results:
+        counts[r0:r1, c0:c1] += visible
+    if combine == 'any':
+        counts = (counts > 0).astype(np.float32)
+    counts[np.isnan(z)] = np.nan
+    metadata = {'product': 'viewshed_' + combine, 'observers': len(observers), 'target_height': target_height}
+    return GridData(counts, grid.transform, metadata=metadata)
+
+
+def line_of_sight(data: Union[GridData, MountainData], observers: Union[Point, Sequence[Point]],
+                  targets: Union[Point, Sequence[Point]], observer_height: Union[float, Sequence[float]] = 1.7,
+                  target_height: Union[float, Sequence[float]] = 0.0, spacing: Optional[float] = None,
+                  earth_curvature: bool = False, refraction: float = DEFAULT_REFRACTION,
+                  resolution: Optional[int] = None) -> np.ndarray:
+    """
+    批量通视查询 | Batch line-of-sight query
+
+    所有观察点-目标对作为两点折线一次加密和采样，遮挡判断按对分组矢量化完成；
+    观察点和目标按NumPy规则广播，可一对多或多对多 |
+    All observer/target pairs are densified and sampled as two-vertex polylines in one call, and the
+    blocking test is vectorized per pair; observers and targets broadcast by NumPy rules, so
+    one-to-many and many-to-many both work
+
+    Args:
+        data: 规则网格或山体数据 | Regular grid or mountain data
+        observers: 观察点坐标(x, y)或(N, 2)数组 | Observer coordinates (x, y) or an (N, 2) array
+        targets: 目标坐标(x, y)或(N, 2)数组 | Target coordinates (x, y) or an (N, 2) array
+        observer_height: 观察点离地高度 | Observer height above ground
+        target_height: 目标离地高度 | Target height above ground
+        spacing: 采样间距（默认为较小的像素尺寸） | Sample spacing (defaults to the smaller pixel size)
+        earth_curvature: 是否修正地球曲率和大气折射 | Whether to correct for earth curvature and refraction
+        refraction: 大气折射系数 | Atmospheric refraction coefficient
+        resolution: 散点数据网格化的分辨率 | Gridding resolution for scattered data
+
+    Returns:
+        每对一个布尔值的数组；端点在网格外或位于无数据单元时为False |
+        Boolean array with one value per pair; False when an endpoint is outside the grid or on a missing cell
+    """
+    observers = np.asarray(observers, dtype=np.float64).reshape(-1, 2)
+    targets = np.asarray(targets, dtype=np.float64).reshape(-1, 2)
+    observers, targets = np.broadcast_arrays(observers, targets)
+    count = len(observers)
+    observer_height = np.broadcast_to(np.asarray(observer_height, dtype=np.float64), (count,))
+    target_height = np.broadcast_to(np.asarray(target_height, dtype=np.float64), (count,))
+
+    sampler = ProfileSampler(as_grid(data, resolution=resolution))
+    profiles = sampler.extract(np.stack((observers, targets), axis=1), spacing)
+    distance, offsets = profiles.distance, profiles.offsets
+    elevation = profiles.elevation - _curvature_coefficient(earth_curvature, refraction) * distance ** 2
+
+    first, last = offsets[:-1], offsets[1:] - 1
+    start = elevation[first] + observer_height
+    rise = elevation[last] + target_height - start
+    length = distance[last]
+
+    # 视线在每个采样点的高度 | Height of the sight line at every sample
+    owner = np.repeat(np.arange(count), np.diff(offsets))
+    fraction = np.divide(distance, length[owner], out=np.zeros_like(distance), where=length[owner] > 0)
+    blocked = elevation > start[owner] + rise[owner] * fraction
+    blocked[first] = False
+    blocked[last] = False
+
+    visible = np.bincount(owner[blocked], minlength=count) == 0
+    return visible & np.isfinite(start) & np.isfinite(rise)
+
+
+def _elevation_array(grid: GridData) -> np.ndarray:
+    """取得无数据为NaN的高程数组 | Get the elevation array with NaN for missing cells"""
+    if grid.is_rotated:
+        raise ValueError("Viewshed analysis requires a grid without rotation")
+    return grid.filled(np.nan, dtype=grid.z.dtype)
+
+
+def _observer_cell(grid: GridData, observer: Point) -> Tuple[int, int]:
+    """观察点所在单元 | Cell containing the observer"""
+    row, col = grid.world_to_pixel(observer[0], observer[1])
+    row, col = int(np.rint(row)), int(np.rint(col))
+    rows, cols = grid.shape
+    if not (0 <= row < rows and 0 <= col < cols):
+        raise ValueError(f"Observer {tuple(observer)} is outside the grid")
+    if not grid.valid_mask()[row, col]:
+        raise ValueError(f"Observer {tuple(observer)} is on a missing cell")
+    return row, col
+
+
+def _curvature_coefficient(earth_curvature: bool, refraction: float) -> float:
+    """地球曲率下降量系数：drop = c * d**2 | Earth curvature drop coefficient: drop = c * d**2"""
+    return (1.0 - refraction) / (2.0 * EARTH_RADIUS) if earth_curvature else 0.0
+
+
+def _analysis_window(shape: Tuple[int, int], transform: Tuple[float, ...], row: int, col: int,
+                     max_distance: Optional[float]) -> Tuple[int, int, int, int]:
+    """包含最大分析距离的网格窗口(r0, r1, c0, c1) | Grid window (r0, r1, c0, c1) covering the maximum analysis distance"""
+    rows, cols = shape
+    if max_distance is None:
+        return 0, rows, 0, cols
+    reach_rows = int(np.ceil(max_distance / abs(transform[5])))
+    reach_cols = int(np.ceil(max_distance / abs(transform[1])))
+    return (max(row - reach_rows, 0), min(row + reach_rows + 1, rows),
+            max(col - reach_cols, 0), min(col + reach_cols + 1, cols))
+
+
+def _window_result(z: np.ndarray, transform: Tuple[float, ...], row: int, col: int,
+                   window: Tuple[int, int, int, int], max_distance: Optional[float]) -> np.ndarray:
+    """窗口内初始化为0、其余为NaN的float32结果 | float32 result that is 0 inside the window and NaN elsewhere"""
+    values = np.full(z.shape, np.nan, dtype=np.float32)
+    r0, r1, c0, c1 = window
+    target = values[r0:r1, c0:c1]
+    target[...] = 0.0
+    target[np.isnan(z[r0:r1, c0:c1])] = np.nan
+    if max_distance is not None:
+        dy = (np.arange(r0, r1) - row) * transform[5]
+        dx = (np.arange(c0, c1) - col) * transform[1]
+        target[np.hypot(dy[:, None], dx[None, :]) > max_distance] = np.nan
+    return values
+
+
+def _visible_window(z: np.ndarray, transform: Tuple[float, ...], row: int, col: int, observer_z: float,
+                    target_height: float, max_distance: Optional[float], curvature: float,
+                    chunk_samples: int) -> Tuple[np.ndarray, Tuple[int, int, int, int]]:
+    """
+    在分析窗口内计算可见单元 | Compute the visible cells inside the analysis window
+
+    Returns:
+        (窗口内的布尔可见数组, 窗口(r0, r1, c0, c1)) | (boolean visibility array of the window, window (r0, r1, c0, c1))
+    """
+    window = _analysis_window(z.shape, transform, row, col, max_distance)
+    r0, r1, c0, c1 = window
+    block = z[r0:r1, c0:c1]
+    height, width = block.shape
+    visible = np.zeros((height, width), dtype=bool)
+    orow, ocol = row - r0, col - c0
+    visible[orow, ocol] = True
+
+    # 窗口边界上的所有单元作为射线终点 | Every cell on the window boundary is a ray end
+    edge_rows = np.concatenate((np.zeros(width), np.arange(1, height), np.full(width - 1, height - 1),
+                                np.arange(height - 2, 0, -1))).astype(np.intp)
+    edge_cols = np.concatenate((np.arange(width), np.full(height - 1, width - 1), np.arange(width - 2, -1, -1),
+                                np.zeros(height - 2))).astype(np.intp)
+    ends = np.unique(edge_rows * width + edge_cols)
+    ends = ends[ends != orow * width + ocol]
+    if len(ends) == 0:
+        return visible, window
+
+    d_row = ends // width - orow
+    d_col = ends % width - ocol
+    steps = np.maximum(np.abs(d_row), np.abs(d_col))
+    ray_length = np.hypot(d_col * transform[1], d_row * transform[5])
+
+    flat_block = block.reshape(-1)
+    flat_visible = visible.reshape(-1)
+    max_steps = int(steps.max())
+    batch = max(1, chunk_samples // max_steps)
+    position = np.arange(1, max_steps + 1, dtype=np.float64)
+
+    for start in range(0, len(ends), batch):
+        part = slice(start, start + batch)
+        n = steps[part, None]
+        inside = position[None, :] <= n
+        # 超出射线终点的采样停在终点并被屏蔽 | Samples past the ray end stay on the end and are masked
+        fraction = np.minimum(position[None, :], n) / n
+        index = (np.rint(orow + d_row[part, None] * fraction).astype(np.intp) * width
+                 + np.rint(ocol + d_col[part, None] * fraction).astype(np.intp))
+        distance = fraction * ray_length[part, None]
+
+        elevation = flat_block[index].astype(np.float64)
+        if curvature:
+            elevation -= curvature * distance ** 2
+        elevation -= observer_z
+        valid = inside & np.isfinite(elevation)
+        if max_distance is not None:
+            valid &= distance <= max_distance
+
+        # 前面所有采样的最大仰角正切就是地平线；无数据单元不遮挡 |
+        # The horizon is the largest elevation tangent over all earlier samples; missing cells do not block
+        tangent = np.where(valid, elevation / distance, -np.inf)
+        horizon = np.maximum.accumulate(tangent, axis=1)
+        horizon[:, 1:] = horizon[:, :-1]
+        horizon[:, 0] = -np.inf
+        seen = valid & ((elevation + target_height) / distance >= horizon)
+        flat_visible[index[seen]] = True
+
+    return visible, window
+
+
+# 工作进程内的内存映射网格 | Per-worker memory-mapped grid
+_WORKER_GRID: Dict[str, Any] = {}
+
+
+def _init_worker(staged_path: str, transform: Tuple[float, ...]) -> None:
+    """工作进程初始化：以只读内存映射打开暂存网格 | Worker initialization: open the staged grid as a read-only memory map"""
+    _WORKER_GRID['z'] = np.load(staged_path, mmap_mode='r')
+    _WORKER_GRID['transform'] = transform
+
+
+def _run_observer(task: Tuple[Any, ...]) -> Tuple[np.ndarray, Tuple[int, int], Tuple[int, int, int, int]]:
+    """在工作进程中计算一个观察点，结果按位打包以减少进程间传输 | Compute one observer in a worker; the result is bit-packed to cut inter-process traffic"""
+    visible, window = _visible_window(_WORKER_GRID['z'], _WORKER_GRID['transform'], *task)
+    return np.packbits(visible, axis=None), visible.shape, window
@@ -0,0 +1,68 @@
+"""
+PyMountain命令行接口 | PyMountain command-line interface
+
+用法 | Usage:
+    pymountain batch jobs.json --workers 8 --retries 2 --report report.json
+"""
+
+import argparse
+import sys
+from typing import List, Optional
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """构建参数解析器 | Build argument parser"""
+    parser = argparse.ArgumentParser(
+        prog='pymountain',
+        description='PyMountain command-line tools',
+    )
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    # 批量渲染子命令 | Batch rendering subcommand
+    batch = subparsers.add_parser('batch', help='Render a list of jobs on a process pool')
+    batch.add_argument('jobs', help='JSON or JSON Lines file with jobs '
+                                    '(dataset_path, renderer_type, config, output_path)')
+    batch.add_argument('--workers', type=int, default=None,
+                       help='Number of worker processes (default: CPU count)')
+    batch.add_argument('--retries', type=int, default=1, help='Retries per failed job (default: 1)')
+    batch.add_argument('--scratch-dir', default=None,
+                       help='Directory for memory-mapped dataset files (default: temporary directory)')
+    batch.add_argument('--report', default=None, help='Write the per-job timing report as JSON')
+    batch.add_argument('--quiet', action='store_true', help='Only print the summary line')
+
+    return parser
+
+
+def _run_batch(args: argparse.Namespace) -> int:
+    """执行batch子命令 | Execute the batch subcommand"""
+    from .services.batch import load_jobs, run_batch
+
+    jobs = load_jobs(args.jobs)
+    report = run_batch(jobs, max_workers=args.workers, retries=args.retries,
+                       scratch_dir=args.scratch_dir, report_path=args.report)
+
+    table = report.format_table()
+    print(table.splitlines()[-1] if args.quiet else table)
+    for result in report.failed:
+        print(f"FAILED {result.job_id}: {result.error}", file=sys.stderr)
+    return 1 if report.failed else 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    命令行入口 | Command-line entry point
+
+    Args:
+        argv: 命令行参数（默认sys.argv[1:]） | Command-line arguments (defaults to sys.argv[1:])
+
+    Returns:
+        退出码 | Exit code
+    """
+    args = _build_parser().parse_args(argv)
+    if args.command == 'batch':
+        return _run_batch(args)
+    return 2
+
+
+if __name__ == '__main__':
+    sys.exit(main())
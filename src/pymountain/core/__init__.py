@@ -6,10 +6,21 @@ PyMountain核心模块 | PyMountain core module
 
 # 核心模块导入 | Core module imports
 from .data import BasePoint, MountainData
+from .grid import GridData
 from .renderer import BaseRenderer
+from .profiling import profile, stage, profiled, record_cache, register_hook, unregister_hook, Profiler, StageRecord
 
 __all__ = [
     "BasePoint",
     "MountainData", 
-    "BaseRenderer"
+    "GridData",
+    "BaseRenderer",
+    "profile",
+    "stage",
+    "profiled",
+    "record_cache",
+    "register_hook",
+    "unregister_hook",
+    "Profiler",
+    "StageRecord",
 ]
\ No newline at end of file
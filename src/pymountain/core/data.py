@@ -8,9 +8,12 @@ import numpy as np
 from typing import List, Tuple, Optional, Union, Dict, Any, Iterator
 from dataclasses import dataclass, field
 import copy
+import hashlib
 import json
 from pathlib import Path
 
+from .profiling import profiled
+
 
 @dataclass
 class BasePoint:
@@ -143,11 +146,19 @@ class MountainData:
     
     负责存储、管理和操作山体地形数据点集合 | Responsible for storing, managing and operating mountain terrain data point collections
     
+    数据可以是BasePoint列表，也可以由NumPy数组直接支撑（见from_arrays()）。数组模式下
+    to_numpy_arrays()、边界和统计信息无需逐点的Python操作；首次访问points或修改数据时
+    才会物化为BasePoint列表 |
+    Data is either a list of BasePoint objects or backed directly by NumPy arrays (see
+    from_arrays()). In array mode to_numpy_arrays(), bounds and statistics need no per-point
+    Python work; the BasePoint list is only materialized on first access to points or on mutation
+    
     Attributes:
         points: 数据点列表 | List of data points
         metadata: 数据集元数据 | Dataset metadata
         _bounds_cache: 边界缓存 | Bounds cache
         _grid_cache: 网格缓存 | Grid cache
+        _fingerprint_cache: 数据指纹缓存 | Data fingerprint cache
     """
     
     def __init__(self, points: Optional[List[BasePoint]] = None, metadata: Optional[Dict[str, Any]] = None):
@@ -158,15 +169,98 @@ class MountainData:
             points: 初始数据点列表 | Initial list of data points
             metadata: 数据集元数据 | Dataset metadata
         """
-        self.points: List[BasePoint] = points or []
+        self._points: Optional[List[BasePoint]] = points or []
+        self._arrays: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None
         self.metadata: Dict[str, Any] = metadata or {}
         self._bounds_cache: Optional[Dict[str, float]] = None
         self._grid_cache: Optional[Dict[str, Any]] = None
+        self._fingerprint_cache: Optional[str] = None
         
         # 验证初始数据 | Validate initial data
-        if self.points:
+        if self._points:
             self._validate_points()
     
+    @classmethod
+    def from_arrays(cls, x_array: np.ndarray, y_array: np.ndarray, z_array: np.ndarray,
+                    metadata: Optional[Dict[str, Any]] = None) -> 'MountainData':
+        """
+        由坐标数组创建数组模式的数据对象 | Create an array-backed data object from coordinate arrays
+        
+        float64数组不会被复制，数据对象持有其只读视图；调用方之后不应修改原数组 |
+        float64 arrays are not copied; the data object holds read-only views of them, and the
+        caller should not modify the original arrays afterwards
+        
+        Args:
+            x_array: X坐标数组 | X coordinate array
+            y_array: Y坐标数组 | Y coordinate array
+            z_array: Z坐标数组 | Z coordinate array
+            metadata: 数据集元数据 | Dataset metadata
+            
+        Returns:
+            新的MountainData实例 | New MountainData instance
+            
+        Raises:
+            ValueError: 数组长度不一致或不是一维 | Arrays differ in length or are not one-dimensional
+        """
+        data = cls(metadata=metadata)
+        data._set_arrays(x_array, y_array, z_array)
+        return data
+    
+    @classmethod
+    def from_xyz(cls, xyz: np.ndarray, metadata: Optional[Dict[str, Any]] = None) -> 'MountainData':
+        """
+        由(N, 3)数组创建数组模式的数据对象（列视图，不复制） | Create an array-backed data object from an (N, 3) array (column views, no copy)
+        
+        Args:
+            xyz: (N, 3)坐标数组 | (N, 3) coordinate array
+            metadata: 数据集元数据 | Dataset metadata
+            
+        Returns:
+            新的MountainData实例 | New MountainData instance
+        """
+        xyz = np.asarray(xyz, dtype=np.float64)
+        if xyz.ndim != 2 or xyz.shape[1] != 3:
+            raise ValueError(f"xyz must have shape (N, 3), got {xyz.shape}")
+        return cls.from_arrays(xyz[:, 0], xyz[:, 1], xyz[:, 2], metadata=metadata)
+    
+    def _set_arrays(self, x_array: np.ndarray, y_array: np.ndarray, z_array: np.ndarray) -> None:
+        """切换到数组模式 | Switch to array mode"""
+        arrays = []
+        for array in (x_array, y_array, z_array):
+            view = np.asarray(array, dtype=np.float64).view()
+            if view.ndim != 1:
+                raise ValueError("Coordinate arrays must be one-dimensional")
+            view.flags.writeable = False
+            arrays.append(view)
+        
+        if not len(arrays[0]) == len(arrays[1]) == len(arrays[2]):
+            raise ValueError("All arrays must have the same length")
+        
+        self._arrays = tuple(arrays)
+        self._points = None
+        self._clear_cache()
+    
+    @property
+    def points(self) -> List[BasePoint]:
+        """数据点列表（数组模式下首次访问时物化） | List of data points (materialized on first access in array mode)"""
+        if self._points is None:
+            x_array, y_array, z_array = self._arrays
+            self._points = [BasePoint(x=x, y=y, z=z) for x, y, z in
+                            zip(x_array.tolist(), y_array.tolist(), z_array.tolist())]
+            self._arrays = None
+        return self._points
+    
+    @points.setter
+    def points(self, points: List[BasePoint]) -> None:
+        self._points = points
+        self._arrays = None
+        self._validate_points()
+        self._clear_cache()
+    
+    def is_array_backed(self) -> bool:
+        """是否处于数组模式 | Whether the data is array-backed"""
+        return self._arrays is not None
+    
     def _validate_points(self) -> None:
         """验证数据点的有效性 | Validate data points"""
         if not all(isinstance(point, BasePoint) for point in self.points):
@@ -176,6 +270,7 @@ class MountainData:
         """清除缓存数据 | Clear cached data"""
         self._bounds_cache = None
         self._grid_cache = None
+        self._fingerprint_cache = None
     
     def add_point(self, x: float, y: float, z: float, metadata: Optional[Dict[str, Any]] = None) -> None:
         """
@@ -263,20 +358,18 @@ class MountainData:
         if self._bounds_cache is not None:
             return self._bounds_cache
         
-        if not self.points:
+        if len(self) == 0:
             return {'min_x': 0, 'max_x': 0, 'min_y': 0, 'max_y': 0, 'min_z': 0, 'max_z': 0}
         
-        x_coords = [p.x for p in self.points]
-        y_coords = [p.y for p in self.points]
-        z_coords = [p.z for p in self.points]
+        x_coords, y_coords, z_coords = self.to_numpy_arrays()
         
         self._bounds_cache = {
-            'min_x': min(x_coords),
-            'max_x': max(x_coords),
-            'min_y': min(y_coords),
-            'max_y': max(y_coords),
-            'min_z': min(z_coords),
-            'max_z': max(z_coords)
+            'min_x': float(np.min(x_coords)),
+            'max_x': float(np.max(x_coords)),
+            'min_y': float(np.min(y_coords)),
+            'max_y': float(np.max(y_coords)),
+            'min_z': float(np.min(z_coords)),
+            'max_z': float(np.max(z_coords))
         }
         
         return self._bounds_cache
@@ -294,6 +387,12 @@ class MountainData:
         Returns:
             区域内的点列表 | List of points in region
         """
+        if self._arrays is not None:
+            x_coords, y_coords, z_coords = self._arrays
+            index = np.flatnonzero((x_coords >= min_x) & (x_coords <= max_x) &
+                                   (y_coords >= min_y) & (y_coords <= max_y))
+            return [BasePoint(x=float(x_coords[i]), y=float(y_coords[i]), z=float(z_coords[i])) for i in index]
+        
         return [p for p in self.points 
                 if min_x <= p.x <= max_x and min_y <= p.y <= max_y]
     
@@ -304,10 +403,10 @@ class MountainData:
         Returns:
             包含统计信息的字典 | Dictionary containing statistics
         """
-        if not self.points:
+        if len(self) == 0:
             return {'min': 0, 'max': 0, 'mean': 0, 'std': 0, 'count': 0}
         
-        elevations = np.array([p.z for p in self.points])
+        elevations = self.to_numpy_arrays()[2]
         
         return {
             'min': float(np.min(elevations)),
@@ -317,19 +416,45 @@ class MountainData:
             'count': len(elevations)
         }
     
+    def fingerprint(self) -> str:
+        """
+        计算数据坐标的内容指纹 | Compute a content fingerprint of the data coordinates
+        
+        指纹在数据通过MountainData方法修改时自动失效；直接修改BasePoint属性后需调用_clear_cache() |
+        The fingerprint is invalidated automatically when data is modified through MountainData methods;
+        call _clear_cache() after mutating BasePoint attributes directly
+        
+        Returns:
+            十六进制摘要字符串 | Hexadecimal digest string
+        """
+        if self._fingerprint_cache is None:
+            digest = hashlib.blake2b(digest_size=16)
+            digest.update(str(len(self)).encode())
+            for array in self.to_numpy_arrays():
+                digest.update(np.ascontiguousarray(array, dtype=np.float64).tobytes())
+            self._fingerprint_cache = digest.hexdigest()
+        return self._fingerprint_cache
+    
+    @profiled('to_numpy_arrays')
     def to_numpy_arrays(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
         """
         转换为NumPy数组格式 | Convert to NumPy array format
         
+        数组模式下直接返回只读视图，不复制 | In array mode read-only views are returned without copying
+        
         Returns:
             (x_array, y_array, z_array)元组 | (x_array, y_array, z_array) tuple
         """
-        if not self.points:
+        if self._arrays is not None:
+            return self._arrays
+        
+        if not self._points:
             return np.array([]), np.array([]), np.array([])
         
-        x_coords = np.array([p.x for p in self.points])
-        y_coords = np.array([p.y for p in self.points])
-        z_coords = np.array([p.z for p in self.points])
+        count = len(self._points)
+        x_coords = np.fromiter((p.x for p in self._points), dtype=np.float64, count=count)
+        y_coords = np.fromiter((p.y for p in self._points), dtype=np.float64, count=count)
+        z_coords = np.fromiter((p.z for p in self._points), dtype=np.float64, count=count)
         
         return x_coords, y_coords, z_coords
     
@@ -347,11 +472,15 @@ class MountainData:
         if len(x_array) != len(y_array) or len(y_array) != len(z_array):
             raise ValueError("All arrays must have the same length")
         
-        if clear_existing:
-            self.points.clear()
-        
-        for x, y, z in zip(x_array, y_array, z_array):
-            self.add_point(float(x), float(y), float(z))
+        # 替换或追加到数组模式数据时无需逐点处理 | Replacing, or appending to array-backed data, needs no per-point work
+        if clear_existing or len(self) == 0:
+            self._set_arrays(x_array, y_array, z_array)
+        elif self._arrays is not None:
+            self._set_arrays(*(np.concatenate((old, np.asarray(new, dtype=np.float64)))
+                               for old, new in zip(self._arrays, (x_array, y_array, z_array))))
+        else:
+            for x, y, z in zip(x_array, y_array, z_array):
+                self.add_point(float(x), float(y), float(z))
     
     def load_from_dataframe(self, df, x_col: str = 'x', y_col: str = 'y', z_col: str = 'z', 
                            clear_existing: bool = True) -> None:
@@ -382,11 +511,8 @@ class MountainData:
         if missing_cols:
             raise KeyError(f"Missing columns: {missing_cols}")
         
-        if clear_existing:
-            self.points.clear()
-        
-        for _, row in df.iterrows():
-            self.add_point(float(row[x_col]), float(row[y_col]), float(row[z_col]))
+        self.load_from_arrays(df[x_col].to_numpy(dtype=np.float64), df[y_col].to_numpy(dtype=np.float64),
+                              df[z_col].to_numpy(dtype=np.float64), clear_existing=clear_existing)
     
     def to_json(self, filepath: Optional[Union[str, Path]] = None) -> Union[str, None]:
         """
@@ -420,7 +546,10 @@ class MountainData:
             data: JSON字符串、文件路径或字典 | JSON string, file path, or dictionary
             clear_existing: 是否清除现有数据 | Whether to clear existing data
         """
-        if isinstance(data, (str, Path)):
+        if isinstance(data, str) and data.lstrip().startswith('{'):
+            # JSON对象字符串（可能长于文件名上限，不能当作路径检查） | JSON object string (may exceed the file name limit, so it is not checked as a path)
+            json_data = json.loads(data)
+        elif isinstance(data, (str, Path)):
             # 判断是文件路径还是JSON字符串 | Determine if it's a file path or JSON string
             if Path(data).exists():
                 with open(data, 'r', encoding='utf-8') as f:
@@ -433,7 +562,7 @@ class MountainData:
             raise TypeError("Data must be a JSON string, file path, or dictionary")
         
         if clear_existing:
-            self.points.clear()
+            self.clear()
         
         # 加载元数据 | Load metadata
         if 'metadata' in json_data:
@@ -452,17 +581,23 @@ class MountainData:
         Returns:
             新的MountainData实例 | New MountainData instance
         """
-        new_points = [point.copy() for point in self.points]
         new_metadata = copy.deepcopy(self.metadata)
+        if self._arrays is not None:
+            return MountainData.from_arrays(*(array.copy() for array in self._arrays), metadata=new_metadata)
+        
+        new_points = [point.copy() for point in self.points]
         return MountainData(points=new_points, metadata=new_metadata)
     
     def clear(self) -> None:
         """清除所有数据点 | Clear all data points"""
-        self.points.clear()
+        self._points = []
+        self._arrays = None
         self._clear_cache()
     
     def __len__(self) -> int:
-        return len(self.points)
+        if self._arrays is not None:
+            return len(self._arrays[0])
+        return len(self._points)
     
     def __getitem__(self, index: int) -> BasePoint:
         return self.points[index]
@@ -479,7 +614,7 @@ class MountainData:
     def __str__(self) -> str:
         bounds = self.get_bounds()
         stats = self.get_elevation_stats()
-        return (f"MountainData(points={len(self.points)}, "
+        return (f"MountainData(points={len(self)}, "
                 f"bounds=({bounds['min_x']:.2f},{bounds['min_y']:.2f}) to ({bounds['max_x']:.2f},{bounds['max_y']:.2f}), "
                 f"elevation={stats['min']:.2f}-{stats['max']:.2f}m)")
     
@@ -0,0 +1,712 @@
+"""
+PyMountain规则网格数据模块 | PyMountain regular grid data module
+
+定义规则栅格数字高程模型(DEM)的数据结构。网格保存二维高程数组、GDAL风格的仿射地理变换和无数据掩膜，
+渲染和分析时在像素空间中重采样，无需展开为散点再三角剖分插值 |
+Defines the data structure for regular raster digital elevation models (DEM). A grid keeps the 2D
+elevation array, a GDAL-style affine geotransform and a nodata mask, and is resampled in pixel space
+for rendering and analysis instead of being exploded into scattered points and re-triangulated
+"""
+
+import copy
+import hashlib
+from typing import Dict, Any, Optional, Tuple, Union, Iterator
+
+import numpy as np
+
+from .data import MountainData
+
+
+# GDAL地理变换(origin_x, pixel_width, x_skew, origin_y, y_skew, pixel_height) |
+# GDAL geotransform (origin_x, pixel_width, x_skew, origin_y, y_skew, pixel_height)
+GeoTransform = Tuple[float, float, float, float, float, float]
+
+# 默认变换：像素即坐标单位，第0行位于y=0 | Default transform: pixels are coordinate units, row 0 at y=0
+IDENTITY_TRANSFORM: GeoTransform = (0.0, 1.0, 0.0, 0.0, 0.0, 1.0)
+
+RESAMPLING_METHODS = ('bilinear', 'nearest', 'average')
+
+# 逐行块统计时每块的元素数 | Elements per row block for block-wise statistics
+_CHUNK_SIZE = 1 << 22
+
+
+class GridData:
+    """
+    规则网格高程数据 | Regular grid elevation data
+    
+    像素(row, col)的中心坐标为 | The center of pixel (row, col) is at
+        x = origin_x + (col + 0.5) * pixel_width + (row + 0.5) * x_skew
+        y = origin_y + (col + 0.5) * y_skew + (row + 0.5) * pixel_height
+    与GDAL一致，北向上的栅格pixel_height为负 | As in GDAL, north-up rasters have a negative pixel_height
+    
+    非有限值和等于nodata的单元格视为无数据 | Non-finite cells and cells equal to nodata are treated as missing
+    
+    Attributes:
+        z: 只读的(rows, cols)高程数组 | Read-only (rows, cols) elevation array
+        transform: 仿射地理变换 | Affine geotransform
+        nodata: 无数据值（可选） | Nodata value (optional)
+        metadata: 数据集元数据 | Dataset metadata
+    """
+    
+    def __init__(self, z: np.ndarray, transform: Optional[GeoTransform] = None,
+                 nodata: Optional[float] = None, metadata: Optional[Dict[str, Any]] = None):
+        """
+        初始化网格数据 | Initialize grid data
+        
+        浮点数组（包括内存映射）不会被复制，网格持有其只读视图；其他类型转换为float64 |
+        Floating-point arrays (including memory maps) are not copied; the grid holds a read-only
+        view of them. Other dtypes are converted to float64
+        
+        Args:
+            z: 二维高程数组 | 2D elevation array
+            transform: GDAL地理变换（默认为IDENTITY_TRANSFORM） | GDAL geotransform (IDENTITY_TRANSFORM by default)
+            nodata: 无数据值 | Nodata value
+            metadata: 数据集元数据 | Dataset metadata
+        
+        Raises:
+            ValueError: 数组不是二维、为空或地理变换不可逆 | Array is not 2D, is empty or the geotransform is singular
+        """
+        z = np.asarray(z)
+        if not np.issubdtype(z.dtype, np.floating):
+            z = z.astype(np.float64)
+        if z.ndim != 2:
+            raise ValueError(f"z must be a 2D array, got shape {z.shape}")
+        if z.size == 0:
+            raise ValueError("z must not be empty")
+        
+        z = z.view()
+        z.flags.writeable = False
+        self.z = z
+        
+        transform = IDENTITY_TRANSFORM if transform is None else tuple(float(value) for value in transform)
+        if len(transform) != 6:
+            raise ValueError("transform must have 6 elements (GDAL geotransform)")
+        if transform[1] * transform[5] - transform[2] * transform[4] == 0:
+            raise ValueError("transform must be invertible")
+        self.transform: GeoTransform = transform
+        
+        self.nodata = None if nodata is None else float(nodata)
+        self.metadata: Dict[str, Any] = metadata or {}
+        self._valid_cache: Optional[np.ndarray] = None
+        self._stats_cache: Optional[Dict[str, float]] = None
+        self._fingerprint_cache: Optional[str] = None
+    
+    @classmethod
+    def from_coordinates(cls, x: np.ndarray, y: np.ndarray, z: np.ndarray,
+                         nodata: Optional[float] = None, metadata: Optional[Dict[str, Any]] = None,
+                         rtol: float = 1e-6) -> 'GridData':
+        """
+        由等间距的单元中心坐标创建网格 | Create a grid from evenly spaced cell-center coordinates
+        
+        Args:
+            x: 列中心X坐标（长度cols），或np.meshgrid生成的二维X数组 | Column-center X coordinates (length cols), or a 2D X array from np.meshgrid
+            y: 行中心Y坐标（长度rows），或二维Y数组 | Row-center Y coordinates (length rows), or a 2D Y array
+            z: (rows, cols)高程数组 | (rows, cols) elevation array
+            nodata: 无数据值 | Nodata value
+            metadata: 数据集元数据 | Dataset metadata
+            rtol: 判断等间距的相对容差 | Relative tolerance for even spacing
+        
+        Returns:
+            新的GridData实例 | New GridData instance
+        
+        Raises:
+            ValueError: 坐标不是等间距或与z的形状不符 | Coordinates are unevenly spaced or do not match z's shape
+        """
+        z = np.asarray(z)
+        x = np.asarray(x, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        if x.ndim == 2:
+            x = x[0]
+        if y.ndim == 2:
+            y = y[:, 0]
+        if z.ndim != 2 or z.shape != (len(y), len(x)):
+            raise ValueError(f"z must have shape (len(y), len(x)) = ({len(y)}, {len(x)}), got {z.shape}")
+        
+        dx = _uniform_step(x, rtol, 'x')
+        dy = _uniform_step(y, rtol, 'y')
+        transform = (x[0] - dx / 2, dx, 0.0, y[0] - dy / 2, 0.0, dy)
+        return cls(z, transform, nodata=nodata, metadata=metadata)
+    
+    @classmethod
+    def from_mountain_data(cls, data: MountainData, resolution: Optional[int] = None,
+                           method: Optional[str] = 'linear', rtol: float = 1e-6) -> 'GridData':
+        """
+        由MountainData创建网格 | Create a grid from MountainData
+        
+        点位于规则格网上时（如展开的DEM）直接按索引放回网格，不做插值，缺失的格点为无数据；
+        否则用scipy.interpolate.griddata插值到resolution网格 |
+        When the points lie on a regular lattice (such as an exploded DEM) they are placed back into the
+        grid by index without interpolation, and missing lattice cells become nodata; otherwise they are
+        interpolated onto a resolution grid with scipy.interpolate.griddata
+        
+        Args:
+            data: 山体数据对象 | Mountain data object
+            resolution: 插值网格的长边单元数（默认约为sqrt(点数)） | Cells along the longer side of the interpolated grid (about sqrt(point count) by default)
+            method: 非规则点的插值方法（'linear'、'cubic'、'nearest'），None表示不插值 |
+                Interpolation method for irregular points ('linear', 'cubic', 'nearest'); None disables interpolation
+            rtol: 判断规则格网的相对容差 | Relative tolerance for lattice detection
+        
+        Returns:
+            新的GridData实例 | New GridData instance
+        
+        Raises:
+            ValueError: 数据少于3个点，或点不在规则格网上且method为None |
+                Fewer than 3 points, or the points are off-lattice and method is None
+        """
+        if len(data) < 3:
+            raise ValueError("At least 3 points are required to build a grid")
+        
+        x, y, z = data.to_numpy_arrays()
+        metadata = copy.deepcopy(data.metadata)
+        
+        lattice = _detect_lattice(x, y, rtol)
+        if lattice is not None:
+            (x0, dx, cols), (y0, dy, rows) = lattice
+            col = np.rint((x - x0) / dx).astype(np.intp)
+            # 北向上：第0行为最大Y | North-up: row 0 holds the largest Y
+            y_top = y0 + (rows - 1) * dy
+            row = np.rint((y_top - y) / dy).astype(np.intp)
+            grid = np.full((rows, cols), np.nan)
+            grid[row, col] = z
+            transform = (x0 - dx / 2, dx, 0.0, y_top + dy / 2, 0.0, -dy)
+            return cls(grid, transform, metadata=metadata)
+        
+        if method is None:
+            raise ValueError("Points do not lie on a regular lattice; pass an interpolation method")
+        
+        from scipy.interpolate import griddata
+        
+        if resolution is None:
+            resolution = max(2, int(np.sqrt(len(x))))
+        bounds = data.get_bounds()
+        span_x = bounds['max_x'] - bounds['min_x']
+        span_y = bounds['max_y'] - bounds['min_y']
+        longest = max(span_x, span_y) or 1.0
+        cols = max(2, int(round(resolution * span_x / longest)))
+        rows = max(2, int(round(resolution * span_y / longest)))
+        
+        xi = np.linspace(bounds['min_x'], bounds['max_x'], cols)
+        yi = np.linspace(bounds['min_y'], bounds['max_y'], rows)
+        X_grid, Y_grid = np.meshgrid(xi, yi)
+        Z_grid = griddata(np.column_stack((x, y)), z, (X_grid, Y_grid), method=method, fill_value=np.nan)
+        metadata['interpolation'] = method
+        return cls.from_coordinates(xi, yi, Z_grid, metadata=metadata)
+    
+    @property
+    def shape(self) -> Tuple[int, int]:
+        """网格形状(rows, cols) | Grid shape (rows, cols)"""
+        return self.z.shape
+    
+    @property
+    def size(self) -> int:
+        """单元格数 | Number of cells"""
+        return self.z.size
+    
+    @property
+    def resolution(self) -> Tuple[float, float]:
+        """像素尺寸(宽, 高)的绝对值 | Absolute pixel size (width, height)"""
+        _, a, b, _, d, e = self.transform
+        return float(np.hypot(a, d)), float(np.hypot(b, e))
+    
+    @property
+    def is_rotated(self) -> bool:
+        """地理变换是否包含旋转或错切 | Whether the geotransform has rotation or shear"""
+        return self.transform[2] != 0 or self.transform[4] != 0
+    
+    def valid_mask(self) -> np.ndarray:
+        """
+        获取有效单元格掩膜 | Get the valid-cell mask
+        
+        Returns:
+            只读布尔数组，True表示有数据 | Read-only boolean array, True where data is present
+        """
+        if self._valid_cache is None:
+            valid = np.isfinite(self.z)
+            if self.nodata is not None:
+                valid &= self.z != self.nodata
+            valid.flags.writeable = False
+            self._valid_cache = valid
+        return self._valid_cache
+    
+    def has_nodata(self) -> bool:
+        """是否存在无数据单元格 | Whether any cell is missing"""
+        return not bool(self.valid_mask().all())
+    
+    def count_valid(self) -> int:
+        """有效单元格数 | Number of valid cells"""
+        return int(np.count_nonzero(self.valid_mask()))
+    
+    def filled(self, value: float = np.nan, dtype: Any = np.float64) -> np.ndarray:
+        """
+        获取无数据单元格替换为value的高程数组 | Get the elevation array with missing cells replaced by value
+        
+        没有需要替换的单元格且类型一致时直接返回z，不复制 | Returns z without copying when nothing needs replacing and the dtype matches
+        
+        Args:
+            value: 替换值 | Replacement value
+            dtype: 输出类型 | Output dtype
+        
+        Returns:
+            高程数组 | Elevation array
+        """
+        if not self.has_nodata() and self.z.dtype == np.dtype(dtype):
+            return self.z
+        out = self.z.astype(dtype)
+        out[~self.valid_mask()] = value
+        return out
+    
+    def masked(self) -> np.ma.MaskedArray:
+        """
+        获取屏蔽无数据单元格的掩码数组（不复制高程） | Get a masked array hiding missing cells (elevations are not copied)
+        
+        Returns:
+            掩码数组 | Masked array
+        """
+        return np.ma.MaskedArray(self.z, mask=~self.valid_mask())
+    
+    def cell_center(self, row: Union[float, np.ndarray], col: Union[float, np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        像素坐标转地理坐标（整数像素坐标对应单元中心） | Pixel to world coordinates (integer pixel coordinates are cell centers)
+        
+        Args:
+            row: 行坐标 | Row coordinate
+            col: 列坐标 | Column coordinate
+        
+        Returns:
+            (x, y)坐标 | (x, y) coordinates
+        """
+        x0, a, b, y0, d, e = self.transform
+        row = np.asarray(row, dtype=np.float64) + 0.5
+        col = np.asarray(col, dtype=np.float64) + 0.5
+        return x0 + col * a + row * b, y0 + col * d + row * e
+    
+    def world_to_pixel(self, x: Union[float, np.ndarray], y: Union[float, np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        地理坐标转像素坐标（整数结果对应单元中心） | World to pixel coordinates (integer results are cell centers)
+        
+        Args:
+            x: X坐标 | X coordinate
+            y: Y坐标 | Y coordinate
+        
+        Returns:
+            (row, col)浮点像素坐标 | (row, col) fractional pixel coordinates
+        """
+        x0, a, b, y0, d, e = self.transform
+        det = a * e - b * d
+        dx = np.asarray(x, dtype=np.float64) - x0
+        dy = np.asarray(y, dtype=np.float64) - y0
+        col = (e * dx - b * dy) / det - 0.5
+        row = (a * dy - d * dx) / det - 0.5
+        return row, col
+    
+    def x_coords(self) -> np.ndarray:
+        """
+        列中心X坐标（仅限无旋转网格） | Column-center X coordinates (unrotated grids only)
+        
+        Raises:
+            ValueError: 网格有旋转 | The grid is rotated
+        """
+        self._require_unrotated()
+        x0, a = self.transform[0], self.transform[1]
+        return x0 + (np.arange(self.shape[1]) + 0.5) * a
+    
+    def y_coords(self) -> np.ndarray:
+        """
+        行中心Y坐标（仅限无旋转网格） | Row-center Y coordinates (unrotated grids only)
+        
+        Raises:
+            ValueError: 网格有旋转 | The grid is rotated
+        """
+        self._require_unrotated()
+        y0, e = self.transform[3], self.transform[5]
+        return y0 + (np.arange(self.shape[0]) + 0.5) * e
+    
+    def coordinate_grids(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        获取单元中心的二维坐标数组 | Get 2D arrays of cell-center coordinates
+        
+        Returns:
+            (X, Y)数组元组，形状与z相同 | (X, Y) array tuple with the shape of z
+        """
+        rows, cols = self.shape
+        if not self.is_rotated:
+            return np.meshgrid(self.x_coords(), self.y_coords())
+        return self.cell_center(np.arange(rows)[:, np.newaxis], np.arange(cols)[np.newaxis, :])
+    
+    def get_bounds(self) -> Dict[str, float]:
+        """
+        获取单元中心和有效高程的边界 | Get bounds of cell centers and valid elevations
+        
+        Returns:
+            包含min_x, max_x, min_y, max_y, min_z, max_z的字典 | Dictionary containing bounds
+        """
+        rows, cols = self.shape
+        cx, cy = self.cell_center(np.array([0, 0, rows - 1, rows - 1]), np.array([0, cols - 1, 0, cols - 1]))
+        stats = self.get_elevation_stats()
+        return {
+            'min_x': float(cx.min()), 'max_x': float(cx.max()),
+            'min_y': float(cy.min()), 'max_y': float(cy.max()),
+            'min_z': stats['min'], 'max_z': stats['max'],
+        }
+    
+    def get_extent(self) -> Tuple[float, float, float, float]:
+        """
+        获取网格外边缘的范围 | Get the extent of the grid's outer edges
+        
+        Returns:
+            (min_x, max_x, min_y, max_y)元组 | (min_x, max_x, min_y, max_y) tuple
+        """
+        rows, cols = self.shape
+        ex, ey = self.cell_center(np.array([-0.5, -0.5, rows - 0.5, rows - 0.5]),
+                                  np.array([-0.5, cols - 0.5, -0.5, cols - 0.5]))
+        return float(ex.min()), float(ex.max()), float(ey.min()), float(ey.max())
+    
+    def get_elevation_stats(self) -> Dict[str, float]:
+        """
+        获取有效单元格的高程统计（按行块计算，不复制整个网格） | Get elevation statistics of valid cells (computed in row blocks without copying the grid)
+        
+        Returns:
+            包含min、max、mean、std和count的字典 | Dictionary with min, max, mean, std and count
+        """
+        if self._stats_cache is not None:
+            return self._stats_cache
+        
+        count, total, total_sq = 0, 0.0, 0.0
+        low, high = np.inf, -np.inf
+        for block, valid in self.iter_row_blocks():
+            values = block[valid].astype(np.float64, copy=False)
+            if values.size == 0:
+                continue
+            count += values.size
+            total += float(values.sum())
+            total_sq += float(np.dot(values, values))
+            low = min(low, float(values.min()))
+            high = max(high, float(values.max()))
+        
+        if count == 0:
+            stats = {'min': 0, 'max': 0, 'mean': 0, 'std': 0, 'count': 0}
+        else:
+            mean = total / count
+            stats = {'min': low, 'max': high, 'mean': mean,
+                     'std': float(np.sqrt(max(total_sq / count - mean * mean, 0.0))), 'count': count}
+        self._stats_cache = stats
+        return stats
+    
+    def fingerprint(self) -> str:
+        """
+        计算高程、地理变换和无数据值的内容指纹 | Compute a content fingerprint of elevations, geotransform and nodata
+        
+        Returns:
+            十六进制摘要字符串 | Hexadecimal digest string
+        """
+        if self._fingerprint_cache is None:
+            digest = hashlib.blake2b(digest_size=16)
+            digest.update(f"grid{self.shape}{self.z.dtype.str}{self.transform}{self.nodata}".encode())
+            for block, _ in self.iter_row_blocks(with_mask=False):
+                digest.update(np.ascontiguousarray(block).tobytes())
+            self._fingerprint_cache = digest.hexdigest()
+        return self._fingerprint_cache
+    
+    def window(self, row_start: int, row_stop: int, col_start: int, col_stop: int) -> 'GridData':
+        """
+        截取窗口（共享高程数组） | Extract a window (sharing the elevation array)
+        
+        Args:
+            row_start: 起始行 | First row
+            row_stop: 结束行（不含） | Stop row (exclusive)
+            col_start: 起始列 | First column
+            col_stop: 结束列（不含） | Stop column (exclusive)
+        
+        Returns:
+            新的GridData实例 | New GridData instance
+        """
+        rows, cols = self.shape
+        row_start, row_stop, _ = slice(row_start, row_stop).indices(rows)
+        col_start, col_stop, _ = slice(col_start, col_stop).indices(cols)
+        if row_stop <= row_start or col_stop <= col_start:
+            raise ValueError("window must contain at least one cell")
+        
+        x0, a, b, y0, d, e = self.transform
+        transform = (x0 + col_start * a + row_start * b, a, b, y0 + col_start * d + row_start * e, d, e)
+        return GridData(self.z[row_start:row_stop, col_start:col_stop], transform,
+                        nodata=self.nodata, metadata=copy.deepcopy(self.metadata))
+    
+    def sample(self, x: Union[float, np.ndarray], y: Union[float, np.ndarray],
+               method: str = 'bilinear') -> np.ndarray:
+        """
+        在任意地理坐标处采样高程 | Sample elevations at arbitrary world coordinates
+        
+        网格外和无数据单元格附近的结果为NaN | Results outside the grid and next to missing cells are NaN
+        
+        Args:
+            x: X坐标 | X coordinates
+            y: Y坐标 | Y coordinates
+            method: 'bilinear'或'nearest' | 'bilinear' or 'nearest'
+        
+        Returns:
+            与输入广播形状相同的高程数组 | Elevation array with the broadcast shape of the inputs
+        """
+        if method not in ('bilinear', 'nearest'):
+            raise ValueError("method must be 'bilinear' or 'nearest'")
+        
+        row, col = np.broadcast_arrays(*self.world_to_pixel(x, y))
+        rows, cols = self.shape
+        z = self.filled()
+        # 允许半个像素的外延，使落在网格边缘上的点有值 | Allow half a pixel outside so points on the grid edge get values
+        inside = (row >= -0.5) & (row <= rows - 0.5) & (col >= -0.5) & (col <= cols - 0.5)
+        row = np.clip(row, 0, rows - 1)
+        col = np.clip(col, 0, cols - 1)
+        
+        if method == 'nearest':
+            result = z[np.rint(row).astype(np.intp), np.rint(col).astype(np.intp)].astype(np.float64)
+        else:
+            r0 = np.minimum(np.floor(row).astype(np.intp), max(rows - 2, 0))
+            c0 = np.minimum(np.floor(col).astype(np.intp), max(cols - 2, 0))
+            r1 = np.minimum(r0 + 1, rows - 1)
+            c1 = np.minimum(c0 + 1, cols - 1)
+            wr = row - r0
+            wc = col - c0
+            top = z[r0, c0] * (1 - wc) + z[r0, c1] * wc
+            bottom = z[r1, c0] * (1 - wc) + z[r1, c1] * wc
+            result = top * (1 - wr) + bottom * wr
+        
+        result = np.where(inside, result, np.nan)
+        return result if result.ndim else float(result)
+    
+    def resample(self, shape: Tuple[int, int], method: str = 'bilinear') -> 'GridData':
+        """
+        重采样到新的形状，保持网格范围不变 | Resample to a new shape, keeping the grid extent
+        
+        'average'先按整数倍块平均（忽略无数据），再用双线性插值补齐剩余的非整数倍 |
+        'average' first averages integer-factor blocks (ignoring missing cells), then bilinear
+        interpolation covers the remaining non-integer factor
+        
+        Args:
+            shape: 新形状(rows, cols) | New shape (rows, cols)
+            method: 'bilinear'、'nearest'或'average' | 'bilinear', 'nearest' or 'average'
+        
+        Returns:
+            新的GridData实例 | New GridData instance
+        """
+        if method not in RESAMPLING_METHODS:
+            raise ValueError(f"method must be one of {RESAMPLING_METHODS}")
+        new_rows, new_cols = int(shape[0]), int(shape[1])
+        if new_rows < 1 or new_cols < 1:
+            raise ValueError("shape must contain two positive integers")
+        
+        source = self
+        if method == 'average':
+            factor_r = max(1, self.shape[0] // new_rows)
+            factor_c = max(1, self.shape[1] // new_cols)
+            if factor_r > 1 or factor_c > 1:
+                source = self._block_average(factor_r, factor_c)
+            method = 'bilinear'
+        
+        rows, cols = source.shape
+        if (rows, cols) == (new_rows, new_cols):
+            return source if source is not self else self.copy()
+        
+        scale_r, scale_c = rows / new_rows, cols / new_cols
+        row = np.clip((np.arange(new_rows) + 0.5) * scale_r - 0.5, 0, rows - 1)
+        col = np.clip((np.arange(new_cols) + 0.5) * scale_c - 0.5, 0, cols - 1)
+        z = _resample_separable(source.filled(), row, col, method)
+        
+        x0, a, b, y0, d, e = source.transform
+        transform = (x0, a * scale_c, b * scale_r, y0, d * scale_c, e * scale_r)
+        return GridData(z, transform, metadata=copy.deepcopy(self.metadata))
+    
+    def to_render_grid(self, resolution: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        获取长边为resolution个单元的渲染网格 | Get a render grid with resolution cells along the longer side
+        
+        缩小时先块平均再插值以避免混叠，放大时双线性插值；无数据单元格为NaN |
+        Downsampling averages blocks before interpolating to avoid aliasing, upsampling is bilinear;
+        missing cells are NaN
+        
+        Args:
+            resolution: 长边单元数 | Cells along the longer side
+        
+        Returns:
+            (X_grid, Y_grid, Z_grid)网格元组 | (X_grid, Y_grid, Z_grid) grid tuple
+        """
+        rows, cols = self.shape
+        scale = resolution / max(rows, cols)
+        target = (max(2, int(round(rows * scale))), max(2, int(round(cols * scale))))
+        grid = self if target == (rows, cols) else self.resample(target, method='average' if scale < 1 else 'bilinear')
+        X_grid, Y_grid = grid.coordinate_grids()
+        return X_grid, Y_grid, grid.filled()
+    
+    def to_numpy_arrays(self, include_nodata: bool = False) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        获取单元中心的散点数组 | Get scattered arrays of cell centers
+        
+        Args:
+            include_nodata: 是否包含无数据单元格（高程为NaN） | Whether to include missing cells (with NaN elevation)
+        
+        Returns:
+            (x_array, y_array, z_array)元组 | (x_array, y_array, z_array) tuple
+        """
+        X_grid, Y_grid = self.coordinate_grids()
+        z = self.filled()
+        if include_nodata or not self.has_nodata():
+            return X_grid.ravel(), Y_grid.ravel(), z.ravel()
+        valid = self.valid_mask()
+        return X_grid[valid], Y_grid[valid], z[valid]
+    
+    def to_mountain_data(self, include_nodata: bool = False) -> MountainData:
+        """
+        转换为数组模式的MountainData | Convert to array-backed MountainData
+        
+        Args:
+            include_nodata: 是否包含无数据单元格 | Whether to include missing cells
+        
+        Returns:
+            MountainData实例 | MountainData instance
+        """
+        metadata = copy.deepcopy(self.metadata)
+        metadata['grid'] = {'shape': list(self.shape), 'transform': list(self.transform), 'nodata': self.nodata}
+        return MountainData.from_arrays(*self.to_numpy_arrays(include_nodata), metadata=metadata)
+    
+    def copy(self) -> 'GridData':
+        """
+        创建网格的深拷贝 | Create deep copy of the grid
+        
+        Returns:
+            新的GridData实例 | New GridData instance
+        """
+        return GridData(self.z.copy(), self.transform, nodata=self.nodata, metadata=copy.deepcopy(self.metadata))
+    
+    def iter_row_blocks(self, with_mask: bool = True) -> Iterator[Tuple[np.ndarray, Optional[np.ndarray]]]:
+        """
+        按行块遍历高程和有效掩膜，用于不复制整个网格的流式计算 | Iterate elevations and the valid mask in row blocks, for streaming computations without copying the grid
+        
+        Args:
+            with_mask: 是否同时返回有效掩膜块 | Whether to yield valid-mask blocks as well
+        
+        Returns:
+            (高程块, 掩膜块或None)的迭代器 | Iterator of (elevation block, mask block or None)
+        """
+        rows, cols = self.shape
+        rows_per_chunk = max(1, _CHUNK_SIZE // cols)
+        valid = self.valid_mask() if with_mask else None
+        for start in range(0, rows, rows_per_chunk):
+            stop = min(rows, start + rows_per_chunk)
+            yield self.z[start:stop], (valid[start:stop] if valid is not None else None)
+    
+    def _block_average(self, factor_r: int, factor_c: int) -> 'GridData':
+        """按整数倍块平均，忽略无数据单元格 | Average integer-factor blocks, ignoring missing cells"""
+        rows, cols = self.shape
+        out_rows, out_cols = rows // factor_r, cols // factor_c
+        total = np.zeros((out_rows, out_cols))
+        count = np.zeros((out_rows, out_cols))
+        
+        # 逐行块累加，临时数组只有一个块大小 | Accumulate by row block so temporaries are one block in size
+        rows_per_chunk = max(1, _CHUNK_SIZE // max(cols, 1) // factor_r) * factor_r
+        for start in range(0, out_rows * factor_r, rows_per_chunk):
+            stop = min(start + rows_per_chunk, out_rows * factor_r)
+            block = np.asarray(self.z[start:stop, :out_cols * factor_c], dtype=np.float64)
+            valid = self.valid_mask()[start:stop, :out_cols * factor_c]
+            shape = ((stop - start) // factor_r, factor_r, out_cols, factor_c)
+            rows_out = slice(start // factor_r, stop // factor_r)
+            total[rows_out] = np.where(valid, block, 0.0).reshape(shape).sum(axis=(1, 3))
+            count[rows_out] = valid.reshape(shape).sum(axis=(1, 3))
+        
+        with np.errstate(invalid='ignore', divide='ignore'):
+            z = np.where(count > 0, total / count, np.nan)
+        x0, a, b, y0, d, e = self.transform
+        transform = (x0, a * factor_c, b * factor_r, y0, d * factor_c, e * factor_r)
+        return GridData(z, transform, metadata=self.metadata)
+    
+    def _require_unrotated(self) -> None:
+        """检查网格无旋转 | Check that the grid is unrotated"""
+        if self.is_rotated:
+            raise ValueError("Operation requires a north-up grid without rotation")
+    
+    def __str__(self) -> str:
+        stats = self.get_elevation_stats()
+        min_x, max_x, min_y, max_y = self.get_extent()
+        return (f"GridData(shape={self.shape[0]}x{self.shape[1]}, "
+                f"extent=({min_x:.2f},{min_y:.2f}) to ({max_x:.2f},{max_y:.2f}), "
+                f"elevation={stats['min']:.2f}-{stats['max']:.2f}m, valid={stats['count']})")
+    
+    def __repr__(self) -> str:
+        return self.__str__()
+
+
+def as_grid(data: Union[GridData, MountainData], **kwargs) -> GridData:
+    """
+    将GridData或MountainData转换为GridData | Convert GridData or MountainData to GridData
+    
+    Args:
+        data: 网格或散点数据 | Grid or scattered data
+        **kwargs: 传递给GridData.from_mountain_data()的参数 | Arguments passed to GridData.from_mountain_data()
+    
+    Returns:
+        GridData实例 | GridData instance
+    """
+    if isinstance(data, GridData):
+        return data
+    if isinstance(data, MountainData):
+        return GridData.from_mountain_data(data, **kwargs)
+    raise TypeError(f"Expected GridData or MountainData, got {type(data).__name__}")
+
+
+def _uniform_step(values: np.ndarray, rtol: float, name: str) -> float:
+    """检查等间距并返回步长 | Check even spacing and return the step"""
+    if values.ndim != 1 or len(values) < 2:
+        raise ValueError(f"{name} coordinates need at least 2 values")
+    steps = np.diff(values)
+    step = float(steps.mean())
+    if step == 0 or not np.allclose(steps, step, rtol=rtol, atol=abs(step) * rtol):
+        raise ValueError(f"{name} coordinates must be evenly spaced")
+    return step
+
+
+def _detect_lattice(x: np.ndarray, y: np.ndarray,
+                    rtol: float) -> Optional[Tuple[Tuple[float, float, int], Tuple[float, float, int]]]:
+    """
+    检测点是否位于规则格网上 | Detect whether points lie on a regular lattice
+    
+    Returns:
+        ((x0, dx, cols), (y0, dy, rows))或None | ((x0, dx, cols), (y0, dy, rows)) or None
+    """
+    axes = []
+    for values in (x, y):
+        unique = np.unique(values)
+        if len(unique) < 2:
+            return None
+        steps = np.diff(unique)
+        step = float(steps.min())
+        # 允许整列缺失：所有间距都应是最小间距的整数倍 | Whole missing columns are allowed: every gap must be a multiple of the smallest
+        ratio = steps / step
+        if not np.allclose(ratio, np.rint(ratio), rtol=0, atol=rtol * 100):
+            return None
+        count = int(round((unique[-1] - unique[0]) / step)) + 1
+        axes.append((float(unique[0]), step, count))
+    
+    (_, _, cols), (_, _, rows) = axes
+    # 格网远大于点数时说明点并非来自栅格 | A lattice far larger than the point count means the points did not come from a raster
+    if cols * rows > 4 * len(x):
+        return None
+    return axes[0], axes[1]
+
+
+def _resample_separable(z: np.ndarray, row: np.ndarray, col: np.ndarray, method: str) -> np.ndarray:
+    """
+    在可分离的行、列像素坐标上插值 | Interpolate at separable row and column pixel coordinates
+    
+    双线性插值先沿行再沿列各做一次一维插值 | Bilinear interpolation does one 1D pass along rows, then one along columns
+    """
+    rows, cols = z.shape
+    if method == 'nearest':
+        return np.asarray(z[np.rint(row).astype(np.intp)][:, np.rint(col).astype(np.intp)], dtype=np.float64)
+    
+    r0 = np.minimum(np.floor(row).astype(np.intp), max(rows - 2, 0))
+    r1 = np.minimum(r0 + 1, rows - 1)
+    wr = (row - r0)[:, np.newaxis]
+    partial = z[r0] * (1 - wr) + z[r1] * wr
+    
+    c0 = np.minimum(np.floor(col).astype(np.intp), max(cols - 2, 0))
+    c1 = np.minimum(c0 + 1, cols - 1)
+    wc = col - c0
+    return partial[:, c0] * (1 - wc) + partial[:, c1] * wc
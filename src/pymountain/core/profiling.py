@@ -0,0 +1,380 @@
+"""
+PyMountain性能剖析模块 | PyMountain profiling module
+
+为渲染管线各阶段记录墙钟时间、CPU时间、内存分配和缓存命中率，并导出Chrome跟踪JSON和摘要表 |
+Records wall time, CPU time, allocations and cache hit rates for each render pipeline stage,
+and exports Chrome trace JSON and a summary table
+
+未启用时，每个被插桩的阶段只多一次全局标志检查 | When disabled, each instrumented stage costs a single global flag check
+
+用法 | Usage:
+    >>> import pymountain
+    >>> with pymountain.profile() as prof:
+    ...     renderer.render(data)
+    ...     renderer.save_figure('out.png')
+    >>> print(prof.format_summary())
+    >>> prof.to_chrome_trace('trace.json')
+"""
+
+import functools
+import json
+import os
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Any, Optional, List, Union, Callable, Iterator
+
+
+@dataclass
+class StageRecord:
+    """
+    单个阶段的剖析记录 | Profiling record of a single stage
+
+    Attributes:
+        name: 阶段名称 | Stage name
+        start: 开始时间（perf_counter秒） | Start time (perf_counter seconds)
+        wall_time: 墙钟时间（秒） | Wall time (seconds)
+        cpu_time: 当前线程CPU时间（秒） | CPU time of the current thread (seconds)
+        alloc_bytes: 阶段内净分配字节数（仅在跟踪内存时） | Net bytes allocated in the stage (only when tracking memory)
+        thread_id: 线程ID | Thread ID
+        depth: 嵌套深度 | Nesting depth
+        metadata: 附加元数据 | Additional metadata
+    """
+
+    name: str
+    start: float
+    wall_time: float = 0.0
+    cpu_time: float = 0.0
+    alloc_bytes: Optional[int] = None
+    thread_id: int = 0
+    depth: int = 0
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+
+class Profiler:
+    """
+    渲染管线剖析器 | Render pipeline profiler
+
+    Attributes:
+        records: 已完成阶段的记录 | Records of completed stages
+        cache_stats: 各缓存的命中与未命中次数 | Hit and miss counts per cache
+        track_memory: 是否用tracemalloc跟踪内存分配 | Whether allocations are tracked with tracemalloc
+    """
+
+    def __init__(self, track_memory: bool = False):
+        """
+        初始化剖析器 | Initialize profiler
+
+        Args:
+            track_memory: 是否用tracemalloc跟踪内存分配 | Whether to track allocations with tracemalloc
+        """
+        self.track_memory = track_memory
+        self.records: List[StageRecord] = []
+        self.cache_stats: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._origin = time.perf_counter()
+
+    def _add_record(self, record: StageRecord) -> None:
+        """添加阶段记录 | Add stage record"""
+        with self._lock:
+            self.records.append(record)
+
+    def _add_cache_event(self, name: str, hit: bool) -> None:
+        """添加缓存事件 | Add cache event"""
+        with self._lock:
+            stats = self.cache_stats.setdefault(name, {'hits': 0, 'misses': 0})
+            stats['hits' if hit else 'misses'] += 1
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """
+        按阶段汇总 | Summarize by stage
+
+        Returns:
+            阶段名称到count、total/mean/max墙钟时间、CPU时间和分配字节的映射 |
+            Mapping of stage name to count, total/mean/max wall time, CPU time and allocated bytes
+        """
+        with self._lock:
+            records = list(self.records)
+
+        result: Dict[str, Dict[str, Any]] = {}
+        for record in records:
+            entry = result.setdefault(record.name, {
+                'count': 0, 'wall_total': 0.0, 'wall_max': 0.0, 'cpu_total': 0.0, 'alloc_bytes': None,
+            })
+            entry['count'] += 1
+            entry['wall_total'] += record.wall_time
+            entry['wall_max'] = max(entry['wall_max'], record.wall_time)
+            entry['cpu_total'] += record.cpu_time
+            if record.alloc_bytes is not None:
+                entry['alloc_bytes'] = (entry['alloc_bytes'] or 0) + record.alloc_bytes
+
+        for entry in result.values():
+            entry['wall_mean'] = entry['wall_total'] / entry['count']
+        return result
+
+    def cache_hit_rates(self) -> Dict[str, Dict[str, Any]]:
+        """
+        获取各缓存的命中率 | Get hit rate per cache
+
+        Returns:
+            缓存名称到hits、misses、hit_rate的映射 | Mapping of cache name to hits, misses and hit_rate
+        """
+        with self._lock:
+            stats = {name: dict(counts) for name, counts in self.cache_stats.items()}
+        for counts in stats.values():
+            total = counts['hits'] + counts['misses']
+            counts['hit_rate'] = counts['hits'] / total if total else 0.0
+        return stats
+
+    def format_summary(self) -> str:
+        """
+        格式化摘要表 | Format summary table
+
+        Returns:
+            表格字符串 | Table string
+        """
+        summary = self.summary()
+        lines = [f"{'stage':<28} {'count':>6} {'total ms':>10} {'mean ms':>10} {'max ms':>10} "
+                 f"{'cpu ms':>10} {'alloc KiB':>10}"]
+        for name, entry in sorted(summary.items(), key=lambda item: -item[1]['wall_total']):
+            alloc = '-' if entry['alloc_bytes'] is None else f"{entry['alloc_bytes'] / 1024:.1f}"
+            lines.append(f"{name:<28} {entry['count']:>6} {entry['wall_total'] * 1e3:>10.2f} "
+                         f"{entry['wall_mean'] * 1e3:>10.2f} {entry['wall_max'] * 1e3:>10.2f} "
+                         f"{entry['cpu_total'] * 1e3:>10.2f} {alloc:>10}")
+
+        hit_rates = self.cache_hit_rates()
+        if hit_rates:
+            lines.append('')
+            lines.append(f"{'cache':<28} {'hits':>6} {'misses':>10} {'hit rate':>10}")
+            for name, counts in sorted(hit_rates.items()):
+                lines.append(f"{name:<28} {counts['hits']:>6} {counts['misses']:>10} {counts['hit_rate']:>10.1%}")
+        return '\n'.join(lines)
+
+    def to_chrome_trace(self, filepath: Optional[Union[str, Path]] = None) -> Union[Dict[str, Any], None]:
+        """
+        导出为Chrome跟踪格式（chrome://tracing、Perfetto） | Export in Chrome trace format (chrome://tracing, Perfetto)
+
+        Args:
+            filepath: 文件路径（可选） | File path (optional)
+
+        Returns:
+            跟踪字典（如果未指定文件路径） | Trace dictionary (if no filepath specified)
+        """
+        with self._lock:
+            records = list(self.records)
+
+        pid = os.getpid()
+        events = []
+        for record in records:
+            args = dict(record.metadata)
+            args['cpu_ms'] = record.cpu_time * 1e3
+            if record.alloc_bytes is not None:
+                args['alloc_bytes'] = record.alloc_bytes
+            events.append({
+                'name': record.name,
+                'cat': 'pymountain',
+                'ph': 'X',
+                'ts': (record.start - self._origin) * 1e6,
+                'dur': record.wall_time * 1e6,
+                'pid': pid,
+                'tid': record.thread_id,
+                'args': args,
+            })
+
+        trace = {
+            'traceEvents': events,
+            'displayTimeUnit': 'ms',
+            'otherData': {'cache_hit_rates': self.cache_hit_rates()},
+        }
+        if filepath:
+            with open(filepath, 'w', encoding='utf-8') as f:
+                json.dump(trace, f)
+            return None
+        return trace
+
+    def clear(self) -> None:
+        """清除所有记录 | Clear all records"""
+        with self._lock:
+            self.records.clear()
+            self.cache_stats.clear()
+
+    def __str__(self) -> str:
+        return f"Profiler(records={len(self.records)}, track_memory={self.track_memory})"
+
+    def __repr__(self) -> str:
+        return self.__str__()
+
+
+# 全局剖析状态 | Global profiling state
+_active_profiler: Optional[Profiler] = None
+_hooks: List[Callable[[StageRecord], None]] = []
+_enabled: bool = False
+_NULL_STAGE = nullcontext()
+
+
+def _update_enabled() -> None:
+    """刷新全局启用标志 | Refresh the global enabled flag"""
+    global _enabled
+    _enabled = _active_profiler is not None or bool(_hooks)
+
+
+def is_enabled() -> bool:
+    """剖析是否启用 | Whether profiling is enabled"""
+    return _enabled
+
+
+def register_hook(callback: Callable[[StageRecord], None]) -> None:
+    """
+    注册阶段完成回调 | Register a stage completion callback
+
+    回调在每个阶段结束时以StageRecord调用，可用于对接外部监控系统 |
+    The callback is called with a StageRecord when each stage ends, e.g. to feed external monitoring
+
+    Args:
+        callback: 回调函数 | Callback function
+    """
+    if callback not in _hooks:
+        _hooks.append(callback)
+    _update_enabled()
+
+
+def unregister_hook(callback: Callable[[StageRecord], None]) -> None:
+    """
+    注销阶段完成回调 | Unregister a stage completion callback
+
+    Args:
+        callback: 回调函数 | Callback function
+    """
+    if callback in _hooks:
+        _hooks.remove(callback)
+    _update_enabled()
+
+
+class _Stage:
+    """活动阶段的计时上下文 | Timing context of an active stage"""
+
+    __slots__ = ('record', '_cpu_start', '_mem_start', '_profiler')
+
+    def __init__(self, name: str, metadata: Dict[str, Any]):
+        self.record = StageRecord(name=name, start=0.0, metadata=metadata)
+        self._profiler = _active_profiler
+
+    def __enter__(self) -> StageRecord:
+        profiler = self._profiler
+        local = profiler._local if profiler is not None else _hook_local
+        depth = getattr(local, 'depth', 0)
+        local.depth = depth + 1
+
+        record = self.record
+        record.depth = depth
+        record.thread_id = threading.get_ident()
+        self._mem_start = (tracemalloc.get_traced_memory()[0]
+                           if profiler is not None and profiler.track_memory else None)
+        self._cpu_start = time.thread_time()
+        record.start = time.perf_counter()
+        return record
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        record = self.record
+        record.wall_time = time.perf_counter() - record.start
+        record.cpu_time = time.thread_time() - self._cpu_start
+        if self._mem_start is not None:
+            record.alloc_bytes = tracemalloc.get_traced_memory()[0] - self._mem_start
+        if exc_type is not None:
+            record.metadata['error'] = exc_type.__name__
+
+        profiler = self._profiler
+        local = profiler._local if profiler is not None else _hook_local
+        local.depth = record.depth
+
+        if profiler is not None:
+            profiler._add_record(record)
+        for hook in list(_hooks):
+            hook(record)
+
+
+_hook_local = threading.local()
+
+
+def stage(name: str, **metadata: Any):
+    """
+    剖析一个代码块 | Profile a code block
+
+    Args:
+        name: 阶段名称 | Stage name
+        **metadata: 附加元数据 | Additional metadata
+
+    Returns:
+        上下文管理器；未启用时为空操作 | Context manager; a no-op when disabled
+    """
+    if not _enabled:
+        return _NULL_STAGE
+    return _Stage(name, metadata)
+
+
+def profiled(name: str) -> Callable:
+    """
+    将函数或方法作为一个阶段剖析的装饰器 | Decorator profiling a function or method as one stage
+
+    Args:
+        name: 阶段名称 | Stage name
+
+    Returns:
+        装饰器 | Decorator
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            with _Stage(name, {}):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def record_cache(name: str, hit: bool) -> None:
+    """
+    记录一次缓存访问 | Record a cache access
+
+    Args:
+        name: 缓存名称 | Cache name
+        hit: 是否命中 | Whether it was a hit
+    """
+    profiler = _active_profiler
+    if profiler is not None:
+        profiler._add_cache_event(name, hit)
+
+
+@contextmanager
+def profile(track_memory: bool = False) -> Iterator[Profiler]:
+    """
+    在代码块内启用渲染管线剖析 | Enable render pipeline profiling within a block
+
+    Args:
+        track_memory: 是否用tracemalloc跟踪内存分配（开销较大） | Whether to track allocations with tracemalloc (higher overhead)
+
+    Yields:
+        Profiler实例 | Profiler instance
+    """
+    global _active_profiler
+
+    profiler = Profiler(track_memory=track_memory)
+    previous = _active_profiler
+    started_tracemalloc = track_memory and not tracemalloc.is_tracing()
+    if started_tracemalloc:
+        tracemalloc.start()
+
+    _active_profiler = profiler
+    _update_enabled()
+    try:
+        yield profiler
+    finally:
+        _active_profiler = previous
+        _update_enabled()
+        if started_tracemalloc:
+            tracemalloc.stop()
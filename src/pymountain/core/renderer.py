@@ -5,9 +5,16 @@ PyMountain渲染器基类模块 | PyMountain renderer base class module
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, Tuple, List, Union
+from typing import Dict, Any, Optional, Tuple, List, Union, Callable
+import io
+import queue
+import threading
+import time
+import warnings
 import numpy as np
 from .data import MountainData
+from .grid import GridData
+from .profiling import profiled
 
 
 class BaseRenderer(ABC):
@@ -38,8 +45,20 @@ class BaseRenderer(ABC):
         self.config: Dict[str, Any] = config or {}
         self.is_interactive: bool = is_interactive
         self.update_interval_ms: int = update_interval_ms
-        self._current_data: Optional[MountainData] = None
+        self._current_data: Optional[Union[MountainData, GridData]] = None
         self._figure: Optional[Any] = None
+        self._render_cache: Optional[Any] = None
+        # 正在渲染的规则网格（数据为GridData时） | Regular grid being rendered (when the data is GridData)
+        self._grid_source: Optional[GridData] = None
+        
+        # 渐进渲染状态 | Progressive rendering state
+        self._progressive_generation: int = 0
+        self._progressive_lock = threading.RLock()
+        self._progressive_local = threading.local()
+        self._progressive_thread: Optional[threading.Thread] = None
+        self._progressive_error: Optional[Exception] = None
+        # 等待在调用线程中应用的细化级别 | Refinement levels waiting to be applied on the calling thread
+        self._progressive_queue: "queue.Queue[Tuple]" = queue.Queue()
         
         # 设置默认配置 | Set default configuration
         self._set_default_config()
@@ -65,7 +84,10 @@ class BaseRenderer(ABC):
             'marker_size': 20,
             'alpha': 1.0,
             'interpolation_method': 'linear',
-            'grid_resolution': 100
+            'grid_resolution': 100,
+            'use_render_cache': False,
+            'progressive_levels': None,
+            'progressive_max_points': 2000
         }
         
         # 合并用户配置和默认配置 | Merge user config with default config
@@ -106,12 +128,13 @@ class BaseRenderer(ABC):
                 raise ValueError(f"interpolation_method must be one of {valid_methods}")
     
     @abstractmethod
-    def render(self, data: MountainData, **kwargs) -> Any:
+    def render(self, data: Union[MountainData, GridData], **kwargs) -> Any:
         """
         渲染山体数据 | Render mountain data
         
         Args:
-            data: 山体数据对象 | Mountain data object
+            data: 山体数据对象或规则网格（GridData直接重采样，不做散点插值） |
+                Mountain data object or regular grid (GridData is resampled directly, without scattered interpolation)
             **kwargs: 额外的渲染参数 | Additional rendering parameters
             
         Returns:
@@ -120,7 +143,7 @@ class BaseRenderer(ABC):
         pass
     
     @abstractmethod
-    def update(self, data: MountainData, **kwargs) -> None:
+    def update(self, data: Union[MountainData, GridData], **kwargs) -> None:
         """
         更新渲染内容 | Update rendered content
         
@@ -172,6 +195,82 @@ class BaseRenderer(ABC):
         """
         raise NotImplementedError("Subclass must implement save_figure method")
     
+    def set_render_cache(self, cache: Optional[Any]) -> None:
+        """
+        设置渲染结果缓存 | Set render result cache
+        
+        Args:
+            cache: RenderCache实例，None表示按use_render_cache配置使用默认缓存 | RenderCache instance, None falls back to the default cache per use_render_cache
+        """
+        self._render_cache = cache
+    
+    def get_render_cache(self) -> Optional[Any]:
+        """
+        获取当前使用的渲染结果缓存 | Get the render result cache in use
+        
+        Returns:
+            RenderCache实例或None | RenderCache instance or None
+        """
+        if self._render_cache is not None:
+            return self._render_cache
+        if self.config.get('use_render_cache', False):
+            from ..utils.render_cache import get_default_render_cache
+            return get_default_render_cache()
+        return None
+    
+    def _make_render_key(self, cache: Optional[Any], data: Any) -> Optional[str]:
+        """
+        构建渲染键；无缓存或配置无法按内容寻址时返回None | Build the render key; None without a cache or when the config cannot be addressed by content
+        
+        Args:
+            cache: RenderCache实例或None | RenderCache instance or None
+            data: 山体数据对象 | Mountain data object
+            
+        Returns:
+            渲染键或None | Render key or None
+        """
+        if cache is None:
+            return None
+        try:
+            return cache.make_render_key(self, data)
+        except TypeError:
+            return None
+    
+    def render_cached(self, data: Union[MountainData, GridData], format: str = 'png', **kwargs) -> bytes:
+        """
+        渲染并编码为图像字节，命中缓存时跳过渲染 | Render and encode to image bytes, skipping rendering on a cache hit
+        
+        Args:
+            data: 山体数据对象 | Mountain data object
+            format: 图像格式 | Image format
+            **kwargs: 保存参数 | Save parameters
+            
+        Returns:
+            编码后的图像字节 | Encoded image bytes
+        """
+        cache = self.get_render_cache()
+        if cache is None:
+            from ..utils.render_cache import get_default_render_cache
+            cache = get_default_render_cache()
+        
+        # 配置或保存参数无法按内容寻址时不缓存 | Skip caching when the config or save parameters cannot be addressed by content
+        render_key = self._make_render_key(cache, data)
+        try:
+            key = cache.make_key(render_key, dict(kwargs, format=format)) if render_key is not None else None
+        except TypeError:
+            key = None
+        blob = cache.get(key) if key is not None else None
+        if blob is None:
+            start = time.perf_counter()
+            self.render(data)
+            buffer = io.BytesIO()
+            self.save_figure(buffer, format=format, **kwargs)
+            blob = buffer.getvalue()
+            # 渲染耗时作为代价感知淘汰的重算代价 | Render time serves as the recompute cost for cost-aware eviction
+            if key is not None:
+                cache.put(key, blob, cost=time.perf_counter() - start)
+        return blob
+    
     def show(self) -> None:
         """
         显示图形 | Show figure
@@ -190,7 +289,7 @@ class BaseRenderer(ABC):
         """
         raise NotImplementedError("Subclass must implement close method")
     
-    def get_current_data(self) -> Optional[MountainData]:
+    def get_current_data(self) -> Optional[Union[MountainData, GridData]]:
         """
         获取当前渲染的数据 | Get currently rendered data
         
@@ -252,12 +351,19 @@ class BaseRenderer(ABC):
             'config': self.config.copy()
         }
     
-    def _prepare_data_for_rendering(self, data: MountainData) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    @profiled('prepare_data')
+    def _prepare_data_for_rendering(self, data: Union[MountainData, GridData]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
         """
         为渲染准备数据 | Prepare data for rendering
         
+        数据为GridData时记录为网格源，之后的_create_interpolated_grid直接重采样网格；返回的数组是按
+        grid_resolution重采样后的有效单元中心，用于坐标范围和颜色范围 |
+        When the data is GridData it is recorded as the grid source, so later _create_interpolated_grid
+        calls resample the grid directly; the returned arrays are the valid cell centers resampled to
+        grid_resolution, used for coordinate and color ranges
+        
         Args:
-            data: 山体数据对象 | Mountain data object
+            data: 山体数据对象或规则网格 | Mountain data object or regular grid
             
         Returns:
             (x, y, z)数组元组 | (x, y, z) array tuple
@@ -265,20 +371,30 @@ class BaseRenderer(ABC):
         Raises:
             ValueError: 数据为空 | Data is empty
         """
+        if isinstance(data, GridData):
+            if data.count_valid() == 0:
+                raise ValueError("Cannot render a grid without valid cells")
+            self._grid_source = data
+            X_grid, Y_grid, Z_grid = data.to_render_grid(self.config.get('grid_resolution', 100))
+            valid = np.isfinite(Z_grid)
+            return X_grid[valid], Y_grid[valid], Z_grid[valid]
+        
+        self._grid_source = None
         if len(data) == 0:
             raise ValueError("Cannot render empty data")
         
         x, y, z = data.to_numpy_arrays()
         
-        # 验证数据有效性 | Validate data validity
-        if np.any(np.isnan(x)) or np.any(np.isnan(y)) or np.any(np.isnan(z)):
-            raise ValueError("Data contains NaN values")
-        
-        if np.any(np.isinf(x)) or np.any(np.isinf(y)) or np.any(np.isinf(z)):
-            raise ValueError("Data contains infinite values")
+        # 验证数据有效性（仅在存在非有限值时区分NaN和无穷） | Validate data validity (NaN and inf are only told apart when non-finite values exist)
+        for array in (x, y, z):
+            if not np.isfinite(array).all():
+                if np.isnan(array).any():
+                    raise ValueError("Data contains NaN values")
+                raise ValueError("Data contains infinite values")
         
         return x, y, z
     
+    @profiled('interpolate_grid')
     def _create_interpolated_grid(self, x: np.ndarray, y: np.ndarray, z: np.ndarray, 
                                  resolution: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
         """
@@ -293,9 +409,18 @@ class BaseRenderer(ABC):
         Returns:
             (X_grid, Y_grid, Z_grid)网格元组 | (X_grid, Y_grid, Z_grid) grid tuple
         """
+        # 渐进细化时使用后台预先计算的网格 | Use the grid precomputed in the background during progressive refinement
+        grid = getattr(self._progressive_local, 'grid', None)
+        if grid is not None:
+            return grid
+        
         if resolution is None:
             resolution = self.config.get('grid_resolution', 100)
         
+        # 规则网格只需在像素空间重采样，无需散点插值 | Regular grids are only resampled in pixel space, without scattered interpolation
+        if self._grid_source is not None:
+            return self._grid_source.to_render_grid(resolution)
+        
         # 创建网格 | Create grid
         x_min, x_max = np.min(x), np.max(x)
         y_min, y_max = np.min(y), np.max(y)
@@ -316,6 +441,254 @@ class BaseRenderer(ABC):
         
         return X_grid, Y_grid, Z_grid
     
+    def render_progressive(self, data: Union[MountainData, GridData], levels: Optional[List[int]] = None,
+                           on_update: Optional[Callable[[int, int, Any], None]] = None) -> Any:
+        """
+        由粗到细渐进渲染 | Progressive coarse-to-fine rendering
+        
+        先在调用线程中用抽稀后的数据点和最粗网格快速渲染，再在后台线程中按递增的网格分辨率
+        细化，每级完成后替换渲染结果并调用on_update。新的渐进渲染、render()、update()或
+        cancel_progressive()会取消尚未完成的细化 |
+        First renders quickly on the calling thread from decimated points and the coarsest grid,
+        then refines on a background thread through increasing grid resolutions, swapping in each
+        result as it completes and calling on_update. A new progressive render, render(), update()
+        or cancel_progressive() cancels any unfinished refinement
+        
+        后台线程始终只计算插值网格；非线程安全的渲染器（_progressive_render_on_worker为False，
+        如Matplotlib）把每个完成的级别排队，由process_progressive()在调用线程中构建图形 |
+        The background thread always computes the interpolated grids; renderers that are not
+        thread-safe (_progressive_render_on_worker is False, e.g. Matplotlib) queue each finished
+        level, and process_progressive() builds it on the calling thread
+        
+        Args:
+            data: 山体数据对象 | Mountain data object
+            levels: 递增的网格分辨率列表（默认由grid_resolution推导） | Increasing grid resolutions (derived from grid_resolution by default)
+            on_update: 回调函数(level_index, resolution, result)。线程安全的渲染器在后台线程中为细化级别调用它，
+                此时回调不得操作GUI；其他渲染器在process_progressive()的调用线程中调用 |
+                Callback (level_index, resolution, result). Thread-safe renderers call it for refinement
+                levels from the background thread, where it must not touch the GUI; other renderers call it
+                on the thread running process_progressive()
+            
+        Returns:
+            粗略渲染结果 | Coarse rendering result
+            
+        Raises:
+            RenderingError: 数据准备失败 | Data preparation failed
+        """
+        generation = self.cancel_progressive()
+        self._progressive_error = None
+        
+        try:
+            x, y, z = self._prepare_data_for_rendering(data)
+        except ValueError as e:
+            raise RenderingError(f"Data preparation failed: {e}")
+        
+        levels = self._progressive_levels(levels)
+        
+        # 抽稀数据点用于首帧 | Decimate points for the first frame
+        max_points = self.config.get('progressive_max_points', 2000)
+        if len(x) > max_points:
+            index = np.sort(np.random.default_rng(0).choice(len(x), max_points, replace=False))
+            coarse = (x[index], y[index], z[index])
+        else:
+            coarse = (x, y, z)
+        
+        grid = self._create_interpolated_grid(*coarse, levels[0])
+        with self._progressive_lock:
+            result = self._swap_in_level(coarse, levels[0], grid)
+            self._current_data = data
+        if on_update is not None:
+            on_update(0, levels[0], result)
+        
+        if len(levels) > 1:
+            thread = threading.Thread(
+                target=self._refine_progressive,
+                args=(generation, x, y, z, levels, on_update),
+                name='pymountain-progressive',
+                daemon=True,
+            )
+            self._progressive_thread = thread
+            thread.start()
+        
+        return result
+    
+    def _progressive_levels(self, levels: Optional[List[int]]) -> List[int]:
+        """
+        确定渐进渲染的分辨率级别 | Determine progressive resolution levels
+        
+        Returns:
+            去重后的递增分辨率列表 | Deduplicated increasing list of resolutions
+        """
+        if levels is None:
+            levels = self.config.get('progressive_levels')
+        if levels is None:
+            final = int(self.config.get('grid_resolution', 100))
+            levels = [max(10, final // 4), max(10, final // 2), final]
+        
+        levels = sorted({int(level) for level in levels})
+        if not levels or levels[0] < 2:
+            raise ValueError("progressive levels must be integers >= 2")
+        return levels
+    
+    # 细化级别能否在后台线程中渲染（渲染器线程安全时为True） | Whether refinement levels may be rendered on the background thread (True for thread-safe renderers)
+    _progressive_render_on_worker = True
+    
+    def _refine_progressive(self, generation: int, x: np.ndarray, y: np.ndarray, z: np.ndarray,
+                            levels: List[int], on_update: Optional[Callable[[int, int, Any], None]]) -> None:
+        """
+        在后台线程中逐级细化 | Refine level by level on a background thread
+        
+        插值在锁外计算，只有替换渲染结果时持有锁；渲染器非线程安全时级别交由process_progressive()渲染。
+        未被取消的级别失败时记录错误并停止细化，由wait_progressive()抛出 | Interpolation runs outside
+        the lock; the lock is held only while swapping in the result. For renderers that are not
+        thread-safe, levels are left to process_progressive(). A level that fails without being
+        cancelled records the error and stops refinement; wait_progressive() raises it
+        """
+        for level_index in range(1, len(levels)):
+            resolution = levels[level_index]
+            if self._progressive_generation != generation:
+                return
+            
+            try:
+                grid = self._create_interpolated_grid(x, y, z, resolution)
+            except Exception as e:
+                self._fail_progressive(generation, resolution, e)
+                return
+            
+            if not self._progressive_render_on_worker:
+                self._progressive_queue.put((generation, level_index, resolution, (x, y, z), grid, on_update))
+                continue
+            
+            if not self._apply_progressive_level(generation, level_index, resolution, (x, y, z), grid, on_update):
+                return
+    
+    def _apply_progressive_level(self, generation: int, level_index: int, resolution: int,
+                                 points: Tuple[np.ndarray, np.ndarray, np.ndarray],
+                                 grid: Tuple[np.ndarray, np.ndarray, np.ndarray],
+                                 on_update: Optional[Callable[[int, int, Any], None]]) -> bool:
+        """
+        替换为一个细化级别的渲染结果 | Swap in the rendering result of one refinement level
+        
+        Returns:
+            级别是否已应用（已取消或失败时为False） | Whether the level was applied (False if cancelled or failed)
+        """
+        with self._progressive_lock:
+            if self._progressive_generation != generation:
+                return False
+            try:
+                result = self._swap_in_level(points, resolution, grid)
+            except Exception as e:
+                self._fail_progressive(generation, resolution, e)
+                return False
+        
+        if on_update is not None:
+            on_update(level_index, resolution, result)
+        return True
+    
+    def process_progressive(self) -> int:
+        """
+        在调用线程中应用后台已完成的细化级别 | Apply refinement levels finished in the background on the calling thread
+        
+        只对非线程安全的渲染器有效，应在GUI线程（或主线程）中调用。交互式Matplotlib渲染器由画布定时器
+        自动调用，wait_progressive()结束时也会调用 | Only relevant to renderers that are not thread-safe;
+        call it from the GUI (or main) thread. Interactive Matplotlib renderers call it from a canvas timer,
+        and wait_progressive() calls it once refinement has finished
+        
+        Returns:
+            应用的级别数 | Number of levels applied
+        """
+        applied = 0
+        while True:
+            try:
+                item = self._progressive_queue.get_nowait()
+            except queue.Empty:
+                return applied
+            if self._apply_progressive_level(*item):
+                applied += 1
+    
+    def _fail_progressive(self, generation: int, resolution: int, error: Exception) -> None:
+        """
+        记录细化失败；已取消的细化的失败被忽略 | Record a refinement failure; failures of cancelled refinement are ignored
+        
+        Args:
+            generation: 细化所属的渐进渲染代数 | Progressive rendering generation of the refinement
+            resolution: 失败级别的网格分辨率 | Grid resolution of the failed level
+            error: 引发的异常 | Raised exception
+        """
+        with self._progressive_lock:
+            if self._progressive_generation != generation:
+                return
+            failure = RenderingError(f"Progressive refinement at resolution {resolution} failed: {error}")
+            failure.__cause__ = error
+            self._progressive_error = failure
+        warnings.warn(str(failure), RuntimeWarning)
+    
+    def _swap_in_level(self, points: Tuple[np.ndarray, np.ndarray, np.ndarray], resolution: int,
+                       grid: Tuple[np.ndarray, np.ndarray, np.ndarray]) -> Any:
+        """用预先计算的网格渲染一个级别 | Render one level from a precomputed grid"""
+        self._progressive_local.grid = grid
+        try:
+            return self._render_progressive_level(*points, resolution)
+        finally:
+            self._progressive_local.grid = None
+    
+    def _render_progressive_level(self, x: np.ndarray, y: np.ndarray, z: np.ndarray, resolution: int) -> Any:
+        """
+        以指定网格分辨率渲染一个渐进级别（由子类重写） | Render one progressive level at the given grid resolution (overridden by subclasses)
+        
+        调用时已持有渐进渲染锁；若后台线程已预先计算该级别的网格，_create_interpolated_grid会直接返回它 |
+        Called with the progressive lock held; if the background thread has precomputed the grid for this
+        level, _create_interpolated_grid returns it directly
+        
+        Args:
+            x: X坐标数组 | X coordinate array
+            y: Y坐标数组 | Y coordinate array
+            z: Z坐标数组 | Z coordinate array
+            resolution: 网格分辨率 | Grid resolution
+            
+        Returns:
+            渲染结果对象 | Rendering result object
+            
+        Raises:
+            NotImplementedError: 子类未实现此方法 | Subclass has not implemented this method
+        """
+        raise NotImplementedError("Subclass must implement _render_progressive_level for progressive rendering")
+    
+    def cancel_progressive(self) -> int:
+        """
+        取消尚未完成的渐进细化 | Cancel any unfinished progressive refinement
+        
+        Returns:
+            新的渐进渲染代数 | New progressive rendering generation
+        """
+        with self._progressive_lock:
+            self._progressive_generation += 1
+            return self._progressive_generation
+    
+    def wait_progressive(self, timeout: Optional[float] = None) -> bool:
+        """
+        等待后台细化结束并应用排队的级别 | Wait for background refinement to finish and apply queued levels
+        
+        Args:
+            timeout: 超时时间（秒） | Timeout (seconds)
+            
+        Returns:
+            细化是否已结束 | Whether refinement has finished
+            
+        Raises:
+            RenderingError: 后台细化失败 | Background refinement failed
+        """
+        thread = self._progressive_thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+            if thread.is_alive():
+                return False
+            # 在调用线程中应用排队的级别 | Apply queued levels on the calling thread
+            self.process_progressive()
+        if self._progressive_error is not None:
+            raise self._progressive_error
+        return True
+    
     def __str__(self) -> str:
         return f"{self.__class__.__name__}(interactive={self.is_interactive}, interval={self.update_interval_ms}ms)"
     
@@ -1,18 +1,59 @@
 """
 PyMountain渲染器模块 | PyMountain renderers module
 
-包含各种渲染器的具体实现 | Contains specific implementations of various renderers
+包含各种渲染器的具体实现。渲染器在首次访问时才导入，以免导入包时加载matplotlib |
+Contains specific implementations of various renderers. Renderers are imported on first access
+so importing the package does not load matplotlib
 """
 
-# Matplotlib渲染器导入 | Matplotlib renderer imports
-from .matplotlib_renderer import (
-    MatplotlibRenderer,
-    Matplotlib3DRenderer,
-    MatplotlibContourRenderer,
-)
+import importlib
+from typing import TYPE_CHECKING
+
+# 延迟导入：公共名称到子模块的映射 | Lazy imports: mapping of public names to submodules
+_LAZY_IMPORTS = {
+    # Matplotlib渲染器 | Matplotlib renderers
+    "MatplotlibRenderer": "matplotlib_renderer",
+    "Matplotlib3DRenderer": "matplotlib_renderer",
+    "MatplotlibContourRenderer": "matplotlib_renderer",
+    "MatplotlibProfileRenderer": "matplotlib_renderer",
+    # 图形池 | Figure pool
+    "FigurePool": "figure_pool",
+    "get_default_figure_pool": "figure_pool",
+    # 软件渲染器 | Software renderer
+    "SoftwareRenderer3D": "software_renderer",
+}
+
+if TYPE_CHECKING:
+    from .matplotlib_renderer import (
+        MatplotlibRenderer,
+        Matplotlib3DRenderer,
+        MatplotlibContourRenderer,
+        MatplotlibProfileRenderer,
+    )
+    from .figure_pool import FigurePool, get_default_figure_pool
+    from .software_renderer import SoftwareRenderer3D
+
+
+def __getattr__(name: str):
+    """按需导入公共名称 | Import public names on demand"""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
 
 __all__ = [
     "MatplotlibRenderer",
     "Matplotlib3DRenderer",
     "MatplotlibContourRenderer",
+    "MatplotlibProfileRenderer",
+    "SoftwareRenderer3D",
+    "FigurePool",
+    "get_default_figure_pool",
 ]
\ No newline at end of file
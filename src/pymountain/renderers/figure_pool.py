@@ -0,0 +1,263 @@
+"""
+PyMountain图形池模块 | PyMountain figure pool module
+
+在重复渲染之间复用Matplotlib图形和坐标轴，避免反复构建图形的开销 |
+Reuses Matplotlib figures and axes across repeated renders to avoid repeated figure construction overhead
+"""
+
+import threading
+import weakref
+from collections import OrderedDict, deque
+from typing import Dict, Any, Optional, Tuple, Deque
+
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+from ..core.profiling import record_cache
+from ..utils.resources import ResourceManager, get_resource_manager
+
+
+# 池键：(图形尺寸, DPI, 投影) | Pool key: (figure size, DPI, projection)
+PoolKey = Tuple[Tuple[float, float], float, Optional[str]]
+
+# 图形上保存初始布局的属性名 | Attribute holding the initial layout on a figure
+_LAYOUT_ATTR = '_pymountain_pool_layout'
+
+
+class FigurePool:
+    """
+    有界的Matplotlib图形池 | Bounded Matplotlib figure pool
+
+    按(figure_size, dpi, projection)分组保存空闲图形。池中的图形基于Agg画布创建，
+    不注册到pyplot，因此空闲图形不会被plt.show()显示 |
+    Idle figures are grouped by (figure_size, dpi, projection). Pooled figures use
+    an Agg canvas and are not registered with pyplot, so idle figures are never
+    shown by plt.show()
+
+    Attributes:
+        max_size: 空闲图形总数上限 | Maximum total number of idle figures
+    """
+
+    def __init__(self, max_size: int = 8, resource_manager: Optional[ResourceManager] = None):
+        """
+        初始化图形池 | Initialize figure pool
+
+        Args:
+            max_size: 空闲图形总数上限 | Maximum total number of idle figures
+            resource_manager: 共享内存预算的资源管理器（默认全局管理器） | Resource manager sharing the memory budget (global manager by default)
+        """
+        if max_size < 0:
+            raise ValueError("max_size must be >= 0")
+
+        self.max_size = max_size
+        self._idle: "OrderedDict[PoolKey, Deque[Figure]]" = OrderedDict()
+        # 弱引用键：布局保存在图形自身上，未归还的图形可被回收 |
+        # Weak keys: the layout lives on the figure itself, so figures that are never released can be collected
+        self._layouts: "weakref.WeakKeyDictionary[Figure, PoolKey]" = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'misses': 0, 'released': 0, 'discarded': 0}
+        self._resources = (resource_manager or get_resource_manager()).register('figure_pool', self._evict)
+
+    @staticmethod
+    def make_key(figure_size: Tuple[float, float], dpi: float, projection: Optional[str]) -> PoolKey:
+        """构建池键 | Build pool key"""
+        return (tuple(float(v) for v in figure_size), float(dpi), projection)
+
+    def acquire(self, figure_size: Tuple[float, float], dpi: float,
+                projection: Optional[str] = None) -> Tuple[Figure, Any]:
+        """
+        获取一个已清空并布局好的图形 | Acquire a cleared, pre-laid-out figure
+
+        Args:
+            figure_size: 图形尺寸（英寸） | Figure size (inches)
+            dpi: 分辨率 | Resolution
+            projection: 坐标轴投影 | Axes projection
+
+        Returns:
+            (figure, axes)元组 | (figure, axes) tuple
+        """
+        key = self.make_key(figure_size, dpi, projection)
+        with self._lock:
+            idle = self._idle.get(key)
+            fig = None
+            if idle:
+                fig = idle.pop()
+                if not idle:
+                    del self._idle[key]
+                self._stats['hits'] += 1
+                ax = getattr(fig, _LAYOUT_ATTR)['axes']
+            else:
+                self._stats['misses'] += 1
+        if fig is not None:
+            self._resources.untrack(id(fig))
+            record_cache('figure_pool', True)
+            return fig, ax
+        record_cache('figure_pool', False)
+
+        fig = Figure(figsize=key[0], dpi=key[1])
+        FigureCanvasAgg(fig)
+        ax = fig.add_subplot(111, projection=projection) if projection else fig.add_subplot(111)
+
+        setattr(fig, _LAYOUT_ATTR, {
+            'axes': ax,
+            'subplotspec': ax.get_subplotspec(),
+            'facecolor': fig.get_facecolor(),
+        })
+        with self._lock:
+            self._layouts[fig] = key
+        return fig, ax
+
+    def owns(self, fig: Figure) -> bool:
+        """判断图形是否由本池创建 | Check whether the figure was created by this pool"""
+        return fig in self._layouts
+
+    def release(self, fig: Figure) -> None:
+        """
+        归还图形，清空内容后放回池中 | Return a figure, clearing its contents before pooling it
+
+        Args:
+            fig: 由acquire()获得的图形 | Figure obtained from acquire()
+        """
+        with self._lock:
+            key = self._layouts.get(fig)
+        if key is None:
+            raise ValueError("Figure was not acquired from this pool")
+
+        # 已被pyplot接管（例如被show()显示过）的图形不再复用 | Figures adopted by pyplot (e.g. shown) are not reused
+        if fig.canvas.manager is not None or not self._reset(fig, getattr(fig, _LAYOUT_ATTR)):
+            self._discard(fig)
+            return
+
+        dropped = []
+        with self._lock:
+            self._stats['released'] += 1
+            self._idle.setdefault(key, deque()).append(fig)
+            self._idle.move_to_end(key)
+
+            # 超出上限时丢弃最久未使用分组中的图形 | Beyond the bound, drop figures from the least recently used group
+            while sum(len(q) for q in self._idle.values()) > self.max_size:
+                oldest_key = next(iter(self._idle))
+                oldest = self._idle[oldest_key].popleft()
+                if not self._idle[oldest_key]:
+                    del self._idle[oldest_key]
+                self._layouts.pop(oldest, None)
+                self._stats['discarded'] += 1
+                dropped.append(id(oldest))
+
+        for fig_id in dropped:
+            self._resources.untrack(fig_id)
+        if id(fig) not in dropped:
+            self._resources.track(id(fig), self.estimate_nbytes(fig))
+
+    @staticmethod
+    def estimate_nbytes(fig: Figure) -> int:
+        """
+        估计图形画布占用的字节数（RGBA缓冲区） | Estimate the bytes held by a figure canvas (RGBA buffer)
+
+        Args:
+            fig: 图形 | Figure
+
+        Returns:
+            估计字节数 | Estimated byte count
+        """
+        width, height = fig.get_size_inches() * fig.dpi
+        return int(width) * int(height) * 4
+
+    def _evict(self, fig_id: int) -> None:
+        """资源管理器的淘汰回调 | Eviction callback of the resource manager"""
+        with self._lock:
+            for key, idle in list(self._idle.items()):
+                for fig in idle:
+                    if id(fig) == fig_id:
+                        idle.remove(fig)
+                        if not idle:
+                            del self._idle[key]
+                        self._layouts.pop(fig, None)
+                        self._stats['discarded'] += 1
+                        return
+
+    def _reset(self, fig: Figure, layout: Dict[str, Any]) -> bool:
+        """
+        将图形恢复到初始布局 | Restore a figure to its initial layout
+
+        Returns:
+            是否成功恢复 | Whether the reset succeeded
+        """
+        ax = layout['axes']
+        try:
+            # 移除颜色条等附加坐标轴 | Remove extra axes such as colorbars
+            for extra in list(fig.axes):
+                if extra is not ax:
+                    fig.delaxes(extra)
+            for text in list(fig.texts):
+                text.remove()
+
+            ax.clear()
+            ax.set_subplotspec(layout['subplotspec'])
+            ax.set_position(layout['subplotspec'].get_position(fig))
+            if hasattr(ax, 'set_zlabel'):
+                ax.set_box_aspect(None)
+            fig.set_facecolor(layout['facecolor'])
+        except Exception:
+            return False
+        return True
+
+    def _discard(self, fig: Figure) -> None:
+        """丢弃不可复用的图形 | Discard a figure that cannot be reused"""
+        with self._lock:
+            self._layouts.pop(fig, None)
+            self._stats['discarded'] += 1
+
+        if fig.canvas.manager is not None:
+            import matplotlib.pyplot as plt
+            plt.close(fig)
+
+    def clear(self) -> None:
+        """清空所有空闲图形 | Drop all idle figures"""
+        with self._lock:
+            for idle in self._idle.values():
+                for fig in idle:
+                    self._layouts.pop(fig, None)
+            self._idle.clear()
+        self._resources.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        获取池统计信息 | Get pool statistics
+
+        Returns:
+            包含命中、未命中、归还、丢弃次数和空闲数量的字典 | Dictionary with hits, misses, releases, discards and idle count
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats['idle'] = sum(len(q) for q in self._idle.values())
+        requests = stats['hits'] + stats['misses']
+        stats['hit_rate'] = stats['hits'] / requests if requests else 0.0
+        return stats
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(len(q) for q in self._idle.values())
+
+    def __str__(self) -> str:
+        return f"FigurePool(max_size={self.max_size}, idle={len(self)})"
+
+    def __repr__(self) -> str:
+        return self.__str__()
+
+
+# 默认全局图形池 | Default global figure pool
+_default_pool: Optional[FigurePool] = None
+
+
+def get_default_figure_pool() -> FigurePool:
+    """
+    获取默认全局图形池 | Get the default global figure pool
+
+    Returns:
+        FigurePool实例 | FigurePool instance
+    """
+    global _default_pool
+    if _default_pool is None:
+        _default_pool = FigurePool()
+    return _default_pool
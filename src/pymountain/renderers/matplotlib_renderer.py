@@ -6,14 +6,25 @@ PyMountain Matplotlib渲染器模块 | PyMountain Matplotlib renderer module
 
 import numpy as np
 import matplotlib.pyplot as plt
-from matplotlib import cm
-from matplotlib.colors import Normalize
+from matplotlib.contour import ContourSet
 from mpl_toolkits.mplot3d import Axes3D
-from typing import Dict, Any, Optional, Tuple, Union
+from typing import Dict, Any, Optional, Tuple, List, Union, Callable, Sequence
+import io
+import time
 import warnings
+from concurrent.futures import Future
+from pathlib import Path
 
 from ..core.renderer import BaseRenderer, RenderingError
 from ..core.data import MountainData
+from ..core.grid import GridData
+from ..core.profiling import stage
+from ..analysis.profiles import ElevationProfile, ProfileSet
+from .figure_pool import FigurePool, get_default_figure_pool
+from ..utils.contours import extract_contours, get_default_contour_engine
+from ..utils.color_mapping import ColorMapper
+from ..utils.render_cache import RenderCache
+from ..utils.image_writer import AsyncImageWriter, RASTER_FORMATS, get_default_image_writer
 
 
 class MatplotlibRenderer(BaseRenderer):
@@ -39,6 +50,17 @@ class MatplotlibRenderer(BaseRenderer):
         # 渲染对象缓存 | Rendering object cache
         self._plot_objects = []
         self._colorbar = None
+
+        # 图形池（可选） | Figure pool (optional)
+        self._figure_pool: Optional[FigurePool] = None
+        
+        # 当前图形的渲染缓存键 | Render cache key of the current figure
+        self._render_key: Optional[str] = None
+        
+        # 渐进渲染时复用当前图形 | Reuse the current figure during progressive rendering
+        self._reuse_figure = False
+        # 交互模式下在GUI线程中应用细化级别的定时器 | Timer applying refinement levels on the GUI thread in interactive mode
+        self._progressive_timer = None
     
     def _set_matplotlib_defaults(self) -> None:
         """设置Matplotlib特定的默认配置 | Set Matplotlib-specific default configuration"""
@@ -51,6 +73,7 @@ class MatplotlibRenderer(BaseRenderer):
             'colorbar_shrink': 0.8,
             'colorbar_aspect': 20,
             'colorbar_pad': 0.1,
+            'use_figure_pool': False,
         }
         
         for key, value in matplotlib_defaults.items():
@@ -71,13 +94,28 @@ class MatplotlibRenderer(BaseRenderer):
         fig_size = self.config.get('figure_size', (10, 8))
         dpi = self.config.get('dpi', 100)
         
-        self._fig = plt.figure(figsize=fig_size, dpi=dpi)
-        
-        # 创建坐标轴 | Create axes
-        if projection:
-            self._ax = self._fig.add_subplot(111, projection=projection)
+        pool = self.get_figure_pool()
+        if self._reuse_figure and self._fig is not None and pool is None:
+            # 渐进渲染在同一图形上替换内容 | Progressive rendering swaps content on the same figure
+            self._fig.clf()
+            self._plot_objects.clear()
+            self._colorbar = None
+            if projection:
+                self._ax = self._fig.add_subplot(111, projection=projection)
+            else:
+                self._ax = self._fig.add_subplot(111)
+        elif pool is not None:
+            # 从图形池获取已布局的图形，并归还上一次的图形 | Take a laid-out figure from the pool, returning the previous one
+            self._release_figure()
+            self._fig, self._ax = pool.acquire(fig_size, dpi, projection)
         else:
-            self._ax = self._fig.add_subplot(111)
+            self._fig = plt.figure(figsize=fig_size, dpi=dpi)
+            
+            # 创建坐标轴 | Create axes
+            if projection:
+                self._ax = self._fig.add_subplot(111, projection=projection)
+            else:
+                self._ax = self._fig.add_subplot(111)
         
         # 设置样式 | Set style
         if self.config.get('style') != 'default':
@@ -90,6 +128,46 @@ class MatplotlibRenderer(BaseRenderer):
         
         return self._fig, self._ax
     
+    def set_figure_pool(self, pool: Optional[FigurePool]) -> None:
+        """
+        设置图形池 | Set figure pool
+        
+        Args:
+            pool: 图形池实例，None表示按use_figure_pool配置使用默认池 | Figure pool instance, None falls back to the default pool per use_figure_pool
+        """
+        self._figure_pool = pool
+    
+    def get_figure_pool(self) -> Optional[FigurePool]:
+        """
+        获取当前使用的图形池 | Get the figure pool in use
+        
+        Returns:
+            图形池实例或None | Figure pool instance or None
+        """
+        if self._figure_pool is not None:
+            return self._figure_pool
+        if self.config.get('use_figure_pool', False):
+            return get_default_figure_pool()
+        return None
+    
+    def _release_figure(self) -> None:
+        """释放当前图形：归还图形池或关闭 | Release the current figure: return it to its pool or close it"""
+        if self._fig is None:
+            return
+        
+        pool = self._figure_pool or get_default_figure_pool()
+        if pool.owns(self._fig):
+            pool.release(self._fig)
+        else:
+            plt.close(self._fig)
+        self._fig = None
+        self._ax = None
+        self._render_key = None
+        
+        # 图形已释放，只需丢弃引用 | Figure is released, only drop the references
+        self._plot_objects.clear()
+        self._colorbar = None
+    
     def _setup_labels_and_title(self) -> None:
         """设置标签和标题 | Setup labels and title"""
         font_size = self.config.get('font_size', 12)
@@ -134,7 +212,7 @@ class MatplotlibRenderer(BaseRenderer):
             )
             self._colorbar.set_label(label, fontsize=self.config.get('font_size', 12))
     
-    def render(self, data: MountainData, **kwargs) -> plt.Figure:
+    def render(self, data: Union[MountainData, GridData], **kwargs) -> plt.Figure:
         """
         渲染山体数据 | Render mountain data
         
@@ -145,6 +223,9 @@ class MatplotlibRenderer(BaseRenderer):
         Returns:
             Matplotlib图形对象 | Matplotlib figure object
         """
+        # 新数据取代未完成的渐进细化 | New data supersedes unfinished progressive refinement
+        self.cancel_progressive()
+        
         # 更新配置 | Update configuration
         if kwargs:
             self.set_config(**kwargs)
@@ -157,9 +238,70 @@ class MatplotlibRenderer(BaseRenderer):
         
         # 存储当前数据 | Store current data
         self._current_data = data
+        cache = self.get_render_cache()
+        self._render_key = self._make_render_key(cache, data)
         
         # 子类实现具体渲染逻辑 | Subclass implements specific rendering logic
-        return self._render_implementation(x, y, z)
+        with stage('render_implementation', renderer=type(self).__name__):
+            return self._render_implementation(x, y, z)
+    
+    # Matplotlib非线程安全：后台线程只计算网格 | Matplotlib is not thread-safe: the background thread only computes grids
+    _progressive_render_on_worker = False
+    
+    def render_progressive(self, data: Union[MountainData, GridData], levels: Optional[List[int]] = None,
+                           on_update: Optional[Callable[[int, int, Any], None]] = None) -> plt.Figure:
+        """
+        由粗到细渐进渲染 | Progressive coarse-to-fine rendering
+        
+        细化级别的图形在调用线程中构建：交互模式下由画布定时器每update_interval_ms调用一次
+        process_progressive()，否则由wait_progressive()或调用方调用 | Refinement levels are built on
+        the calling thread: in interactive mode a canvas timer calls process_progressive() every
+        update_interval_ms, otherwise wait_progressive() or the caller does
+        
+        Args:
+            data: 山体数据对象 | Mountain data object
+            levels: 递增的网格分辨率列表 | Increasing grid resolutions
+            on_update: 回调函数(level_index, resolution, result) | Callback (level_index, resolution, result)
+            
+        Returns:
+            粗略渲染的图形 | Figure of the coarse rendering
+        """
+        if self._progressive_timer is not None:
+            self._progressive_timer.stop()
+            self._progressive_timer = None
+        
+        fig = super().render_progressive(data, levels, on_update)
+        
+        thread = self._progressive_thread
+        if self.is_interactive and thread is not None and thread.is_alive():
+            timer = fig.canvas.new_timer(interval=self.update_interval_ms)
+            
+            def poll() -> None:
+                self.process_progressive()
+                if not thread.is_alive() and self._progressive_queue.empty():
+                    timer.stop()
+            
+            timer.add_callback(poll)
+            timer.start()
+            self._progressive_timer = timer
+        return fig
+    
+    def _render_progressive_level(self, x: np.ndarray, y: np.ndarray, z: np.ndarray, resolution: int) -> plt.Figure:
+        """
+        以指定网格分辨率渲染一个渐进级别，复用当前图形 | Render one progressive level at the given grid resolution, reusing the current figure
+        
+        交互模式下通过draw_idle()请求重绘 | In interactive mode a redraw is requested through draw_idle()
+        """
+        self._reuse_figure = True
+        try:
+            with stage('render_implementation', renderer=type(self).__name__, resolution=resolution):
+                fig = self._render_implementation(x, y, z)
+        finally:
+            self._reuse_figure = False
+        
+        if self.is_interactive and fig.canvas is not None:
+            fig.canvas.draw_idle()
+        return fig
     
     def _render_implementation(self, x: np.ndarray, y: np.ndarray, z: np.ndarray) -> plt.Figure:
         """
@@ -175,7 +317,7 @@ class MatplotlibRenderer(BaseRenderer):
         """
         raise NotImplementedError("Subclass must implement _render_implementation")
     
-    def update(self, data: MountainData, **kwargs) -> None:
+    def update(self, data: Union[MountainData, GridData], **kwargs) -> None:
         """
         更新渲染内容 | Update rendered content
         
@@ -213,14 +355,22 @@ class MatplotlibRenderer(BaseRenderer):
             self._ax.clear()
         self._clear_plot_objects()
         self._current_data = None
+        self._render_key = None
     
-    def save_figure(self, filepath: str, **kwargs) -> None:
+    def save_figure(self, filepath: str, **kwargs) -> Optional[bytes]:
         """
         保存图形到文件 | Save figure to file
         
+        启用渲染缓存时，相同数据、配置和保存参数的结果直接从缓存写出并返回编码字节 |
+        With a render cache enabled, results for identical data, config and save parameters are
+        written straight from the cache, and the encoded bytes are returned
+        
         Args:
             filepath: 文件路径 | File path
             **kwargs: 保存参数 | Save parameters
+            
+        Returns:
+            启用渲染缓存时为编码后的图像字节，否则为None | Encoded image bytes when a render cache is enabled, otherwise None
         """
         if self._fig is None:
             raise RenderingError("No figure to save. Call render() first.")
@@ -234,11 +384,131 @@ class MatplotlibRenderer(BaseRenderer):
         }
         save_params.update(kwargs)
         
+        cache = self.get_render_cache()
+        if cache is not None and self._render_key is not None and isinstance(filepath, (str, Path)):
+            return self._save_cached(cache, filepath, save_params)
+        
         try:
-            self._fig.savefig(filepath, **save_params)
+            with stage('savefig'):
+                self._fig.savefig(filepath, **save_params)
         except Exception as e:
             raise RenderingError(f"Failed to save figure: {e}")
+        return None
     
+    def _save_cached(self, cache: RenderCache, filepath: Union[str, Path], save_params: Dict[str, Any]) -> bytes:
+        """
+        通过渲染缓存保存图形 | Save figure through the render cache
+        
+        Returns:
+            编码后的图像字节 | Encoded image bytes
+        """
+        save_params = dict(save_params)
+        save_params['format'] = (save_params.get('format') or Path(filepath).suffix.lstrip('.') or 'png').lower()
+        try:
+            key = cache.make_key(self._render_key, save_params)
+        except TypeError:
+            # 保存参数无法按内容寻址时不缓存 | Skip caching when save parameters cannot be addressed by content
+            key = None
+        
+        blob = cache.get(key) if key is not None else None
+        try:
+            if blob is None:
+                start = time.perf_counter()
+                buffer = io.BytesIO()
+                with stage('savefig'):
+                    self._fig.savefig(buffer, **save_params)
+                blob = buffer.getvalue()
+                if key is not None:
+                    cache.put(key, blob, cost=time.perf_counter() - start)
+            with open(filepath, 'wb') as f:
+                f.write(blob)
+        except Exception as e:
+            raise RenderingError(f"Failed to save figure: {e}")
+        return blob
+
+    def save_figure_async(self, filepath: str, writer: Optional[AsyncImageWriter] = None,
+                          **kwargs) -> Future:
+        """
+        异步保存图形到文件 | Save figure to file asynchronously
+
+        在当前线程绘制画布并复制像素缓冲区，PNG等编码和文件写入交给后台写入器，
+        返回后即可开始渲染下一帧。bbox_inches='tight'通过裁剪快照实现，超出图形范围的
+        元素会被裁掉；矢量格式或非Agg画布回退为同步保存 |
+        Draws the canvas and copies the pixel buffer on the calling thread, then hands
+        encoding and file I/O to a background writer so the next frame can start immediately.
+        bbox_inches='tight' is implemented by cropping the snapshot, so artists outside the
+        figure are clipped; vector formats or non-Agg canvases fall back to a synchronous save
+
+        Args:
+            filepath: 文件路径 | File path
+            writer: 后台写入器（默认使用全局写入器） | Background writer (defaults to the global writer)
+            **kwargs: 保存参数（dpi、bbox_inches、pad_inches、facecolor、format、metadata） |
+                Save parameters (dpi, bbox_inches, pad_inches, facecolor, format, metadata)
+
+        Returns:
+            完成时结果为文件路径的Future | Future resolving to the file path
+        """
+        if self._fig is None:
+            raise RenderingError("No figure to save. Call render() first.")
+
+        if writer is None:
+            writer = get_default_image_writer()
+
+        format = writer.resolve_format(filepath, kwargs.pop('format', None))
+        if format not in RASTER_FORMATS or not hasattr(self._fig.canvas, 'buffer_rgba'):
+            future = Future()
+            try:
+                self.save_figure(filepath, format=format, **kwargs)
+                future.set_result(Path(filepath))
+            except RenderingError as e:
+                future.set_exception(e)
+            return future
+
+        dpi = kwargs.get('dpi', self.config.get('dpi', 100))
+        facecolor = kwargs.get('facecolor', self.config.get('background_color', 'white'))
+
+        try:
+            with stage('snapshot_figure'):
+                image = self._snapshot(dpi, facecolor, kwargs.get('bbox_inches', 'tight'),
+                                       kwargs.get('pad_inches', 0.1))
+        except Exception as e:
+            raise RenderingError(f"Failed to snapshot figure: {e}")
+
+        return writer.submit(image, filepath, format=format, dpi=dpi, metadata=kwargs.get('metadata'))
+
+    def _snapshot(self, dpi: float, facecolor: Any, bbox_inches: Optional[str],
+                  pad_inches: float) -> np.ndarray:
+        """
+        绘制画布并复制RGBA缓冲区 | Draw the canvas and copy its RGBA buffer
+
+        Returns:
+            (H, W, 4) uint8数组 | (H, W, 4) uint8 array
+        """
+        fig = self._fig
+        original_dpi = fig.get_dpi()
+        original_facecolor = fig.get_facecolor()
+        try:
+            fig.set_dpi(dpi)
+            fig.set_facecolor(facecolor)
+            fig.canvas.draw()
+            image = np.asarray(fig.canvas.buffer_rgba())
+
+            if bbox_inches == 'tight':
+                # 按紧凑边界框加边距裁剪 | Crop to the tight bounding box plus padding
+                bbox = fig.get_tightbbox(fig.canvas.get_renderer()).padded(pad_inches)
+                height, width = image.shape[:2]
+                x0 = max(int(np.floor(bbox.x0 * dpi)), 0)
+                x1 = min(int(np.ceil(bbox.x1 * dpi)), width)
+                y0 = max(int(np.floor(height - bbox.y1 * dpi)), 0)
+                y1 = min(int(np.ceil(height - bbox.y0 * dpi)), height)
+                if x1 > x0 and y1 > y0:
+                    image = image[y0:y1, x0:x1]
+
+            return image.copy()
+        finally:
+            fig.set_dpi(original_dpi)
+            fig.set_facecolor(original_facecolor)
+
     def show(self) -> None:
         """显示图形 | Show figure"""
         if self._fig is None:
@@ -247,15 +517,22 @@ class MatplotlibRenderer(BaseRenderer):
         if self.config.get('tight_layout', True):
             self._fig.tight_layout()
         
+        # 池中的图形未注册到pyplot，显示前需交给pyplot管理 | Pooled figures are not registered with pyplot and must be adopted before showing
+        if self._fig.canvas.manager is None:
+            try:
+                plt.figure(self._fig)
+            except Exception as e:
+                raise RenderingError(f"Cannot show pooled figure: {e}")
+        
         plt.show()
     
     def close(self) -> None:
         """关闭图形 | Close figure"""
-        if self._fig:
-            plt.close(self._fig)
-            self._fig = None
-            self._ax = None
-        self._clear_plot_objects()
+        self.cancel_progressive()
+        if self._progressive_timer is not None:
+            self._progressive_timer.stop()
+            self._progressive_timer = None
+        self._release_figure()
         self._current_data = None
     
     def get_figure(self) -> Optional[plt.Figure]:
@@ -284,16 +561,22 @@ class Matplotlib3DRenderer(MatplotlibRenderer):
         alpha = self.config.get('alpha', 1.0)
         marker_size = self.config.get('marker_size', 20)
         
-        # 创建颜色映射 | Create color mapping
-        norm = Normalize(vmin=np.min(z), vmax=np.max(z))
-        colors = cm.get_cmap(colormap)(norm(z))
+        # 规则网格的单元中心不是测量点，只绘制表面 | Cell centers of a regular grid are not measured points, so only the surface is drawn
+        grid_source = self._grid_source is not None
+        mappable = None
         
-        # 绘制3D散点图 | Plot 3D scatter
-        scatter = self._ax.scatter(x, y, z, c=colors, s=marker_size, alpha=alpha)
-        self._plot_objects.append(scatter)
+        if not grid_source:
+            # 创建颜色映射 | Create color mapping
+            mapper = ColorMapper(colormap, vmin=np.min(z), vmax=np.max(z))
+            colors = mapper.map_values(z)
+            
+            # 绘制3D散点图 | Plot 3D scatter
+            scatter = self._ax.scatter(x, y, z, c=colors, s=marker_size, alpha=alpha)
+            self._plot_objects.append(scatter)
+            mappable = scatter
         
         # 如果数据点足够多，创建表面图 | Create surface plot if enough data points
-        if len(x) > 10 and self.config.get('show_surface', True):
+        if (grid_source or len(x) > 10) and self.config.get('show_surface', True):
             try:
                 X_grid, Y_grid, Z_grid = self._create_interpolated_grid(x, y, z)
                 
@@ -303,11 +586,15 @@ class Matplotlib3DRenderer(MatplotlibRenderer):
                     surface = self._ax.plot_surface(
                         X_grid, Y_grid, Z_grid,
                         cmap=colormap,
-                        alpha=alpha * 0.7,
+                        vmin=np.min(z),
+                        vmax=np.max(z),
+                        alpha=alpha if grid_source else alpha * 0.7,
                         linewidth=0,
                         antialiased=True
                     )
                     self._plot_objects.append(surface)
+                    if mappable is None:
+                        mappable = surface
             except Exception as e:
                 warnings.warn(f"Surface plotting failed: {e}")
         
@@ -318,7 +605,8 @@ class Matplotlib3DRenderer(MatplotlibRenderer):
         self._setup_grid()
         
         # 添加颜色条 | Add colorbar
-        self._add_colorbar(scatter)
+        if mappable is not None:
+            self._add_colorbar(mappable)
         
         # 设置视角 | Set viewing angle
         elev = self.config.get('elevation_angle', 30)
@@ -361,27 +649,43 @@ class MatplotlibContourRenderer(MatplotlibRenderer):
         else:
             levels = num_levels
         
+        # 提取（或复用缓存的）等高线几何 | Extract (or reuse cached) contour geometry
+        filled = self.config.get('filled_contours', True)
+        show_lines = self.config.get('show_contour_lines', True)
+        if self.config.get('use_contour_cache', True):
+            contours = get_default_contour_engine().compute(X_grid, Y_grid, Z_grid, levels, filled=filled, lines=show_lines)
+        else:
+            contours = extract_contours(X_grid, Y_grid, Z_grid, levels, filled=filled, lines=show_lines)
+        
+        # 与contourf一致，坐标轴范围贴合网格边界 | As with contourf, axis limits stick to the grid extent
+        grid_x_edges = [float(np.min(X_grid)), float(np.max(X_grid))]
+        grid_y_edges = [float(np.min(Y_grid)), float(np.max(Y_grid))]
+        
         # 绘制填充等高线 | Plot filled contours
-        if self.config.get('filled_contours', True):
-            contourf = self._ax.contourf(X_grid, Y_grid, Z_grid, levels=levels, cmap=colormap)
+        if filled:
+            contourf = ContourSet(self._ax, contours.levels, contours.bands, contours.band_kinds,
+                                  filled=True, cmap=colormap)
+            contourf.sticky_edges.x[:] = grid_x_edges
+            contourf.sticky_edges.y[:] = grid_y_edges
             self._plot_objects.append(contourf)
             
             # 添加颜色条 | Add colorbar
             self._add_colorbar(contourf)
         
         # 绘制等高线 | Plot contour lines
-        if self.config.get('show_contour_lines', True):
+        if show_lines:
             line_color = self.config.get('contour_line_color', 'black')
             line_width = self.config.get('line_width', 1.0)
             line_alpha = self.config.get('contour_line_alpha', 0.5)
             
-            contour = self._ax.contour(
-                X_grid, Y_grid, Z_grid, 
-                levels=levels, 
+            contour = ContourSet(
+                self._ax, contours.levels, contours.lines, contours.line_kinds,
                 colors=line_color, 
                 linewidths=line_width,
                 alpha=line_alpha
             )
+            contour.sticky_edges.x[:] = grid_x_edges
+            contour.sticky_edges.y[:] = grid_y_edges
             self._plot_objects.append(contour)
             
             # 添加等高线标签 | Add contour labels
@@ -389,8 +693,8 @@ class MatplotlibContourRenderer(MatplotlibRenderer):
                 label_fontsize = self.config.get('font_size', 12) - 2
                 self._ax.clabel(contour, inline=True, fontsize=label_fontsize, fmt='%.0f')
         
-        # 绘制原始数据点 | Plot original data points
-        if self.config.get('show_data_points', True):
+        # 绘制原始数据点（规则网格没有原始点） | Plot original data points (regular grids have none)
+        if self.config.get('show_data_points', True) and self._grid_source is None:
             marker_size = self.config.get('marker_size', 20)
             marker_color = self.config.get('data_point_color', 'red')
             marker_alpha = self.config.get('data_point_alpha', 0.8)
@@ -419,6 +723,107 @@ class MatplotlibContourRenderer(MatplotlibRenderer):
         return self._fig
 
 
+class MatplotlibProfileRenderer(MatplotlibRenderer):
+    """
+    Matplotlib高程剖面渲染器 | Matplotlib elevation profile renderer
+    
+    以距离-高程折线绘制ProfileSet或ElevationProfile；多条剖面合为一个LineCollection按颜色映射着色 |
+    Draws a ProfileSet or ElevationProfile as distance-elevation lines; multiple profiles share one
+    LineCollection colored by the colormap
+    """
+    
+    def _set_default_config(self) -> None:
+        """设置剖面图默认配置（先于通用默认值） | Set profile plot defaults (ahead of the generic defaults)"""
+        profile_defaults = {
+            'title': 'Elevation Profile',
+            'xlabel': 'Distance',
+            'ylabel': 'Elevation (m)',
+            'profile_color': 'saddlebrown',
+            'profile_fill': True,
+            'profile_fill_alpha': 0.3,
+        }
+        
+        for key, value in profile_defaults.items():
+            if key not in self.config:
+                self.config[key] = value
+        
+        super()._set_default_config()
+    
+    def render(self, data: Union[ProfileSet, ElevationProfile, Sequence[ElevationProfile]], **kwargs) -> plt.Figure:
+        """
+        渲染高程剖面 | Render elevation profiles
+        
+        Args:
+            data: 剖面集合、单条剖面或剖面列表 | Profile set, single profile or list of profiles
+            **kwargs: 额外的渲染参数 | Additional rendering parameters
+            
+        Returns:
+            Matplotlib图形对象 | Matplotlib figure object
+        """
+        self.cancel_progressive()
+        
+        if kwargs:
+            self.set_config(**kwargs)
+        
+        if isinstance(data, ElevationProfile):
+            data = ProfileSet.from_profiles([data])
+        elif not isinstance(data, ProfileSet):
+            data = ProfileSet.from_profiles(list(data))
+        if len(data) == 0:
+            raise RenderingError("No profiles to render")
+        
+        self._current_data = data
+        cache = self.get_render_cache()
+        self._render_key = self._make_render_key(cache, data)
+        
+        with stage('render_implementation', renderer=type(self).__name__):
+            return self._render_profiles(data)
+    
+    def _render_profiles(self, profiles: ProfileSet) -> plt.Figure:
+        """剖面渲染实现 | Profile rendering implementation"""
+        from matplotlib.collections import LineCollection
+        
+        self._setup_figure()
+        
+        line_width = self.config.get('line_width', 1.0)
+        
+        if len(profiles) == 1:
+            profile = profiles[0]
+            line_color = self.config['profile_color']
+            line, = self._ax.plot(profile.distance, profile.elevation, color=line_color, linewidth=line_width)
+            self._plot_objects.append(line)
+            
+            # 填充剖面下方区域 | Fill the area below the profile
+            if self.config.get('profile_fill', True):
+                finite = np.isfinite(profile.elevation)
+                if finite.any():
+                    base = np.nanmin(profile.elevation)
+                    fill = self._ax.fill_between(
+                        profile.distance, profile.elevation, base, where=finite,
+                        color=line_color, alpha=self.config.get('profile_fill_alpha', 0.3)
+                    )
+                    self._plot_objects.append(fill)
+        else:
+            # 每条剖面一段，按序号着色 | One segment list per profile, colored by index
+            segments = [np.column_stack((profile.distance, profile.elevation)) for profile in profiles]
+            collection = LineCollection(
+                segments,
+                cmap=self.config.get('colormap', 'terrain'),
+                linewidths=line_width,
+                alpha=self.config.get('alpha', 0.8)
+            )
+            collection.set_array(np.arange(len(profiles), dtype=np.float64))
+            self._ax.add_collection(collection)
+            self._ax.autoscale_view()
+            self._plot_objects.append(collection)
+            self._add_colorbar(collection, label='Profile')
+        
+        self._setup_labels_and_title()
+        self._setup_grid()
+        
+        return self._fig
+
+
 # 为了向后兼容，提供一个通用的MatplotlibRenderer别名 | For backward compatibility, provide a generic MatplotlibRenderer alias
 class MatplotlibRenderer(Matplotlib3DRenderer):
     """
@@ -0,0 +1,501 @@
+"""
+PyMountain软件3D渲染器模块 | PyMountain software 3D renderer module
+
+基于纯NumPy Z缓冲光栅化的3D地形渲染器，适用于批量生成缩略图 | Pure-NumPy z-buffer rasterizing 3D terrain renderer, suited to bulk thumbnail generation
+"""
+
+import numpy as np
+from typing import Dict, Any, Optional, Tuple, Union
+from pathlib import Path
+from concurrent.futures import Future
+
+from ..core.renderer import BaseRenderer, RenderingError
+from ..core.data import MountainData
+from ..core.grid import GridData
+from ..core.profiling import profiled, stage
+from ..utils.color_mapping import ColorMapper
+from ..utils.image_writer import AsyncImageWriter, get_default_image_writer
+
+
+class SoftwareRenderer3D(BaseRenderer):
+    """
+    软件3D渲染器 | Software 3D renderer
+
+    将插值网格剖分为三角形，用相机投影后以向量化NumPy光栅化到Z缓冲，
+    再按颜色映射和光照方向着色，输出RGBA数组或PNG图像 |
+    Splits the interpolated grid into triangles, projects them with a camera,
+    rasterizes them into a z-buffer with vectorized NumPy and shades them with
+    the colormap and a light direction, producing an RGBA array or PNG image
+
+    与Matplotlib3DRenderer不同，本渲染器不创建Matplotlib图形对象 |
+    Unlike Matplotlib3DRenderer, this renderer does not create Matplotlib figures
+    """
+
+    # 每批光栅化的候选像素上限 | Maximum candidate pixels rasterized per batch
+    _BATCH_PIXELS = 1 << 22
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None,
+                 is_interactive: bool = False,
+                 update_interval_ms: int = 100):
+        """初始化软件3D渲染器 | Initialize software 3D renderer"""
+        super().__init__(config, is_interactive, update_interval_ms)
+
+        # 软件渲染特定配置 | Software rendering specific configuration
+        self._set_software_defaults()
+
+        # 渲染结果 | Rendering result
+        self._image: Optional[np.ndarray] = None
+
+    def _set_software_defaults(self) -> None:
+        """设置软件渲染特定的默认配置 | Set software rendering specific default configuration"""
+        software_defaults = {
+            'image_size': None,
+            'elevation_angle': 30,
+            'azimuth_angle': 45,
+            'z_scale': 0.5,
+            'light_azimuth': 315,
+            'light_altitude': 45,
+            'ambient': 0.35,
+            'margin': 0.05,
+        }
+
+        for key, value in software_defaults.items():
+            if key not in self.config:
+                self.config[key] = value
+
+    def _get_image_size(self) -> Tuple[int, int]:
+        """
+        获取输出图像尺寸 | Get output image size
+
+        Returns:
+            (宽度, 高度)像素元组 | (width, height) pixel tuple
+        """
+        image_size = self.config.get('image_size')
+        if image_size is None:
+            fig_w, fig_h = self.config.get('figure_size', (10, 8))
+            dpi = self.config.get('dpi', 100)
+            image_size = (fig_w * dpi, fig_h * dpi)
+
+        width, height = int(round(image_size[0])), int(round(image_size[1]))
+        if width <= 0 or height <= 0:
+            raise RenderingError("image_size must contain two positive numbers")
+        return width, height
+
+    def render(self, data: Union[MountainData, GridData], **kwargs) -> np.ndarray:
+        """
+        渲染山体数据 | Render mountain data
+
+        Args:
+            data: 山体数据对象 | Mountain data object
+            **kwargs: 额外的渲染参数 | Additional rendering parameters
+
+        Returns:
+            (高度, 宽度, 4)的uint8 RGBA数组 | (height, width, 4) uint8 RGBA array
+        """
+        # 新数据取代未完成的渐进细化 | New data supersedes unfinished progressive refinement
+        self.cancel_progressive()
+
+        # 更新配置 | Update configuration
+        if kwargs:
+            self.set_config(**kwargs)
+
+        # 准备数据 | Prepare data
+        try:
+            x, y, z = self._prepare_data_for_rendering(data)
+        except ValueError as e:
+            raise RenderingError(f"Data preparation failed: {e}")
+
+        if len(x) < 3:
+            raise RenderingError("At least 3 points are required for surface rendering")
+
+        # 存储当前数据 | Store current data
+        self._current_data = data
+
+        try:
+            X_grid, Y_grid, Z_grid = self._create_interpolated_grid(x, y, z)
+        except Exception as e:
+            raise RenderingError(f"Grid interpolation failed: {e}")
+
+        return self.render_grid(X_grid, Y_grid, Z_grid)
+
+    def _render_progressive_level(self, x: np.ndarray, y: np.ndarray, z: np.ndarray, resolution: int) -> np.ndarray:
+        """以指定网格分辨率渲染一个渐进级别 | Render one progressive level at the given grid resolution"""
+        X_grid, Y_grid, Z_grid = self._create_interpolated_grid(x, y, z, resolution)
+        return self.render_grid(X_grid, Y_grid, Z_grid)
+
+    def render_grid(self, X_grid: np.ndarray, Y_grid: np.ndarray, Z_grid: np.ndarray) -> np.ndarray:
+        """
+        直接渲染规则网格 | Render a regular grid directly
+
+        Args:
+            X_grid: X坐标网格 | X coordinate grid
+            Y_grid: Y坐标网格 | Y coordinate grid
+            Z_grid: 高程网格，NaN单元格不绘制 | Elevation grid, NaN cells are not drawn
+
+        Returns:
+            (高度, 宽度, 4)的uint8 RGBA数组 | (height, width, 4) uint8 RGBA array
+        """
+        X_grid = np.asarray(X_grid, dtype=np.float64)
+        Y_grid = np.asarray(Y_grid, dtype=np.float64)
+        Z_grid = np.asarray(Z_grid, dtype=np.float64)
+
+        if X_grid.shape != Y_grid.shape or Y_grid.shape != Z_grid.shape or Z_grid.ndim != 2:
+            raise RenderingError("X_grid, Y_grid and Z_grid must be 2D arrays of the same shape")
+        if min(Z_grid.shape) < 2:
+            raise RenderingError("Grid must be at least 2x2")
+
+        width, height = self._get_image_size()
+        valid = np.isfinite(Z_grid)
+        if not np.any(valid):
+            raise RenderingError("Grid contains no finite elevation values")
+
+        z_min, z_max = float(np.min(Z_grid[valid])), float(np.max(Z_grid[valid]))
+
+        # 投影顶点 | Project vertices
+        world = self._normalize_world(X_grid, Y_grid, Z_grid, z_min, z_max)
+        screen_x, screen_y, depth = self._project(world, width, height)
+
+        # 三角剖分与面法线着色 | Triangulation and face normal shading
+        triangles = self._triangulate(Z_grid.shape, valid)
+        shade = self._shade_faces(world, triangles)
+
+        # 光栅化 | Rasterize
+        depth_buffer, elevation_buffer, shade_buffer = self._rasterize(
+            screen_x, screen_y, depth, Z_grid.ravel(), triangles, shade, width, height
+        )
+
+        self._image = self._compose_image(depth_buffer, elevation_buffer, shade_buffer, z_min, z_max)
+        return self._image
+
+    def _normalize_world(self, X_grid: np.ndarray, Y_grid: np.ndarray, Z_grid: np.ndarray,
+                         z_min: float, z_max: float) -> np.ndarray:
+        """
+        将网格坐标归一化到单位包围盒 | Normalize grid coordinates into a unit bounding box
+
+        Returns:
+            (N, 3)顶点数组 | (N, 3) vertex array
+        """
+        def _unit(values: np.ndarray, lo: float, hi: float) -> np.ndarray:
+            span = hi - lo
+            if span <= 0:
+                return np.zeros_like(values)
+            return (values - lo) / span - 0.5
+
+        world = np.empty((Z_grid.size, 3), dtype=np.float64)
+        world[:, 0] = _unit(X_grid.ravel(), float(np.min(X_grid)), float(np.max(X_grid)))
+        world[:, 1] = _unit(Y_grid.ravel(), float(np.min(Y_grid)), float(np.max(Y_grid)))
+        world[:, 2] = _unit(Z_grid.ravel(), z_min, z_max) * self.config.get('z_scale', 0.5)
+
+        # 无效顶点放在基准面上，其三角形随后被丢弃 | Invalid vertices sit on the base plane, their triangles are dropped later
+        world[~np.isfinite(world[:, 2]), 2] = 0.0
+        return world
+
+    def _camera_axes(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        按仰角和方位角计算相机坐标轴 | Compute camera axes from elevation and azimuth angles
+
+        与Matplotlib的view_init(elev, azim)约定一致 | Follows Matplotlib's view_init(elev, azim) convention
+
+        Returns:
+            (右方向, 上方向, 视线方向)元组 | (right, up, view direction) tuple
+        """
+        elev = np.radians(self.config.get('elevation_angle', 30))
+        azim = np.radians(self.config.get('azimuth_angle', 45))
+
+        view = np.array([np.cos(elev) * np.cos(azim), np.cos(elev) * np.sin(azim), np.sin(elev)])
+        right = np.array([-np.sin(azim), np.cos(azim), 0.0])
+        up = np.cross(view, right)
+        return right, up, view
+
+    @profiled('project')
+    def _project(self, world: np.ndarray, width: int, height: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        正交投影到像素坐标 | Orthographic projection into pixel coordinates
+
+        Returns:
+            (屏幕X, 屏幕Y, 深度)数组元组，深度越大越远 | (screen x, screen y, depth) array tuple, larger depth is farther
+        """
+        right, up, view = self._camera_axes()
+        sx = world @ right
+        sy = world @ up
+        depth = -(world @ view)
+
+        # 适配图像尺寸并保持纵横比 | Fit image size while keeping aspect ratio
+        margin = self.config.get('margin', 0.05)
+        span_x = max(float(np.max(sx) - np.min(sx)), 1e-12)
+        span_y = max(float(np.max(sy) - np.min(sy)), 1e-12)
+        scale = min(width * (1 - 2 * margin) / span_x, height * (1 - 2 * margin) / span_y)
+
+        center_x = (np.max(sx) + np.min(sx)) / 2
+        center_y = (np.max(sy) + np.min(sy)) / 2
+        px = (sx - center_x) * scale + width / 2
+        py = (center_y - sy) * scale + height / 2
+        return px, py, depth
+
+    @staticmethod
+    @profiled('triangulate')
+    def _triangulate(shape: Tuple[int, int], valid: np.ndarray) -> np.ndarray:
+        """
+        将网格单元剖分为三角形 | Split grid cells into triangles
+
+        Returns:
+            (T, 3)顶点索引数组 | (T, 3) vertex index array
+        """
+        rows, cols = shape
+        index = np.arange(rows * cols).reshape(rows, cols)
+        v00 = index[:-1, :-1].ravel()
+        v01 = index[:-1, 1:].ravel()
+        v10 = index[1:, :-1].ravel()
+        v11 = index[1:, 1:].ravel()
+
+        triangles = np.concatenate([
+            np.column_stack((v00, v01, v11)),
+            np.column_stack((v00, v11, v10)),
+        ])
+
+        # 丢弃含无效顶点的三角形 | Drop triangles with invalid vertices
+        flat_valid = valid.ravel()
+        keep = flat_valid[triangles].all(axis=1)
+        return triangles[keep]
+
+    @profiled('shade_faces')
+    def _shade_faces(self, world: np.ndarray, triangles: np.ndarray) -> np.ndarray:
+        """
+        计算每个三角形的Lambert光照强度 | Compute Lambert shading intensity per triangle
+
+        Returns:
+            (T,)光照强度数组 | (T,) shading intensity array
+        """
+        p0, p1, p2 = world[triangles[:, 0]], world[triangles[:, 1]], world[triangles[:, 2]]
+        normals = np.cross(p1 - p0, p2 - p0)
+        lengths = np.linalg.norm(normals, axis=1)
+        lengths[lengths == 0] = 1.0
+        normals /= lengths[:, None]
+
+        # 法线统一朝上 | Orient normals upwards
+        normals[normals[:, 2] < 0] *= -1
+
+        light_az = np.radians(self.config.get('light_azimuth', 315))
+        light_alt = np.radians(self.config.get('light_altitude', 45))
+        light = np.array([np.cos(light_alt) * np.sin(light_az),
+                          np.cos(light_alt) * np.cos(light_az),
+                          np.sin(light_alt)])
+
+        ambient = self.config.get('ambient', 0.35)
+        diffuse = np.clip(normals @ light, 0.0, 1.0)
+        return ambient + (1.0 - ambient) * diffuse
+
+    @profiled('rasterize')
+    def _rasterize(self, px: np.ndarray, py: np.ndarray, depth: np.ndarray, elevation: np.ndarray,
+                   triangles: np.ndarray, shade: np.ndarray,
+                   width: int, height: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        向量化Z缓冲光栅化 | Vectorized z-buffer rasterization
+
+        三角形按包围盒尺寸分组，每组在固定大小的像素窗口上并行求重心坐标 |
+        Triangles are grouped by bounding box size and each group evaluates
+        barycentric coordinates over a fixed-size pixel window in parallel
+
+        Returns:
+            (深度缓冲, 高程缓冲, 光照缓冲)扁平数组元组 | (depth, elevation, shade) flat buffer tuple
+        """
+        n_pixels = width * height
+        depth_buffer = np.full(n_pixels, np.inf)
+        elevation_buffer = np.full(n_pixels, np.nan)
+        shade_buffer = np.zeros(n_pixels)
+
+        if len(triangles) == 0:
+            return depth_buffer, elevation_buffer, shade_buffer
+
+        tx, ty = px[triangles], py[triangles]
+
+        # 像素中心位于整数坐标+0.5 | Pixel centres lie at integer + 0.5
+        x0 = np.floor(tx.min(axis=1) - 0.5).astype(np.int64) + 1
+        x1 = np.floor(tx.max(axis=1) - 0.5).astype(np.int64)
+        y0 = np.floor(ty.min(axis=1) - 0.5).astype(np.int64) + 1
+        y1 = np.floor(ty.max(axis=1) - 0.5).astype(np.int64)
+        x0, y0 = np.maximum(x0, 0), np.maximum(y0, 0)
+        x1, y1 = np.minimum(x1, width - 1), np.minimum(y1, height - 1)
+
+        area = ((tx[:, 1] - tx[:, 0]) * (ty[:, 2] - ty[:, 0]) -
+                (tx[:, 2] - tx[:, 0]) * (ty[:, 1] - ty[:, 0]))
+        visible = (x1 >= x0) & (y1 >= y0) & (area != 0)
+
+        extent = np.maximum(x1 - x0, y1 - y0) + 1
+        # 按包围盒尺寸的2的幂分组 | Group by power-of-two bounding box size
+        group_size = np.where(visible, 2 ** np.ceil(np.log2(np.maximum(extent, 1))).astype(np.int64), 0)
+
+        for size in np.unique(group_size[visible]):
+            group = np.nonzero(group_size == size)[0]
+            offsets = np.arange(size)
+            off_x = np.tile(offsets, size)
+            off_y = np.repeat(offsets, size)
+            batch = max(1, self._BATCH_PIXELS // (size * size))
+
+            for start in range(0, len(group), batch):
+                tri = group[start:start + batch]
+                cx = x0[tri, None] + off_x[None, :]
+                cy = y0[tri, None] + off_y[None, :]
+                inside = (cx <= x1[tri, None]) & (cy <= y1[tri, None])
+
+                # 重心坐标 | Barycentric coordinates
+                fx, fy = cx + 0.5, cy + 0.5
+                ax, ay = tx[tri, 0, None], ty[tri, 0, None]
+                bx, by = tx[tri, 1, None], ty[tri, 1, None]
+                qx, qy = tx[tri, 2, None], ty[tri, 2, None]
+                inv_area = 1.0 / area[tri, None]
+
+                w1 = ((fx - ax) * (qy - ay) - (qx - ax) * (fy - ay)) * inv_area
+                w2 = ((bx - ax) * (fy - ay) - (fx - ax) * (by - ay)) * inv_area
+                w0 = 1.0 - w1 - w2
+                inside &= (w0 >= 0) & (w1 >= 0) & (w2 >= 0)
+
+                hit_tri, hit_px = np.nonzero(inside)
+                if len(hit_tri) == 0:
+                    continue
+
+                tri_ids = tri[hit_tri]
+                vertices = triangles[tri_ids]
+                b0, b1, b2 = w0[hit_tri, hit_px], w1[hit_tri, hit_px], w2[hit_tri, hit_px]
+                frag_depth = b0 * depth[vertices[:, 0]] + b1 * depth[vertices[:, 1]] + b2 * depth[vertices[:, 2]]
+                pixel = cy[hit_tri, hit_px] * width + cx[hit_tri, hit_px]
+
+                # 每个像素保留最近的片元 | Keep nearest fragment per pixel
+                order = np.lexsort((frag_depth, pixel))
+                pixel, frag_depth = pixel[order], frag_depth[order]
+                first = np.ones(len(pixel), dtype=bool)
+                first[1:] = pixel[1:] != pixel[:-1]
+                pixel, frag_depth, order = pixel[first], frag_depth[first], order[first]
+
+                closer = frag_depth < depth_buffer[pixel]
+                pixel, frag_depth, order = pixel[closer], frag_depth[closer], order[closer]
+
+                vertices = vertices[order]
+                b0, b1, b2 = b0[order], b1[order], b2[order]
+                depth_buffer[pixel] = frag_depth
+                elevation_buffer[pixel] = (b0 * elevation[vertices[:, 0]] +
+                                           b1 * elevation[vertices[:, 1]] +
+                                           b2 * elevation[vertices[:, 2]])
+                shade_buffer[pixel] = shade[tri_ids[order]]
+
+        return depth_buffer, elevation_buffer, shade_buffer
+
+    @profiled('compose_image')
+    def _compose_image(self, depth_buffer: np.ndarray, elevation_buffer: np.ndarray,
+                       shade_buffer: np.ndarray, z_min: float, z_max: float) -> np.ndarray:
+        """
+        将缓冲区合成为RGBA图像 | Compose buffers into an RGBA image
+
+        Returns:
+            (高度, 宽度, 4)的uint8 RGBA数组 | (height, width, 4) uint8 RGBA array
+        """
+        from matplotlib.colors import to_rgba
+
+        width, height = self._get_image_size()
+        background = np.array(to_rgba(self.config.get('background_color', 'white')))
+        image = np.empty((width * height, 4), dtype=np.float64)
+        image[:] = background
+
+        covered = np.isfinite(depth_buffer)
+        if np.any(covered):
+            mapper = ColorMapper(self.config.get('colormap', 'terrain'), vmin=z_min, vmax=z_max)
+            colors = mapper.map_values(elevation_buffer[covered], dtype=np.float32)
+            colors[:, :3] *= shade_buffer[covered, None]
+
+            alpha = self.config.get('alpha', 1.0)
+            image[covered, :3] = alpha * colors[:, :3] + (1 - alpha) * background[:3]
+            image[covered, 3] = alpha + (1 - alpha) * background[3]
+
+        return (np.clip(image, 0.0, 1.0) * 255 + 0.5).astype(np.uint8).reshape(height, width, 4)
+
+    def update(self, data: Union[MountainData, GridData], **kwargs) -> None:
+        """
+        更新渲染内容 | Update rendered content
+
+        Args:
+            data: 新的山体数据 | New mountain data
+            **kwargs: 额外的更新参数 | Additional update parameters
+        """
+        self.render(data, **kwargs)
+
+    def clear(self) -> None:
+        """清除渲染内容 | Clear rendered content"""
+        self._image = None
+        self._current_data = None
+
+    def get_image(self) -> Optional[np.ndarray]:
+        """
+        获取渲染后的RGBA数组 | Get rendered RGBA array
+
+        Returns:
+            RGBA数组或None | RGBA array or None
+        """
+        return self._image
+
+    def get_figure(self) -> Optional[np.ndarray]:
+        """获取渲染结果（RGBA数组） | Get rendering result (RGBA array)"""
+        return self._image
+
+    def save_figure(self, filepath: Union[str, Path], **kwargs) -> None:
+        """
+        保存图像到文件 | Save image to file
+
+        Args:
+            filepath: 文件路径 | File path
+            **kwargs: 传递给matplotlib.image.imsave的参数 | Parameters passed to matplotlib.image.imsave
+        """
+        if self._image is None:
+            raise RenderingError("No image to save. Call render() first.")
+
+        from matplotlib.image import imsave
+
+        try:
+            with stage('savefig'):
+                imsave(filepath, self._image, **kwargs)
+        except Exception as e:
+            raise RenderingError(f"Failed to save image: {e}")
+
+    def save_figure_async(self, filepath: Union[str, Path], writer: Optional[AsyncImageWriter] = None,
+                          **kwargs) -> Future:
+        """
+        异步保存图像到文件 | Save image to file asynchronously
+
+        每次渲染都会生成新的图像数组，因此无需复制即可交给后台写入器 |
+        Each render produces a new image array, so it is handed to the background writer without copying
+
+        Args:
+            filepath: 文件路径 | File path
+            writer: 后台写入器（默认使用全局写入器） | Background writer (defaults to the global writer)
+            **kwargs: 传递给AsyncImageWriter.submit的参数 | Parameters passed to AsyncImageWriter.submit
+
+        Returns:
+            完成时结果为文件路径的Future | Future resolving to the file path
+        """
+        if self._image is None:
+            raise RenderingError("No image to save. Call render() first.")
+
+        if writer is None:
+            writer = get_default_image_writer()
+        kwargs.setdefault('dpi', self.config.get('dpi', 100))
+        return writer.submit(self._image, filepath, **kwargs)
+
+    def show(self) -> None:
+        """显示图像 | Show image"""
+        if self._image is None:
+            raise RenderingError("No image to show. Call render() first.")
+
+        import matplotlib.pyplot as plt
+
+        fig, ax = plt.subplots(figsize=self.config.get('figure_size', (10, 8)))
+        ax.imshow(self._image)
+        ax.set_axis_off()
+        ax.set_title(self.config.get('title', 'Mountain Terrain Visualization'))
+        plt.show()
+
+    def close(self) -> None:
+        """释放渲染结果 | Release rendering result"""
+        self.clear()
+
+    def get_supported_formats(self) -> list:
+        """获取支持的文件格式 | Get supported file formats"""
+        return ['png', 'jpg', 'tiff']
@@ -0,0 +1,38 @@
+"""
+PyMountain服务模块 | PyMountain services module
+
+包含瓦片渲染、批量渲染等面向服务部署的组件 | Contains service-oriented components such as tile and batch rendering
+"""
+
+# 瓦片服务导入 | Tile service imports
+from .tiles import (
+    TileCache,
+    TileRenderer,
+    TileServer,
+    TileLatencyStats,
+    serve_tiles,
+)
+
+# 批量渲染导入 | Batch rendering imports
+from .batch import (
+    BatchJob,
+    JobResult,
+    BatchReport,
+    run_batch,
+    load_jobs,
+)
+
+__all__ = [
+    # 瓦片服务 | Tile service
+    "TileCache",
+    "TileRenderer",
+    "TileServer",
+    "TileLatencyStats",
+    "serve_tiles",
+    # 批量渲染 | Batch rendering
+    "BatchJob",
+    "JobResult",
+    "BatchReport",
+    "run_batch",
+    "load_jobs",
+]
@@ -0,0 +1,496 @@
+"""
+PyMountain批量渲染模块 | PyMountain batch rendering module
+
+在进程池上并行执行大量渲染任务，数据集通过内存映射文件在进程间共享 |
+Runs large numbers of render jobs in parallel on a process pool, sharing datasets between processes through memory-mapped files
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import time
+import traceback
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field, asdict
+from pathlib import Path
+from typing import Dict, Any, Optional, Tuple, List, Union, Iterable
+
+import numpy as np
+
+from ..utils.raster_io import RASTER_SUFFIXES, read_raster
+
+
+# 渲染器类型名称到类路径的映射 | Mapping of renderer type names to class paths
+RENDERER_TYPES: Dict[str, Tuple[str, str]] = {
+    '3d': ('pymountain.renderers.matplotlib_renderer', 'Matplotlib3DRenderer'),
+    'contour': ('pymountain.renderers.matplotlib_renderer', 'MatplotlibContourRenderer'),
+    'software': ('pymountain.renderers.software_renderer', 'SoftwareRenderer3D'),
+}
+
+
+@dataclass
+class BatchJob:
+    """
+    批量渲染任务 | Batch render job
+
+    Attributes:
+        dataset_path: 数据集路径（.json/.npy/.npz/.csv或栅格） | Dataset path (.json/.npy/.npz/.csv or a raster)
+        renderer_type: 渲染器类型 | Renderer type ('3d', 'contour', 'software')
+        config: 渲染器配置 | Renderer configuration
+        output_path: 输出文件路径 | Output file path
+        save_kwargs: 传递给save_figure的参数 | Parameters passed to save_figure
+        job_id: 任务标识 | Job identifier
+    """
+
+    dataset_path: str
+    renderer_type: str = '3d'
+    config: Dict[str, Any] = field(default_factory=dict)
+    output_path: str = 'output.png'
+    save_kwargs: Dict[str, Any] = field(default_factory=dict)
+    job_id: Optional[str] = None
+
+    def __post_init__(self):
+        """初始化后验证任务 | Post-initialization job validation"""
+        if self.renderer_type not in RENDERER_TYPES:
+            raise ValueError(f"Unknown renderer_type '{self.renderer_type}'. "
+                             f"Supported types: {list(RENDERER_TYPES.keys())}")
+        self.dataset_path = str(self.dataset_path)
+        self.output_path = str(self.output_path)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'BatchJob':
+        """
+        从字典创建任务 | Create job from dictionary
+
+        Args:
+            data: 包含任务字段的字典 | Dictionary containing job fields
+
+        Returns:
+            BatchJob实例 | BatchJob instance
+        """
+        return cls(
+            dataset_path=data['dataset_path'],
+            renderer_type=data.get('renderer_type', '3d'),
+            config=data.get('config', {}),
+            output_path=data['output_path'],
+            save_kwargs=data.get('save_kwargs', {}),
+            job_id=data.get('job_id'),
+        )
+
+
+@dataclass
+class JobResult:
+    """
+    单个任务的执行结果与计时 | Execution result and timing of a single job
+
+    Attributes:
+        job_id: 任务标识 | Job identifier
+        status: 状态 | Status ('ok' or 'failed')
+        attempts: 尝试次数 | Number of attempts
+        load_time: 数据加载时间（秒） | Data load time (seconds)
+        render_time: 渲染时间（秒） | Render time (seconds)
+        save_time: 保存时间（秒） | Save time (seconds)
+        total_time: 最后一次尝试的总时间（秒） | Total time of the last attempt (seconds)
+        worker_pid: 工作进程ID | Worker process ID
+        output_path: 输出文件路径 | Output file path
+        error: 错误信息 | Error message
+    """
+
+    job_id: str
+    status: str = 'failed'
+    attempts: int = 0
+    load_time: float = 0.0
+    render_time: float = 0.0
+    save_time: float = 0.0
+    total_time: float = 0.0
+    worker_pid: Optional[int] = None
+    output_path: str = ''
+    error: Optional[str] = None
+
+
+class BatchReport:
+    """
+    批量渲染报告 | Batch rendering report
+
+    Attributes:
+        results: 按提交顺序排列的任务结果 | Job results in submission order
+        wall_time: 总墙钟时间（秒） | Total wall-clock time (seconds)
+        max_workers: 工作进程数 | Number of worker processes
+    """
+
+    def __init__(self, results: List[JobResult], wall_time: float, max_workers: int):
+        self.results = results
+        self.wall_time = wall_time
+        self.max_workers = max_workers
+
+    @property
+    def failed(self) -> List[JobResult]:
+        """失败的任务 | Failed jobs"""
+        return [r for r in self.results if r.status != 'ok']
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        获取汇总统计 | Get summary statistics
+
+        Returns:
+            汇总统计字典 | Summary statistics dictionary
+        """
+        ok = [r for r in self.results if r.status == 'ok']
+        busy = sum(r.total_time for r in ok)
+        render_times = np.array([r.render_time for r in ok]) if ok else np.zeros(1)
+        return {
+            'jobs': len(self.results),
+            'succeeded': len(ok),
+            'failed': len(self.results) - len(ok),
+            'retried': sum(1 for r in self.results if r.attempts > 1),
+            'max_workers': self.max_workers,
+            'wall_time': self.wall_time,
+            'busy_time': busy,
+            'parallel_efficiency': busy / (self.wall_time * self.max_workers) if self.wall_time > 0 else 0.0,
+            'jobs_per_second': len(ok) / self.wall_time if self.wall_time > 0 else 0.0,
+            'render_time_mean': float(np.mean(render_times)),
+            'render_time_p95': float(np.percentile(render_times, 95)),
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        """转换为字典格式 | Convert to dictionary format"""
+        return {
+            'summary': self.summary(),
+            'jobs': [asdict(r) for r in self.results],
+        }
+
+    def to_json(self, filepath: Optional[Union[str, Path]] = None) -> Union[str, None]:
+        """
+        导出为JSON格式 | Export to JSON format
+
+        Args:
+            filepath: 文件路径（可选） | File path (optional)
+
+        Returns:
+            JSON字符串（如果未指定文件路径） | JSON string (if no filepath specified)
+        """
+        json_str = json.dumps(self.to_dict(), indent=2, ensure_ascii=False)
+        if filepath:
+            with open(filepath, 'w', encoding='utf-8') as f:
+                f.write(json_str)
+            return None
+        return json_str
+
+    def format_table(self, limit: Optional[int] = None) -> str:
+        """
+        格式化为文本表格 | Format as a text table
+
+        Args:
+            limit: 最多显示的任务数 | Maximum number of jobs shown
+
+        Returns:
+            表格字符串 | Table string
+        """
+        lines = [f"{'job':<24} {'status':<7} {'tries':>5} {'load':>8} {'render':>8} {'save':>8} {'total':>8}"]
+        for r in self.results[:limit]:
+            lines.append(f"{r.job_id[:24]:<24} {r.status:<7} {r.attempts:>5} "
+                         f"{r.load_time:>8.3f} {r.render_time:>8.3f} {r.save_time:>8.3f} {r.total_time:>8.3f}")
+        s = self.summary()
+        lines.append(f"{s['succeeded']}/{s['jobs']} succeeded in {s['wall_time']:.2f}s "
+                     f"({s['jobs_per_second']:.2f} jobs/s, {s['max_workers']} workers, "
+                     f"efficiency {s['parallel_efficiency']:.0%})")
+        return '\n'.join(lines)
+
+    def __str__(self) -> str:
+        s = self.summary()
+        return f"BatchReport(jobs={s['jobs']}, succeeded={s['succeeded']}, wall_time={s['wall_time']:.2f}s)"
+
+    def __repr__(self) -> str:
+        return self.__str__()
+
+
+def load_dataset_arrays(path: Union[str, Path]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    从文件加载数据集坐标数组 | Load dataset coordinate arrays from file
+
+    Args:
+        path: 数据集路径（.json/.npy/.npz/.csv，或.asc/.flt/.bil等栅格） | Dataset path (.json/.npy/.npz/.csv, or rasters such as .asc/.flt/.bil)
+
+    Returns:
+        (x, y, z)数组元组 | (x, y, z) array tuple
+    """
+    from ..core.data import MountainData
+
+    path = Path(path)
+    suffix = path.suffix.lower()
+
+    if suffix == '.json':
+        data = MountainData()
+        data.load_from_json(path)
+        return data.to_numpy_arrays()
+    if suffix == '.npy':
+        array = np.load(path, mmap_mode='r')
+        if array.ndim != 2 or 3 not in array.shape:
+            raise ValueError(f"{path}: .npy datasets must have shape (N, 3) or (3, N)")
+        array = array if array.shape[0] == 3 and array.shape[1] != 3 else array.T
+        return array[0], array[1], array[2]
+    if suffix == '.npz':
+        with np.load(path) as archive:
+            return archive['x'], archive['y'], archive['z']
+    if suffix == '.csv':
+        table = np.genfromtxt(path, delimiter=',', names=True)
+        return table['x'], table['y'], table['z']
+    if suffix in RASTER_SUFFIXES:
+        # 栅格展开为有效单元中心 | Rasters are exploded into valid cell centers
+        return read_raster(path).to_numpy_arrays()
+
+    raise ValueError(f"Unsupported dataset format: {path.suffix}")
+
+
+def _stage_datasets(jobs: List[BatchJob], scratch_dir: Path) -> Dict[str, str]:
+    """
+    将每个不同的数据集写为(3, N)的.npy文件供工作进程内存映射 |
+    Write each distinct dataset as a (3, N) .npy file for workers to memory-map
+
+    Returns:
+        数据集路径到暂存文件路径的映射 | Mapping of dataset path to staged file path
+    """
+    staged: Dict[str, str] = {}
+    for job in jobs:
+        if job.dataset_path in staged:
+            continue
+        x, y, z = load_dataset_arrays(job.dataset_path)
+        target = scratch_dir / f"dataset_{len(staged)}.npy"
+        np.save(target, np.vstack((x, y, z)).astype(np.float64, copy=False))
+        staged[job.dataset_path] = str(target)
+    return staged
+
+
+# 工作进程内的内存映射缓存 | Per-worker cache of memory-mapped datasets
+_WORKER_DATASETS: Dict[str, np.ndarray] = {}
+
+
+def _init_worker() -> None:
+    """工作进程初始化：使用非交互Agg后端 | Worker initialization: use the non-interactive Agg backend"""
+    import matplotlib
+    matplotlib.use('Agg', force=True)
+
+
+def _run_job(job: BatchJob, staged_path: str) -> Dict[str, Any]:
+    """
+    在工作进程中执行单个任务 | Execute a single job in a worker process
+
+    Returns:
+        包含计时和错误信息的字典 | Dictionary with timings and error information
+    """
+    import importlib
+    from ..core.data import MountainData
+
+    result: Dict[str, Any] = {'worker_pid': os.getpid(), 'load_time': 0.0,
+                              'render_time': 0.0, 'save_time': 0.0, 'error': None}
+    start = time.perf_counter()
+    renderer = None
+    try:
+        arrays = _WORKER_DATASETS.get(staged_path)
+        if arrays is None:
+            arrays = np.load(staged_path, mmap_mode='r')
+            _WORKER_DATASETS[staged_path] = arrays
+        data = MountainData.from_arrays(arrays[0], arrays[1], arrays[2])
+        t_loaded = time.perf_counter()
+
+        module_name, class_name = RENDERER_TYPES[job.renderer_type]
+        renderer_class = getattr(importlib.import_module(module_name), class_name)
+        renderer = renderer_class(config=dict(job.config))
+        renderer.render(data)
+        t_rendered = time.perf_counter()
+
+        Path(job.output_path).parent.mkdir(parents=True, exist_ok=True)
+        renderer.save_figure(job.output_path, **job.save_kwargs)
+        t_saved = time.perf_counter()
+
+        result.update(load_time=t_loaded - start, render_time=t_rendered - t_loaded,
+                      save_time=t_saved - t_rendered)
+    except Exception as e:
+        result['error'] = f"{type(e).__name__}: {e}\n{traceback.format_exc(limit=5)}"
+    finally:
+        if renderer is not None:
+            try:
+                renderer.close()
+            except Exception:
+                pass
+
+    result['total_time'] = time.perf_counter() - start
+    return result
+
+
+def run_batch(jobs: Iterable[Union[BatchJob, Dict[str, Any]]],
+              max_workers: Optional[int] = None,
+              retries: int = 1,
+              scratch_dir: Optional[Union[str, Path]] = None,
+              report_path: Optional[Union[str, Path]] = None,
+              mp_context: Optional[Any] = None) -> BatchReport:
+    """
+    在进程池上执行批量渲染 | Run batch rendering on a process pool
+
+    每个不同的数据集只加载一次并写入暂存目录，工作进程以内存映射方式只读打开，
+    避免为每个任务序列化数据 | Each distinct dataset is loaded once and written to the
+    scratch directory; workers open it read-only as a memory map, so data is never
+    pickled per job
+
+    Args:
+        jobs: 任务列表 | List of jobs
+        max_workers: 工作进程数（默认CPU核数） | Number of worker processes (defaults to CPU count)
+        retries: 失败任务的重试次数 | Number of retries for failed jobs
+        scratch_dir: 暂存目录（默认临时目录） | Scratch directory (defaults to a temporary directory)
+        report_path: 报告JSON输出路径（可选） | Report JSON output path (optional)
+        mp_context: multiprocessing上下文（可选） | multiprocessing context (optional)
+
+    Returns:
+        BatchReport实例 | BatchReport instance
+    """
+    jobs = [job if isinstance(job, BatchJob) else BatchJob.from_dict(job) for job in jobs]
+    for index, job in enumerate(jobs):
+        if job.job_id is None:
+            job.job_id = f"job-{index}"
+    if retries < 0:
+        raise ValueError("retries must be >= 0")
+
+    max_workers = max_workers or os.cpu_count() or 1
+    start = time.perf_counter()
+
+    own_scratch = scratch_dir is None
+    scratch = Path(tempfile.mkdtemp(prefix='pymountain-batch-')) if own_scratch else Path(scratch_dir)
+    scratch.mkdir(parents=True, exist_ok=True)
+
+    results = [JobResult(job_id=job.job_id, output_path=job.output_path) for job in jobs]
+    try:
+        staged = _stage_datasets(jobs, scratch)
+        pending = list(range(len(jobs)))
+
+        while pending:
+            pending, suspects = _run_round(jobs, pending, staged, results, max_workers, retries, mp_context)
+            # 进程池崩溃后逐个在单进程池上重跑进行中的任务以找出崩溃任务 |
+            # After a pool break, rerun in-flight jobs one at a time on single-worker pools to find the culprit
+            while suspects:
+                rerun, crashed = _run_round(jobs, [suspects.pop(0)], staged, results, 1, retries, mp_context)
+                pending.extend(rerun)
+                suspects.extend(crashed)
+    finally:
+        if own_scratch:
+            shutil.rmtree(scratch, ignore_errors=True)
+
+    report = BatchReport(results, time.perf_counter() - start, max_workers)
+    if report_path:
+        report.to_json(report_path)
+    return report
+
+
+def _run_round(jobs: List[BatchJob], pending: List[int], staged: Dict[str, str],
+               results: List[JobResult], max_workers: int, retries: int,
+               mp_context: Optional[Any]) -> Tuple[List[int], List[int]]:
+    """
+    在一个进程池上运行待执行任务，进程池崩溃时返回未完成的任务 |
+    Run pending jobs on one process pool; returns unfinished jobs if the pool breaks
+
+    同时提交的任务不超过max_workers个，因此进程池崩溃时只有正在运行的任务可疑，
+    尚未提交的任务原样返回。若只有一个任务在运行，则计入其尝试次数；否则退还这些任务的
+    尝试次数，交由调用方逐个隔离重跑 |
+    At most max_workers jobs are submitted at a time, so when the pool breaks only the running
+    jobs are suspects and jobs not yet submitted are handed back untouched. With a single job
+    running the attempt is charged to that job; otherwise the running jobs are refunded and
+    handed back to the caller to be rerun in isolation
+
+    Returns:
+        (需要在新进程池上重新运行的任务索引, 需要隔离重跑的任务索引) |
+        (job indices to rerun on a fresh pool, job indices to rerun in isolation)
+    """
+    queue = deque(pending)
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker,
+                             mp_context=mp_context) as executor:
+        running: Dict[Any, int] = {}
+        while queue or running:
+            while queue and len(running) < max_workers:
+                index = queue.popleft()
+                job = jobs[index]
+                results[index].attempts += 1
+                running[executor.submit(_run_job, job, staged[job.dataset_path])] = index
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                index = running.pop(future)
+                try:
+                    outcome = future.result()
+                except BrokenProcessPool as e:
+                    rerun, suspects = _handle_broken_pool(index, running, results, retries, e)
+                    return [*queue, *rerun], suspects
+
+                _record_outcome(results[index], outcome)
+                if results[index].status != 'ok' and results[index].attempts <= retries:
+                    queue.append(index)
+    return [], []
+
+
+def _record_outcome(result: JobResult, outcome: Dict[str, Any]) -> None:
+    """将工作进程返回的计时与错误写入任务结果 | Copy worker timings and error into a job result"""
+    result.worker_pid = outcome['worker_pid']
+    result.load_time = outcome['load_time']
+    result.render_time = outcome['render_time']
+    result.save_time = outcome['save_time']
+    result.total_time = outcome['total_time']
+    result.error = outcome['error']
+    result.status = 'ok' if outcome['error'] is None else 'failed'
+
+
+def _handle_broken_pool(index: int, running: Dict[Any, int], results: List[JobResult],
+                        retries: int, error: BrokenProcessPool) -> Tuple[List[int], List[int]]:
+    """
+    处理进程池崩溃，只将尝试次数计入确定导致崩溃的任务 |
+    Handle a pool break, charging the attempt only to a job known to have caused it
+
+    Returns:
+        (需要重新运行的任务索引, 需要隔离重跑的任务索引) |
+        (job indices to rerun, job indices to rerun in isolation)
+    """
+    rerun = []
+    in_flight = [index]
+    # 崩溃前已完成的任务保留其结果 | Keep results of jobs that finished before the break
+    for future, i in running.items():
+        if future.done() and not isinstance(future.exception(), BrokenProcessPool):
+            _record_outcome(results[i], future.result())
+            if results[i].status != 'ok' and results[i].attempts <= retries:
+                rerun.append(i)
+        else:
+            in_flight.append(i)
+
+    if len(in_flight) == 1:
+        # 唯一进行中的任务即为崩溃任务 | The only in-flight job is the one that crashed
+        result = results[index]
+        result.status = 'failed'
+        result.error = f"BrokenProcessPool: {error}"
+        return rerun, [index] if result.attempts <= retries else []
+
+    # 无法确定崩溃任务：退还尝试次数并逐个隔离 | Culprit unknown: refund attempts and isolate each job
+    for i in in_flight:
+        results[i].attempts -= 1
+    return rerun, in_flight
+
+
+def load_jobs(filepath: Union[str, Path]) -> List[BatchJob]:
+    """
+    从JSON或JSON Lines文件加载任务列表 | Load job list from a JSON or JSON Lines file
+
+    Args:
+        filepath: 任务文件路径 | Job file path
+
+    Returns:
+        任务列表 | List of jobs
+    """
+    with open(filepath, 'r', encoding='utf-8') as f:
+        text = f.read()
+
+    if Path(filepath).suffix.lower() == '.jsonl':
+        entries = [json.loads(line) for line in text.splitlines() if line.strip()]
+    else:
+        entries = json.loads(text)
+        if isinstance(entries, dict):
+            entries = entries['jobs']
+
+    return [BatchJob.from_dict(entry) for entry in entries]
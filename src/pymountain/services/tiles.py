@@ -0,0 +1,567 @@
+"""
+PyMountain地图瓦片模块 | PyMountain map tile module
+
+按z/x/y瓦片金字塔渲染地形图像，提供内容寻址的磁盘缓存和本地瓦片服务器 |
+Renders terrain imagery on a z/x/y tile pyramid, with a content-addressed disk cache and a local tile server
+"""
+
+import hashlib
+import io
+import json
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, Any, Optional, Tuple, List, Union
+
+import numpy as np
+
+from ..core.data import MountainData
+from ..core.grid import GridData
+from ..core.renderer import RenderingError
+from ..core.profiling import record_cache, profiled
+
+
+class TileCache:
+    """
+    内容寻址的瓦片磁盘缓存 | Content-addressed on-disk tile cache
+
+    瓦片以其渲染输入的SHA-256摘要为键存储在两级目录中 |
+    Tiles are stored under the SHA-256 digest of their rendering inputs in a two-level directory layout
+
+    Attributes:
+        cache_dir: 缓存根目录 | Cache root directory
+    """
+
+    def __init__(self, cache_dir: Union[str, Path], extension: str = 'png'):
+        """
+        初始化瓦片缓存 | Initialize tile cache
+
+        Args:
+            cache_dir: 缓存根目录 | Cache root directory
+            extension: 瓦片文件扩展名 | Tile file extension
+        """
+        self.cache_dir = Path(cache_dir)
+        self.extension = extension
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        """
+        由渲染输入计算缓存键 | Compute cache key from rendering inputs
+
+        Args:
+            *parts: 可JSON序列化的键组成部分 | JSON-serializable key parts
+
+        Returns:
+            十六进制SHA-256摘要 | Hex SHA-256 digest
+        """
+        payload = json.dumps(parts, sort_keys=True, default=repr).encode('utf-8')
+        return hashlib.sha256(payload).hexdigest()
+
+    def path_for(self, key: str) -> Path:
+        """获取缓存键对应的文件路径 | Get file path for a cache key"""
+        return self.cache_dir / key[:2] / f"{key}.{self.extension}"
+
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        读取缓存的瓦片 | Read cached tile
+
+        Args:
+            key: 缓存键 | Cache key
+
+        Returns:
+            瓦片字节或None | Tile bytes or None
+        """
+        try:
+            with open(self.path_for(key), 'rb') as f:
+                tile = f.read()
+        except FileNotFoundError:
+            record_cache('tile_cache', False)
+            return None
+        record_cache('tile_cache', True)
+        return tile
+
+    def put(self, key: str, tile: bytes) -> Path:
+        """
+        原子地写入瓦片 | Atomically write tile
+
+        Args:
+            key: 缓存键 | Cache key
+            tile: 瓦片字节 | Tile bytes
+
+        Returns:
+            瓦片文件路径 | Tile file path
+        """
+        path = self.path_for(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        # 先写临时文件再替换，避免读到半写入的瓦片 | Write a temp file then replace, so readers never see partial tiles
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(tile)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        return path
+
+    def __contains__(self, key: str) -> bool:
+        return self.path_for(key).exists()
+
+
+class TileRenderer:
+    """
+    地形瓦片渲染器 | Terrain tile renderer
+
+    将数据范围划分为2^z x 2^z的瓦片金字塔（y=0位于最北侧），每个瓦片只对其邻域窗口内的数据点插值；
+    GridData直接在瓦片网格上双线性采样 |
+    Divides the data extent into a 2^z x 2^z tile pyramid (y=0 is the northern row); each tile
+    only interpolates the data points in its neighbourhood window. GridData is sampled bilinearly
+    on the tile grid directly
+
+    Attributes:
+        data: 山体数据对象 | Mountain data object
+        tile_size: 瓦片像素尺寸 | Tile size in pixels
+        config: 瓦片渲染配置 | Tile rendering configuration
+        cache: 瓦片缓存 | Tile cache
+    """
+
+    def __init__(self, data: Union[MountainData, GridData], cache: Optional[TileCache] = None,
+                 tile_size: int = 256, config: Optional[Dict[str, Any]] = None):
+        """
+        初始化瓦片渲染器 | Initialize tile renderer
+
+        Args:
+            data: 山体数据对象或规则网格 | Mountain data object or regular grid
+            cache: 瓦片缓存（可选） | Tile cache (optional)
+            tile_size: 瓦片像素尺寸 | Tile size in pixels
+            config: 瓦片渲染配置 | Tile rendering configuration
+        """
+        self._grid = data if isinstance(data, GridData) else None
+        if self._grid is not None:
+            if self._grid.count_valid() == 0:
+                raise ValueError("Cannot render tiles from a grid without valid cells")
+        elif len(data) < 3:
+            raise ValueError("At least 3 points are required for tile rendering")
+
+        self.data = data
+        self.cache = cache
+        self.tile_size = int(tile_size)
+        self.config: Dict[str, Any] = config or {}
+        self._set_default_config()
+
+        # 按X排序的坐标，用于快速窗口选择 | Coordinates sorted by X for fast window selection
+        if self._grid is None:
+            x, y, z = data.to_numpy_arrays()
+            order = np.argsort(x, kind='stable')
+            self._x, self._y, self._z = x[order], y[order], z[order]
+
+        bounds = data.get_bounds()
+        if self._grid is not None:
+            # 网格范围到单元外边缘 | Grid extent reaches the outer cell edges
+            self._extent = self._grid.get_extent()
+        else:
+            self._extent = (bounds['min_x'], bounds['max_x'], bounds['min_y'], bounds['max_y'])
+
+        # 全局等高线级别保证相邻瓦片无缝衔接 | Global contour levels keep neighbouring tiles seamless
+        num_levels = self.config['contour_levels']
+        if isinstance(num_levels, int):
+            self._levels = np.linspace(bounds['min_z'], bounds['max_z'], num_levels)
+        else:
+            self._levels = np.asarray(num_levels, dtype=float)
+
+        self._fingerprint = self._compute_fingerprint()
+
+    def _set_default_config(self) -> None:
+        """设置默认配置参数 | Set default configuration parameters"""
+        default_config = {
+            'colormap': 'terrain',
+            'contour_levels': 20,
+            'show_contour_lines': True,
+            'contour_line_color': 'black',
+            'contour_line_alpha': 0.5,
+            'line_width': 0.5,
+            'interpolation_method': 'linear',
+            'grid_resolution': 128,
+            'min_window_points': 16,
+            'max_zoom': 18,
+        }
+
+        for key, value in default_config.items():
+            if key not in self.config:
+                self.config[key] = value
+
+    def _compute_fingerprint(self) -> str:
+        """计算数据和配置的摘要 | Compute digest of data and configuration"""
+        digest = hashlib.sha256()
+        if self._grid is not None:
+            digest.update(self._grid.fingerprint().encode('ascii'))
+        else:
+            for array in (self._x, self._y, self._z):
+                digest.update(np.ascontiguousarray(array).tobytes())
+        digest.update(json.dumps(self.config, sort_keys=True, default=repr).encode('utf-8'))
+        digest.update(str(self.tile_size).encode('ascii'))
+        return digest.hexdigest()
+
+    def tile_key(self, z: int, x: int, y: int) -> str:
+        """获取瓦片的内容寻址缓存键 | Get content-addressed cache key of a tile"""
+        return TileCache.make_key(self._fingerprint, z, x, y)
+
+    def validate_tile(self, z: int, x: int, y: int) -> None:
+        """
+        验证瓦片坐标 | Validate tile coordinates
+
+        Raises:
+            ValueError: 瓦片坐标无效 | Invalid tile coordinates
+        """
+        if not 0 <= z <= self.config['max_zoom']:
+            raise ValueError(f"Zoom level {z} out of range [0, {self.config['max_zoom']}]")
+        n = 1 << z
+        if not (0 <= x < n and 0 <= y < n):
+            raise ValueError(f"Tile ({x}, {y}) out of range for zoom level {z}")
+
+    def tile_bounds(self, z: int, x: int, y: int) -> Tuple[float, float, float, float]:
+        """
+        计算瓦片的数据坐标范围 | Compute data-coordinate bounds of a tile
+
+        Returns:
+            (min_x, max_x, min_y, max_y)元组 | (min_x, max_x, min_y, max_y) tuple
+        """
+        min_x, max_x, min_y, max_y = self._extent
+        n = 1 << z
+        width = (max_x - min_x) / n
+        height = (max_y - min_y) / n
+        return (min_x + x * width, min_x + (x + 1) * width,
+                max_y - (y + 1) * height, max_y - y * height)
+
+    def _select_window(self, bounds: Tuple[float, float, float, float]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        选择瓦片邻域窗口内的数据点 | Select data points in the tile's neighbourhood window
+
+        窗口按瓦片尺寸逐步扩大，直到包含足够的点以保证边缘插值连续 |
+        The window grows by tile-size steps until it holds enough points for continuous interpolation at the edges
+
+        Returns:
+            (x, y, z)数组元组 | (x, y, z) array tuple
+        """
+        min_x, max_x, min_y, max_y = bounds
+        span_x, span_y = max_x - min_x, max_y - min_y
+        min_points = self.config['min_window_points']
+
+        margin = 0.5
+        while True:
+            lo = np.searchsorted(self._x, min_x - margin * span_x, side='left')
+            hi = np.searchsorted(self._x, max_x + margin * span_x, side='right')
+            ys = self._y[lo:hi]
+            mask = (ys >= min_y - margin * span_y) & (ys <= max_y + margin * span_y)
+
+            covers_all = (lo == 0 and hi == len(self._x) and bool(np.all(mask)))
+            if np.count_nonzero(mask) >= min_points or covers_all:
+                return self._x[lo:hi][mask], ys[mask], self._z[lo:hi][mask]
+            margin *= 2
+
+    @profiled('render_tile')
+    def render_tile(self, z: int, x: int, y: int) -> bytes:
+        """
+        渲染单个瓦片为PNG字节 | Render a single tile to PNG bytes
+
+        Args:
+            z: 缩放级别 | Zoom level
+            x: 瓦片列号 | Tile column
+            y: 瓦片行号 | Tile row
+
+        Returns:
+            PNG字节 | PNG bytes
+        """
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+        self.validate_tile(z, x, y)
+        min_x, max_x, min_y, max_y = bounds = self.tile_bounds(z, x, y)
+
+        # 使用Figure对象而非pyplot，以便在工作线程中渲染 | Use Figure instead of pyplot so tiles can render on worker threads
+        dpi = 100
+        fig = Figure(figsize=(self.tile_size / dpi, self.tile_size / dpi), dpi=dpi)
+        FigureCanvasAgg(fig)
+        ax = fig.add_axes([0, 0, 1, 1])
+        ax.set_axis_off()
+        ax.set_xlim(min_x, max_x)
+        ax.set_ylim(min_y, max_y)
+
+        resolution = self.config['grid_resolution']
+        xi = np.linspace(min_x, max_x, resolution)
+        yi = np.linspace(min_y, max_y, resolution)
+        X_grid, Y_grid = np.meshgrid(xi, yi)
+
+        method = self.config['interpolation_method']
+        if method == 'rbf':
+            method = 'cubic'
+
+        if self._grid is not None:
+            Z_grid = self._grid.sample(X_grid, Y_grid, method='nearest' if method == 'nearest' else 'bilinear')
+        else:
+            from scipy.interpolate import griddata
+
+            wx, wy, wz = self._select_window(bounds)
+            Z_grid = None
+            if len(wx) >= 3:
+                try:
+                    Z_grid = griddata(np.column_stack((wx, wy)), wz, (X_grid, Y_grid),
+                                      method=method, fill_value=np.nan)
+                except Exception as e:
+                    raise RenderingError(f"Tile interpolation failed: {e}")
+
+        if Z_grid is not None and np.any(np.isfinite(Z_grid)):
+            ax.contourf(X_grid, Y_grid, Z_grid, levels=self._levels,
+                        cmap=self.config['colormap'], extend='both')
+            if self.config['show_contour_lines']:
+                ax.contour(X_grid, Y_grid, Z_grid, levels=self._levels,
+                           colors=self.config['contour_line_color'],
+                           linewidths=self.config['line_width'],
+                           alpha=self.config['contour_line_alpha'])
+
+        buffer = io.BytesIO()
+        fig.savefig(buffer, format='png', dpi=dpi, transparent=True)
+        return buffer.getvalue()
+
+    def get_tile(self, z: int, x: int, y: int) -> Tuple[bytes, bool]:
+        """
+        获取瓦片，优先读取缓存 | Get tile, reading from cache first
+
+        Returns:
+            (PNG字节, 是否命中缓存)元组 | (PNG bytes, cache hit) tuple
+        """
+        key = self.tile_key(z, x, y)
+        if self.cache is not None:
+            tile = self.cache.get(key)
+            if tile is not None:
+                return tile, True
+
+        tile = self.render_tile(z, x, y)
+        if self.cache is not None:
+            self.cache.put(key, tile)
+        return tile, False
+
+
+class TileLatencyStats:
+    """
+    瓦片延迟统计 | Tile latency statistics
+
+    分别记录冷（渲染）和热（缓存命中）瓦片请求的延迟 | Records latency of cold (rendered) and warm (cache hit) tile requests separately
+    """
+
+    def __init__(self, max_samples: int = 10000):
+        """
+        初始化延迟统计 | Initialize latency statistics
+
+        Args:
+            max_samples: 每类保留的最大样本数 | Maximum samples kept per kind
+        """
+        self.max_samples = max_samples
+        self._samples: Dict[str, List[float]] = {'cold': [], 'warm': [], 'coalesced': []}
+        self._lock = threading.Lock()
+
+    def record(self, kind: str, seconds: float) -> None:
+        """记录一次请求延迟 | Record a request latency"""
+        with self._lock:
+            samples = self._samples[kind]
+            samples.append(seconds)
+            if len(samples) > self.max_samples:
+                del samples[:len(samples) - self.max_samples]
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """
+        获取延迟摘要（毫秒） | Get latency summary (milliseconds)
+
+        Returns:
+            各类请求的count、mean、p50、p95、max | count, mean, p50, p95, max per request kind
+        """
+        with self._lock:
+            snapshot = {kind: list(samples) for kind, samples in self._samples.items()}
+
+        result = {}
+        for kind, samples in snapshot.items():
+            if not samples:
+                result[kind] = {'count': 0, 'mean_ms': 0.0, 'p50_ms': 0.0, 'p95_ms': 0.0, 'max_ms': 0.0}
+                continue
+            ms = np.asarray(samples) * 1000.0
+            result[kind] = {
+                'count': len(samples),
+                'mean_ms': float(np.mean(ms)),
+                'p50_ms': float(np.percentile(ms, 50)),
+                'p95_ms': float(np.percentile(ms, 95)),
+                'max_ms': float(np.max(ms)),
+            }
+        return result
+
+
+class TileServer:
+    """
+    本地瓦片HTTP服务器 | Local tile HTTP server
+
+    提供/{z}/{x}/{y}.png和/stats端点；未命中缓存的瓦片在工作线程池中渲染，
+    同一瓦片的并发请求会合并为一次渲染 |
+    Serves /{z}/{x}/{y}.png and /stats; cache misses render on a worker pool and
+    concurrent requests for the same tile are coalesced into a single render
+    """
+
+    def __init__(self, tile_renderer: TileRenderer, host: str = '127.0.0.1',
+                 port: int = 0, max_workers: int = 4):
+        """
+        初始化瓦片服务器 | Initialize tile server
+
+        Args:
+            tile_renderer: 瓦片渲染器 | Tile renderer
+            host: 监听地址 | Listen host
+            port: 监听端口（0表示自动分配） | Listen port (0 picks a free port)
+            max_workers: 渲染工作线程数 | Number of render worker threads
+        """
+        self.tile_renderer = tile_renderer
+        self.stats = TileLatencyStats()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='pymountain-tile')
+        self._inflight: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+        self._httpd = ThreadingHTTPServer((host, port), self._make_handler())
+        self._httpd.daemon_threads = True
+
+    @property
+    def url(self) -> str:
+        """服务器根URL | Server root URL"""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def get_tile(self, z: int, x: int, y: int) -> Tuple[bytes, str]:
+        """
+        获取瓦片并记录延迟 | Get tile and record latency
+
+        Returns:
+            (PNG字节, 请求类型'warm'/'cold'/'coalesced')元组 | (PNG bytes, request kind 'warm'/'cold'/'coalesced') tuple
+        """
+        start = time.perf_counter()
+        renderer = self.tile_renderer
+        renderer.validate_tile(z, x, y)
+        key = renderer.tile_key(z, x, y)
+
+        tile = renderer.cache.get(key) if renderer.cache is not None else None
+        if tile is not None:
+            kind = 'warm'
+        else:
+            with self._lock:
+                future = self._inflight.get(key)
+                kind = 'coalesced' if future is not None else 'cold'
+                if future is None:
+                    future = self._executor.submit(self._render_miss, key, z, x, y)
+                    self._inflight[key] = future
+            tile = future.result()
+
+        self.stats.record(kind, time.perf_counter() - start)
+        return tile, kind
+
+    def _render_miss(self, key: str, z: int, x: int, y: int) -> bytes:
+        """渲染未命中的瓦片并写入缓存 | Render a missed tile and store it in the cache"""
+        try:
+            tile = self.tile_renderer.render_tile(z, x, y)
+            if self.tile_renderer.cache is not None:
+                self.tile_renderer.cache.put(key, tile)
+            return tile
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+    def _make_handler(self):
+        """创建请求处理类 | Create request handler class"""
+        server = self
+
+        class TileRequestHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                path = self.path.split('?', 1)[0].strip('/')
+                if path == 'stats':
+                    body = json.dumps(server.stats.summary(), indent=2).encode('utf-8')
+                    self._send(200, 'application/json', body)
+                    return
+
+                parts = path.split('/')
+                if len(parts) != 3 or not parts[2].endswith('.png'):
+                    self._send(404, 'text/plain', b'Not found')
+                    return
+                try:
+                    z, x, y = int(parts[0]), int(parts[1]), int(parts[2][:-4])
+                    tile, kind = server.get_tile(z, x, y)
+                except ValueError as e:
+                    self._send(404, 'text/plain', str(e).encode('utf-8'))
+                    return
+                except Exception as e:
+                    self._send(500, 'text/plain', f"Tile rendering failed: {e}".encode('utf-8'))
+                    return
+                self._send(200, 'image/png', tile, {'X-Tile-Cache': kind})
+
+            def _send(self, status, content_type, body, headers=None):
+                self.send_response(status)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return TileRequestHandler
+
+    def start(self) -> 'TileServer':
+        """在后台线程中启动服务器 | Start the server on a background thread"""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._httpd.serve_forever,
+                                            name='pymountain-tile-server', daemon=True)
+            self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        """在当前线程中运行服务器 | Run the server on the current thread"""
+        self._httpd.serve_forever()
+
+    def stop(self) -> None:
+        """停止服务器并释放工作线程 | Stop the server and release worker threads"""
+        if self._thread is not None:
+            self._httpd.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._httpd.server_close()
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self) -> 'TileServer':
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.stop()
+
+
+def serve_tiles(data: Union[MountainData, GridData], cache_dir: Union[str, Path], host: str = '127.0.0.1',
+                port: int = 8080, tile_size: int = 256, max_workers: int = 4,
+                config: Optional[Dict[str, Any]] = None) -> TileServer:
+    """
+    启动本地瓦片服务器的便捷函数 | Convenience function to start a local tile server
+
+    Args:
+        data: 山体数据对象或规则网格 | Mountain data object or regular grid
+        cache_dir: 瓦片缓存目录 | Tile cache directory
+        host: 监听地址 | Listen host
+        port: 监听端口 | Listen port
+        tile_size: 瓦片像素尺寸 | Tile size in pixels
+        max_workers: 渲染工作线程数 | Number of render worker threads
+        config: 瓦片渲染配置 | Tile rendering configuration
+
+    Returns:
+        已启动的TileServer实例 | Started TileServer instance
+    """
+    renderer = TileRenderer(data, cache=TileCache(cache_dir), tile_size=tile_size, config=config)
+    return TileServer(renderer, host=host, port=port, max_workers=max_workers).start()
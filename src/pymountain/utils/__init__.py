@@ -1,22 +1,134 @@
 """
 PyMountain工具函数模块 | PyMountain utilities module
 
-包含插值、颜色映射等实用工具函数 | Contains utility functions for interpolation, color mapping, etc.
+包含插值、颜色映射等实用工具函数。公共名称在首次访问时才导入对应子模块 |
+Contains utility functions for interpolation, color mapping, etc. Public names import their submodule on first access
 """
 
-# 插值工具导入 | Interpolation utilities imports
-from .interpolation import (
-    linear_interpolation,
-    cubic_interpolation,
-    rbf_interpolation,
-)
+import importlib
+from typing import TYPE_CHECKING
+
+# 延迟导入：公共名称到子模块的映射 | Lazy imports: mapping of public names to submodules
+_LAZY_IMPORTS = {
+    # 插值工具 | Interpolation utilities
+    "linear_interpolation": "interpolation",
+    "cubic_interpolation": "interpolation",
+    "rbf_interpolation": "interpolation",
+    # 颜色映射工具 | Color mapping utilities
+    "ColorMapper": "color_mapping",
+    "create_elevation_colormap": "color_mapping",
+    "apply_color_mapping": "color_mapping",
+    "get_colormap": "color_mapping",
+    "get_colormap_lut": "color_mapping",
+    "warm_colormap_cache": "color_mapping",
+    "clear_colormap_cache": "color_mapping",
+    "colormap_cache_info": "color_mapping",
+    # 等高线提取工具 | Contour extraction utilities
+    "ContourEngine": "contours",
+    "ContourResult": "contours",
+    "compute_contours": "contours",
+    "extract_contours": "contours",
+    "get_default_contour_engine": "contours",
+    # 异步图像写入 | Asynchronous image writer
+    "AsyncImageWriter": "image_writer",
+    "get_default_image_writer": "image_writer",
+    # 渲染结果缓存 | Render result cache
+    "RenderCache": "render_cache",
+    "get_default_render_cache": "render_cache",
+    # 资源管理 | Resource management
+    "ResourceManager": "resources",
+    "ResourceHandle": "resources",
+    "get_resource_manager": "resources",
+    # 流式统计 | Streaming statistics
+    "StreamingHistogram": "statistics",
+    "streaming_histogram": "statistics",
+    # 合成地形 | Synthetic terrain
+    "generate_terrain": "terrain",
+    "generate_terrain_to_file": "terrain",
+    "sample_terrain": "terrain",
+    "iter_terrain_samples": "terrain",
+    "synthetic_mountain_data": "terrain",
+    # 栅格读写 | Raster I/O
+    "read_raster": "raster_io",
+    "read_raster_header": "raster_io",
+    "read_esri_ascii": "raster_io",
+    "read_binary_raster": "raster_io",
+    "write_esri_ascii": "raster_io",
+    "write_float_grid": "raster_io",
+    "RasterHeader": "raster_io",
+}
+
+if TYPE_CHECKING:
+    from .interpolation import (
+        linear_interpolation,
+        cubic_interpolation,
+        rbf_interpolation,
+    )
+    from .color_mapping import (
+        ColorMapper,
+        create_elevation_colormap,
+        apply_color_mapping,
+        get_colormap,
+        get_colormap_lut,
+        warm_colormap_cache,
+        clear_colormap_cache,
+        colormap_cache_info,
+    )
+    from .contours import (
+        ContourEngine,
+        ContourResult,
+        compute_contours,
+        extract_contours,
+        get_default_contour_engine,
+    )
+    from .image_writer import (
+        AsyncImageWriter,
+        get_default_image_writer,
+    )
+    from .render_cache import (
+        RenderCache,
+        get_default_render_cache,
+    )
+    from .resources import (
+        ResourceManager,
+        ResourceHandle,
+        get_resource_manager,
+    )
+    from .statistics import (
+        StreamingHistogram,
+        streaming_histogram,
+    )
+    from .terrain import (
+        generate_terrain,
+        generate_terrain_to_file,
+        sample_terrain,
+        iter_terrain_samples,
+        synthetic_mountain_data,
+    )
+    from .raster_io import (
+        read_raster,
+        read_raster_header,
+        read_esri_ascii,
+        read_binary_raster,
+        write_esri_ascii,
+        write_float_grid,
+        RasterHeader,
+    )
+
+
+def __getattr__(name: str):
+    """按需导入公共名称 | Import public names on demand"""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
 
-# 颜色映射工具导入 | Color mapping utilities imports
-from .color_mapping import (
-    ColorMapper,
-    create_elevation_colormap,
-    apply_color_mapping,
-)
 
 __all__ = [
     # 插值函数 | Interpolation functions
@@ -27,4 +139,42 @@ __all__ = [
     "ColorMapper",
     "create_elevation_colormap",
     "apply_color_mapping",
+    "get_colormap",
+    "get_colormap_lut",
+    "warm_colormap_cache",
+    "clear_colormap_cache",
+    "colormap_cache_info",
+    # 等高线提取 | Contour extraction
+    "ContourEngine",
+    "ContourResult",
+    "compute_contours",
+    "extract_contours",
+    "get_default_contour_engine",
+    # 异步图像写入 | Asynchronous image writing
+    "AsyncImageWriter",
+    "get_default_image_writer",
+    # 渲染结果缓存 | Render result cache
+    "RenderCache",
+    "get_default_render_cache",
+    # 资源管理 | Resource management
+    "ResourceManager",
+    "ResourceHandle",
+    "get_resource_manager",
+    # 流式统计 | Streaming statistics
+    "StreamingHistogram",
+    "streaming_histogram",
+    # 合成地形 | Synthetic terrain
+    "generate_terrain",
+    "generate_terrain_to_file",
+    "sample_terrain",
+    "iter_terrain_samples",
+    "synthetic_mountain_data",
+    # 栅格读写 | Raster I/O
+    "read_raster",
+    "read_raster_header",
+    "read_esri_ascii",
+    "read_binary_raster",
+    "write_esri_ascii",
+    "write_float_grid",
+    "RasterHeader",
 ]
\ No newline at end of file
@@ -5,11 +5,188 @@ PyMountain颜色映射工具模块 | PyMountain color mapping utilities module
 """
 
 import numpy as np
-import matplotlib.pyplot as plt
+import matplotlib
 import matplotlib.colors as mcolors
 from matplotlib.colors import LinearSegmentedColormap, Normalize, ListedColormap
-from typing import Dict, List, Tuple, Union, Optional, Any
+from typing import Dict, List, Tuple, Union, Optional, Any, Iterable, TYPE_CHECKING
+from collections import OrderedDict
+from functools import lru_cache
+import threading
 import warnings
+import weakref
+
+from .statistics import StreamingHistogram
+from ..core.grid import GridData
+from .resources import get_resource_manager
+
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
+    from matplotlib.colorbar import Colorbar
+
+
+# 颜色查找表的最大条目数 | Maximum number of color lookup table entries
+LUT_SIZE = 4096
+
+# 分块映射的元素数 | Number of elements mapped per chunk
+_MAP_CHUNK_SIZE = 1 << 18
+
+# 超过此元素数时使用流式统计 | Streaming statistics are used above this many elements
+STREAMING_THRESHOLD = 1 << 22
+
+# 构建的颜色映射和查找表的缓存上限 | Cache bounds for constructed colormaps and lookup tables
+COLORMAP_CACHE_SIZE = 128
+LUT_CACHE_SIZE = 256
+
+# 常用颜色映射（用于预热） | Common colormaps (used for pre-warming)
+COMMON_COLORMAPS = ('terrain', 'viridis', 'gist_earth', 'cividis', 'plasma', 'gray')
+
+
+class _Identity:
+    """按对象身份哈希的包装器，用于缓存不可哈希的颜色映射 | Wrapper hashing by object identity, used to cache unhashable colormaps"""
+
+    __slots__ = ('obj',)
+
+    def __init__(self, obj: Any):
+        self.obj = obj
+
+    def __hash__(self) -> int:
+        return id(self.obj)
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, _Identity) and other.obj is self.obj
+
+
+def _freeze(value: Any) -> Any:
+    """将颜色参数转换为可哈希形式 | Convert color arguments into a hashable form"""
+    if isinstance(value, str):
+        return value
+    if isinstance(value, (np.ndarray, list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, (np.generic, int, float)):
+        return float(value)
+    return _Identity(value)
+
+
+def _thaw(value: Any) -> Any:
+    """还原_freeze()的结果 | Undo _freeze()"""
+    if isinstance(value, tuple):
+        return [_thaw(item) for item in value]
+    if isinstance(value, _Identity):
+        return value.obj
+    return value
+
+
+@lru_cache(maxsize=COLORMAP_CACHE_SIZE)
+def get_colormap(name: str) -> mcolors.Colormap:
+    """
+    获取共享的命名颜色映射 | Get a shared named colormap
+    
+    plt.get_cmap()每次返回新副本；此函数返回缓存的共享实例，以便复用其查找表。
+    返回的实例不应被修改，需要修改时请先调用copy()；ColorMapper会自行复制 |
+    plt.get_cmap() returns a new copy on every call; this returns a cached shared instance
+    so its lookup table can be reused. The returned instance must not be mutated; call
+    copy() first if you need to modify it. ColorMapper makes its own copy
+    
+    Args:
+        name: 颜色映射名称 | Colormap name
+        
+    Returns:
+        颜色映射对象 | Colormap object
+        
+    Raises:
+        ValueError: 未知的颜色映射名称 | Unknown colormap name
+    """
+    # 使用颜色映射注册表而非pyplot，避免导入pyplot | Use the colormap registry rather than pyplot to avoid importing pyplot
+    try:
+        return matplotlib.colormaps[name]
+    except KeyError:
+        raise ValueError(f"{name!r} is not a valid value for cmap; supported values are "
+                         f"{', '.join(map(repr, sorted(matplotlib.colormaps)))}") from None
+
+
+# 查找表缓存：(id, dtype, under, over, bad) -> LUT | Lookup table cache: (id, dtype, under, over, bad) -> LUT
+_lut_cache: "OrderedDict[Tuple, np.ndarray]" = OrderedDict()
+_lut_cache_lock = threading.Lock()
+_lut_cache_owners: Dict[int, Any] = {}
+
+
+def _evict_luts(owner_id: int) -> None:
+    """颜色映射被回收时移除其查找表 | Drop lookup tables of a garbage-collected colormap"""
+    with _lut_cache_lock:
+        _lut_cache_owners.pop(owner_id, None)
+        keys = [key for key in _lut_cache if key[0] == owner_id]
+        for key in keys:
+            del _lut_cache[key]
+    for key in keys:
+        _lut_resources.untrack(key)
+
+
+def _evict_lut(key: Tuple) -> None:
+    """资源管理器的淘汰回调 | Eviction callback of the resource manager"""
+    with _lut_cache_lock:
+        _lut_cache.pop(key, None)
+
+
+# 查找表缓存在全局资源管理器中的注册 | Registration of the lookup table cache with the global resource manager
+_lut_resources = get_resource_manager().register('colormap_lut', _evict_lut)
+
+
+def get_colormap_lut(colormap: mcolors.Colormap, dtype: Any = np.float64) -> np.ndarray:
+    """
+    获取颜色映射的只读查找表（全局有界缓存） | Get a read-only lookup table for a colormap (bounded global cache)
+    
+    查找表包含min(colormap.N, LUT_SIZE)个等宽区间的颜色，其后依次为under、over和bad颜色。
+    当colormap.N不超过LUT_SIZE时查找结果与直接调用colormap完全一致 |
+    The table holds the colors of min(colormap.N, LUT_SIZE) equal-width bins followed by the
+    under, over and bad colors. When colormap.N does not exceed LUT_SIZE the lookup matches
+    calling the colormap exactly
+    
+    Args:
+        colormap: 颜色映射对象 | Colormap object
+        dtype: 输出类型（float64、float32或uint8） | Output type (float64, float32 or uint8)
+        
+    Returns:
+        (size + 3, 4)的RGBA查找表 | (size + 3, 4) RGBA lookup table
+    """
+    dtype = np.dtype(dtype)
+    key = (id(colormap), dtype.str, colormap.N,
+           tuple(colormap.get_under()), tuple(colormap.get_over()), tuple(colormap.get_bad()))
+    
+    with _lut_cache_lock:
+        lut = _lut_cache.get(key)
+        if lut is not None:
+            _lut_cache.move_to_end(key)
+    if lut is not None:
+        _lut_resources.touch(key)
+        return lut
+    
+    size = min(colormap.N, LUT_SIZE)
+    # 在区间中心采样 | Sample at bin centres
+    centres = (np.arange(size) + 0.5) / size
+    table = np.empty((size + 3, 4), dtype=np.float64)
+    table[:size] = colormap(centres)
+    table[size] = colormap.get_under()
+    table[size + 1] = colormap.get_over()
+    table[size + 2] = colormap.get_bad()
+    
+    if dtype == np.uint8:
+        # 与colormap(..., bytes=True)相同的截断方式 | Same truncation as colormap(..., bytes=True)
+        lut = (table * 255).astype(np.uint8)
+    else:
+        lut = table.astype(dtype)
+    lut.setflags(write=False)
+    
+    with _lut_cache_lock:
+        if id(colormap) not in _lut_cache_owners:
+            _lut_cache_owners[id(colormap)] = weakref.finalize(colormap, _evict_luts, id(colormap))
+        _lut_cache[key] = lut
+        evicted = []
+        while len(_lut_cache) > LUT_CACHE_SIZE:
+            evicted.append(_lut_cache.popitem(last=False)[0])
+    for old_key in evicted:
+        _lut_resources.untrack(old_key)
+    _lut_resources.track(key, lut.nbytes)
+    return lut
 
 
 class ColorMapper:
@@ -38,46 +215,130 @@ class ColorMapper:
         """
         self.name = name or str(colormap)
         
-        # 设置颜色映射 | Set colormap
+        # 设置颜色映射：命名颜色映射使用共享实例的副本，修改不会影响其他映射器 |
+        # Set colormap: named colormaps use a copy of the shared instance, so mutations stay local to this mapper
+        self._shared_colormap: Optional[Tuple[mcolors.Colormap, mcolors.Colormap]] = None
         if isinstance(colormap, str):
             try:
-                self.colormap = plt.get_cmap(colormap)
+                shared = get_colormap(colormap)
             except ValueError:
                 warnings.warn(f"Unknown colormap '{colormap}', using 'terrain' instead")
-                self.colormap = plt.get_cmap('terrain')
+                shared = get_colormap('terrain')
+            self.colormap = shared.copy()
+            self._shared_colormap = (self.colormap, shared)
         else:
             self.colormap = colormap
         
         # 设置标准化器 | Set normalizer
         self.normalizer = Normalize(vmin=vmin, vmax=vmax)
         
-        # 缓存映射结果 | Cache mapping results
+        # 缓存颜色查找表 | Cache color lookup tables
         self._cache = {}
     
-    def map_values(self, values: np.ndarray, alpha: Optional[float] = None) -> np.ndarray:
+    def get_lut(self, dtype: Any = np.float64) -> np.ndarray:
+        """
+        获取颜色查找表 | Get the color lookup table
+        
+        Args:
+            dtype: 输出类型（float64、float32或uint8） | Output type (float64, float32 or uint8)
+            
+        Returns:
+            (size + 3, 4)的RGBA查找表，详见get_colormap_lut() | (size + 3, 4) RGBA lookup table, see get_colormap_lut()
+        """
+        # 每次经全局缓存查找：其键包含N和极值颜色，修改或替换颜色映射后立即生效 |
+        # Look up through the global cache every time: its key covers N and the extreme colors,
+        # so mutating or replacing the colormap takes effect immediately
+        return get_colormap_lut(self._lut_colormap(), dtype)
+    
+    def _lut_colormap(self) -> mcolors.Colormap:
+        """
+        查找表的来源颜色映射 | Colormap the lookup table is built from
+        
+        副本未被替换且极值颜色未修改时使用共享实例，使各映射器共享同一查找表 |
+        Uses the shared instance while the copy is unreplaced and its extreme colors are unchanged,
+        so mappers share one lookup table
+        """
+        if self._shared_colormap is not None:
+            copy, shared = self._shared_colormap
+            if (self.colormap is copy and copy.N == shared.N
+                    and np.array_equal(copy.get_under(), shared.get_under())
+                    and np.array_equal(copy.get_over(), shared.get_over())
+                    and np.array_equal(copy.get_bad(), shared.get_bad())):
+                return shared
+        return self.colormap
+    
+    def map_values(self, values: Union[np.ndarray, GridData], alpha: Optional[float] = None,
+                   out: Optional[np.ndarray] = None, dtype: Any = None) -> np.ndarray:
         """
         将数值映射为颜色 | Map values to colors
         
+        数组输入通过预计算查找表和np.take分块映射，不产生与输入等大的中间数组 |
+        Array input is mapped in chunks through the precomputed lookup table with np.take,
+        without input-sized temporaries
+        
         Args:
-            values: 输入数值数组 | Input value array
+            values: 输入数值数组或GridData（无数据单元格映射为'bad'颜色） | Input value array or GridData (missing cells map to the 'bad' color)
             alpha: 透明度 | Alpha transparency
+            out: 输出缓冲区，形状为values.shape + (4,)（可选） | Output buffer of shape values.shape + (4,) (optional)
+            dtype: 输出类型（默认float64；uint8对应0-255颜色） | Output type (float64 by default; uint8 gives 0-255 colors)
             
         Returns:
             RGBA颜色数组 | RGBA color array
         """
-        # 标准化数值 | Normalize values
-        normalized_values = self.normalizer(values)
+        if isinstance(values, GridData):
+            values = values.masked()
+        
+        if np.ndim(values) == 0 and out is None:
+            # 标量保持原有行为 | Scalars keep the original behavior
+            colors = self.colormap(self.normalizer(values))
+            if alpha is not None:
+                colors = np.array(colors)
+                colors[..., 3] = alpha
+            return colors
+        
+        mask = np.ma.getmask(values)
+        values = np.ma.getdata(values)
+        if not np.issubdtype(values.dtype, np.floating):
+            values = values.astype(np.float64)
+        
+        # 未设置范围时按数据自动缩放 | Autoscale from the data when the range is unset
+        if self.normalizer.vmin is None or self.normalizer.vmax is None:
+            self.normalizer.autoscale_None(values)
+        
+        if out is None:
+            out = np.empty(values.shape + (4,), dtype=np.float64 if dtype is None else dtype)
+        elif out.shape != values.shape + (4,):
+            raise ValueError(f"out must have shape {values.shape + (4,)}, got {out.shape}")
+        elif not out.flags.c_contiguous:
+            raise ValueError("out must be a C-contiguous array")
+        
+        lut = self.get_lut(out.dtype)
+        size = lut.shape[0] - 3
+        vmin, vmax = float(self.normalizer.vmin), float(self.normalizer.vmax)
+        scale = size / (vmax - vmin) if vmax > vmin else 0.0
+        
+        flat_values = values.reshape(-1)
+        flat_out = out.reshape(-1, 4)
+        flat_mask = None if mask is np.ma.nomask else np.asarray(mask).reshape(-1)
         
-        # 应用颜色映射 | Apply colormap
-        colors = self.colormap(normalized_values)
+        for start in range(0, flat_values.size, _MAP_CHUNK_SIZE):
+            stop = min(start + _MAP_CHUNK_SIZE, flat_values.size)
+            t = flat_values[start:stop] - vmin
+            t *= scale
+            with np.errstate(invalid='ignore'):
+                index = np.clip(t, 0, size - 1).astype(np.intp)
+            index[t < 0] = size
+            index[t > size] = size + 1
+            index[np.isnan(t)] = size + 2
+            if flat_mask is not None:
+                index[flat_mask[start:stop]] = size + 2
+            np.take(lut, index, axis=0, out=flat_out[start:stop], mode='clip')
         
         # 设置透明度 | Set alpha
         if alpha is not None:
-            if colors.ndim == 1:
-                colors = np.array(colors)
-            colors[..., 3] = alpha
+            out[..., 3] = alpha * 255 + 0.5 if out.dtype == np.uint8 else alpha
         
-        return colors
+        return out
     
     def get_color_at_value(self, value: float, alpha: Optional[float] = None) -> Tuple[float, float, float, float]:
         """
@@ -110,25 +371,41 @@ class ColorMapper:
         self.normalizer.vmax = vmax
         self._cache.clear()
     
-    def auto_range(self, values: np.ndarray, percentile: Tuple[float, float] = (2, 98)) -> None:
+    def auto_range(self, values: Union[np.ndarray, StreamingHistogram, GridData],
+                   percentile: Tuple[float, float] = (2, 98)) -> None:
         """
         自动设置数值范围 | Automatically set value range
         
+        超过STREAMING_THRESHOLD个元素的数组和StreamingHistogram使用流式近似分位数，
+        误差不超过一个直方图箱宽 |
+        Arrays with more than STREAMING_THRESHOLD elements and StreamingHistogram sketches use
+        streaming approximate percentiles, accurate to within one histogram bin width
+        
         Args:
-            values: 数值数组 | Value array
+            values: 数值数组、流式直方图或GridData（忽略无数据单元格） | Value array, streaming histogram or GridData (missing cells are ignored)
             percentile: 百分位数范围 | Percentile range
         """
-        valid_values = values[~np.isnan(values)]
-        if len(valid_values) == 0:
-            return
+        if isinstance(values, GridData):
+            values = StreamingHistogram().update(values) if values.size > STREAMING_THRESHOLD else values.z[values.valid_mask()]
+        elif not isinstance(values, StreamingHistogram) and np.size(values) > STREAMING_THRESHOLD:
+            values = StreamingHistogram().update(values)
         
-        vmin = np.percentile(valid_values, percentile[0])
-        vmax = np.percentile(valid_values, percentile[1])
+        if isinstance(values, StreamingHistogram):
+            if values.count == 0:
+                return
+            vmin, vmax = values.percentile(percentile)
+        else:
+            valid_values = values[~np.isnan(values)]
+            if len(valid_values) == 0:
+                return
+            
+            vmin = np.percentile(valid_values, percentile[0])
+            vmax = np.percentile(valid_values, percentile[1])
         
         self.update_range(vmin, vmax)
     
-    def create_colorbar(self, ax: plt.Axes, label: str = 'Elevation (m)', 
-                       orientation: str = 'vertical', **kwargs) -> plt.colorbar:
+    def create_colorbar(self, ax: 'Axes', label: str = 'Elevation (m)', 
+                       orientation: str = 'vertical', **kwargs) -> 'Colorbar':
         """
         创建颜色条 | Create colorbar
         
@@ -141,8 +418,11 @@ class ColorMapper:
         Returns:
             颜色条对象 | Colorbar object
         """
+        import matplotlib.pyplot as plt
+        from matplotlib.cm import ScalarMappable
+        
         # 创建ScalarMappable对象 | Create ScalarMappable object
-        sm = plt.cm.ScalarMappable(cmap=self.colormap, norm=self.normalizer)
+        sm = ScalarMappable(cmap=self.colormap, norm=self.normalizer)
         sm.set_array([])
         
         # 创建颜色条 | Create colorbar
@@ -174,6 +454,8 @@ class ColorMapper:
             width: 图像宽度 | Image width
             height: 图像高度 | Image height
         """
+        import matplotlib.pyplot as plt
+        
         # 创建颜色条图像 | Create colorbar image
         gradient = np.linspace(0, 1, width).reshape(1, -1)
         gradient = np.vstack([gradient] * height)
@@ -199,6 +481,8 @@ def create_elevation_colormap(colors: Optional[List[str]] = None,
     """
     创建高程颜色映射 | Create elevation colormap
     
+    相同参数返回缓存的共享实例，不应被修改 | Identical arguments return a cached shared instance that must not be mutated
+    
     Args:
         colors: 颜色列表 | Color list
         name: 颜色映射名称 | Colormap name
@@ -222,15 +506,15 @@ def create_elevation_colormap(colors: Optional[List[str]] = None,
         ]
     
     # 创建线性分段颜色映射 | Create linear segmented colormap
-    cmap = LinearSegmentedColormap.from_list(name, colors)
-    
-    return cmap
+    return _cached_from_list(name, _freeze(colors))
 
 
 def create_terrain_colormap(style: str = 'realistic') -> LinearSegmentedColormap:
     """
     创建地形颜色映射 | Create terrain colormap
     
+    相同参数返回缓存的共享实例，不应被修改 | Identical arguments return a cached shared instance that must not be mutated
+    
     Args:
         style: 风格类型 | Style type ('realistic', 'artistic', 'scientific')
         
@@ -281,7 +565,7 @@ def create_terrain_colormap(style: str = 'realistic') -> LinearSegmentedColormap
     else:
         raise ValueError(f"Unknown style: {style}. Supported styles: 'realistic', 'artistic', 'scientific'")
     
-    return LinearSegmentedColormap.from_list(f'terrain_{style}', colors)
+    return _cached_from_list(f'terrain_{style}', _freeze(colors))
 
 
 def apply_color_mapping(values: np.ndarray, 
@@ -334,9 +618,9 @@ def create_categorical_colormap(categories: List[str],
     if colors is None:
         # 使用默认颜色序列 | Use default color sequence
         if n_categories <= 10:
-            colors = plt.cm.tab10(np.linspace(0, 1, n_categories))
+            colors = matplotlib.colormaps['tab10'](np.linspace(0, 1, n_categories))
         elif n_categories <= 20:
-            colors = plt.cm.tab20(np.linspace(0, 1, n_categories))
+            colors = matplotlib.colormaps['tab20'](np.linspace(0, 1, n_categories))
         else:
             # 对于更多类别，使用HSV颜色空间 | For more categories, use HSV color space
             hues = np.linspace(0, 1, n_categories, endpoint=False)
@@ -349,40 +633,67 @@ def create_categorical_colormap(categories: List[str],
     return cmap, category_indices
 
 
-def analyze_color_distribution(values: np.ndarray, 
+def analyze_color_distribution(values: Union[np.ndarray, StreamingHistogram], 
                               colormap: Union[str, ColorMapper] = 'terrain',
                               n_bins: int = 50) -> Dict[str, Any]:
     """
     分析颜色分布 | Analyze color distribution
     
+    超过STREAMING_THRESHOLD个元素的数组和StreamingHistogram使用流式近似统计，结果中
+    statistics['approximate']为True |
+    Arrays with more than STREAMING_THRESHOLD elements and StreamingHistogram sketches use
+    streaming approximate statistics, with statistics['approximate'] set to True
+    
     Args:
-        values: 数值数组 | Value array
+        values: 数值数组或流式直方图 | Value array or streaming histogram
         colormap: 颜色映射 | Colormap
         n_bins: 直方图箱数 | Number of histogram bins
         
     Returns:
         分析结果字典 | Analysis result dictionary
     """
-    # 过滤有效值 | Filter valid values
-    valid_values = values[~np.isnan(values)]
-    
-    if len(valid_values) == 0:
-        return {'error': 'No valid values found'}
-    
-    # 基本统计 | Basic statistics
-    stats = {
-        'count': len(valid_values),
-        'min': np.min(valid_values),
-        'max': np.max(valid_values),
-        'mean': np.mean(valid_values),
-        'std': np.std(valid_values),
-        'median': np.median(valid_values),
-        'q25': np.percentile(valid_values, 25),
-        'q75': np.percentile(valid_values, 75)
-    }
+    # 大数组使用流式统计，避免复制和排序 | Large arrays use streaming statistics, avoiding copies and sorting
+    if isinstance(values, StreamingHistogram) or np.size(values) > STREAMING_THRESHOLD:
+        sketch = values if isinstance(values, StreamingHistogram) else StreamingHistogram().update(values)
+        if sketch.count == 0:
+            return {'error': 'No valid values found'}
+        
+        q25, median, q75 = (float(v) for v in sketch.percentile([25, 50, 75]))
+        stats = {
+            'count': sketch.count,
+            'min': sketch.min,
+            'max': sketch.max,
+            'mean': sketch.mean,
+            'std': sketch.std,
+            'median': median,
+            'q25': q25,
+            'q75': q75,
+            'approximate': True
+        }
+        hist, bin_edges = sketch.histogram(bins=n_bins)
+        valid_values = sketch
+    else:
+        # 过滤有效值 | Filter valid values
+        valid_values = values[~np.isnan(values)]
+        
+        if len(valid_values) == 0:
+            return {'error': 'No valid values found'}
+        
+        # 基本统计 | Basic statistics
+        stats = {
+            'count': len(valid_values),
+            'min': np.min(valid_values),
+            'max': np.max(valid_values),
+            'mean': np.mean(valid_values),
+            'std': np.std(valid_values),
+            'median': np.median(valid_values),
+            'q25': np.percentile(valid_values, 25),
+            'q75': np.percentile(valid_values, 75)
+        }
+        
+        # 直方图分析 | Histogram analysis
+        hist, bin_edges = np.histogram(valid_values, bins=n_bins)
     
-    # 直方图分析 | Histogram analysis
-    hist, bin_edges = np.histogram(valid_values, bins=n_bins)
     bin_centers = (bin_edges[:-1] + bin_edges[1:]) / 2
     
     # 颜色映射分析 | Colormap analysis
@@ -416,6 +727,8 @@ def create_elevation_zones_colormap(zone_elevations: List[float],
     """
     创建高程分带颜色映射 | Create elevation zones colormap
     
+    相同参数返回缓存的共享颜色映射实例，不应被修改 | Identical arguments return a cached shared colormap instance that must not be mutated
+    
     Args:
         zone_elevations: 高程分带边界 | Elevation zone boundaries
         zone_colors: 分带颜色 | Zone colors
@@ -442,7 +755,7 @@ def create_elevation_zones_colormap(zone_elevations: List[float],
         raise ValueError(f"Number of colors ({len(zone_colors)}) must match number of zones ({n_zones})")
     
     # 创建分带颜色映射 | Create zoned colormap
-    cmap = ListedColormap(zone_colors, name=name)
+    cmap = _cached_listed(name, _freeze(zone_colors))
     
     return cmap, zone_elevations
 
@@ -454,6 +767,8 @@ def blend_colormaps(cmap1: Union[str, LinearSegmentedColormap],
     """
     混合两个颜色映射 | Blend two colormaps
     
+    相同参数返回缓存的共享实例，不应被修改 | Identical arguments return a cached shared instance that must not be mutated
+    
     Args:
         cmap1: 第一个颜色映射 | First colormap
         cmap2: 第二个颜色映射 | Second colormap
@@ -463,21 +778,94 @@ def blend_colormaps(cmap1: Union[str, LinearSegmentedColormap],
     Returns:
         混合后的颜色映射 | Blended colormap
     """
+    return _cached_blend(_freeze(cmap1), _freeze(cmap2), float(ratio), name)
+
+
+def _sample_colormap(cmap: mcolors.Colormap, x: np.ndarray) -> np.ndarray:
+    """通过查找表在[0, 1]内采样颜色映射 | Sample a colormap in [0, 1] through its lookup table"""
+    lut = get_colormap_lut(cmap)
+    size = lut.shape[0] - 3
+    index = np.minimum((x * size).astype(np.intp), size - 1)
+    return np.take(lut, index, axis=0)
+
+
+@lru_cache(maxsize=COLORMAP_CACHE_SIZE)
+def _cached_from_list(name: str, colors: Tuple) -> LinearSegmentedColormap:
+    """缓存的LinearSegmentedColormap.from_list | Cached LinearSegmentedColormap.from_list"""
+    return LinearSegmentedColormap.from_list(name, _thaw(colors))
+
+
+@lru_cache(maxsize=COLORMAP_CACHE_SIZE)
+def _cached_listed(name: str, colors: Tuple) -> ListedColormap:
+    """缓存的ListedColormap构造 | Cached ListedColormap construction"""
+    return ListedColormap(_thaw(colors), name=name)
+
+
+@lru_cache(maxsize=COLORMAP_CACHE_SIZE)
+def _cached_blend(cmap1: Any, cmap2: Any, ratio: float, name: str) -> LinearSegmentedColormap:
+    """缓存的颜色映射混合 | Cached colormap blending"""
     # 获取颜色映射对象 | Get colormap objects
-    if isinstance(cmap1, str):
-        cmap1 = plt.get_cmap(cmap1)
-    if isinstance(cmap2, str):
-        cmap2 = plt.get_cmap(cmap2)
+    cmap1 = get_colormap(cmap1) if isinstance(cmap1, str) else _thaw(cmap1)
+    cmap2 = get_colormap(cmap2) if isinstance(cmap2, str) else _thaw(cmap2)
     
-    # 生成混合颜色 | Generate blended colors
-    n_colors = 256
-    x = np.linspace(0, 1, n_colors)
+    # 通过查找表向量化采样并线性混合 | Sample vectorized through the lookup tables and blend linearly
+    x = np.linspace(0, 1, 256)
+    blended_colors = (1 - ratio) * _sample_colormap(cmap1, x) + ratio * _sample_colormap(cmap2, x)
     
-    colors1 = cmap1(x)
-    colors2 = cmap2(x)
+    # 创建新的颜色映射 | Create new colormap
+    return LinearSegmentedColormap.from_list(name, blended_colors)
+
+
+def warm_colormap_cache(colormaps: Optional[Iterable[Union[str, mcolors.Colormap]]] = None,
+                        dtypes: Iterable[Any] = (np.float64, np.uint8)) -> int:
+    """
+    预热颜色映射及其查找表缓存（例如在服务启动时） | Pre-warm colormap and lookup table caches (e.g. at service startup)
     
-    # 线性混合 | Linear blending
-    blended_colors = (1 - ratio) * colors1 + ratio * colors2
+    Args:
+        colormaps: 颜色映射名称或对象（默认为常用颜色映射和内置地形颜色映射） |
+            Colormap names or objects (defaults to the common colormaps plus the built-in terrain colormaps)
+        dtypes: 需要预先构建查找表的类型 | Types to prebuild lookup tables for
+        
+    Returns:
+        预热的查找表数量 | Number of lookup tables warmed
+    """
+    if colormaps is None:
+        colormaps = list(COMMON_COLORMAPS) + [create_elevation_colormap()] + [
+            create_terrain_colormap(style) for style in ('realistic', 'artistic', 'scientific')
+        ]
     
-    # 创建新的颜色映射 | Create new colormap
-    return LinearSegmentedColormap.from_list(name, blended_colors)
\ No newline at end of file
+    count = 0
+    for colormap in colormaps:
+        cmap = get_colormap(colormap) if isinstance(colormap, str) else colormap
+        for dtype in dtypes:
+            get_colormap_lut(cmap, dtype)
+            count += 1
+    return count
+
+
+def clear_colormap_cache() -> None:
+    """清空颜色映射和查找表缓存 | Clear the colormap and lookup table caches"""
+    get_colormap.cache_clear()
+    _cached_from_list.cache_clear()
+    _cached_listed.cache_clear()
+    _cached_blend.cache_clear()
+    with _lut_cache_lock:
+        _lut_cache.clear()
+    _lut_resources.clear()
+
+
+def colormap_cache_info() -> Dict[str, Any]:
+    """
+    获取颜色映射缓存统计信息 | Get colormap cache statistics
+    
+    Returns:
+        各缓存的命中、未命中次数和大小 | Hits, misses and size of each cache
+    """
+    info = {}
+    for name, cached in (('named', get_colormap), ('from_list', _cached_from_list),
+                         ('listed', _cached_listed), ('blend', _cached_blend)):
+        stats = cached.cache_info()
+        info[name] = {'hits': stats.hits, 'misses': stats.misses, 'size': stats.currsize}
+    with _lut_cache_lock:
+        info['lut'] = {'size': len(_lut_cache)}
+    return info
@@ -0,0 +1,475 @@
+"""
+PyMountain等高线提取模块 | PyMountain contour extraction module
+
+一次计算等高线和填充色带几何并缓存复用，支持不依赖图形的GeoJSON/SVG矢量导出 |
+Computes isoline and filled-band geometry once, caches it for reuse, and exports vector GeoJSON/SVG without a figure
+"""
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Any, Optional, Tuple, List, Union, Iterator, IO
+
+import numpy as np
+
+from ..core.profiling import record_cache, stage
+from .resources import ResourceManager, get_resource_manager
+
+
+# Matplotlib路径代码 | Matplotlib path codes
+_MOVETO = 1
+_CLOSEPOLY = 79
+
+# 超过该尺寸的网格自动分块 | Grids larger than this are chunked automatically
+_AUTO_CHUNK_SIZE = 256
+
+
+@dataclass
+class ContourResult:
+    """
+    等高线几何结果 | Contour geometry result
+
+    几何以Matplotlib的allsegs/allkinds形式保存，可直接构建ContourSet |
+    Geometry is stored in Matplotlib's allsegs/allkinds layout and can build a ContourSet directly
+
+    Attributes:
+        levels: 等高线级别 | Contour levels
+        lines: 每个级别的线段顶点数组列表 | Per-level lists of line vertex arrays
+        line_kinds: 每个级别的线段路径代码列表 | Per-level lists of line path codes
+        bands: 每个色带（levels[i]到levels[i+1]）的多边形顶点数组列表 | Per-band (levels[i] to levels[i+1]) lists of polygon vertex arrays
+        band_kinds: 每个色带的多边形路径代码列表 | Per-band lists of polygon path codes
+    """
+
+    levels: np.ndarray
+    lines: Optional[List[List[np.ndarray]]] = None
+    line_kinds: Optional[List[List[np.ndarray]]] = None
+    bands: Optional[List[List[np.ndarray]]] = None
+    band_kinds: Optional[List[List[np.ndarray]]] = None
+
+    @property
+    def nbytes(self) -> int:
+        """几何数据占用的字节数 | Bytes held by the geometry"""
+        total = self.levels.nbytes
+        for groups in (self.lines, self.line_kinds, self.bands, self.band_kinds):
+            if groups:
+                total += sum(array.nbytes for group in groups for array in group)
+        return total
+
+    def iter_geojson_features(self) -> Iterator[Dict[str, Any]]:
+        """
+        逐个生成GeoJSON要素 | Yield GeoJSON features one at a time
+
+        等高线为MultiLineString（属性elevation），色带为MultiPolygon（属性lower/upper） |
+        Isolines are MultiLineStrings (property elevation), bands are MultiPolygons (properties lower/upper)
+        """
+        if self.bands is not None:
+            for i, (segs, kinds) in enumerate(zip(self.bands, self.band_kinds)):
+                polygons = [
+                    [ring.tolist() for ring in _split_rings(seg, kind)]
+                    for seg, kind in zip(segs, kinds)
+                ]
+                if not polygons:
+                    continue
+                yield {
+                    'type': 'Feature',
+                    'properties': {'kind': 'band', 'lower': float(self.levels[i]),
+                                   'upper': float(self.levels[i + 1])},
+                    'geometry': {'type': 'MultiPolygon', 'coordinates': polygons},
+                }
+
+        if self.lines is not None:
+            for level, segs in zip(self.levels, self.lines):
+                if not segs:
+                    continue
+                yield {
+                    'type': 'Feature',
+                    'properties': {'kind': 'isoline', 'elevation': float(level)},
+                    'geometry': {'type': 'MultiLineString', 'coordinates': [seg.tolist() for seg in segs]},
+                }
+
+    def write_geojson(self, fp: IO[str]) -> None:
+        """
+        以流式方式写出GeoJSON FeatureCollection | Stream a GeoJSON FeatureCollection
+
+        Args:
+            fp: 文本文件对象 | Text file object
+        """
+        fp.write('{"type": "FeatureCollection", "features": [')
+        for i, feature in enumerate(self.iter_geojson_features()):
+            fp.write(',\n' if i else '\n')
+            fp.write(json.dumps(feature))
+        fp.write('\n]}\n')
+
+    def to_geojson(self, filepath: Optional[Union[str, Path]] = None) -> Union[str, None]:
+        """
+        导出为GeoJSON | Export to GeoJSON
+
+        Args:
+            filepath: 文件路径（可选） | File path (optional)
+
+        Returns:
+            GeoJSON字符串（如果未指定文件路径） | GeoJSON string (if no filepath specified)
+        """
+        if filepath:
+            with open(filepath, 'w', encoding='utf-8') as f:
+                self.write_geojson(f)
+            return None
+
+        import io
+        buffer = io.StringIO()
+        self.write_geojson(buffer)
+        return buffer.getvalue()
+
+    def write_svg(self, fp: IO[str], width: int = 800, colormap: str = 'terrain',
+                  line_color: str = 'black', line_width: float = 1.0) -> None:
+        """
+        以流式方式写出SVG | Stream an SVG document
+
+        Args:
+            fp: 文本文件对象 | Text file object
+            width: 图像宽度（像素），高度按数据纵横比计算 | Image width (pixels), height follows the data aspect ratio
+            colormap: 色带颜色映射 | Colormap for bands
+            line_color: 等高线颜色 | Isoline colour
+            line_width: 等高线宽度 | Isoline width
+        """
+        from matplotlib.colors import to_hex
+        from .color_mapping import ColorMapper
+
+        min_x, max_x, min_y, max_y = self.get_extent()
+        span_x = max(max_x - min_x, 1e-12)
+        span_y = max(max_y - min_y, 1e-12)
+        scale = width / span_x
+        height = max(1, int(round(span_y * scale)))
+
+        def path_data(seg: np.ndarray, kind: np.ndarray) -> str:
+            px = (seg[:, 0] - min_x) * scale
+            py = (max_y - seg[:, 1]) * scale
+            parts = []
+            for x, y, code in zip(px, py, kind):
+                if code == _CLOSEPOLY:
+                    parts.append('Z')
+                else:
+                    parts.append(f"{'M' if code == _MOVETO else 'L'}{x:.2f},{y:.2f}")
+            return ''.join(parts)
+
+        fp.write(f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
+                 f'viewBox="0 0 {width} {height}">\n')
+
+        if self.bands is not None:
+            mapper = ColorMapper(colormap, vmin=float(self.levels[0]), vmax=float(self.levels[-1]))
+            fp.write('<g class="bands" stroke="none" fill-rule="evenodd">\n')
+            for i, (segs, kinds) in enumerate(zip(self.bands, self.band_kinds)):
+                color = to_hex(mapper.get_color_at_value((self.levels[i] + self.levels[i + 1]) / 2))
+                for seg, kind in zip(segs, kinds):
+                    fp.write(f'<path fill="{color}" data-lower="{self.levels[i]:g}" '
+                             f'data-upper="{self.levels[i + 1]:g}" d="{path_data(seg, kind)}"/>\n')
+            fp.write('</g>\n')
+
+        if self.lines is not None:
+            fp.write(f'<g class="isolines" fill="none" stroke="{line_color}" stroke-width="{line_width}">\n')
+            for level, segs, kinds in zip(self.levels, self.lines, self.line_kinds):
+                for seg, kind in zip(segs, kinds):
+                    fp.write(f'<path data-elevation="{level:g}" d="{path_data(seg, kind)}"/>\n')
+            fp.write('</g>\n')
+
+        fp.write('</svg>\n')
+
+    def to_svg(self, filepath: Optional[Union[str, Path]] = None, **kwargs) -> Union[str, None]:
+        """
+        导出为SVG | Export to SVG
+
+        Args:
+            filepath: 文件路径（可选） | File path (optional)
+            **kwargs: 传递给write_svg的参数 | Parameters passed to write_svg
+
+        Returns:
+            SVG字符串（如果未指定文件路径） | SVG string (if no filepath specified)
+        """
+        if filepath:
+            with open(filepath, 'w', encoding='utf-8') as f:
+                self.write_svg(f, **kwargs)
+            return None
+
+        import io
+        buffer = io.StringIO()
+        self.write_svg(buffer, **kwargs)
+        return buffer.getvalue()
+
+    def get_extent(self) -> Tuple[float, float, float, float]:
+        """
+        获取几何范围 | Get geometry extent
+
+        Returns:
+            (min_x, max_x, min_y, max_y)元组 | (min_x, max_x, min_y, max_y) tuple
+        """
+        arrays = [seg for groups in (self.bands, self.lines) if groups for group in groups for seg in group]
+        if not arrays:
+            return (0.0, 1.0, 0.0, 1.0)
+        mins = np.min([a.min(axis=0) for a in arrays], axis=0)
+        maxs = np.max([a.max(axis=0) for a in arrays], axis=0)
+        return (float(mins[0]), float(maxs[0]), float(mins[1]), float(maxs[1]))
+
+
+def _split_rings(seg: np.ndarray, kind: np.ndarray) -> List[np.ndarray]:
+    """
+    按MOVETO代码把多边形拆分为闭合环 | Split a polygon into closed rings at MOVETO codes
+
+    Returns:
+        首尾闭合的环列表，第一个为外环 | List of closed rings, the first being the outer ring
+    """
+    starts = np.nonzero(kind == _MOVETO)[0]
+    rings = []
+    for start, stop in zip(starts, list(starts[1:]) + [len(seg)]):
+        ring = seg[start:stop]
+        if len(ring) and not np.array_equal(ring[0], ring[-1]):
+            ring = np.vstack((ring, ring[:1]))
+        rings.append(ring)
+    return rings
+
+
+def _resolve_levels(Z: np.ndarray, levels: Union[int, np.ndarray, List[float]]) -> np.ndarray:
+    """将级别数量展开为覆盖数据范围的级别数组 | Expand a level count into levels spanning the data range"""
+    if isinstance(levels, (int, np.integer)):
+        z_min, z_max = np.nanmin(Z), np.nanmax(Z)
+        levels = np.linspace(z_min, z_max, int(levels))
+    return np.asarray(levels, dtype=np.float64)
+
+
+class ContourEngine:
+    """
+    带缓存的等高线提取引擎 | Caching contour extraction engine
+
+    以(网格, 级别)为键缓存几何结果；大网格按分块用contourpy的多线程算法并行提取 |
+    Caches geometry keyed by (grid, levels); large grids are extracted in parallel
+    chunks with contourpy's threaded algorithm
+
+    Attributes:
+        max_entries: 最大缓存条目数 | Maximum number of cache entries
+        chunk_size: 分块大小（None表示自动） | Chunk size (None for automatic)
+        thread_count: 线程数（0表示全部核心） | Thread count (0 uses all cores)
+    """
+
+    def __init__(self, max_entries: int = 32, chunk_size: Optional[int] = None, thread_count: int = 0,
+                 resource_manager: Optional[ResourceManager] = None):
+        """
+        初始化等高线引擎 | Initialize contour engine
+
+        Args:
+            max_entries: 最大缓存条目数 | Maximum number of cache entries
+            chunk_size: 分块大小（None表示自动） | Chunk size (None for automatic)
+            thread_count: 线程数（0表示全部核心） | Thread count (0 uses all cores)
+            resource_manager: 共享内存预算的资源管理器（默认全局管理器） | Resource manager sharing the memory budget (global manager by default)
+        """
+        self.max_entries = max_entries
+        self.chunk_size = chunk_size
+        self.thread_count = thread_count
+        self._cache: "OrderedDict[str, ContourResult]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'misses': 0}
+        self._resources = (resource_manager or get_resource_manager()).register('contour', self._evict)
+
+    @staticmethod
+    def make_key(X: np.ndarray, Y: np.ndarray, Z: np.ndarray, levels: np.ndarray,
+                 filled: bool, lines: bool) -> str:
+        """计算(网格, 级别)的缓存键 | Compute the cache key of (grid, levels)"""
+        digest = hashlib.blake2b(digest_size=16)
+        for array in (X, Y, Z, levels):
+            array = np.ascontiguousarray(array, dtype=np.float64)
+            digest.update(str(array.shape).encode('ascii'))
+            digest.update(array.tobytes())
+        digest.update(bytes([filled, lines]))
+        return digest.hexdigest()
+
+    def compute(self, X: np.ndarray, Y: np.ndarray, Z: np.ndarray,
+                levels: Union[int, np.ndarray, List[float]] = 20,
+                filled: bool = True, lines: bool = True) -> ContourResult:
+        """
+        计算（或从缓存获取）等高线几何 | Compute (or fetch from cache) contour geometry
+
+        Args:
+            X: X坐标网格 | X coordinate grid
+            Y: Y坐标网格 | Y coordinate grid
+            Z: 高程网格，NaN视为缺失 | Elevation grid, NaN treated as missing
+            levels: 级别数量或级别数组 | Number of levels or level array
+            filled: 是否计算填充色带 | Whether to compute filled bands
+            lines: 是否计算等高线 | Whether to compute isolines
+
+        Returns:
+            ContourResult实例 | ContourResult instance
+        """
+        Z = np.asarray(Z, dtype=np.float64)
+        levels = _resolve_levels(Z, levels)
+
+        key = self.make_key(X, Y, Z, levels, filled, lines)
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                self._stats['hits'] += 1
+            else:
+                self._stats['misses'] += 1
+        if cached is not None:
+            self._resources.touch(key)
+            record_cache('contour', True)
+            return cached
+        record_cache('contour', False)
+
+        start = time.perf_counter()
+        result = self._extract(X, Y, Z, levels, filled, lines)
+        elapsed = time.perf_counter() - start
+
+        evicted = []
+        with self._lock:
+            self._cache[key] = result
+            while len(self._cache) > self.max_entries:
+                evicted.append(self._cache.popitem(last=False)[0])
+            retained = key in self._cache
+        for old_key in evicted:
+            if old_key != key:
+                self._resources.untrack(old_key)
+        # 只登记仍在缓存中的条目 | Only track entries that are still cached
+        if retained:
+            self._resources.track(key, result.nbytes, cost=elapsed)
+        return result
+
+    def _evict(self, key: str) -> None:
+        """资源管理器的淘汰回调 | Eviction callback of the resource manager"""
+        with self._lock:
+            self._cache.pop(key, None)
+
+    def _extract(self, X: np.ndarray, Y: np.ndarray, Z: np.ndarray, levels: np.ndarray,
+                 filled: bool, lines: bool) -> ContourResult:
+        """执行等高线提取 | Perform contour extraction"""
+        return extract_contours(X, Y, Z, levels, filled=filled, lines=lines,
+                                chunk_size=self.chunk_size, thread_count=self.thread_count)
+
+    def clear(self) -> None:
+        """清空缓存 | Clear cache"""
+        with self._lock:
+            self._cache.clear()
+        self._resources.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        获取缓存统计信息 | Get cache statistics
+
+        Returns:
+            包含命中、未命中次数、命中率和条目数的字典 | Dictionary with hits, misses, hit rate and entry count
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats['entries'] = len(self._cache)
+            stats['nbytes'] = sum(result.nbytes for result in self._cache.values())
+        requests = stats['hits'] + stats['misses']
+        stats['hit_rate'] = stats['hits'] / requests if requests else 0.0
+        return stats
+
+    def __str__(self) -> str:
+        return f"ContourEngine(entries={len(self._cache)}, max_entries={self.max_entries})"
+
+    def __repr__(self) -> str:
+        return self.__str__()
+
+
+# 默认全局等高线引擎 | Default global contour engine
+_default_engine: Optional[ContourEngine] = None
+
+
+def get_default_contour_engine() -> ContourEngine:
+    """
+    获取默认全局等高线引擎 | Get the default global contour engine
+
+    Returns:
+        ContourEngine实例 | ContourEngine instance
+    """
+    global _default_engine
+    if _default_engine is None:
+        _default_engine = ContourEngine()
+    return _default_engine
+
+
+def compute_contours(X: np.ndarray, Y: np.ndarray, Z: np.ndarray,
+                     levels: Union[int, np.ndarray, List[float]] = 20,
+                     filled: bool = True, lines: bool = True) -> ContourResult:
+    """
+    使用默认引擎计算等高线几何的便捷函数 | Convenience function computing contour geometry with the default engine
+
+    Args:
+        X: X坐标网格 | X coordinate grid
+        Y: Y坐标网格 | Y coordinate grid
+        Z: 高程网格 | Elevation grid
+        levels: 级别数量或级别数组 | Number of levels or level array
+        filled: 是否计算填充色带 | Whether to compute filled bands
+        lines: 是否计算等高线 | Whether to compute isolines
+
+    Returns:
+        ContourResult实例 | ContourResult instance
+    """
+    return get_default_contour_engine().compute(X, Y, Z, levels, filled=filled, lines=lines)
+
+
+def extract_contours(X: np.ndarray, Y: np.ndarray, Z: np.ndarray,
+                     levels: Union[int, np.ndarray, List[float]] = 20,
+                     filled: bool = True, lines: bool = True,
+                     chunk_size: Optional[int] = None, thread_count: int = 0) -> ContourResult:
+    """
+    不经缓存直接提取等高线几何 | Extract contour geometry directly, without caching
+
+    Args:
+        X: X坐标网格 | X coordinate grid
+        Y: Y坐标网格 | Y coordinate grid
+        Z: 高程网格，NaN视为缺失 | Elevation grid, NaN treated as missing
+        levels: 级别数量或级别数组 | Number of levels or level array
+        filled: 是否计算填充色带 | Whether to compute filled bands
+        lines: 是否计算等高线 | Whether to compute isolines
+        chunk_size: 分块大小（None表示自动） | Chunk size (None for automatic)
+        thread_count: 线程数（0表示全部核心） | Thread count (0 uses all cores)
+
+    Returns:
+        ContourResult实例 | ContourResult instance
+    """
+    import contourpy
+
+    X = np.asarray(X, dtype=np.float64)
+    Y = np.asarray(Y, dtype=np.float64)
+    Z = np.asarray(Z, dtype=np.float64)
+    levels = _resolve_levels(Z, levels)
+    if chunk_size is None and max(Z.shape) > _AUTO_CHUNK_SIZE:
+        chunk_size = _AUTO_CHUNK_SIZE
+
+    with stage('contour_extract', levels=len(levels)):
+        generator = contourpy.contour_generator(
+            X, Y, np.ma.masked_invalid(Z),
+            name='threaded',
+            line_type=contourpy.LineType.SeparateCode,
+            fill_type=contourpy.FillType.OuterCode,
+            chunk_size=chunk_size,
+            thread_count=thread_count,
+        )
+
+        result = ContourResult(levels=levels)
+
+        if lines:
+            result.lines, result.line_kinds = [], []
+            for level in levels:
+                segs, kinds = generator.lines(level)
+                result.lines.append(list(segs))
+                result.line_kinds.append(list(kinds))
+
+        if filled and len(levels) > 1:
+            # 与Matplotlib一致：最低级别等于数据最小值时下调，以包含最低点 |
+            # As in Matplotlib: lower the first bound when it equals the data minimum so the lowest cells are included
+            lowers = levels[:-1].copy()
+            if np.nanmin(Z) == lowers[0]:
+                lowers[0] -= 1
+            result.bands, result.band_kinds = [], []
+            for lower, upper in zip(lowers, levels[1:]):
+                segs, kinds = generator.filled(lower, upper)
+                result.bands.append(list(segs))
+                result.band_kinds.append(list(kinds))
+
+    return result
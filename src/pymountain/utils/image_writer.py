@@ -0,0 +1,227 @@
+"""
+PyMountain异步图像写入模块 | PyMountain asynchronous image writer module
+
+将图像编码和文件写入交给后台线程池，渲染线程只需复制像素缓冲区即可继续下一帧 |
+Hands image encoding and file I/O to a background thread pool so the rendering thread
+only copies the pixel buffer before moving on to the next frame
+"""
+
+import os
+import tempfile
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Any, Optional, Union
+
+import numpy as np
+
+from ..core.profiling import stage
+
+
+# 支持后台编码的栅格格式 | Raster formats supported by background encoding
+RASTER_FORMATS = ('png', 'jpg', 'jpeg', 'tif', 'tiff', 'webp')
+
+
+class AsyncImageWriter:
+    """
+    有界队列的后台图像写入器 | Background image writer with a bounded queue
+
+    待处理任务数达到max_pending时submit()会阻塞，从而限制排队帧占用的内存 |
+    submit() blocks once max_pending tasks are outstanding, bounding the memory held by queued frames
+
+    Attributes:
+        max_workers: 后台线程数 | Number of background threads
+        max_pending: 最大待处理任务数 | Maximum number of outstanding tasks
+    """
+
+    def __init__(self, max_workers: int = 2, max_pending: int = 8):
+        """
+        初始化写入器 | Initialize writer
+
+        Args:
+            max_workers: 后台线程数 | Number of background threads
+            max_pending: 最大待处理任务数 | Maximum number of outstanding tasks
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be >= 1")
+        if max_pending < 1:
+            raise ValueError("max_pending must be >= 1")
+
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='pymountain-writer')
+        self._lock = threading.Lock()
+        self._pending: Dict[Future, None] = {}
+        self._stats = {'submitted': 0, 'completed': 0, 'failed': 0, 'bytes_written': 0}
+        self._closed = False
+
+    @staticmethod
+    def resolve_format(filepath: Union[str, Path], format: Optional[str] = None) -> str:
+        """
+        根据参数或文件扩展名确定格式 | Determine format from argument or file extension
+
+        Args:
+            filepath: 文件路径 | File path
+            format: 显式格式 | Explicit format
+
+        Returns:
+            小写格式名 | Lower-case format name
+        """
+        if format is None:
+            format = Path(filepath).suffix.lstrip('.') or 'png'
+        return format.lower()
+
+    def submit(self, image: np.ndarray, filepath: Union[str, Path], format: Optional[str] = None,
+               dpi: float = 100, metadata: Optional[Dict[str, str]] = None) -> Future:
+        """
+        提交图像写入任务 | Submit an image write task
+
+        调用方在提交后不得再修改image | The caller must not modify image after submitting it
+
+        Args:
+            image: (H, W, 3/4) uint8图像数组 | (H, W, 3/4) uint8 image array
+            filepath: 文件路径 | File path
+            format: 图像格式（默认由扩展名推断） | Image format (inferred from extension by default)
+            dpi: 写入文件的DPI元数据 | DPI metadata written to the file
+            metadata: 附加元数据 | Additional metadata
+
+        Returns:
+            完成时结果为文件路径的Future | Future resolving to the file path
+
+        Raises:
+            RuntimeError: 写入器已关闭 | Writer is closed
+            ValueError: 不支持的格式 | Unsupported format
+        """
+        format = self.resolve_format(filepath, format)
+        if format not in RASTER_FORMATS:
+            raise ValueError(f"Unsupported format for background encoding: {format}. "
+                             f"Supported formats: {RASTER_FORMATS}")
+        if self._closed:
+            raise RuntimeError("AsyncImageWriter is closed")
+
+        # 队列已满时阻塞（背压） | Block while the queue is full (backpressure)
+        self._slots.acquire()
+        try:
+            future = self._executor.submit(self._write, image, Path(filepath), format, dpi, metadata)
+        except BaseException:
+            self._slots.release()
+            raise
+
+        with self._lock:
+            self._stats['submitted'] += 1
+            self._pending[future] = None
+        future.add_done_callback(self._on_done)
+        return future
+
+    def _write(self, image: np.ndarray, filepath: Path, format: str,
+               dpi: float, metadata: Optional[Dict[str, str]]) -> Path:
+        """在后台线程中编码并原子地写入文件 | Encode and atomically write the file in a background thread"""
+        from matplotlib.image import imsave
+
+        if format in ('jpg', 'jpeg') and image.ndim == 3 and image.shape[2] == 4:
+            # JPEG不支持透明通道 | JPEG has no alpha channel
+            image = image[..., :3]
+
+        with stage('encode_image', format=format):
+            directory = filepath.parent
+            directory.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.tmp-', suffix=f'.{format}')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    imsave(f, image, format=format, dpi=dpi, metadata=metadata)
+                os.replace(tmp_path, filepath)
+            except BaseException:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+                raise
+
+        with self._lock:
+            self._stats['bytes_written'] += filepath.stat().st_size
+        return filepath
+
+    def _on_done(self, future: Future) -> None:
+        """任务完成回调 | Task completion callback"""
+        with self._lock:
+            self._pending.pop(future, None)
+            if future.cancelled() or future.exception() is not None:
+                self._stats['failed'] += 1
+            else:
+                self._stats['completed'] += 1
+        self._slots.release()
+
+    def pending(self) -> int:
+        """获取待处理任务数 | Get number of outstanding tasks"""
+        with self._lock:
+            return len(self._pending)
+
+    def flush(self, timeout: Optional[float] = None) -> None:
+        """
+        等待当前所有任务完成 | Wait for all current tasks to finish
+
+        Args:
+            timeout: 每个任务的超时时间（秒） | Timeout per task (seconds)
+
+        Raises:
+            Exception: 第一个失败任务的异常 | Exception of the first failed task
+        """
+        with self._lock:
+            futures = list(self._pending)
+        for future in futures:
+            future.result(timeout=timeout)
+
+    def close(self, wait: bool = True) -> None:
+        """
+        关闭写入器 | Close writer
+
+        Args:
+            wait: 是否等待未完成任务 | Whether to wait for outstanding tasks
+        """
+        self._closed = True
+        self._executor.shutdown(wait=wait, cancel_futures=not wait)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        获取写入统计信息 | Get writer statistics
+
+        Returns:
+            包含提交、完成、失败次数、写入字节数和待处理数的字典 |
+            Dictionary with submitted, completed and failed counts, bytes written and pending count
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats['pending'] = len(self._pending)
+        return stats
+
+    def __enter__(self) -> "AsyncImageWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close(wait=True)
+
+    def __str__(self) -> str:
+        return f"AsyncImageWriter(max_workers={self.max_workers}, max_pending={self.max_pending})"
+
+    def __repr__(self) -> str:
+        return self.__str__()
+
+
+# 默认全局写入器 | Default global writer
+_default_writer: Optional[AsyncImageWriter] = None
+_default_writer_lock = threading.Lock()
+
+
+def get_default_image_writer() -> AsyncImageWriter:
+    """
+    获取默认全局图像写入器 | Get the default global image writer
+
+    Returns:
+        AsyncImageWriter实例 | AsyncImageWriter instance
+    """
+    global _default_writer
+    with _default_writer_lock:
+        if _default_writer is None or _default_writer._closed:
+            _default_writer = AsyncImageWriter()
+        return _default_writer
@@ -6,8 +6,6 @@ PyMountain插值工具模块 | PyMountain interpolation utilities module
 
 import numpy as np
 from typing import Tuple, Optional, Union, Callable, Dict
-from scipy.interpolate import griddata, interp2d, RBFInterpolator
-from scipy.spatial.distance import cdist
 import warnings
 
 
@@ -53,7 +51,9 @@ def linear_interpolation(x: np.ndarray, y: np.ndarray, z: np.ndarray,
     xi_flat, yi_flat = xi.flatten(), yi.flatten()
     target_points = np.column_stack((xi_flat, yi_flat))
     
-    # 执行线性插值 | Perform linear interpolation
+    # 执行线性插值（scipy按需导入） | Perform linear interpolation (scipy is imported on demand)
+    from scipy.interpolate import griddata
+    
     try:
         zi_flat = griddata(points, z, target_points, method='linear', fill_value=fill_value)
         zi = zi_flat.reshape(xi.shape)
@@ -106,6 +106,8 @@ def cubic_interpolation(x: np.ndarray, y: np.ndarray, z: np.ndarray,
     target_points = np.column_stack((xi_flat, yi_flat))
     
     # 执行三次插值 | Perform cubic interpolation
+    from scipy.interpolate import griddata
+    
     try:
         zi_flat = griddata(points, z, target_points, method='cubic', fill_value=fill_value)
         zi = zi_flat.reshape(xi.shape)
@@ -165,6 +167,8 @@ def rbf_interpolation(x: np.ndarray, y: np.ndarray, z: np.ndarray,
     target_points = np.column_stack((xi_flat, yi_flat))
     
     # 执行RBF插值 | Perform RBF interpolation
+    from scipy.interpolate import griddata, RBFInterpolator
+    
     try:
         # 使用scipy的RBFInterpolator | Use scipy's RBFInterpolator
         rbf_params = {'kernel': kernel, 'smoothing': smoothing}
@@ -0,0 +1,563 @@
+"""
+PyMountain栅格读写模块 | PyMountain raster I/O module
+
+无需GDAL读取ESRI ASCII网格(.asc)和带.hdr头文件的原始二进制栅格(.flt/.bil/.bip/.bsq)，返回GridData。
+ASCII网格按行块解析，二进制栅格通过内存映射读取；两者都支持只读取子矩形的窗口读取 |
+Reads ESRI ASCII grids (.asc) and headered raw binary rasters (.flt/.bil/.bip/.bsq) into GridData
+without GDAL. ASCII grids are parsed in row chunks and binary rasters are memory-mapped; both
+support windowed reads that fetch only a sub-rectangle
+"""
+
+import io
+import itertools
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Any, Optional, Tuple, List, Union, Iterator
+
+import numpy as np
+
+from ..core.grid import GridData, GeoTransform
+
+
+# ESRI ASCII网格的扩展名 | ESRI ASCII grid suffixes
+ASCII_SUFFIXES = ('.asc', '.grd')
+
+# 带.hdr头文件的二进制栅格扩展名 | Suffixes of binary rasters with a .hdr header
+BINARY_SUFFIXES = ('.flt', '.bil', '.bip', '.bsq')
+
+RASTER_SUFFIXES = ASCII_SUFFIXES + BINARY_SUFFIXES
+
+# 每个解析块的单元格数 | Cells per parsed chunk
+_CHUNK_CELLS = 1 << 20
+
+# 跳过行时每次读取的字节数 | Bytes read per step while skipping rows
+_SKIP_BLOCK = 1 << 22
+
+# .hdr中PIXELTYPE到NumPy类型种类的映射 | Mapping of .hdr PIXELTYPE to NumPy dtype kinds
+_PIXEL_KINDS = {'SIGNEDINT': 'i', 'UNSIGNEDINT': 'u', 'FLOAT': 'f'}
+
+Window = Tuple[int, int, int, int]
+Bounds = Tuple[float, float, float, float]
+
+
+@dataclass
+class RasterHeader:
+    """
+    栅格头信息 | Raster header information
+
+    Attributes:
+        path: 数据文件路径 | Data file path
+        format: 'esri_ascii'、'flt'或'ehdr' | 'esri_ascii', 'flt' or 'ehdr'
+        nrows: 行数 | Number of rows
+        ncols: 列数 | Number of columns
+        transform: GDAL地理变换（北向上） | GDAL geotransform (north-up)
+        nodata: 无数据值 | Nodata value
+        dtype: 像素类型（ASCII网格为None） | Pixel dtype (None for ASCII grids)
+        data_offset: 数据起始的字节偏移 | Byte offset of the first data value
+        nbands: 波段数 | Number of bands
+        layout: 'BIL'、'BIP'或'BSQ' | 'BIL', 'BIP' or 'BSQ'
+        band_row_bytes: 每个波段一行的字节数 | Bytes per band row
+        total_row_bytes: 所有波段一行的字节数 | Bytes per row across all bands
+        band_gap_bytes: BSQ波段之间的间隔字节数 | Gap bytes between BSQ bands
+        extra: 未识别的头字段 | Unrecognized header fields
+    """
+    path: Path
+    format: str
+    nrows: int
+    ncols: int
+    transform: GeoTransform
+    nodata: Optional[float] = None
+    dtype: Optional[np.dtype] = None
+    data_offset: int = 0
+    nbands: int = 1
+    layout: str = 'BIL'
+    band_row_bytes: int = 0
+    total_row_bytes: int = 0
+    band_gap_bytes: int = 0
+    extra: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        """栅格形状(nrows, ncols) | Raster shape (nrows, ncols)"""
+        return self.nrows, self.ncols
+
+    def window_for_bounds(self, bounds: Bounds) -> Window:
+        """
+        计算覆盖地理范围的像素窗口 | Compute the pixel window covering a world-coordinate range
+
+        Args:
+            bounds: (min_x, max_x, min_y, max_y)范围 | (min_x, max_x, min_y, max_y) range
+
+        Returns:
+            (row_start, row_stop, col_start, col_stop)窗口 | (row_start, row_stop, col_start, col_stop) window
+
+        Raises:
+            ValueError: 范围与栅格不相交 | The range does not intersect the raster
+        """
+        min_x, max_x, min_y, max_y = bounds
+        origin_x, width, _, origin_y, _, height = self.transform
+        cols = sorted(((min_x - origin_x) / width, (max_x - origin_x) / width))
+        rows = sorted(((min_y - origin_y) / height, (max_y - origin_y) / height))
+        col_start, col_stop = max(0, int(np.floor(cols[0]))), min(self.ncols, int(np.ceil(cols[1])))
+        row_start, row_stop = max(0, int(np.floor(rows[0]))), min(self.nrows, int(np.ceil(rows[1])))
+        if row_stop <= row_start or col_stop <= col_start:
+            raise ValueError(f"Bounds {bounds} do not intersect the raster")
+        return row_start, row_stop, col_start, col_stop
+
+    def resolve_window(self, window: Optional[Window] = None, bounds: Optional[Bounds] = None) -> Window:
+        """
+        规范化窗口参数（window和bounds互斥，均未给出时为整个栅格） |
+        Normalize window arguments (window and bounds are exclusive; neither means the whole raster)
+
+        Returns:
+            (row_start, row_stop, col_start, col_stop)窗口 | (row_start, row_stop, col_start, col_stop) window
+        """
+        if window is not None and bounds is not None:
+            raise ValueError("window and bounds are mutually exclusive")
+        if bounds is not None:
+            return self.window_for_bounds(bounds)
+        if window is None:
+            return 0, self.nrows, 0, self.ncols
+
+        row_start, row_stop, col_start, col_stop = (int(value) for value in window)
+        if not (0 <= row_start < row_stop <= self.nrows and 0 <= col_start < col_stop <= self.ncols):
+            raise ValueError(f"Window {window} is outside the raster shape {self.shape}")
+        return row_start, row_stop, col_start, col_stop
+
+    def window_transform(self, window: Window) -> GeoTransform:
+        """窗口左上角的地理变换 | Geotransform of the window's upper-left corner"""
+        origin_x, width, x_skew, origin_y, y_skew, height = self.transform
+        row_start, _, col_start, _ = window
+        return (origin_x + col_start * width, width, x_skew,
+                origin_y + row_start * height, y_skew, height)
+
+
+def read_raster_header(path: Union[str, Path]) -> RasterHeader:
+    """
+    读取栅格头信息，不读取像素数据 | Read raster header information without reading pixel data
+
+    Args:
+        path: .asc文件、二进制数据文件或其.hdr头文件 | .asc file, binary data file or its .hdr header
+
+    Returns:
+        RasterHeader实例 | RasterHeader instance
+
+    Raises:
+        ValueError: 扩展名不受支持或头信息无效 | Unsupported suffix or invalid header
+        FileNotFoundError: 找不到数据文件或头文件 | Data or header file not found
+    """
+    path = Path(path)
+    suffix = path.suffix.lower()
+    if suffix in ASCII_SUFFIXES:
+        return _read_ascii_header(path)
+    if suffix in BINARY_SUFFIXES or suffix == '.hdr':
+        return _read_binary_header(path)
+    raise ValueError(f"Unsupported raster format: {path.suffix}")
+
+
+def read_raster(path: Union[str, Path], window: Optional[Window] = None,
+                bounds: Optional[Bounds] = None, **kwargs) -> GridData:
+    """
+    按扩展名读取栅格 | Read a raster by its suffix
+
+    Args:
+        path: 栅格路径 | Raster path
+        window: 像素窗口(row_start, row_stop, col_start, col_stop) | Pixel window (row_start, row_stop, col_start, col_stop)
+        bounds: 地理范围(min_x, max_x, min_y, max_y)，与window互斥 | World range (min_x, max_x, min_y, max_y), exclusive with window
+        **kwargs: 传递给read_esri_ascii()或read_binary_raster()的参数 | Arguments passed to read_esri_ascii() or read_binary_raster()
+
+    Returns:
+        GridData实例 | GridData instance
+    """
+    header = read_raster_header(path)
+    if header.format == 'esri_ascii':
+        return read_esri_ascii(header, window=window, bounds=bounds, **kwargs)
+    return read_binary_raster(header, window=window, bounds=bounds, **kwargs)
+
+
+def read_esri_ascii(path: Union[str, Path, RasterHeader], window: Optional[Window] = None,
+                    bounds: Optional[Bounds] = None, dtype: Any = np.float32,
+                    chunk_cells: int = _CHUNK_CELLS) -> GridData:
+    """
+    读取ESRI ASCII网格 | Read an ESRI ASCII grid
+
+    数据按行块解析，内存占用为窗口大小加一个块。每行一条记录的常见布局在窗口之前的行只统计换行符而不解析，
+    读到窗口末行即停止 |
+    Data is parsed in row chunks, so memory use is the window plus one chunk. In the common one-row-
+    per-line layout, rows before the window are skipped by counting newlines without parsing, and
+    reading stops after the last window row
+
+    Args:
+        path: .asc路径或已读取的头信息 | .asc path or an already-read header
+        window: 像素窗口(row_start, row_stop, col_start, col_stop) | Pixel window (row_start, row_stop, col_start, col_stop)
+        bounds: 地理范围(min_x, max_x, min_y, max_y)，与window互斥 | World range (min_x, max_x, min_y, max_y), exclusive with window
+        dtype: 输出浮点类型 | Output floating-point dtype
+        chunk_cells: 每块解析的单元格数 | Cells parsed per chunk
+
+    Returns:
+        GridData实例 | GridData instance
+
+    Raises:
+        ValueError: 文件格式错误或数据不足 | Malformed file or missing data
+    """
+    header = path if isinstance(path, RasterHeader) else _read_ascii_header(Path(path))
+    window = header.resolve_window(window, bounds)
+    row_start, row_stop, col_start, col_stop = window
+    out = np.empty((row_stop - row_start, col_stop - col_start), dtype=dtype)
+
+    rows_per_chunk = max(1, chunk_cells // header.ncols)
+    with open(header.path, 'rb') as f:
+        f.seek(header.data_offset)
+        first_line = f.readline()
+        f.seek(header.data_offset)
+        one_row_per_line = len(first_line.split()) == header.ncols
+
+        if one_row_per_line:
+            _skip_lines(f, row_start, header)
+            chunks = _iter_line_rows(f, row_stop - row_start, rows_per_chunk, (col_start, col_stop), dtype)
+            first_row = row_start
+        else:
+            chunks = _iter_token_rows(f, header.ncols, rows_per_chunk, dtype)
+            first_row = 0
+
+        row = first_row
+        for rows in chunks:
+            # 行切片与窗口的交集 | Intersection of the row slice with the window
+            lo, hi = max(row, row_start), min(row + len(rows), row_stop)
+            if hi > lo:
+                block = rows[lo - row:hi - row]
+                out[lo - row_start:hi - row_start] = block if one_row_per_line else block[:, col_start:col_stop]
+            row += len(rows)
+            if row >= row_stop:
+                break
+
+    if row < row_stop:
+        raise ValueError(f"{header.path}: expected {header.nrows} rows, found {row}")
+    return _make_grid(out, header, window)
+
+
+def read_binary_raster(path: Union[str, Path, RasterHeader], window: Optional[Window] = None,
+                       bounds: Optional[Bounds] = None, band: int = 0, memmap: bool = True) -> GridData:
+    """
+    读取带.hdr头文件的二进制栅格 | Read a binary raster with a .hdr header
+
+    数据文件被内存映射，窗口是映射上的跨步视图，只有实际访问的页会被读入。浮点栅格的GridData直接引用该视图；
+    整数栅格在窗口上转换为float64 |
+    The data file is memory-mapped and the window is a strided view of the mapping, so only pages
+    actually touched are read. Floating-point rasters give a GridData referencing that view directly;
+    integer rasters are converted to float64 over the window
+
+    Args:
+        path: 数据文件或.hdr路径，或已读取的头信息 | Data file or .hdr path, or an already-read header
+        window: 像素窗口(row_start, row_stop, col_start, col_stop) | Pixel window (row_start, row_stop, col_start, col_stop)
+        bounds: 地理范围(min_x, max_x, min_y, max_y)，与window互斥 | World range (min_x, max_x, min_y, max_y), exclusive with window
+        band: 波段索引（从0开始） | Band index (0-based)
+        memmap: False时把窗口复制到内存并释放映射 | When False, copy the window into memory and release the mapping
+
+    Returns:
+        GridData实例 | GridData instance
+
+    Raises:
+        ValueError: 波段索引无效或文件小于头信息描述的大小 | Invalid band index or file smaller than the header describes
+    """
+    header = path if isinstance(path, RasterHeader) else _read_binary_header(Path(path))
+    if not 0 <= band < header.nbands:
+        raise ValueError(f"band must be in [0, {header.nbands}), got {band}")
+    window = header.resolve_window(window, bounds)
+    row_start, row_stop, col_start, col_stop = window
+
+    itemsize = header.dtype.itemsize
+    if header.layout == 'BIP':
+        row_stride, col_stride = header.total_row_bytes, header.nbands * itemsize
+        band_offset = band * itemsize
+    elif header.layout == 'BSQ':
+        row_stride, col_stride = header.band_row_bytes, itemsize
+        band_offset = band * (header.nrows * header.band_row_bytes + header.band_gap_bytes)
+    else:
+        row_stride, col_stride = header.total_row_bytes, itemsize
+        band_offset = band * header.band_row_bytes
+
+    # 窗口最后一个像素之后的字节位置 | Byte position just past the window's last pixel
+    offset = header.data_offset + band_offset + row_start * row_stride + col_start * col_stride
+    end = offset + (row_stop - row_start - 1) * row_stride + (col_stop - col_start - 1) * col_stride + itemsize
+    size = os.path.getsize(header.path)
+    if end > size:
+        raise ValueError(f"{header.path}: file has {size} bytes, header requires at least {end}")
+
+    mapping = np.memmap(header.path, dtype=np.uint8, mode='r')
+    z = np.ndarray((row_stop - row_start, col_stop - col_start), dtype=header.dtype,
+                   buffer=mapping, offset=offset, strides=(row_stride, col_stride))
+    if not memmap:
+        z = np.array(z)
+        del mapping
+    return _make_grid(z, header, window, band=band)
+
+
+def write_esri_ascii(grid: GridData, path: Union[str, Path], fmt: str = '%.6g',
+                     nodata: Optional[float] = None, chunk_cells: int = _CHUNK_CELLS) -> Path:
+    """
+    将网格写为ESRI ASCII网格（按行块写出） | Write a grid as an ESRI ASCII grid (in row chunks)
+
+    Args:
+        grid: 北向上、无旋转的网格 | North-up grid without rotation
+        path: 输出路径 | Output path
+        fmt: 数值格式 | Number format
+        nodata: 无数据值（默认为grid.nodata或-9999） | Nodata value (grid.nodata or -9999 by default)
+        chunk_cells: 每块写出的单元格数 | Cells written per chunk
+
+    Returns:
+        输出路径 | Output path
+    """
+    origin_x, width, origin_y, height, nodata = _writable_transform(grid, nodata)
+    rows, cols = grid.shape
+    lines = [f"ncols {cols}", f"nrows {rows}", f"xllcorner {origin_x!r}", f"yllcorner {origin_y + rows * height!r}"]
+    if np.isclose(width, -height):
+        lines.append(f"cellsize {width!r}")
+    else:
+        lines.extend([f"dx {width!r}", f"dy {-height!r}"])
+    lines.append(f"NODATA_value {nodata:g}")
+
+    path = Path(path)
+    with open(path, 'w', encoding='ascii') as f:
+        f.write('\n'.join(lines) + '\n')
+        for block in _iter_filled_blocks(grid, nodata, chunk_cells, np.float64):
+            np.savetxt(f, block, fmt=fmt)
+    return path
+
+
+def write_float_grid(grid: GridData, path: Union[str, Path], nodata: Optional[float] = None,
+                     chunk_cells: int = _CHUNK_CELLS) -> Path:
+    """
+    将网格写为ESRI浮点网格(.flt + .hdr，小端float32) | Write a grid as an ESRI float grid (.flt + .hdr, little-endian float32)
+
+    Args:
+        grid: 北向上、无旋转的网格 | North-up grid without rotation
+        path: .flt输出路径 | .flt output path
+        nodata: 无数据值（默认为grid.nodata或-9999） | Nodata value (grid.nodata or -9999 by default)
+        chunk_cells: 每块写出的单元格数 | Cells written per chunk
+
+    Returns:
+        .flt路径 | .flt path
+    """
+    origin_x, width, origin_y, height, nodata = _writable_transform(grid, nodata)
+    if not np.isclose(width, -height):
+        raise ValueError("Float grids require square cells")
+    rows, cols = grid.shape
+
+    path = Path(path).with_suffix('.flt')
+    with open(path.with_suffix('.hdr'), 'w', encoding='ascii') as f:
+        f.write(f"ncols {cols}\nnrows {rows}\nxllcorner {origin_x!r}\nyllcorner {origin_y + rows * height!r}\n"
+                f"cellsize {width!r}\nNODATA_value {nodata:g}\nbyteorder LSBFIRST\n")
+    with open(path, 'wb') as f:
+        for block in _iter_filled_blocks(grid, nodata, chunk_cells, np.dtype('<f4')):
+            block.tofile(f)
+    return path
+
+
+def _make_grid(z: np.ndarray, header: RasterHeader, window: Window, band: int = 0) -> GridData:
+    """由窗口数组构建GridData | Build GridData from a window array"""
+    metadata: Dict[str, Any] = {
+        'source': str(header.path),
+        'format': header.format,
+        'source_shape': [header.nrows, header.ncols],
+        'window': list(window),
+    }
+    if header.nbands > 1:
+        metadata['band'] = band
+    return GridData(z, header.window_transform(window), nodata=header.nodata, metadata=metadata)
+
+
+def _parse_header_lines(lines: List[str], path: Path) -> Dict[str, str]:
+    """解析"键 值"头字段（键不区分大小写） | Parse "key value" header fields (keys are case-insensitive)"""
+    fields: Dict[str, str] = {}
+    for line in lines:
+        parts = line.split(None, 1)
+        if len(parts) == 2:
+            fields[parts[0].lower()] = parts[1].strip()
+        elif parts:
+            raise ValueError(f"{path}: malformed header line {line.strip()!r}")
+    return fields
+
+
+def _corner_transform(fields: Dict[str, str], nrows: int, path: Path) -> GeoTransform:
+    """由xll/yll和cellsize字段计算地理变换 | Compute the geotransform from xll/yll and cellsize fields"""
+    if 'cellsize' in fields:
+        width = height = float(fields['cellsize'])
+    elif 'dx' in fields and 'dy' in fields:
+        width, height = float(fields['dx']), float(fields['dy'])
+    else:
+        raise ValueError(f"{path}: header needs cellsize (or dx and dy)")
+
+    if 'xllcorner' in fields and 'yllcorner' in fields:
+        left, bottom = float(fields['xllcorner']), float(fields['yllcorner'])
+    elif 'xllcenter' in fields and 'yllcenter' in fields:
+        left, bottom = float(fields['xllcenter']) - width / 2, float(fields['yllcenter']) - height / 2
+    else:
+        raise ValueError(f"{path}: header needs xllcorner/yllcorner or xllcenter/yllcenter")
+    return left, width, 0.0, bottom + nrows * height, 0.0, -height
+
+
+def _read_ascii_header(path: Path) -> RasterHeader:
+    """读取ESRI ASCII网格的头部 | Read the header of an ESRI ASCII grid"""
+    lines = []
+    with open(path, 'rb') as f:
+        while True:
+            offset = f.tell()
+            line = f.readline()
+            token = line.split(None, 1)[0] if line.strip() else b''
+            # 头字段以字母开头，数据以数字或符号开头 | Header keys start with a letter, data with a digit or sign
+            if not line or (token and not token[:1].isalpha()):
+                break
+            lines.append(line.decode('ascii'))
+
+    fields = _parse_header_lines(lines, path)
+    try:
+        nrows, ncols = int(fields.pop('nrows')), int(fields.pop('ncols'))
+    except KeyError as e:
+        raise ValueError(f"{path}: header is missing {e.args[0]}")
+    transform = _corner_transform(fields, nrows, path)
+    nodata = fields.get('nodata_value')
+    return RasterHeader(path=path, format='esri_ascii', nrows=nrows, ncols=ncols, transform=transform,
+                        nodata=float(nodata) if nodata is not None else None, data_offset=offset,
+                        extra={key: value for key, value in fields.items()
+                               if key not in ('cellsize', 'dx', 'dy', 'xllcorner', 'yllcorner',
+                                              'xllcenter', 'yllcenter', 'nodata_value')})
+
+
+def _find_sibling(path: Path, suffixes: Tuple[str, ...]) -> Path:
+    """查找同名但扩展名不同的文件（不区分大小写） | Find the file with the same stem and another suffix (case-insensitive)"""
+    for suffix in suffixes:
+        for candidate in (path.with_suffix(suffix), path.with_suffix(suffix.upper())):
+            if candidate.exists():
+                return candidate
+    raise FileNotFoundError(f"No {'/'.join(suffixes)} file found next to {path}")
+
+
+def _read_binary_header(path: Path) -> RasterHeader:
+    """读取二进制栅格的.hdr头文件 | Read the .hdr header of a binary raster"""
+    if path.suffix.lower() == '.hdr':
+        hdr_path, data_path = path, _find_sibling(path, BINARY_SUFFIXES)
+    else:
+        hdr_path, data_path = _find_sibling(path, ('.hdr',)), path
+
+    with open(hdr_path, 'r', encoding='ascii', errors='replace') as f:
+        fields = _parse_header_lines(f.read().splitlines(), hdr_path)
+    try:
+        nrows, ncols = int(fields['nrows']), int(fields['ncols'])
+    except KeyError as e:
+        raise ValueError(f"{hdr_path}: header is missing {e.args[0]}")
+
+    byteorder = fields.get('byteorder', 'I').upper()
+    endian = '>' if byteorder in ('M', 'MSBFIRST') else '<'
+
+    if data_path.suffix.lower() == '.flt':
+        # ArcGIS浮点网格：float32，ASCII网格式的坐标字段 | ArcGIS float grid: float32 with ASCII-grid style coordinates
+        fmt, dtype = 'flt', np.dtype(endian + 'f4')
+        transform = _corner_transform(fields, nrows, hdr_path)
+        nodata = fields.get('nodata_value')
+    else:
+        fmt = 'ehdr'
+        nbits = int(fields.get('nbits', 8))
+        kind = _PIXEL_KINDS.get(fields.get('pixeltype', 'FLOAT' if nbits == 64 else 'UNSIGNEDINT').upper())
+        if kind is None or nbits not in (8, 16, 32, 64) or (kind == 'f' and nbits < 32):
+            raise ValueError(f"{hdr_path}: unsupported pixel type {fields.get('pixeltype')} with {nbits} bits")
+        dtype = np.dtype(f"{endian if nbits > 8 else '|'}{kind}{nbits // 8}")
+        if 'xllcorner' in fields or 'xllcenter' in fields:
+            transform = _corner_transform(fields, nrows, hdr_path)
+        else:
+            # ULXMAP/ULYMAP是左上角像素的中心 | ULXMAP/ULYMAP are the center of the upper-left pixel
+            xdim, ydim = float(fields.get('xdim', 1)), float(fields.get('ydim', 1))
+            ulx, uly = float(fields.get('ulxmap', 0)), float(fields.get('ulymap', nrows - 1))
+            transform = (ulx - xdim / 2, xdim, 0.0, uly + ydim / 2, 0.0, -ydim)
+        nodata = fields.get('nodata', fields.get('nodata_value'))
+
+    nbands = int(fields.get('nbands', 1))
+    layout = fields.get('layout', 'BIL').upper()
+    if layout not in ('BIL', 'BIP', 'BSQ'):
+        raise ValueError(f"{hdr_path}: unsupported layout {layout}")
+    band_row_bytes = int(fields.get('bandrowbytes', ncols * dtype.itemsize))
+    default_total = ncols * nbands * dtype.itemsize if layout == 'BIP' else nbands * band_row_bytes
+    total_row_bytes = int(fields.get('totalrowbytes', default_total))
+
+    return RasterHeader(path=data_path, format=fmt, nrows=nrows, ncols=ncols, transform=transform,
+                        nodata=float(nodata) if nodata is not None else None, dtype=dtype,
+                        data_offset=int(fields.get('skipbytes', 0)), nbands=nbands, layout=layout,
+                        band_row_bytes=band_row_bytes, total_row_bytes=total_row_bytes,
+                        band_gap_bytes=int(fields.get('bandgapbytes', 0)), extra=fields)
+
+
+def _skip_lines(f: io.BufferedReader, count: int, header: RasterHeader) -> None:
+    """跳过count行，只统计换行符而不解析 | Skip count lines by counting newlines, without parsing"""
+    while count > 0:
+        start = f.tell()
+        block = f.read(_SKIP_BLOCK)
+        if not block:
+            raise ValueError(f"{header.path}: expected {header.nrows} rows, file ended early")
+        newlines = block.count(b'\n')
+        if newlines < count:
+            count -= newlines
+            continue
+        index = -1
+        for _ in range(count):
+            index = block.index(b'\n', index + 1)
+        f.seek(start + index + 1)
+        return
+
+
+def _iter_line_rows(f: io.BufferedReader, nrows: int, rows_per_chunk: int,
+                    columns: Tuple[int, int], dtype: Any) -> Iterator[np.ndarray]:
+    """每行一条记录时按块解析窗口列 | Parse the window columns in chunks when each line holds one row"""
+    remaining = nrows
+    usecols = range(*columns)
+    while remaining > 0:
+        lines = list(itertools.islice(f, min(rows_per_chunk, remaining)))
+        if not lines:
+            return
+        yield np.loadtxt(lines, dtype=dtype, usecols=usecols, ndmin=2)
+        remaining -= len(lines)
+
+
+def _iter_token_rows(f: io.BufferedReader, ncols: int, rows_per_chunk: int, dtype: Any) -> Iterator[np.ndarray]:
+    """数值跨行折行时按字节块解析并重组为整行 | Parse byte blocks and regroup into full rows when values wrap across lines"""
+    carry = np.empty(0, dtype=dtype)
+    block_bytes = max(_SKIP_BLOCK // 4, rows_per_chunk * ncols * 8)
+    tail = b''
+    while True:
+        block = f.read(block_bytes)
+        text = tail + block
+        if block:
+            # 保留最后一个可能不完整的数值 | Keep the last, possibly incomplete, number for the next block
+            cut = max(text.rfind(b' '), text.rfind(b'\n'), text.rfind(b'\t'))
+            text, tail = (text[:cut], text[cut:]) if cut >= 0 else (b'', text)
+        else:
+            tail = b''
+        values = np.concatenate((carry, np.array(text.split(), dtype=dtype)))
+        full = len(values) // ncols
+        if full:
+            yield values[:full * ncols].reshape(full, ncols)
+        carry = values[full * ncols:]
+        if not block:
+            return
+
+
+def _writable_transform(grid: GridData, nodata: Optional[float]) -> Tuple[float, float, float, float, float]:
+    """检查网格可写为ESRI格式并返回(origin_x, width, origin_y, height, nodata) |
+    Check that the grid can be written in ESRI formats and return (origin_x, width, origin_y, height, nodata)"""
+    origin_x, width, x_skew, origin_y, y_skew, height = grid.transform
+    if x_skew or y_skew or width <= 0 or height >= 0:
+        raise ValueError("ESRI rasters require a north-up grid (positive pixel width, negative pixel height)")
+    if nodata is None:
+        nodata = grid.nodata if grid.nodata is not None else -9999.0
+    return origin_x, width, origin_y, height, nodata
+
+
+def _iter_filled_blocks(grid: GridData, nodata: float, chunk_cells: int, dtype: Any) -> Iterator[np.ndarray]:
+    """按行块输出无数据单元格替换为nodata的数组 | Yield row blocks with missing cells replaced by nodata"""
+    rows, cols = grid.shape
+    valid = grid.valid_mask()
+    rows_per_chunk = max(1, chunk_cells // cols)
+    for start in range(0, rows, rows_per_chunk):
+        block = np.array(grid.z[start:start + rows_per_chunk], dtype=dtype)
+        block[~valid[start:start + rows_per_chunk]] = nodata
+        yield block
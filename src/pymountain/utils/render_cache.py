@@ -0,0 +1,302 @@
+"""
+PyMountain渲染结果缓存模块 | PyMountain render result cache module
+
+按内容寻址缓存编码后的渲染图像：键由数据指纹、规范化的渲染器配置、渲染器类和保存参数构成 |
+Content-addressed cache of encoded render images, keyed by the data fingerprint, the normalized
+renderer configuration, the renderer class and the save parameters
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Any, Optional, Union
+
+import numpy as np
+from matplotlib.colors import Colormap
+
+from ..core.profiling import record_cache
+from .resources import ResourceManager, get_resource_manager
+
+
+# 不影响渲染结果的配置键 | Configuration keys that do not affect the rendered output
+CACHE_NEUTRAL_KEYS = frozenset({'use_figure_pool', 'use_contour_cache', 'use_render_cache'})
+
+
+def _json_default(value: Any) -> Any:
+    """
+    按内容序列化NumPy类型和颜色映射等非JSON值 | Serialize non-JSON values such as NumPy types and colormaps by content
+
+    Raises:
+        TypeError: 值无法按内容寻址时 | If the value cannot be addressed by content
+    """
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, Colormap):
+        # 名称加查找表与越界/无效颜色的摘要 | Name plus a digest of the lookup table and under/over/bad colors
+        lut = np.vstack((value(np.linspace(0.0, 1.0, value.N)), value.get_under(), value.get_over(), value.get_bad()))
+        return {'colormap': value.name, 'lut': hashlib.blake2b(lut.tobytes(), digest_size=16).hexdigest()}
+    raise TypeError(f"Cannot build a content-addressed cache key for {type(value).__name__}")
+
+
+class RenderCache:
+    """
+    内存LRU加可选磁盘的渲染结果缓存 | Render result cache with an in-memory LRU and optional disk tier
+
+    Attributes:
+        max_bytes: 内存中缓存的最大字节数 | Maximum bytes held in memory
+        cache_dir: 磁盘缓存目录（可选） | Disk cache directory (optional)
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024, cache_dir: Optional[Union[str, Path]] = None,
+                 resource_manager: Optional[ResourceManager] = None):
+        """
+        初始化渲染缓存 | Initialize render cache
+
+        Args:
+            max_bytes: 内存中缓存的最大字节数 | Maximum bytes held in memory
+            cache_dir: 磁盘缓存目录（可选） | Disk cache directory (optional)
+            resource_manager: 共享内存预算的资源管理器（默认全局管理器） | Resource manager sharing the memory budget (global manager by default)
+        """
+        if max_bytes < 0:
+            raise ValueError("max_bytes must be >= 0")
+
+        self.max_bytes = max_bytes
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        if self.cache_dir is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        self._entries: "OrderedDict[str, bytes]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'disk_hits': 0, 'misses': 0, 'evictions': 0}
+        self._resources = (resource_manager or get_resource_manager()).register('render', self._evict)
+
+    @staticmethod
+    def normalize_config(config: Dict[str, Any]) -> str:
+        """
+        规范化渲染器配置 | Normalize renderer configuration
+
+        Args:
+            config: 渲染器配置 | Renderer configuration
+
+        Returns:
+            键有序的JSON字符串 | JSON string with sorted keys
+
+        Raises:
+            TypeError: 配置包含无法按内容寻址的值时 | If the configuration holds a value that cannot be addressed by content
+        """
+        relevant = {key: value for key, value in config.items() if key not in CACHE_NEUTRAL_KEYS}
+        return json.dumps(relevant, sort_keys=True, default=_json_default)
+
+    def make_render_key(self, renderer: Any, data: Any) -> str:
+        """
+        构建渲染键（数据指纹 + 配置 + 渲染器类） | Build render key (data fingerprint + config + renderer class)
+
+        Args:
+            renderer: 渲染器实例 | Renderer instance
+            data: MountainData实例 | MountainData instance
+
+        Returns:
+            渲染键 | Render key
+
+        Raises:
+            TypeError: 配置包含无法按内容寻址的值时 | If the configuration holds a value that cannot be addressed by content
+        """
+        cls = type(renderer)
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(f"{cls.__module__}.{cls.__qualname__}".encode())
+        digest.update(data.fingerprint().encode())
+        digest.update(self.normalize_config(renderer.config).encode())
+        return digest.hexdigest()
+
+    @staticmethod
+    def make_key(render_key: str, save_params: Dict[str, Any]) -> str:
+        """
+        由渲染键和保存参数构建缓存键 | Build cache key from render key and save parameters
+
+        Args:
+            render_key: 渲染键 | Render key
+            save_params: 保存参数（包括format） | Save parameters (including format)
+
+        Returns:
+            缓存键 | Cache key
+
+        Raises:
+            TypeError: 保存参数包含无法按内容寻址的值时 | If the save parameters hold a value that cannot be addressed by content
+        """
+        params = json.dumps(save_params, sort_keys=True, default=_json_default)
+        save_key = hashlib.blake2b(params.encode(), digest_size=8).hexdigest()
+        return f"{render_key}_{save_key}"
+
+    def _path_for(self, key: str) -> Path:
+        """获取磁盘缓存路径 | Get disk cache path"""
+        return self.cache_dir / key[:2] / f"{key}.bin"
+
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        读取缓存的图像字节 | Read cached image bytes
+
+        Args:
+            key: 缓存键 | Cache key
+
+        Returns:
+            图像字节或None | Image bytes or None
+        """
+        with self._lock:
+            blob = self._entries.get(key)
+            if blob is not None:
+                self._entries.move_to_end(key)
+                self._stats['hits'] += 1
+        if blob is not None:
+            self._resources.touch(key)
+            record_cache('render', True)
+            return blob
+
+        if self.cache_dir is not None:
+            try:
+                with open(self._path_for(key), 'rb') as f:
+                    blob = f.read()
+            except FileNotFoundError:
+                blob = None
+            if blob is not None:
+                with self._lock:
+                    self._stats['disk_hits'] += 1
+                self._store(key, blob)
+                record_cache('render', True)
+                return blob
+
+        with self._lock:
+            self._stats['misses'] += 1
+        record_cache('render', False)
+        return None
+
+    def put(self, key: str, blob: bytes, cost: float = 1.0) -> None:
+        """
+        写入图像字节 | Store image bytes
+
+        Args:
+            key: 缓存键 | Cache key
+            blob: 编码后的图像字节 | Encoded image bytes
+            cost: 重新渲染的代价（如秒数），供代价感知淘汰使用 | Cost of re-rendering (e.g. seconds), used by cost-aware eviction
+        """
+        self._store(key, blob, cost)
+
+        if self.cache_dir is not None:
+            path = self._path_for(key)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix='.tmp-')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(blob)
+                os.replace(tmp_path, path)
+            except BaseException:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+                raise
+
+    def _store(self, key: str, blob: bytes, cost: float = 1.0) -> None:
+        """写入内存LRU并按字节数淘汰 | Store in the memory LRU and evict by byte size"""
+        if len(blob) > self.max_bytes:
+            return
+
+        evicted_keys = []
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= len(previous)
+            self._entries[key] = blob
+            self._size += len(blob)
+
+            while self._size > self.max_bytes:
+                evicted_key, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+                self._stats['evictions'] += 1
+                evicted_keys.append(evicted_key)
+
+        for evicted_key in evicted_keys:
+            self._resources.untrack(evicted_key)
+        self._resources.track(key, len(blob), cost=cost)
+
+    def _evict(self, key: str) -> None:
+        """资源管理器的淘汰回调（磁盘文件保留） | Eviction callback of the resource manager (disk files are kept)"""
+        with self._lock:
+            blob = self._entries.pop(key, None)
+            if blob is not None:
+                self._size -= len(blob)
+                self._stats['evictions'] += 1
+
+    def clear(self, disk: bool = False) -> None:
+        """
+        清空缓存 | Clear cache
+
+        Args:
+            disk: 是否同时删除磁盘缓存文件 | Whether to also delete disk cache files
+        """
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+        self._resources.clear()
+
+        if disk and self.cache_dir is not None:
+            for path in self.cache_dir.glob('*/*.bin'):
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        获取缓存统计信息 | Get cache statistics
+
+        Returns:
+            包含命中、磁盘命中、未命中、淘汰次数、条目数和字节数的字典 |
+            Dictionary with hits, disk hits, misses, evictions, entry count and byte size
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats['entries'] = len(self._entries)
+            stats['bytes'] = self._size
+        requests = stats['hits'] + stats['disk_hits'] + stats['misses']
+        stats['hit_rate'] = (stats['hits'] + stats['disk_hits']) / requests if requests else 0.0
+        return stats
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            if key in self._entries:
+                return True
+        return self.cache_dir is not None and self._path_for(key).exists()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def __str__(self) -> str:
+        return f"RenderCache(entries={len(self)}, max_bytes={self.max_bytes}, cache_dir={self.cache_dir})"
+
+    def __repr__(self) -> str:
+        return self.__str__()
+
+
+# 默认全局渲染缓存 | Default global render cache
+_default_cache: Optional[RenderCache] = None
+
+
+def get_default_render_cache() -> RenderCache:
+    """
+    获取默认全局渲染缓存 | Get the default global render cache
+
+    Returns:
+        RenderCache实例 | RenderCache instance
+    """
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = RenderCache()
+    return _default_cache
@@ -0,0 +1,344 @@
+"""
+PyMountain资源管理模块 | PyMountain resource management module
+
+为各个内存缓存提供共享的字节预算：已注册的缓存报告条目大小，超出预算时由管理器跨缓存按LRU或
+代价感知（GreedyDual-Size）策略选择淘汰对象 |
+Provides a shared byte budget for the in-memory caches: registered caches report entry sizes and,
+when the budget is exceeded, the manager picks victims across caches by LRU or a cost-aware
+(GreedyDual-Size) policy
+"""
+
+import heapq
+import itertools
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Callable, Hashable, List, Tuple
+
+
+# 支持的淘汰策略 | Supported eviction policies
+EVICTION_POLICIES = ('lru', 'cost')
+
+
+class _Entry:
+    """被跟踪的缓存条目 | Tracked cache entry"""
+
+    __slots__ = ('name', 'key', 'nbytes', 'cost', 'priority', 'version')
+
+    def __init__(self, name: str, key: Hashable, nbytes: int, cost: float):
+        self.name = name
+        self.key = key
+        self.nbytes = nbytes
+        self.cost = cost
+        self.priority = 0.0
+        self.version = 0
+
+
+class ResourceHandle:
+    """
+    缓存在资源管理器中的注册句柄 | Registration handle of a cache in the resource manager
+
+    缓存在插入、命中和自行移除条目时分别调用track()、touch()和untrack()。调用时不应持有缓存自身的锁，
+    因为track()可能同步触发淘汰回调 |
+    Caches call track(), touch() and untrack() when inserting, hitting and removing entries
+    themselves. Calls should be made without holding the cache's own lock, since track() may
+    invoke eviction callbacks synchronously
+
+    Attributes:
+        name: 缓存名称 | Cache name
+    """
+
+    def __init__(self, manager: 'ResourceManager', name: str, evict: Callable[[Hashable], None]):
+        self.name = name
+        self._manager = manager
+        # 弱引用绑定方法，避免管理器使缓存常驻 | Weakly reference bound methods so the manager does not keep caches alive
+        self._evict = weakref.WeakMethod(evict) if hasattr(evict, '__self__') else (lambda: evict)
+
+    def track(self, key: Hashable, nbytes: int, cost: float = 1.0) -> None:
+        """
+        记录新条目（或更新已有条目） | Record a new entry (or update an existing one)
+
+        Args:
+            key: 条目键 | Entry key
+            nbytes: 条目占用的字节数 | Bytes held by the entry
+            cost: 重新计算该条目的代价（如秒数） | Cost of recomputing the entry (e.g. seconds)
+        """
+        self._manager._track(self, key, nbytes, cost)
+
+    def touch(self, key: Hashable) -> None:
+        """记录一次命中 | Record a hit"""
+        self._manager._touch(self, key)
+
+    def untrack(self, key: Hashable) -> None:
+        """缓存自行移除条目后调用 | Call after the cache removed an entry itself"""
+        self._manager._untrack(self, key)
+
+    def clear(self) -> None:
+        """缓存清空后调用 | Call after the cache was cleared"""
+        self._manager._untrack_all(self)
+
+    def _call_evict(self, key: Hashable) -> None:
+        """调用缓存的淘汰回调 | Invoke the cache's eviction callback"""
+        evict = self._evict()
+        if evict is not None:
+            evict(key)
+
+    def __str__(self) -> str:
+        return f"ResourceHandle(name={self.name!r})"
+
+    def __repr__(self) -> str:
+        return self.__str__()
+
+
+class ResourceManager:
+    """
+    跨缓存的内存预算管理器 | Cross-cache memory budget manager
+
+    'lru'策略淘汰全局最久未使用的条目；'cost'策略使用GreedyDual-Size，优先淘汰每字节重算代价最低的条目，
+    并通过膨胀值L让长期未命中的条目逐渐老化 |
+    The 'lru' policy evicts the globally least recently used entry; the 'cost' policy uses
+    GreedyDual-Size, evicting the entry with the lowest recompute cost per byte first, with the
+    inflation value L ageing entries that are no longer hit
+
+    Attributes:
+        budget_bytes: 字节预算（None表示不限制） | Byte budget (None for unlimited)
+        policy: 淘汰策略 | Eviction policy
+    """
+
+    def __init__(self, budget_bytes: Optional[int] = None, policy: str = 'lru'):
+        """
+        初始化资源管理器 | Initialize resource manager
+
+        Args:
+            budget_bytes: 字节预算（None表示不限制） | Byte budget (None for unlimited)
+            policy: 淘汰策略（'lru'或'cost'） | Eviction policy ('lru' or 'cost')
+        """
+        self._lock = threading.RLock()
+        self._entries: "OrderedDict[Tuple[int, Hashable], _Entry]" = OrderedDict()
+        self._heap: List[Tuple[float, int, int, Tuple[int, Hashable]]] = []
+        self._counter = itertools.count()
+        self._inflation = 0.0
+        self._usage = 0
+        self._handles: "weakref.WeakValueDictionary[int, ResourceHandle]" = weakref.WeakValueDictionary()
+        self._evictions: Dict[str, int] = {}
+        self._evicted_bytes = 0
+        self.budget_bytes = None
+        self.policy = 'lru'
+        self.set_budget(budget_bytes, policy)
+
+    def set_budget(self, budget_bytes: Optional[int], policy: Optional[str] = None) -> None:
+        """
+        设置字节预算和淘汰策略，并立即执行预算 | Set the byte budget and eviction policy, enforcing it immediately
+
+        Args:
+            budget_bytes: 字节预算（None表示不限制） | Byte budget (None for unlimited)
+            policy: 淘汰策略（None保持不变） | Eviction policy (None keeps the current one)
+        """
+        if budget_bytes is not None and budget_bytes < 0:
+            raise ValueError("budget_bytes must be >= 0 or None")
+        if policy is not None and policy not in EVICTION_POLICIES:
+            raise ValueError(f"policy must be one of {EVICTION_POLICIES}")
+
+        with self._lock:
+            self.budget_bytes = budget_bytes
+            if policy is not None and policy != self.policy:
+                self.policy = policy
+                self._rebuild_heap()
+        self.enforce()
+
+    def register(self, name: str, evict: Callable[[Hashable], None]) -> ResourceHandle:
+        """
+        注册一个缓存 | Register a cache
+
+        Args:
+            name: 缓存名称（用于统计，可重复） | Cache name (used for statistics, may repeat)
+            evict: 淘汰回调，接收条目键并从缓存中移除该条目 | Eviction callback taking an entry key and removing it from the cache
+
+        Returns:
+            ResourceHandle实例 | ResourceHandle instance
+        """
+        handle = ResourceHandle(self, name, evict)
+        with self._lock:
+            self._handles[id(handle)] = handle
+            self._evictions.setdefault(name, 0)
+        weakref.finalize(handle, self._drop_handle, id(handle))
+        return handle
+
+    def unregister(self, handle: ResourceHandle) -> None:
+        """
+        注销缓存并停止跟踪其条目 | Unregister a cache and stop tracking its entries
+
+        Args:
+            handle: register()返回的句柄 | Handle returned by register()
+        """
+        self._untrack_all(handle)
+        with self._lock:
+            self._handles.pop(id(handle), None)
+
+    def _drop_handle(self, handle_id: int) -> None:
+        """句柄被回收时移除其条目 | Drop the entries of a garbage-collected handle"""
+        with self._lock:
+            for ident in [ident for ident in self._entries if ident[0] == handle_id]:
+                self._usage -= self._entries.pop(ident).nbytes
+
+    def _priority(self, entry: _Entry) -> float:
+        """GreedyDual-Size优先级 | GreedyDual-Size priority"""
+        return self._inflation + entry.cost / max(entry.nbytes, 1)
+
+    def _push(self, ident: Tuple[int, Hashable], entry: _Entry) -> None:
+        """更新条目优先级并压入堆（旧记录延迟失效） | Update entry priority and push it (stale records are invalidated lazily)"""
+        entry.priority = self._priority(entry)
+        entry.version += 1
+        heapq.heappush(self._heap, (entry.priority, next(self._counter), entry.version, ident))
+        # 失效记录过多时压缩堆 | Compact the heap when stale records pile up
+        if len(self._heap) > 2 * len(self._entries) + 64:
+            self._rebuild_heap()
+
+    def _rebuild_heap(self) -> None:
+        """重建优先级堆 | Rebuild the priority heap"""
+        self._heap = []
+        if self.policy == 'cost':
+            for ident, entry in self._entries.items():
+                self._push(ident, entry)
+
+    def _track(self, handle: ResourceHandle, key: Hashable, nbytes: int, cost: float) -> None:
+        """记录条目并执行预算 | Record an entry and enforce the budget"""
+        ident = (id(handle), key)
+        nbytes = int(nbytes)
+        with self._lock:
+            entry = self._entries.pop(ident, None)
+            if entry is not None:
+                self._usage -= entry.nbytes
+                entry.nbytes, entry.cost = nbytes, float(cost)
+            else:
+                entry = _Entry(handle.name, key, nbytes, float(cost))
+            self._entries[ident] = entry
+            self._usage += nbytes
+            if self.policy == 'cost':
+                self._push(ident, entry)
+        self.enforce()
+
+    def _touch(self, handle: ResourceHandle, key: Hashable) -> None:
+        """记录命中 | Record a hit"""
+        ident = (id(handle), key)
+        with self._lock:
+            entry = self._entries.get(ident)
+            if entry is None:
+                return
+            self._entries.move_to_end(ident)
+            if self.policy == 'cost':
+                self._push(ident, entry)
+
+    def _untrack(self, handle: ResourceHandle, key: Hashable) -> None:
+        """停止跟踪条目 | Stop tracking an entry"""
+        with self._lock:
+            entry = self._entries.pop((id(handle), key), None)
+            if entry is not None:
+                self._usage -= entry.nbytes
+
+    def _untrack_all(self, handle: ResourceHandle) -> None:
+        """停止跟踪缓存的所有条目 | Stop tracking all entries of a cache"""
+        self._drop_handle(id(handle))
+
+    def _pop_victim(self) -> Optional[Tuple[Tuple[int, Hashable], _Entry]]:
+        """按策略取出下一个淘汰对象 | Take the next victim according to the policy"""
+        if self.policy == 'lru':
+            if not self._entries:
+                return None
+            return self._entries.popitem(last=False)
+
+        while self._heap:
+            priority, _, version, ident = heapq.heappop(self._heap)
+            entry = self._entries.get(ident)
+            if entry is None or entry.version != version:
+                continue
+            del self._entries[ident]
+            # 膨胀值随淘汰对象的优先级上升 | Inflation rises to the victim's priority
+            self._inflation = priority
+            return ident, entry
+        return None
+
+    def enforce(self) -> int:
+        """
+        淘汰条目直到用量不超过预算 | Evict entries until usage is within budget
+
+        淘汰回调在管理器锁之外调用 | Eviction callbacks are invoked outside the manager lock
+
+        Returns:
+            淘汰的条目数 | Number of evicted entries
+        """
+        victims: List[Tuple[Optional[ResourceHandle], Hashable]] = []
+        with self._lock:
+            if self.budget_bytes is None:
+                return 0
+            while self._usage > self.budget_bytes:
+                victim = self._pop_victim()
+                if victim is None:
+                    break
+                ident, entry = victim
+                self._usage -= entry.nbytes
+                self._evicted_bytes += entry.nbytes
+                self._evictions[entry.name] = self._evictions.get(entry.name, 0) + 1
+                victims.append((self._handles.get(ident[0]), entry.key))
+
+        for handle, key in victims:
+            if handle is not None:
+                handle._call_evict(key)
+        return len(victims)
+
+    def get_usage(self) -> Dict[str, Any]:
+        """
+        获取当前用量 | Get current usage
+
+        Returns:
+            包含总字节数、预算和按缓存名称汇总的字节数与条目数的字典 |
+            Dictionary with total bytes, the budget and per-cache-name bytes and entry counts
+        """
+        with self._lock:
+            caches: Dict[str, Dict[str, int]] = {}
+            for entry in self._entries.values():
+                usage = caches.setdefault(entry.name, {'bytes': 0, 'entries': 0})
+                usage['bytes'] += entry.nbytes
+                usage['entries'] += 1
+            return {'bytes': self._usage, 'budget_bytes': self.budget_bytes, 'caches': caches}
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        获取管理器统计信息 | Get manager statistics
+
+        Returns:
+            包含用量、策略和按缓存名称统计的淘汰次数的字典 | Dictionary with usage, policy and eviction counts per cache name
+        """
+        stats = self.get_usage()
+        with self._lock:
+            stats['policy'] = self.policy
+            stats['evictions'] = dict(self._evictions)
+            stats['total_evictions'] = sum(self._evictions.values())
+            stats['evicted_bytes'] = self._evicted_bytes
+            stats['registered'] = len(self._handles)
+        return stats
+
+    def __str__(self) -> str:
+        return f"ResourceManager(budget_bytes={self.budget_bytes}, policy={self.policy!r}, bytes={self._usage})"
+
+    def __repr__(self) -> str:
+        return self.__str__()
+
+
+# 默认全局资源管理器（默认不限制预算） | Default global resource manager (unlimited by default)
+_default_manager: Optional[ResourceManager] = None
+_default_manager_lock = threading.Lock()
+
+
+def get_resource_manager() -> ResourceManager:
+    """
+    获取默认全局资源管理器 | Get the default global resource manager
+
+    Returns:
+        ResourceManager实例 | ResourceManager instance
+    """
+    global _default_manager
+    with _default_manager_lock:
+        if _default_manager is None:
+            _default_manager = ResourceManager()
+        return _default_manager
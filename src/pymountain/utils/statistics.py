@@ -0,0 +1,374 @@
+"""
+PyMountain流式统计模块 | PyMountain streaming statistics module
+
+提供可分块输入、可合并的直方图草图，用于在无法一次载入内存的超大网格上近似计算分位数和直方图 |
+Provides a mergeable histogram sketch fed chunk by chunk, for approximate quantiles and
+histograms over grids too large to hold in memory at once
+"""
+
+import math
+from typing import Dict, Any, Optional, Tuple, Union, Iterable
+
+import numpy as np
+
+
+# 每次处理的元素数，限制临时数组大小 | Elements processed per step, bounding temporary arrays
+_CHUNK_SIZE = 1 << 20
+
+
+class StreamingHistogram:
+    """
+    可合并的流式直方图 | Mergeable streaming histogram
+
+    箱宽始终为2的整数次幂，箱边界对齐到箱宽的整数倍，因此任意两个草图都可以通过把较细的
+    草图按2的倍数合并箱来精确合并。值域扩大时箱宽加倍，箱数不超过max_bins。分位数误差不超过
+    一个箱宽（见error_bound()），计数、最值、均值和标准差是精确的 |
+    Bin widths are always powers of two and bin edges are aligned to multiples of the width,
+    so any two sketches merge exactly by coarsening the finer one by powers of two. The width
+    doubles as the value range grows, keeping at most max_bins bins. Quantile error is at most
+    one bin width (see error_bound()); count, extremes, mean and standard deviation are exact
+
+    Attributes:
+        max_bins: 最大箱数 | Maximum number of bins
+        count: 有限值数量 | Number of finite values
+        nan_count: 非有限值数量 | Number of non-finite values
+    """
+
+    def __init__(self, max_bins: int = 4096):
+        """
+        初始化流式直方图 | Initialize streaming histogram
+
+        Args:
+            max_bins: 最大箱数 | Maximum number of bins
+        """
+        if max_bins < 2:
+            raise ValueError("max_bins must be >= 2")
+
+        self.max_bins = int(max_bins)
+        self.count = 0
+        self.nan_count = 0
+        self._exponent: Optional[int] = None   # 箱宽为2**exponent | Bin width is 2**exponent
+        self._offset = 0                        # 第一个箱的索引 | Index of the first bin
+        self._counts = np.zeros(0, dtype=np.int64)
+        self._min = math.inf
+        self._max = -math.inf
+        self._mean = 0.0
+        self._m2 = 0.0
+
+    @property
+    def bin_width(self) -> Optional[float]:
+        """当前箱宽 | Current bin width"""
+        return None if self._exponent is None else math.ldexp(1.0, self._exponent)
+
+    @property
+    def min(self) -> float:
+        """最小值 | Minimum value"""
+        return self._min if self.count else math.nan
+
+    @property
+    def max(self) -> float:
+        """最大值 | Maximum value"""
+        return self._max if self.count else math.nan
+
+    @property
+    def mean(self) -> float:
+        """均值 | Mean"""
+        return self._mean if self.count else math.nan
+
+    @property
+    def std(self) -> float:
+        """总体标准差 | Population standard deviation"""
+        return math.sqrt(self._m2 / self.count) if self.count else math.nan
+
+    def error_bound(self) -> float:
+        """
+        分位数的最大绝对误差 | Maximum absolute quantile error
+
+        Returns:
+            当前箱宽（无数据时为0） | Current bin width (0 when empty)
+        """
+        return self.bin_width or 0.0
+
+    def update(self, values: Union[np.ndarray, Iterable[float]]) -> "StreamingHistogram":
+        """
+        加入一批数值，非有限值单独计数 | Add a batch of values; non-finite values are counted separately
+
+        大数组（包括内存映射数组）按块处理，不会整体复制；GridData的无数据单元格计入nan_count |
+        Large arrays (including memory-mapped arrays) are processed in chunks without a full copy;
+        missing cells of GridData are counted in nan_count
+
+        Args:
+            values: 数值数组或GridData | Value array or GridData
+
+        Returns:
+            self
+        """
+        from ..core.grid import GridData
+
+        if isinstance(values, GridData):
+            for block, valid in values.iter_row_blocks():
+                chunk = np.asarray(block[valid], dtype=np.float64)
+                self.nan_count += valid.size - chunk.size
+                if chunk.size:
+                    self._add_chunk(chunk)
+            return self
+
+        flat = np.asarray(values).reshape(-1)
+        for start in range(0, flat.size, _CHUNK_SIZE):
+            chunk = np.asarray(flat[start:start + _CHUNK_SIZE], dtype=np.float64)
+            finite = np.isfinite(chunk)
+            n_finite = int(np.count_nonzero(finite))
+            self.nan_count += chunk.size - n_finite
+            if n_finite == 0:
+                continue
+            if n_finite != chunk.size:
+                chunk = chunk[finite]
+            self._add_chunk(chunk)
+        return self
+
+    def _add_chunk(self, chunk: np.ndarray) -> None:
+        """加入一块有限值 | Add a chunk of finite values"""
+        lo, hi = float(chunk.min()), float(chunk.max())
+        self._ensure_range(min(lo, self._min), max(hi, self._max))
+
+        width = self.bin_width
+        index = np.floor(chunk / width).astype(np.int64) - self._offset
+        self._counts += np.bincount(index, minlength=self._counts.size)[:self._counts.size]
+
+        # 合并矩（Chan等人的并行算法） | Combine moments (Chan et al. parallel algorithm)
+        n = chunk.size
+        mean = float(chunk.mean())
+        m2 = float(np.square(chunk - mean).sum())
+        self._combine_moments(n, mean, m2, lo, hi)
+
+    def _combine_moments(self, n: int, mean: float, m2: float, lo: float, hi: float) -> None:
+        """合并计数、均值、二阶矩和最值 | Combine count, mean, second moment and extremes"""
+        total = self.count + n
+        delta = mean - self._mean
+        self._mean += delta * n / total
+        self._m2 += m2 + delta * delta * self.count * n / total
+        self.count = total
+        self._min = min(self._min, lo)
+        self._max = max(self._max, hi)
+
+    def _bins_needed(self, lo: float, hi: float, exponent: int) -> Tuple[int, int]:
+        """给定箱宽下覆盖[lo, hi]所需的起始索引和箱数 | First index and bin count covering [lo, hi] at a given width"""
+        width = math.ldexp(1.0, exponent)
+        first = math.floor(lo / width)
+        return first, math.floor(hi / width) - first + 1
+
+    def _ensure_range(self, lo: float, hi: float) -> None:
+        """必要时加倍箱宽以覆盖[lo, hi] | Double the bin width as needed to cover [lo, hi]"""
+        if self._exponent is None:
+            span = hi - lo
+            if span <= 0:
+                span = max(abs(lo), 1.0) * 2.0 ** -20
+            exponent = math.ceil(math.log2(span / (self.max_bins - 1)))
+        else:
+            exponent = self._exponent
+
+        first, n_bins = self._bins_needed(lo, hi, exponent)
+        while n_bins > self.max_bins:
+            exponent += 1
+            first, n_bins = self._bins_needed(lo, hi, exponent)
+
+        if self._exponent is None:
+            self._exponent = exponent
+            self._offset = first
+            self._counts = np.zeros(n_bins, dtype=np.int64)
+            return
+
+        self._coarsen(exponent)
+        # 向两侧扩展箱数组 | Extend the bin array on either side
+        if first < self._offset or first + n_bins > self._offset + self._counts.size:
+            counts = np.zeros(n_bins, dtype=np.int64)
+            shift = self._offset - first
+            counts[shift:shift + self._counts.size] = self._counts
+            self._counts = counts
+            self._offset = first
+
+    def _coarsen(self, exponent: int) -> None:
+        """将箱宽提高到2**exponent | Raise the bin width to 2**exponent"""
+        if exponent <= self._exponent:
+            return
+        factor = 1 << (exponent - self._exponent)
+        first = self._offset // factor
+        index = (np.arange(self._counts.size, dtype=np.int64) + self._offset) // factor - first
+        self._counts = np.bincount(index, weights=self._counts).astype(np.int64)
+        self._offset = first
+        self._exponent = exponent
+
+    def merge(self, other: "StreamingHistogram") -> "StreamingHistogram":
+        """
+        合并另一个草图（例如来自其他分块或工作进程） | Merge another sketch (e.g. from another tile or worker)
+
+        Args:
+            other: 另一个StreamingHistogram | Another StreamingHistogram
+
+        Returns:
+            self
+        """
+        self.nan_count += other.nan_count
+        if other.count == 0:
+            return self
+
+        if self.count == 0:
+            nan_count = self.nan_count
+            self.__dict__.update(other.copy().__dict__)
+            self.nan_count = nan_count
+            return self
+
+        other = other.copy()
+        exponent = max(self._exponent, other._exponent)
+        self._coarsen(exponent)
+        other._coarsen(exponent)
+        self._ensure_range(min(self._min, other._min), max(self._max, other._max))
+        other._coarsen(self._exponent)
+
+        shift = other._offset - self._offset
+        self._counts[shift:shift + other._counts.size] += other._counts
+        self._combine_moments(other.count, other._mean, other._m2, other._min, other._max)
+        return self
+
+    def copy(self) -> "StreamingHistogram":
+        """创建副本 | Create a copy"""
+        new = StreamingHistogram(self.max_bins)
+        new.__dict__.update(self.__dict__)
+        new._counts = self._counts.copy()
+        return new
+
+    def quantile(self, q: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+        """
+        近似分位数 | Approximate quantile
+
+        Args:
+            q: [0, 1]内的分位数（标量或数组） | Quantile(s) in [0, 1] (scalar or array)
+
+        Returns:
+            分位数值，误差不超过error_bound() | Quantile value(s), within error_bound()
+        """
+        q_array = np.asarray(q, dtype=np.float64)
+        if np.any((q_array < 0) | (q_array > 1)):
+            raise ValueError("Quantiles must be in the range [0, 1]")
+        if self.count == 0:
+            result = np.full(q_array.shape, np.nan)
+            return float(result) if result.ndim == 0 else result
+
+        cumulative = np.cumsum(self._counts)
+        target = q_array * self.count
+        bin_index = np.clip(np.searchsorted(cumulative, target, side='left'), 0, self._counts.size - 1)
+        before = cumulative[bin_index] - self._counts[bin_index]
+        in_bin = np.maximum(self._counts[bin_index], 1)
+        fraction = np.clip((target - before) / in_bin, 0.0, 1.0)
+
+        width = self.bin_width
+        result = (self._offset + bin_index + fraction) * width
+        result = np.clip(result, self._min, self._max)
+        result = np.where(q_array == 0, self._min, np.where(q_array == 1, self._max, result))
+        return float(result) if result.ndim == 0 else result
+
+    def percentile(self, p: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+        """
+        近似百分位数（与np.percentile的参数约定一致） | Approximate percentile (same convention as np.percentile)
+
+        Args:
+            p: [0, 100]内的百分位数 | Percentile(s) in [0, 100]
+
+        Returns:
+            百分位数值 | Percentile value(s)
+        """
+        return self.quantile(np.asarray(p, dtype=np.float64) / 100.0)
+
+    def histogram(self, bins: int = 50,
+                  range: Optional[Tuple[float, float]] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        近似直方图（与np.histogram的返回约定一致） | Approximate histogram (same return convention as np.histogram)
+
+        每个内部箱按中心值归入输出箱 | Each internal bin is assigned to an output bin by its centre
+
+        Args:
+            bins: 输出箱数 | Number of output bins
+            range: 值域（默认为[min, max]） | Value range (defaults to [min, max])
+
+        Returns:
+            (counts, bin_edges)元组 | (counts, bin_edges) tuple
+        """
+        if range is None:
+            range = (self.min, self.max) if self.count else (0.0, 1.0)
+        if self.count == 0:
+            return np.histogram([], bins=bins, range=range)
+
+        centres = (self._offset + np.arange(self._counts.size) + 0.5) * self.bin_width
+        centres = np.clip(centres, self._min, self._max)
+        counts, edges = np.histogram(centres, bins=bins, range=range, weights=self._counts)
+        return counts.astype(np.int64), edges
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        转换为可JSON序列化的字典 | Convert to a JSON-serializable dictionary
+
+        Returns:
+            草图字典 | Sketch dictionary
+        """
+        return {
+            'max_bins': self.max_bins,
+            'count': self.count,
+            'nan_count': self.nan_count,
+            'exponent': self._exponent,
+            'offset': self._offset,
+            'counts': self._counts.tolist(),
+            'min': self._min if self.count else None,
+            'max': self._max if self.count else None,
+            'mean': self._mean,
+            'm2': self._m2,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "StreamingHistogram":
+        """
+        从字典恢复草图 | Restore a sketch from a dictionary
+
+        Args:
+            data: to_dict()的结果 | Result of to_dict()
+
+        Returns:
+            StreamingHistogram实例 | StreamingHistogram instance
+        """
+        sketch = cls(data['max_bins'])
+        sketch.count = data['count']
+        sketch.nan_count = data['nan_count']
+        sketch._exponent = data['exponent']
+        sketch._offset = data['offset']
+        sketch._counts = np.asarray(data['counts'], dtype=np.int64)
+        sketch._min = math.inf if data['min'] is None else data['min']
+        sketch._max = -math.inf if data['max'] is None else data['max']
+        sketch._mean = data['mean']
+        sketch._m2 = data['m2']
+        return sketch
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __str__(self) -> str:
+        return (f"StreamingHistogram(count={self.count}, range=({self.min}, {self.max}), "
+                f"bin_width={self.bin_width})")
+
+    def __repr__(self) -> str:
+        return self.__str__()
+
+
+def streaming_histogram(chunks: Iterable[np.ndarray], max_bins: int = 4096) -> StreamingHistogram:
+    """
+    由数据块序列构建流式直方图 | Build a streaming histogram from a sequence of chunks
+
+    Args:
+        chunks: 数据块（例如瓦片或内存映射网格的行块） | Chunks (e.g. tiles or row blocks of a memory-mapped grid)
+        max_bins: 最大箱数 | Maximum number of bins
+
+    Returns:
+        StreamingHistogram实例 | StreamingHistogram instance
+    """
+    sketch = StreamingHistogram(max_bins)
+    for chunk in chunks:
+        sketch.update(chunk)
+    return sketch
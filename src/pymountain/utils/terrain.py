@@ -0,0 +1,545 @@
+"""
+PyMountain合成地形模块 | PyMountain synthetic terrain module
+
+用向量化的分形算法生成任意规模的确定性地形，用于基准测试和长时间压力测试而无需附带数据：
+
+- 'fbm'：基于哈希梯度噪声（Perlin噪声）的分形布朗运动
+- 'ridged'：Musgrave脊状多重分形，产生尖锐山脊
+- 'diamond_square'：菱形-正方形中点位移
+- 'spectral'：频域1/f^beta滤波的白噪声
+
+'fbm'和'ridged'可在任意坐标上逐点求值，结果与分块方式无关，因此支持分块写入内存映射文件和散点采样；
+'diamond_square'和'spectral'是全局算法，只能在内存中生成整个网格 |
+Generates deterministic terrain of any size with vectorized fractal algorithms, for benchmarks
+and soak tests without shipping data:
+
+- 'fbm': fractional Brownian motion of hash-based gradient (Perlin) noise
+- 'ridged': Musgrave ridged multifractal, producing sharp ridges
+- 'diamond_square': diamond-square midpoint displacement
+- 'spectral': white noise filtered by 1/f^beta in the frequency domain
+
+'fbm' and 'ridged' are evaluated point-wise at arbitrary coordinates and do not depend on how
+the work is chunked, so they support chunked output to memory-mapped files and scattered samples.
+'diamond_square' and 'spectral' are global algorithms that generate the whole grid in memory
+
+用法 | Usage:
+    >>> from pymountain.utils.terrain import generate_terrain, generate_terrain_to_file, sample_terrain
+    >>> Z = generate_terrain((1024, 1024), method='ridged', seed=7)
+    >>> Z = generate_terrain_to_file('dem.npy', (40_000, 25_000), seed=7)     # 1e9 cells, float32
+    >>> x, y, z = sample_terrain(10_000_000, seed=7)
+"""
+
+import math
+from pathlib import Path
+from typing import Iterator, Optional, Tuple, Union
+
+import numpy as np
+
+
+TERRAIN_METHODS = ('fbm', 'ridged', 'diamond_square', 'spectral')
+
+# 可逐点求值、支持分块和散点采样的方法 | Point-wise methods supporting chunking and scattered samples
+POINTWISE_METHODS = ('fbm', 'ridged')
+
+# 每个分块的元素数，限制临时数组大小 | Elements per chunk, bounding temporary arrays
+_CHUNK_SIZE = 1 << 20
+
+# 64位哈希常数（splitmix64/murmur3终结器） | 64-bit hash constants (splitmix64/murmur3 finalizer)
+_PRIME_X = np.uint64(0x9E3779B97F4A7C15)
+_PRIME_Y = np.uint64(0xC2B2AE3D27D4EB4F)
+_PRIME_SEED = np.uint64(0x165667B19E3779F9)
+_MIX_1 = np.uint64(0xFF51AFD7ED558CCD)
+_MIX_2 = np.uint64(0xC4CEB9FE1A85EC53)
+_SHIFT_33 = np.uint64(33)
+_SHIFT_GRADIENT = np.uint64(61)
+_SHIFT_UNIFORM = np.uint64(11)
+
+# 8个单位梯度方向 | Eight unit gradient directions
+_ANGLES = np.arange(8) * (np.pi / 4)
+_GRADIENT_X = np.cos(_ANGLES)
+_GRADIENT_Y = np.sin(_ANGLES)
+
+ShapeLike = Union[int, Tuple[int, int]]
+
+
+def _seed_term(seed: int) -> np.uint64:
+    """种子对哈希的贡献 | Contribution of the seed to the hash"""
+    with np.errstate(over='ignore'):
+        return np.uint64(seed & 0xFFFFFFFFFFFFFFFF) * _PRIME_SEED
+
+
+def _mix(h: np.ndarray) -> np.ndarray:
+    """
+    murmur3 64位终结器，原地混合 | murmur3 64-bit finalizer, mixing in place
+
+    uint64乘法按2**64回绕，这正是哈希所需的；0维输入会退化为NumPy标量，标量溢出会发出警告 |
+    uint64 multiplication wraps modulo 2**64, which is what the hash needs; 0-d inputs degrade to
+    NumPy scalars, whose overflow warns
+    """
+    with np.errstate(over='ignore'):
+        h ^= h >> _SHIFT_33
+        h *= _MIX_1
+        h ^= h >> _SHIFT_33
+        h *= _MIX_2
+        h ^= h >> _SHIFT_33
+    return h
+
+
+def _hash(ix: np.ndarray, iy: np.ndarray, seed: int) -> np.ndarray:
+    """整数格点坐标的64位哈希 | 64-bit hash of integer lattice coordinates"""
+    with np.errstate(over='ignore'):
+        h = ix.astype(np.uint64) * _PRIME_X
+        h ^= iy.astype(np.uint64) * _PRIME_Y
+        h ^= _seed_term(seed)
+    return _mix(h)
+
+
+def _fade(t: np.ndarray) -> np.ndarray:
+    """五次平滑曲线6t^5 - 15t^4 + 10t^3 | Quintic smoothstep 6t^5 - 15t^4 + 10t^3"""
+    return t * t * t * (t * (t * 6.0 - 15.0) + 10.0)
+
+
+def perlin_noise(x: np.ndarray, y: np.ndarray, seed: int = 0) -> np.ndarray:
+    """
+    二维梯度噪声 | Two-dimensional gradient noise
+
+    格点梯度由坐标哈希决定而不是置换表，因此没有周期且可在任意坐标上求值 |
+    Lattice gradients come from a hash of the coordinates instead of a permutation table, so the
+    noise has no period and can be evaluated at any coordinates
+
+    Args:
+        x: X坐标（格点单位） | X coordinates (lattice units)
+        y: Y坐标（格点单位） | Y coordinates (lattice units)
+        seed: 随机种子 | Random seed
+
+    Returns:
+        约在[-1, 1]内的噪声值，整数格点处为0 | Noise values roughly in [-1, 1], zero at integer lattice points
+    """
+    # 坐标保持各自的广播形状，网格的行列坐标因此只需一维运算 |
+    # Coordinates keep their own broadcast shapes, so grid row and column coordinates only need 1-D work
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    x0 = np.floor(x)
+    y0 = np.floor(y)
+    fx = x - x0
+    fy = y - y0
+
+    # (ix + 1) * P = ix * P + P (mod 2**64)
+    seed_term = _seed_term(seed)
+    with np.errstate(over='ignore'):
+        hx0 = x0.astype(np.int64).astype(np.uint64) * _PRIME_X
+        hx1 = hx0 + _PRIME_X
+        hy0 = y0.astype(np.int64).astype(np.uint64) * _PRIME_Y
+        hy1 = hy0 + _PRIME_Y
+        hy0 ^= seed_term
+        hy1 ^= seed_term
+
+    def corner(hx: np.ndarray, hy: np.ndarray, dx: int, dy: int) -> np.ndarray:
+        gradient = (_mix(hx ^ hy) >> _SHIFT_GRADIENT).astype(np.intp)
+        return _GRADIENT_X[gradient] * (fx - dx) + _GRADIENT_Y[gradient] * (fy - dy)
+
+    u = _fade(fx)
+    v = _fade(fy)
+    bottom = corner(hx0, hy0, 0, 0)
+    bottom += u * (corner(hx1, hy0, 1, 0) - bottom)
+    top = corner(hx0, hy1, 0, 1)
+    top += u * (corner(hx1, hy1, 1, 1) - top)
+    bottom += v * (top - bottom)
+    # 单位梯度时的最大幅值为sqrt(2)/2 | The maximum magnitude with unit gradients is sqrt(2)/2
+    bottom *= math.sqrt(2.0)
+    return bottom
+
+
+def fbm_noise(x: np.ndarray, y: np.ndarray, seed: int = 0, frequency: float = 4.0,
+              octaves: int = 8, lacunarity: float = 2.0, gain: float = 0.5,
+              ridged: bool = False) -> np.ndarray:
+    """
+    分形噪声：多个倍频程的梯度噪声叠加 | Fractal noise: gradient noise summed over octaves
+
+    Args:
+        x: X坐标 | X coordinates
+        y: Y坐标 | Y coordinates
+        seed: 随机种子 | Random seed
+        frequency: 基础频率（每坐标单位的特征数） | Base frequency (features per coordinate unit)
+        octaves: 倍频程数 | Number of octaves
+        lacunarity: 相邻倍频程的频率比 | Frequency ratio between octaves
+        gain: 相邻倍频程的振幅比 | Amplitude ratio between octaves
+        ridged: 是否使用Musgrave脊状多重分形 | Whether to use the Musgrave ridged multifractal
+
+    Returns:
+        [-1, 1]内的噪声值 | Noise values in [-1, 1]
+    """
+    if octaves < 1:
+        raise ValueError("octaves must be >= 1")
+    if frequency <= 0 or lacunarity <= 0 or gain <= 0:
+        raise ValueError("frequency, lacunarity and gain must be positive")
+
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    total = np.zeros(np.broadcast(x, y).shape)
+    weight = np.ones_like(total) if ridged else None
+    amplitude = 1.0
+    norm = 0.0
+
+    for octave in range(octaves):
+        # 每个倍频程使用不同种子，避免格点在原点处对齐 | Distinct seeds per octave keep lattices from aligning at the origin
+        noise = perlin_noise(x * frequency, y * frequency, seed=seed * 131 + octave)
+        if ridged:
+            # 脊线处|noise|接近0；上一倍频程的信号作为权重，使山脊上的细节多于山谷 |
+            # Ridges are where |noise| is near 0; the previous octave's signal weights the next,
+            # so ridges get more detail than valleys
+            signal = 1.0 - np.abs(noise, out=noise)
+            signal *= signal
+            signal *= weight
+            np.clip(signal * 2.0, 0.0, 1.0, out=weight)
+            total += amplitude * signal
+        else:
+            noise *= amplitude
+            total += noise
+        norm += amplitude
+        amplitude *= gain
+        frequency *= lacunarity
+
+    total /= norm
+    if ridged:
+        total *= 2.0
+        total -= 1.0
+    return np.clip(total, -1.0, 1.0, out=total)
+
+
+def diamond_square(size: int, roughness: float = 0.55, seed: int = 0,
+                   dtype: np.dtype = np.float32) -> np.ndarray:
+    """
+    菱形-正方形算法生成(2**k + 1)见方的网格 | Diamond-square grid of (2**k + 1) cells per side
+
+    每一层的菱形步和正方形步都对所有单元一次性切片完成 |
+    The diamond and square steps of each level are done for all cells at once with slicing
+
+    Args:
+        size: 每边的最小单元数，向上取整到2**k + 1 | Minimum cells per side, rounded up to 2**k + 1
+        roughness: 每层位移幅度的衰减系数（0-1，越大越崎岖） | Per-level displacement decay (0-1, larger is rougher)
+        seed: 随机种子 | Random seed
+        dtype: 输出数据类型 | Output dtype
+
+    Returns:
+        未归一化的高度网格 | Unnormalized height grid
+    """
+    if size < 2:
+        raise ValueError("size must be >= 2")
+    if not 0.0 < roughness <= 1.0:
+        raise ValueError("roughness must be in (0, 1]")
+
+    rng = np.random.default_rng(seed)
+    n = (1 << max(1, math.ceil(math.log2(size - 1)))) + 1
+    grid = np.zeros((n, n), dtype=dtype)
+    grid[::n - 1, ::n - 1] = rng.uniform(-1.0, 1.0, (2, 2))
+
+    step = n - 1
+    scale = 1.0
+    while step > 1:
+        half = step // 2
+        cells = (n - 1) // step
+
+        # 菱形步：每个正方形的中心取四角均值 | Diamond step: square centers take the mean of the four corners
+        centers = grid[half::step, half::step]
+        centers[...] = grid[:-1:step, :-1:step]
+        centers += grid[:-1:step, step::step]
+        centers += grid[step::step, :-1:step]
+        centers += grid[step::step, step::step]
+        centers *= 0.25
+        centers += rng.uniform(-scale, scale, (cells, cells)).astype(dtype)
+
+        # 正方形步：边中点取相邻角点和中心的均值，边界上只有三个邻居 |
+        # Square step: edge midpoints take the mean of the adjacent corners and centers; border points have three neighbors
+        for axis in (0, 1):
+            view = grid if axis == 0 else grid.T
+            center_view = centers if axis == 0 else centers.T
+            total = view[::step, :-1:step] + view[::step, step::step]
+            count = np.full(total.shape, 2.0, dtype=dtype)
+            total[1:] += center_view
+            count[1:] += 1
+            total[:-1] += center_view
+            count[:-1] += 1
+            total /= count
+            total += rng.uniform(-scale, scale, total.shape).astype(dtype)
+            view[::step, half::step] = total
+
+        step = half
+        scale *= roughness
+
+    return grid
+
+
+def spectral_terrain(shape: ShapeLike, beta: float = 3.0, seed: int = 0,
+                     dtype: np.dtype = np.float32) -> np.ndarray:
+    """
+    频域合成：功率谱按1/f^beta衰减的高斯随机场 | Spectral synthesis: Gaussian random field with 1/f^beta power spectrum
+
+    beta越大地形越平滑；自然地形约为2-4 | Larger beta gives smoother terrain; natural terrain is about 2-4
+
+    Args:
+        shape: 网格形状(rows, cols)或边长 | Grid shape (rows, cols) or side length
+        beta: 功率谱指数 | Power spectrum exponent
+        seed: 随机种子 | Random seed
+        dtype: 输出数据类型 | Output dtype
+
+    Returns:
+        未归一化的高度网格 | Unnormalized height grid
+    """
+    rows, cols = _normalize_shape(shape)
+    rng = np.random.default_rng(seed)
+
+    fy = np.fft.fftfreq(rows)[:, np.newaxis]
+    fx = np.fft.rfftfreq(cols)[np.newaxis, :]
+    radius = np.sqrt(fx * fx + fy * fy)
+    radius[0, 0] = np.inf    # 去除直流分量 | Drop the DC component
+    amplitude = radius ** (-beta / 2.0)
+
+    spectrum = rng.standard_normal(amplitude.shape) + 1j * rng.standard_normal(amplitude.shape)
+    spectrum *= amplitude
+    return np.fft.irfft2(spectrum, s=(rows, cols)).astype(dtype, copy=False)
+
+
+def generate_terrain(shape: ShapeLike, method: str = 'fbm', seed: int = 0,
+                     elevation_range: Tuple[float, float] = (0.0, 3000.0),
+                     x_bounds: Tuple[float, float] = (0.0, 1.0),
+                     y_bounds: Tuple[float, float] = (0.0, 1.0),
+                     dtype: np.dtype = np.float32, **options) -> np.ndarray:
+    """
+    生成高程网格 | Generate an elevation grid
+
+    网格第i行对应Y坐标、第j列对应X坐标，与np.meshgrid(xi, yi)一致 |
+    Row i corresponds to a Y coordinate and column j to an X coordinate, matching np.meshgrid(xi, yi)
+
+    Args:
+        shape: 网格形状(rows, cols)或边长 | Grid shape (rows, cols) or side length
+        method: 'fbm'、'ridged'、'diamond_square'或'spectral' | 'fbm', 'ridged', 'diamond_square' or 'spectral'
+        seed: 随机种子 | Random seed
+        elevation_range: 输出高程范围(min, max) | Output elevation range (min, max)
+        x_bounds: X坐标边界（仅逐点方法） | X coordinate bounds (point-wise methods only)
+        y_bounds: Y坐标边界（仅逐点方法） | Y coordinate bounds (point-wise methods only)
+        dtype: 输出数据类型 | Output dtype
+        **options: 方法参数：frequency/octaves/lacunarity/gain（fbm、ridged）、roughness（diamond_square）、
+            beta（spectral） | Method options: frequency/octaves/lacunarity/gain (fbm, ridged),
+            roughness (diamond_square), beta (spectral)
+
+    Returns:
+        形状为(rows, cols)的高程网格 | Elevation grid of shape (rows, cols)
+    """
+    _check_method(method)
+    rows, cols = _normalize_shape(shape)
+
+    if method in POINTWISE_METHODS:
+        out = np.empty((rows, cols), dtype=dtype)
+        _fill_grid(out, method, seed, elevation_range, x_bounds, y_bounds, options)
+        return out
+
+    if method == 'diamond_square':
+        grid = diamond_square(max(rows, cols), seed=seed, dtype=dtype, **options)[:rows, :cols]
+    else:
+        grid = spectral_terrain((rows, cols), seed=seed, dtype=dtype, **options)
+
+    # 全局方法按实际范围归一化 | Global methods are normalized by their actual range
+    low, high = float(grid.min()), float(grid.max())
+    span = high - low if high > low else 1.0
+    grid = np.ascontiguousarray(grid)
+    grid -= low
+    grid *= (elevation_range[1] - elevation_range[0]) / span
+    grid += elevation_range[0]
+    return grid
+
+
+def generate_terrain_to_file(path: Union[str, Path], shape: ShapeLike, method: str = 'fbm', seed: int = 0,
+                             elevation_range: Tuple[float, float] = (0.0, 3000.0),
+                             x_bounds: Tuple[float, float] = (0.0, 1.0),
+                             y_bounds: Tuple[float, float] = (0.0, 1.0),
+                             dtype: np.dtype = np.float32, chunk_size: int = _CHUNK_SIZE,
+                             **options) -> np.memmap:
+    """
+    分块生成高程网格并写入内存映射的.npy文件 | Generate an elevation grid in chunks into a memory-mapped .npy file
+
+    内存占用只取决于chunk_size，与网格大小无关；结果与generate_terrain()逐元素相同 |
+    Memory use depends only on chunk_size, not on the grid size; the result matches generate_terrain() element for element
+
+    Args:
+        path: 输出.npy文件路径 | Output .npy file path
+        shape: 网格形状(rows, cols)或边长 | Grid shape (rows, cols) or side length
+        method: 'fbm'或'ridged' | 'fbm' or 'ridged'
+        seed: 随机种子 | Random seed
+        elevation_range: 输出高程范围(min, max) | Output elevation range (min, max)
+        x_bounds: X坐标边界 | X coordinate bounds
+        y_bounds: Y坐标边界 | Y coordinate bounds
+        dtype: 输出数据类型 | Output dtype
+        chunk_size: 每个分块的近似元素数 | Approximate elements per chunk
+        **options: frequency/octaves/lacunarity/gain | frequency/octaves/lacunarity/gain
+
+    Returns:
+        以'r+'模式打开的内存映射网格 | Memory-mapped grid opened in 'r+' mode
+
+    Raises:
+        ValueError: 方法不支持逐点求值时 | When the method cannot be evaluated point-wise
+    """
+    _check_method(method, pointwise=True)
+    rows, cols = _normalize_shape(shape)
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    out = np.lib.format.open_memmap(path, mode='w+', dtype=dtype, shape=(rows, cols))
+    rows_per_chunk = max(1, chunk_size // cols)
+    for start in range(0, rows, rows_per_chunk):
+        stop = min(rows, start + rows_per_chunk)
+        _fill_grid(out[start:stop], method, seed, elevation_range, x_bounds, y_bounds, options,
+                   row_offset=start, total_rows=rows)
+    out.flush()
+    return out
+
+
+def iter_terrain_samples(n: int, method: str = 'fbm', seed: int = 0,
+                         elevation_range: Tuple[float, float] = (0.0, 3000.0),
+                         x_bounds: Tuple[float, float] = (0.0, 1.0),
+                         y_bounds: Tuple[float, float] = (0.0, 1.0),
+                         chunk_size: int = _CHUNK_SIZE,
+                         **options) -> Iterator[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """
+    分块生成散点样本 | Generate scattered samples in chunks
+
+    第i个样本的坐标由(seed, i)的哈希决定，因此样本序列与chunk_size无关 |
+    The coordinates of sample i come from a hash of (seed, i), so the sample sequence does not depend on chunk_size
+
+    Args:
+        n: 样本数 | Number of samples
+        method: 'fbm'或'ridged' | 'fbm' or 'ridged'
+        seed: 随机种子 | Random seed
+        elevation_range: 输出高程范围(min, max) | Output elevation range (min, max)
+        x_bounds: X坐标边界 | X coordinate bounds
+        y_bounds: Y坐标边界 | Y coordinate bounds
+        chunk_size: 每个分块的样本数 | Samples per chunk
+        **options: frequency/octaves/lacunarity/gain | frequency/octaves/lacunarity/gain
+
+    Yields:
+        (x, y, z)数组元组 | (x, y, z) array tuples
+    """
+    _check_method(method, pointwise=True)
+    if n < 0:
+        raise ValueError("n must be >= 0")
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be >= 1")
+
+    for start in range(0, n, chunk_size):
+        index = np.arange(start, min(n, start + chunk_size), dtype=np.int64)
+        x = _uniform(index, seed, 0, x_bounds)
+        y = _uniform(index, seed, 1, y_bounds)
+        z = _elevation(x, y, method, seed, elevation_range, options)
+        yield x, y, z
+
+
+def sample_terrain(n: int, method: str = 'fbm', seed: int = 0,
+                   elevation_range: Tuple[float, float] = (0.0, 3000.0),
+                   x_bounds: Tuple[float, float] = (0.0, 1.0),
+                   y_bounds: Tuple[float, float] = (0.0, 1.0),
+                   out: Optional[np.ndarray] = None, chunk_size: int = _CHUNK_SIZE,
+                   **options) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    生成散点样本 | Generate scattered samples
+
+    Args:
+        n: 样本数 | Number of samples
+        method: 'fbm'或'ridged' | 'fbm' or 'ridged'
+        seed: 随机种子 | Random seed
+        elevation_range: 输出高程范围(min, max) | Output elevation range (min, max)
+        x_bounds: X坐标边界 | X coordinate bounds
+        y_bounds: Y坐标边界 | Y coordinate bounds
+        out: 可选的(3, n)输出数组（如np.lib.format.open_memmap创建的内存映射） |
+            Optional (3, n) output array (e.g. a memory map created by np.lib.format.open_memmap)
+        chunk_size: 每个分块的样本数 | Samples per chunk
+        **options: frequency/octaves/lacunarity/gain | frequency/octaves/lacunarity/gain
+
+    Returns:
+        (x, y, z)数组元组（给定out时为其各行的视图） | (x, y, z) array tuple (views of the rows of out when given)
+    """
+    if out is None:
+        out = np.empty((3, n), dtype=np.float64)
+    elif out.shape != (3, n):
+        raise ValueError(f"out must have shape (3, {n}), got {out.shape}")
+
+    start = 0
+    for x, y, z in iter_terrain_samples(n, method, seed, elevation_range, x_bounds, y_bounds,
+                                        chunk_size, **options):
+        stop = start + len(x)
+        out[0, start:stop] = x
+        out[1, start:stop] = y
+        out[2, start:stop] = z
+        start = stop
+    return out[0], out[1], out[2]
+
+
+def synthetic_mountain_data(n: int, method: str = 'fbm', seed: int = 0, **kwargs):
+    """
+    生成散点样本并包装为数组模式的MountainData | Generate scattered samples as array-backed MountainData
+
+    Args:
+        n: 样本数 | Number of samples
+        method: 'fbm'或'ridged' | 'fbm' or 'ridged'
+        seed: 随机种子 | Random seed
+        **kwargs: 传递给sample_terrain()的参数 | Arguments passed to sample_terrain()
+
+    Returns:
+        MountainData实例 | MountainData instance
+    """
+    from ..core.data import MountainData
+
+    x, y, z = sample_terrain(n, method=method, seed=seed, **kwargs)
+    return MountainData.from_arrays(x, y, z, metadata={'source': 'synthetic', 'method': method, 'seed': seed})
+
+
+def _normalize_shape(shape: ShapeLike) -> Tuple[int, int]:
+    """规范化网格形状 | Normalize grid shape"""
+    rows, cols = (shape, shape) if isinstance(shape, (int, np.integer)) else shape
+    rows, cols = int(rows), int(cols)
+    if rows < 2 or cols < 2:
+        raise ValueError("terrain grids need at least 2 rows and 2 columns")
+    return rows, cols
+
+
+def _check_method(method: str, pointwise: bool = False) -> None:
+    """校验生成方法 | Validate generation method"""
+    if method not in TERRAIN_METHODS:
+        raise ValueError(f"Unknown terrain method: {method!r}; expected one of {TERRAIN_METHODS}")
+    if pointwise and method not in POINTWISE_METHODS:
+        raise ValueError(f"Method {method!r} generates the whole grid at once; "
+                         f"chunked output and scattered samples need one of {POINTWISE_METHODS}")
+
+
+def _elevation(x: np.ndarray, y: np.ndarray, method: str, seed: int,
+               elevation_range: Tuple[float, float], options: dict) -> np.ndarray:
+    """逐点求高程，噪声按理论范围映射以保持分块无关 | Point-wise elevation, mapped by the theoretical noise range to stay chunk-independent"""
+    noise = fbm_noise(x, y, seed=seed, ridged=(method == 'ridged'), **options)
+    low, high = elevation_range
+    noise += 1.0
+    noise *= (high - low) / 2.0
+    noise += low
+    return noise
+
+
+def _fill_grid(out: np.ndarray, method: str, seed: int, elevation_range: Tuple[float, float],
+               x_bounds: Tuple[float, float], y_bounds: Tuple[float, float], options: dict,
+               row_offset: int = 0, total_rows: Optional[int] = None) -> None:
+    """按行块填充网格 | Fill a grid block of rows"""
+    rows, cols = out.shape
+    total_rows = total_rows or rows
+    xi = np.linspace(x_bounds[0], x_bounds[1], cols)
+    y_step = (y_bounds[1] - y_bounds[0]) / (total_rows - 1)
+    rows_per_chunk = max(1, _CHUNK_SIZE // cols)
+
+    for start in range(0, rows, rows_per_chunk):
+        stop = min(rows, start + rows_per_chunk)
+        yi = y_bounds[0] + np.arange(row_offset + start, row_offset + stop) * y_step
+        out[start:stop] = _elevation(xi[np.newaxis, :], yi[:, np.newaxis], method, seed, elevation_range, options)
+
+
+def _uniform(index: np.ndarray, seed: int, stream: int, bounds: Tuple[float, float]) -> np.ndarray:
+    """由样本序号的哈希得到均匀分布的坐标 | Uniform coordinates from a hash of the sample index"""
+    bits = _hash(index, np.full_like(index, stream), seed) >> _SHIFT_UNIFORM
+    # 53位尾数映射到[0, 1) | Map 53 bits of mantissa onto [0, 1)
+    unit = bits.astype(np.float64) * (1.0 / (1 << 53))
+    return bounds[0] + unit * (bounds[1] - bounds[0])